@@ -12,6 +12,8 @@
 
 use App\Models\Booking;
 
+use App\Jobs\GenerateImageVariants;
+
 
 class AdminController extends Controller
 {
@@ -78,6 +80,10 @@ public function add_room(Request $request)
 
         $data->save();
 
+        if ($data->image) {
+            GenerateImageVariants::dispatch($data);
+        }
+
         return redirect()->back();
 
     }
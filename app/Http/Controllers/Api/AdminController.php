@@ -3,11 +3,22 @@
 namespace App\Http\Controllers\Api;
 
 use App\Http\Controllers\Controller;
+use App\Jobs\GenerateImageVariants;
 use App\Models\Room;
 use App\Models\Booking;
 use App\Models\User;
 use App\Models\Payment;
 use App\Models\Review;
+use App\Models\RatePlan;
+use App\Services\ExportService;
+use App\Services\ImageVariantService;
+use App\Services\LifecycleService;
+use App\Services\NotificationService;
+use App\Services\PricingService;
+use App\Services\ReportRollupService;
+use App\Services\RequestMetricsService;
+use App\Services\ResponseCacheService;
+use Carbon\Carbon;
 use Illuminate\Http\Request;
 use Illuminate\Support\Facades\Storage;
 
@@ -18,7 +29,7 @@ class AdminController extends Controller
      */
     private function checkAdmin(Request $request)
     {
-        $user = auth()->user();
+        $user = $request->user();
         if (!$user || $user->usertype !== 'admin') {
             return false;
         }
@@ -34,22 +45,20 @@ public function dashboard()
             return response()->json(['success' => false, 'message' => 'Unauthorized'], 403);
         }
 
-        $totalBookings = Booking::count();
-        $totalRevenue = Payment::where('status', 'verified')->sum('amount');
+        $totals = ReportRollupService::totals();
         $totalUsers = User::where('usertype', '!=', 'admin')->count();
         $totalRooms = Room::count();
 
-        $pendingPayments = Payment::where('status', 'pending_verification')->count();
         $recentBookings = Booking::orderBy('created_at', 'desc')->limit(5)->get();
 
         return response()->json([
             'success' => true,
             'data' => [
-                'total_bookings' => $totalBookings,
-                'total_revenue' => (float) $totalRevenue,
+                'total_bookings' => $totals['total_bookings'],
+                'total_revenue' => $totals['total_revenue'],
                 'total_users' => $totalUsers,
                 'total_rooms' => $totalRooms,
-                'pending_payments' => $pendingPayments,
+                'pending_payments' => $totals['pending_payments'],
                 'recent_bookings' => $recentBookings->map(function ($booking) {
                     return [
                         'id' => $booking->booking_id,
@@ -75,9 +84,15 @@ public function listRooms()
 
         $rooms = Room::paginate(12);
 
+        // Bookings reference rooms by type; count them for the whole page in one query
+        $bookingCounts = Booking::whereIn('room_type', $rooms->pluck('room_type')->unique())
+            ->selectRaw('room_type, COUNT(*) as total')
+            ->groupBy('room_type')
+            ->pluck('total', 'room_type');
+
         return response()->json([
             'success' => true,
-            'data' => $rooms->map(function ($room) {
+            'data' => $rooms->map(function ($room) use ($bookingCounts) {
                 return [
                     'id' => $room->id,
                     'room_title' => $room->room_title,
@@ -85,7 +100,7 @@ public function listRooms()
                     'price' => (float) $room->price,
                     'capacity' => $room->capacity,
                     'status' => $room->status,
-                    'bookings_count' => $room->bookings()->count(),
+                    'bookings_count' => (int) ($bookingCounts[$room->room_type] ?? 0),
                 ];
             }),
             'pagination' => [
@@ -129,6 +144,10 @@ public function createRoom(Request $request)
 
             $room = Room::create($roomData);
 
+            if ($room->image) {
+                GenerateImageVariants::dispatch($room);
+            }
+
             return response()->json([
                 'success' => true,
                 'message' => 'Room created successfully',
@@ -175,11 +194,18 @@ public function updateRoom($id, Request $request)
                 if ($room->image) {
                     Storage::disk('public')->delete($room->image);
                 }
+                ImageVariantService::delete($room->image_variants);
+
                 $path = $request->file('image')->store('rooms', 'public');
                 $validated['image'] = $path;
+                $validated['image_variants'] = null;
             }
 
-            $room->update($validated);
+            $room->forceFill($validated)->save();
+
+            if ($request->hasFile('image')) {
+                GenerateImageVariants::dispatch($room);
+            }
 
             return response()->json([
                 'success' => true,
@@ -210,6 +236,7 @@ public function deleteRoom($id, Request $request)
             if ($room->image) {
                 Storage::disk('public')->delete($room->image);
             }
+            ImageVariantService::delete($room->image_variants);
             $room->delete();
 
             return response()->json([
@@ -234,17 +261,27 @@ public function listBookings(Request $request)
             return response()->json(['success' => false, 'message' => 'Unauthorized'], 403);
         }
 
-        $query = Booking::query();
+        $request->validate([
+            'from' => 'nullable|date',
+            'to' => 'nullable|date',
+        ]);
 
-        if ($request->has('status')) {
-            $query->where('status', $request->status);
-        }
+        // A stay range starting before the archive horizon also lists archived bookings
+        $query = LifecycleService::bookingsFrom($request->from, function ($query) use ($request) {
+            if ($request->has('status')) {
+                $query->where('status', $request->status);
+            }
 
-        if ($request->has('paid_status')) {
-            $query->where('paid_status', $request->paid_status);
-        }
+            if ($request->has('paid_status')) {
+                $query->where('paid_status', $request->paid_status);
+            }
 
-        $bookings = $query->orderBy('created_at', 'desc')->paginate(20);
+            return $query
+                ->when($request->from, fn ($q) => $q->where('check_in', '>=', Carbon::parse($request->from)->startOfDay()))
+                ->when($request->to, fn ($q) => $q->where('check_in', '<=', Carbon::parse($request->to)->endOfDay()));
+        });
+
+        $bookings = $query->orderBy('created_at', 'desc')->orderBy('id', 'desc')->paginate(20);
 
         return response()->json([
             'success' => true,
@@ -278,7 +315,52 @@ public function listUsers(Request $request)
             return response()->json(['success' => false, 'message' => 'Unauthorized'], 403);
         }
 
-        $users = User::where('usertype', '!=', 'admin')
+        $request->validate([
+            'sort' => 'nullable|string|in:name,created_at,total_bookings,total_spent,last_stay,cancellations',
+            'direction' => 'nullable|string|in:asc,desc',
+            'min_spent' => 'nullable|numeric|min:0',
+            'min_bookings' => 'nullable|integer|min:0',
+            'stayed_since' => 'nullable|date',
+        ]);
+
+        // Sortable columns, read from the materialized user_stats projection.
+        // Users without a stats row sort as zero: NULLs come first ascending, last descending.
+        $sortable = [
+            'name' => 'users.name',
+            'created_at' => 'users.created_at',
+            'total_bookings' => 'user_stats.booking_count',
+            'total_spent' => 'user_stats.lifetime_spend',
+            'last_stay' => 'user_stats.last_stay_at',
+            'cancellations' => 'user_stats.cancellation_count',
+        ];
+
+        $query = User::where('users.usertype', '!=', 'admin')
+            ->leftJoin('user_stats', 'user_stats.user_id', '=', 'users.id')
+            ->select([
+                'users.*',
+                'user_stats.booking_count',
+                'user_stats.cancellation_count',
+                'user_stats.lifetime_spend',
+                'user_stats.last_stay_at',
+            ]);
+
+        if ($request->filled('min_spent')) {
+            $query->where('user_stats.lifetime_spend', '>=', $request->min_spent);
+        }
+
+        if ($request->filled('min_bookings')) {
+            $query->where('user_stats.booking_count', '>=', $request->min_bookings);
+        }
+
+        if ($request->filled('stayed_since')) {
+            $query->where('user_stats.last_stay_at', '>=', $request->stayed_since);
+        }
+
+        $sort = $request->sort ?? 'created_at';
+        $direction = $request->direction ?? 'desc';
+
+        $users = $query->orderByRaw($sortable[$sort] . ' ' . $direction)
+            ->orderBy('users.id', $direction)
             ->paginate(20);
 
         return response()->json([
@@ -289,8 +371,10 @@ public function listUsers(Request $request)
                     'name' => $user->name,
                     'email' => $user->email,
                     'phone' => $user->phone,
-                    'total_bookings' => $user->bookings()->count(),
-                    'total_spent' => Payment::where('user_email', $user->email)->sum('amount'),
+                    'total_bookings' => (int) $user->booking_count,
+                    'total_spent' => (float) $user->lifetime_spend,
+                    'cancellations' => (int) $user->cancellation_count,
+                    'last_stay' => $user->last_stay_at,
                     'created_at' => $user->created_at->format('Y-m-d'),
                 ];
             }),
@@ -302,6 +386,32 @@ public function listUsers(Request $request)
         ]);
     }
 
+    /**
+     * Stream bookings, payments or users as CSV or NDJSON
+     */
+    public function export(Request $request, $dataset)
+    {
+        if (!$this->checkAdmin($request)) {
+            return response()->json(['success' => false, 'message' => 'Unauthorized'], 403);
+        }
+
+        $request->validate([
+            'format' => 'nullable|string|in:csv,ndjson',
+            'since' => 'nullable|date',
+            'status' => 'nullable|string',
+            'paid_status' => 'nullable|string',
+            'min_spent' => 'nullable|numeric|min:0',
+            'min_bookings' => 'nullable|integer|min:0',
+            'stayed_since' => 'nullable|date',
+        ]);
+
+        return ExportService::response(
+            $dataset,
+            array_filter($request->only(['since', 'status', 'paid_status', 'min_spent', 'min_bookings', 'stayed_since']), fn ($value) => $value !== null && $value !== ''),
+            $request->format ?? 'csv'
+        );
+    }
+
     /**
      * List pending payment verifications
      */
@@ -323,7 +433,9 @@ public function pendingPayments(Request $request)
                     'id' => $payment->id,
                     'booking_id' => $payment->booking_id,
                     'amount' => (float) $payment->amount,
-                    'proof_url' => $payment->proof_file ? asset('storage/' . $payment->proof_file) : null,
+                    'proof_url' => $payment->proofUrl('full'),
+                    'proof_thumb_url' => $payment->proofUrl('thumb'),
+                    'proof_original_url' => $payment->proof_file ? asset('storage/' . $payment->proof_file) : null,
                     'submitted_at' => $payment->created_at->format('Y-m-d H:i'),
                 ];
             }),
@@ -336,45 +448,111 @@ public function pendingPayments(Request $request)
     }
 
     /**
-     * Get reports/analytics
+     * Per-route query, DB time, latency and memory numbers over a recent period
      */
-    public function reports(Request $request)
+    public function metrics(Request $request)
     {
         if (!$this->checkAdmin($request)) {
             return response()->json(['success' => false, 'message' => 'Unauthorized'], 403);
         }
 
-        $period = $request->period ?? 'monthly'; // daily, weekly, monthly, yearly
+        $request->validate([
+            'minutes' => 'nullable|integer|min:1|max:60',
+        ]);
 
-        // Booking stats by date
-        $bookingStats = Booking::selectRaw('DATE(created_at) as date, COUNT(*) as count, SUM(total) as revenue')
-            ->groupBy('date')
-            ->orderBy('date', 'desc')
-            ->limit(30)
-            ->get();
+        return response()->json([
+            'success' => true,
+            'data' => [
+                'minutes' => (int) ($request->minutes ?? 60),
+                'recording' => RequestMetricsService::store() !== null,
+                'routes' => RequestMetricsService::summary($request->minutes ?? 60),
+                'response_cache' => ResponseCacheService::stats(),
+            ]
+        ]);
+    }
 
-        // Revenue by payment method
-        $revenueByMethod = Payment::selectRaw('payment_method, SUM(amount) as total, COUNT(*) as count')
-            ->where('status', 'verified')
-            ->groupBy('payment_method')
-            ->get();
+    /**
+     * Hit/miss counters of the public response cache
+     */
+    public function cacheStats(Request $request)
+    {
+        if (!$this->checkAdmin($request)) {
+            return response()->json(['success' => false, 'message' => 'Unauthorized'], 403);
+        }
 
-        // Top rooms by bookings
-        $topRooms = Booking::selectRaw('room_type, COUNT(*) as count, SUM(total) as revenue')
-            ->groupBy('room_type')
-            ->orderBy('count', 'desc')
-            ->limit(5)
-            ->get();
+        return response()->json([
+            'success' => true,
+            'data' => ResponseCacheService::stats()
+        ]);
+    }
+
+    /**
+     * Queue a notification for every guest checking in on a given day
+     */
+    public function notifyArrivals(Request $request)
+    {
+        if (!$this->checkAdmin($request)) {
+            return response()->json(['success' => false, 'message' => 'Unauthorized'], 403);
+        }
+
+        $validated = $request->validate([
+            'date' => 'nullable|date',
+            'title' => 'required|string|max:255',
+            'message' => 'required|string',
+            'type' => 'nullable|string|max:50',
+        ]);
+
+        $day = Carbon::parse($validated['date'] ?? now()->addDay())->startOfDay();
+
+        $recipients = Booking::where('check_in', '>=', $day)
+            ->where('check_in', '<', $day->copy()->addDay())
+            ->where('status', '!=', 'cancelled')
+            ->whereNotNull('user_id')
+            ->select(['id', 'user_id'])
+            ->lazyById(1000)
+            ->map(fn ($booking) => ['user_id' => $booking->user_id, 'booking_id' => $booking->id]);
+
+        $queued = NotificationService::fanOut(
+            $recipients,
+            $validated['type'] ?? 'check_in_reminder',
+            $validated['title'],
+            $validated['message']
+        );
+
+        return response()->json([
+            'success' => true,
+            'message' => "{$queued} notification(s) queued",
+            'date' => $day->toDateString(),
+            'queued' => $queued,
+        ], 202);
+    }
+
+    /**
+     * Get reports/analytics
+     */
+    public function reports(Request $request)
+    {
+        if (!$this->checkAdmin($request)) {
+            return response()->json(['success' => false, 'message' => 'Unauthorized'], 403);
+        }
+
+        $request->validate([
+            'period' => 'nullable|string|in:daily,weekly,monthly,yearly',
+        ]);
+
+        $period = $request->period ?? 'monthly';
+        $totals = ReportRollupService::totals();
 
         return response()->json([
             'success' => true,
             'data' => [
-                'booking_stats' => $bookingStats,
-                'revenue_by_method' => $revenueByMethod,
-                'top_rooms' => $topRooms,
-                'total_revenue' => Payment::where('status', 'verified')->sum('amount'),
-                'total_bookings' => Booking::count(),
-                'average_booking_value' => Booking::avg('total'),
+                'period' => $period,
+                'booking_stats' => ReportRollupService::bookingSeries($period),
+                'revenue_by_method' => ReportRollupService::revenueByMethod(),
+                'top_rooms' => ReportRollupService::topRoomTypes(),
+                'total_revenue' => $totals['total_revenue'],
+                'total_bookings' => $totals['total_bookings'],
+                'average_booking_value' => $totals['average_booking_value'],
             ]
         ]);
     }
@@ -395,13 +573,14 @@ public function updatePrices(Request $request)
         ]);
 
         try {
-            foreach ($validated['updates'] as $update) {
-                Room::findOrFail($update['room_id'])->update(['price' => $update['price']]);
-            }
+            $updated = PricingService::setBasePrices(
+                collect($validated['updates'])->pluck('price', 'room_id')->all()
+            );
 
             return response()->json([
                 'success' => true,
-                'message' => 'Prices updated successfully'
+                'message' => 'Prices updated successfully',
+                'updated' => $updated
             ]);
 
         } catch (\Exception $e) {
@@ -411,4 +590,83 @@ public function updatePrices(Request $request)
             ], 500);
         }
     }
+
+    /**
+     * List rate plans, optionally for one room or room type
+     */
+    public function listRatePlans(Request $request)
+    {
+        if (!$this->checkAdmin($request)) {
+            return response()->json(['success' => false, 'message' => 'Unauthorized'], 403);
+        }
+
+        $plans = RatePlan::query()
+            ->when($request->room_id, fn ($q, $roomId) => $q->where('room_id', $roomId))
+            ->when($request->room_type, fn ($q, $roomType) => $q->where('room_type', $roomType))
+            ->orderByDesc('priority')
+            ->orderBy('starts_on')
+            ->get();
+
+        return response()->json([
+            'success' => true,
+            'data' => $plans
+        ]);
+    }
+
+    /**
+     * Create or update rate plans (bulk)
+     */
+    public function saveRatePlans(Request $request)
+    {
+        if (!$this->checkAdmin($request)) {
+            return response()->json(['success' => false, 'message' => 'Unauthorized'], 403);
+        }
+
+        $validated = $request->validate([
+            'plans' => 'required|array|max:1000',
+            'plans.*.id' => 'nullable|integer|exists:rate_plans,id',
+            'plans.*.room_id' => 'nullable|required_without:plans.*.room_type|integer|exists:rooms,id',
+            'plans.*.room_type' => 'nullable|required_without:plans.*.room_id|string',
+            'plans.*.name' => 'required|string|max:255',
+            'plans.*.price' => 'required|numeric|min:0',
+            'plans.*.starts_on' => 'nullable|date',
+            'plans.*.ends_on' => 'nullable|date|after_or_equal:plans.*.starts_on',
+            'plans.*.weekdays' => 'nullable|array',
+            'plans.*.weekdays.*' => 'integer|between:1,7',
+            'plans.*.priority' => 'nullable|integer',
+        ]);
+
+        try {
+            $saved = PricingService::savePlans($validated['plans']);
+
+            return response()->json([
+                'success' => true,
+                'message' => 'Rate plans saved successfully',
+                'saved' => $saved
+            ]);
+
+        } catch (\Exception $e) {
+            return response()->json([
+                'success' => false,
+                'message' => 'Error saving rate plans: ' . $e->getMessage()
+            ], 500);
+        }
+    }
+
+    /**
+     * Delete a rate plan
+     */
+    public function deleteRatePlan(Request $request, $id)
+    {
+        if (!$this->checkAdmin($request)) {
+            return response()->json(['success' => false, 'message' => 'Unauthorized'], 403);
+        }
+
+        RatePlan::findOrFail($id)->delete();
+
+        return response()->json([
+            'success' => true,
+            'message' => 'Rate plan deleted successfully'
+        ]);
+    }
 }
@@ -5,57 +5,54 @@
 use App\Http\Controllers\Controller;
 use App\Models\Booking;
 use App\Models\User;
+use App\Services\BookingImportService;
+use App\Services\LifecycleService;
 use App\Services\NotificationService;
+use App\Services\PricingService;
+use App\Services\ReservationService;
+use App\Services\RoomInventoryService;
+use Carbon\Carbon;
 use Illuminate\Http\Request;
 use Illuminate\Support\Facades\Auth;
 
 class BookingController extends Controller
 {
+    // Batas jumlah booking per request import
+    const IMPORT_MAX_ROWS = 5000;
+
+    // Aturan validasi booking, dipakai store(), checkout() dan tiap baris import (BookingImportService)
+    const BOOKING_RULES = [
+        'bookingId'   => 'required|string|max:255',
+        'firstName'   => 'required|string|max:255',
+        'lastName'    => 'required|string|max:255',
+        'email'       => 'required|email|max:255',
+        'phone'       => 'required|string|max:20',
+        'roomType'    => 'required|string',
+        'checkin'     => 'required|date',
+        'checkout'    => 'required|date|after:checkin',
+        'guests'      => 'required|integer|min:1|max:10',
+        'nights'      => 'required|integer|min:1',
+        'rate'        => 'required|numeric|min:0',
+        'total'       => 'required|numeric|min:0',
+        'specialRequests' => 'nullable|string',
+        'userEmail'   => 'nullable|email'
+    ];
+
     // Simpan booking baru
     public function store(Request $request)
     {
-        $validated = $request->validate([
-            'bookingId'   => 'required|string|max:255',
-            'firstName'   => 'required|string|max:255',
-            'lastName'    => 'required|string|max:255',
-            'email'       => 'required|email|max:255',
-            'phone'       => 'required|string|max:20',
-            'roomType'    => 'required|string',
-            'checkin'     => 'required|date',
-            'checkout'    => 'required|date|after:checkin',
-            'guests'      => 'required|integer|min:1|max:10',
-            'nights'      => 'required|integer|min:1',
-            'rate'        => 'required|numeric|min:0',
-            'total'       => 'required|numeric|min:0',
-            'specialRequests' => 'nullable|string',
-            'userEmail'   => 'nullable|email'
-        ]);
+        $validated = $request->validate(self::BOOKING_RULES);
 
         try {
             // Cari user jika email ada
-            $user = null;
-            if (!empty($validated['userEmail'])) {
-                $user = User::where('email', $validated['userEmail'])->first();
-            }
+            $user = $this->bookingUser($validated);
 
-            // Simpan booking
-            $booking = Booking::create([
-                'user_id'          => $user ? $user->id : null,
-                'booking_id'       => $validated['bookingId'],
-                'first_name'       => $validated['firstName'],
-                'last_name'        => $validated['lastName'],
-                'email'            => $validated['email'],
-                'phone'            => $validated['phone'],
-                'room_type'        => $validated['roomType'],
-                'check_in'         => $validated['checkin'],
-                'check_out'        => $validated['checkout'],
-                'guests'           => $validated['guests'],
-                'nights'           => $validated['nights'],
-                'rate'             => $validated['rate'],
-                'total'            => $validated['total'],
-                'status'           => 'confirmed',
-                'special_requests' => $validated['specialRequests'] ?? null
-            ]);
+            // Simpan booking sekaligus klaim malam kamar secara atomik
+            [$booking, $conflict] = ReservationService::reserve($this->bookingAttributes($validated, $user));
+
+            if ($conflict) {
+                return $this->conflictResponse($conflict);
+            }
 
             // Notifikasi (opsional)
             if ($user) {
@@ -76,16 +73,166 @@ public function store(Request $request)
         }
     }
 
+    // Checkout satu kali jalan: booking, pembayaran dan notifikasi dalam satu request
+    public function checkout(Request $request)
+    {
+        $validated = $request->validate(array_merge(self::BOOKING_RULES, [
+            'paymentMethod'  => 'required|string',
+            'cardholderName' => 'required|string|max:255',
+            'cardLastFour'   => 'required|digits:4',
+            'billingAddress' => 'required|string|max:255',
+            'city'           => 'required|string|max:100',
+            'zipCode'        => 'required|string|max:20',
+            'country'        => 'required|string|max:100',
+        ]));
+
+        try {
+            $user = $this->bookingUser($validated);
+
+            // Booking, klaim malam kamar dan pembayaran di-commit bersama atau tidak sama sekali
+            [$booking, $payment, $conflict] = ReservationService::checkout($this->bookingAttributes($validated, $user), [
+                'payment_method'  => $validated['paymentMethod'],
+                'cardholder_name' => $validated['cardholderName'],
+                'card_last_four'  => $validated['cardLastFour'],
+                'status'          => 'completed',
+                'billing_address' => $validated['billingAddress'],
+                'city'            => $validated['city'],
+                'zip_code'        => $validated['zipCode'],
+                'country'         => $validated['country'],
+                'user_email'      => $user ? $user->email : $validated['email'],
+                'transaction_id'  => 'TXN' . date('YmdHis') . random_int(1000, 9999),
+            ]);
+
+            if ($conflict) {
+                return $this->conflictResponse($conflict);
+            }
+
+            // Diantrekan setelah commit; keduanya dikirim sebagai satu job di akhir request
+            if ($user) {
+                NotificationService::notifyBookingConfirmation($booking, $user);
+                NotificationService::notifyPaymentConfirmation($payment, $user, $booking);
+            }
+
+            return response()->json([
+                'success' => true,
+                'message' => 'Booking paid successfully',
+                'booking' => $booking,
+                'payment' => $payment,
+                'transaction_id' => $payment->transaction_id
+            ], 201);
+
+        } catch (\Exception $e) {
+            return response()->json([
+                'success' => false,
+                'message' => 'Checkout failed: ' . $e->getMessage()
+            ], 500);
+        }
+    }
+
+    // User pemilik booking berdasarkan userEmail, bila ada
+    protected function bookingUser(array $validated)
+    {
+        if (empty($validated['userEmail'])) {
+            return null;
+        }
+
+        return User::where('email', $validated['userEmail'])->first();
+    }
+
+    // Kolom booking dari input tervalidasi
+    protected function bookingAttributes(array $validated, ?User $user)
+    {
+        // Harga dihitung di server dari rate plan; nilai dari client hanya dipakai
+        // untuk tipe kamar yang belum ada di tabel rooms
+        $quote = PricingService::quoteForType($validated['roomType'], $validated['checkin'], $validated['checkout']);
+        if ($quote) {
+            $validated['nights'] = $quote['nights'];
+            $validated['rate'] = $quote['rate'];
+            $validated['total'] = $quote['total'];
+        }
+
+        return [
+            'user_id'          => $user ? $user->id : null,
+            'booking_id'       => $validated['bookingId'],
+            'first_name'       => $validated['firstName'],
+            'last_name'        => $validated['lastName'],
+            'email'            => $validated['email'],
+            'phone'            => $validated['phone'],
+            'room_type'        => $validated['roomType'],
+            'check_in'         => $validated['checkin'],
+            'check_out'        => $validated['checkout'],
+            'guests'           => $validated['guests'],
+            'nights'           => $validated['nights'],
+            'rate'             => $validated['rate'],
+            'total'            => $validated['total'],
+            'status'           => 'confirmed',
+            'special_requests' => $validated['specialRequests'] ?? null
+        ];
+    }
+
+    // Respons 409 untuk reservasi yang gagal
+    protected function conflictResponse($conflict)
+    {
+        return response()->json([
+            'success' => false,
+            'message' => $conflict === 'duplicate'
+                ? 'Booking ID already exists'
+                : 'Room is not available for the selected dates'
+        ], 409);
+    }
+
+    // Import booking massal dari body NDJSON (satu booking per baris)
+    public function import(Request $request)
+    {
+        $stream = $request->getContent(true);
+        $lines = [];
+        $rows = 0;
+
+        // Blank lines are kept so the report's line numbers match the file
+        while (($line = fgets($stream)) !== false) {
+            $lines[] = $line;
+
+            if (trim($line) !== '' && ++$rows > self::IMPORT_MAX_ROWS) {
+                return response()->json([
+                    'success' => false,
+                    'message' => 'Too many bookings in one request (max ' . self::IMPORT_MAX_ROWS . ')'
+                ], 413);
+            }
+        }
+
+        if (!$rows) {
+            return response()->json([
+                'success' => false,
+                'message' => 'Request body must contain NDJSON booking rows'
+            ], 422);
+        }
+
+        $report = BookingImportService::import($lines);
+
+        return response()->json(array_merge([
+            'success' => $report['created'] > 0,
+        ], $report));
+    }
+
     // Booking user (auth)
-    public function userBookings()
+    public function userBookings(Request $request)
     {
         $user = Auth::user();
         if (!$user) {
             return response()->json(['success'=>false,'message'=>'Unauthorized'], 401);
         }
 
-        $bookings = Booking::where('user_id', $user->id)
-            ->orderBy('created_at','desc')->get();
+        $request->validate([
+            'from' => 'nullable|date',
+            'to'   => 'nullable|date',
+        ]);
+
+        // Rentang tanggal menginap; booking yang sudah diarsip ikut dibaca bila "from" melewati horizon arsip
+        $bookings = LifecycleService::bookingsFrom($request->from, function ($query) use ($request, $user) {
+            return $query->where('user_id', $user->id)
+                ->when($request->from, fn ($q) => $q->where('check_in', '>=', Carbon::parse($request->from)->startOfDay()))
+                ->when($request->to, fn ($q) => $q->where('check_in', '<=', Carbon::parse($request->to)->endOfDay()));
+        })->orderBy('created_at','desc')->get();
 
         return response()->json(['success'=>true,'bookings'=>$bookings]);
     }
@@ -165,22 +312,15 @@ public function getRoomAvailability(Request $request)
         ]);
 
         // Check if room is available for the given dates
-        $booking = Booking::where('room_type', $request->room_type)
-            ->where('status', '!=', 'cancelled')
-            ->where('paid_status', 'paid')
-            ->where(function ($query) use ($request) {
-                $query->whereBetween('check_in', [$request->check_in, $request->check_out])
-                    ->orWhereBetween('check_out', [$request->check_in, $request->check_out])
-                    ->orWhere(function ($q) use ($request) {
-                        $q->where('check_in', '<=', $request->check_in)
-                          ->where('check_out', '>=', $request->check_out);
-                    });
-            })
-            ->exists();
+        $available = RoomInventoryService::isAvailable(
+            $request->room_type,
+            $request->check_in,
+            $request->check_out
+        );
 
         return response()->json([
             'success' => true,
-            'available' => !$booking,
+            'available' => $available,
             'room_type' => $request->room_type,
             'check_in' => $request->check_in,
             'check_out' => $request->check_out,
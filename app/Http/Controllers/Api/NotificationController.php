@@ -4,15 +4,36 @@
 
 use App\Http\Controllers\Controller;
 use App\Models\Notification;
+use App\Services\NotificationService;
 use Illuminate\Http\Request;
 use Illuminate\Support\Facades\Auth;
 
 class NotificationController extends Controller
 {
     /**
-     * Get all notifications for the authenticated user
+     * Longest a long-poll request may wait for news (seconds)
      */
-    public function index()
+    const MAX_POLL_SECONDS = 30;
+
+    /**
+     * Pause between change-marker checks while a long-poll waits (milliseconds)
+     */
+    const POLL_INTERVAL_MS = 500;
+
+    /**
+     * Pause used instead on cache stores where every check is a database or disk read
+     */
+    const SLOW_STORE_POLL_INTERVAL_MS = 5000;
+
+    /**
+     * Cache drivers that get the slow interval
+     */
+    const SLOW_STORES = ['database', 'file'];
+
+    /**
+     * Get notifications for the authenticated user, newest first, one cursor page at a time
+     */
+    public function index(Request $request)
     {
         $user = Auth::user();
 
@@ -23,14 +44,22 @@ public function index()
             ], 401);
         }
 
+        $request->validate([
+            'per_page' => 'nullable|integer|min:1|max:100',
+            'cursor' => 'nullable|string',
+        ]);
+
         $notifications = Notification::where('user_id', $user->id)
             ->orderBy('created_at', 'desc')
-            ->get();
+            ->orderBy('id', 'desc')
+            ->cursorPaginate($request->per_page ?? 20);
 
         return response()->json([
             'success' => true,
-            'notifications' => $notifications,
-            'unread_count' => $notifications->where('status', 'unread')->count()
+            'notifications' => $notifications->items(),
+            'unread_count' => NotificationService::unreadCount($user->id),
+            'next_cursor' => $notifications->nextCursor()?->encode(),
+            'prev_cursor' => $notifications->previousCursor()?->encode(),
         ]);
     }
 
@@ -48,13 +77,59 @@ public function unreadCount()
             ], 401);
         }
 
-        $count = Notification::where('user_id', $user->id)
-            ->where('status', 'unread')
-            ->count();
+        return response()->json([
+            'success' => true,
+            'unread_count' => NotificationService::unreadCount($user->id)
+        ]);
+    }
+
+    /**
+     * Long-poll for notifications newer than `after` (a notification id)
+     *
+     * Returns as soon as something new arrives, or with an empty list once
+     * `timeout` seconds pass. While waiting only the cached change marker is
+     * checked, not the notifications table: every 0.5 s on a memory store
+     * (redis, memcached), every 5 s on the database or file store.
+     */
+    public function poll(Request $request)
+    {
+        $user = Auth::user();
+
+        if (!$user) {
+            return response()->json([
+                'success' => false,
+                'message' => 'Unauthorized'
+            ], 401);
+        }
+
+        $request->validate([
+            'after' => 'nullable|integer|min:0',
+            'timeout' => 'nullable|integer|min:0|max:' . self::MAX_POLL_SECONDS,
+        ]);
+
+        $after = (int) ($request->after ?? 0);
+        $deadline = microtime(true) + ($request->timeout ?? 20);
+        $marker = NotificationService::changeMarker($user->id);
+        $interval = $this->pollInterval();
+
+        $fresh = $this->newerThan($user->id, $after);
+
+        while ($fresh->isEmpty() && microtime(true) < $deadline) {
+            usleep((int) min($interval, max(0, $deadline - microtime(true)) * 1000000));
+
+            $current = NotificationService::changeMarker($user->id);
+            if ($current !== $marker) {
+                $marker = $current;
+                $fresh = $this->newerThan($user->id, $after);
+            }
+        }
 
         return response()->json([
             'success' => true,
-            'unread_count' => $count
+            'notifications' => $fresh,
+            'last_id' => $fresh->isEmpty() ? $after : $fresh->last()->id,
+            'unread_count' => NotificationService::unreadCount($user->id),
+            'timed_out' => $fresh->isEmpty(),
         ]);
     }
 
@@ -83,7 +158,10 @@ public function markAsRead($id)
             ], 404);
         }
 
-        $notification->markAsRead();
+        if ($notification->status === 'unread') {
+            $notification->markAsRead();
+            NotificationService::adjustUnread($user->id, -1);
+        }
 
         return response()->json([
             'success' => true,
@@ -113,6 +191,8 @@ public function markAllAsRead()
                 'read_at' => now()
             ]);
 
+        NotificationService::clearUnread($user->id);
+
         return response()->json([
             'success' => true,
             'message' => 'All notifications marked as read'
@@ -146,9 +226,35 @@ public function destroy($id)
 
         $notification->delete();
 
+        if ($notification->status === 'unread') {
+            NotificationService::adjustUnread($user->id, -1);
+        }
+
         return response()->json([
             'success' => true,
             'message' => 'Notification deleted'
         ]);
     }
+
+    /**
+     * Notifications for a user with an id above the given one, oldest first
+     */
+    private function newerThan($userId, $afterId)
+    {
+        return Notification::where('user_id', $userId)
+            ->where('id', '>', $afterId)
+            ->orderBy('id')
+            ->limit(100)
+            ->get();
+    }
+
+    /**
+     * Microseconds to sleep between change-marker checks on the configured cache store
+     */
+    private function pollInterval()
+    {
+        $driver = config('cache.stores.' . config('cache.default') . '.driver');
+
+        return (in_array($driver, self::SLOW_STORES) ? self::SLOW_STORE_POLL_INTERVAL_MS : self::POLL_INTERVAL_MS) * 1000;
+    }
 }
@@ -3,10 +3,14 @@
 namespace App\Http\Controllers\Api;
 
 use App\Http\Controllers\Controller;
+use App\Jobs\GenerateImageVariants;
 use App\Models\Payment;
 use App\Models\Booking;
 use App\Models\User;
+use App\Services\LifecycleService;
 use App\Services\NotificationService;
+use App\Services\PaymentVerificationService;
+use Carbon\Carbon;
 use Illuminate\Http\Request;
 
 class PaymentController extends Controller
@@ -102,6 +106,8 @@ public function getByBooking($bookingId)
 
     /**
      * Get all payments for authenticated user
+     *
+     * Optional from/to (payment date) reach into the archive like my_bookings.
      */
     public function userPayments()
     {
@@ -114,9 +120,19 @@ public function userPayments()
             ], 400);
         }
 
-        $payments = Payment::where('user_email', $userEmail)
-            ->orderBy('created_at', 'desc')
-            ->get();
+        request()->validate([
+            'from' => 'nullable|date',
+            'to' => 'nullable|date',
+        ]);
+
+        $from = request()->input('from');
+        $to = request()->input('to');
+
+        $payments = LifecycleService::paymentsFrom($from, function ($query) use ($userEmail, $from, $to) {
+            return $query->where('user_email', $userEmail)
+                ->when($from, fn ($q) => $q->where('created_at', '>=', Carbon::parse($from)->startOfDay()))
+                ->when($to, fn ($q) => $q->where('created_at', '<=', Carbon::parse($to)->endOfDay()));
+        })->orderBy('created_at', 'desc')->get();
 
         return response()->json([
             'success' => true,
@@ -154,7 +170,7 @@ public function uploadProof(Request $request)
             'proof' => 'required|file|image|max:5120', // 5MB
         ]);
 
-        $user = auth()->user();
+        $user = $request->user();
         $booking = Booking::where('booking_id', $request->booking_id)->first();
 
         // Verify ownership
@@ -179,6 +195,9 @@ public function uploadProof(Request $request)
                 'amount' => $booking->total,
             ]);
 
+            // Resize for the verification queue in the background
+            GenerateImageVariants::dispatch($payment);
+
             // Send notification
             NotificationService::notifyPaymentProofReceived($payment, $user, $booking);
 
@@ -205,7 +224,7 @@ public function uploadProof(Request $request)
      */
     public function verifyProof(Request $request)
     {
-        if (!auth()->user() || auth()->user()->usertype !== 'admin') {
+        if (!$request->user() || $request->user()->usertype !== 'admin') {
             return response()->json([
                 'success' => false,
                 'message' => 'Admin access required'
@@ -254,4 +273,34 @@ public function verifyProof(Request $request)
             'payment' => $payment
         ]);
     }
+
+    /**
+     * Admin: Verify or reject a page of payment proofs in one request
+     */
+    public function verifyBatch(Request $request)
+    {
+        if (!$request->user() || $request->user()->usertype !== 'admin') {
+            return response()->json([
+                'success' => false,
+                'message' => 'Admin access required'
+            ], 403);
+        }
+
+        $validated = $request->validate([
+            'items' => 'required|array|min:1|max:' . PaymentVerificationService::MAX_BATCH,
+            'items.*.payment_id' => 'required|integer|distinct',
+            'items.*.verified' => 'required|boolean',
+            'items.*.comment' => 'nullable|string',
+        ]);
+
+        $results = PaymentVerificationService::review($validated['items']);
+        $reviewed = count(array_filter(array_column($results, 'success')));
+
+        return response()->json([
+            'success' => true,
+            'message' => "{$reviewed} of " . count($results) . ' payments reviewed',
+            'reviewed' => $reviewed,
+            'results' => $results
+        ]);
+    }
 }
@@ -5,7 +5,9 @@
 use App\Http\Controllers\Controller;
 use App\Models\Review;
 use App\Models\Booking;
+use App\Services\RoomRatingService;
 use Illuminate\Http\Request;
+use Illuminate\Support\Facades\DB;
 
 class ReviewController extends Controller
 {
@@ -53,7 +55,7 @@ public function store(Request $request)
 
         // Verify user owns this booking
         $booking = Booking::findOrFail($request->booking_id);
-        if ($booking->user_id !== auth()->id()) {
+        if ($booking->user_id !== $request->user()->id) {
             return response()->json([
                 'success' => false,
                 'message' => 'Unauthorized'
@@ -69,14 +71,20 @@ public function store(Request $request)
             ], 422);
         }
 
-        $review = Review::create([
-            'user_id' => auth()->id(),
-            'room_id' => $request->room_id,
-            'booking_id' => $request->booking_id,
-            'rating' => $request->rating,
-            'comment' => $request->comment,
-            'verified_booking' => true,
-        ]);
+        $review = DB::transaction(function () use ($request) {
+            $review = Review::create([
+                'user_id' => $request->user()->id,
+                'room_id' => $request->room_id,
+                'booking_id' => $request->booking_id,
+                'rating' => $request->rating,
+                'comment' => $request->comment,
+                'verified_booking' => true,
+            ]);
+
+            RoomRatingService::reviewAdded($review);
+
+            return $review;
+        });
 
         return response()->json([
             'success' => true,
@@ -101,17 +109,23 @@ public function update($id, Request $request)
 
         $review = Review::findOrFail($id);
 
-        if ($review->user_id !== auth()->id()) {
+        if ($review->user_id !== $request->user()->id) {
             return response()->json([
                 'success' => false,
                 'message' => 'Unauthorized'
             ], 403);
         }
 
-        $review->update([
-            'rating' => $request->rating,
-            'comment' => $request->comment,
-        ]);
+        DB::transaction(function () use ($review, $request) {
+            $oldRating = $review->rating;
+
+            $review->update([
+                'rating' => $request->rating,
+                'comment' => $request->comment,
+            ]);
+
+            RoomRatingService::reviewChanged($review, $oldRating);
+        });
 
         return response()->json([
             'success' => true,
@@ -123,18 +137,21 @@ public function update($id, Request $request)
     /**
      * Delete a review
      */
-    public function destroy($id)
+    public function destroy($id, Request $request)
     {
         $review = Review::findOrFail($id);
 
-        if ($review->user_id !== auth()->id()) {
+        if ($review->user_id !== $request->user()->id) {
             return response()->json([
                 'success' => false,
                 'message' => 'Unauthorized'
             ], 403);
         }
 
-        $review->delete();
+        DB::transaction(function () use ($review) {
+            $review->delete();
+            RoomRatingService::reviewRemoved($review);
+        });
 
         return response()->json([
             'success' => true,
@@ -4,6 +4,10 @@
 
 use App\Http\Controllers\Controller;
 use App\Models\Room;
+use App\Services\PricingService;
+use App\Services\RoomInventoryService;
+use App\Services\RoomSearchService;
+use Carbon\Carbon;
 use Illuminate\Http\Request;
 
 class RoomController extends Controller
@@ -13,25 +17,7 @@ class RoomController extends Controller
      */
     public function index(Request $request)
     {
-        $query = Room::where('status', 'available');
-
-        // Filter by room type
-        if ($request->has('room_type')) {
-            $query->where('room_type', $request->room_type);
-        }
-
-        // Filter by price range
-        if ($request->has('min_price') && $request->has('max_price')) {
-            $query->whereBetween('price', [
-                floatval($request->min_price),
-                floatval($request->max_price)
-            ]);
-        }
-
-        // Filter by capacity
-        if ($request->has('capacity')) {
-            $query->where('capacity', '>=', intval($request->capacity));
-        }
+        $filters = $request->only(['room_type', 'min_price', 'max_price', 'capacity']);
 
         // Filter by amenities (all must match)
         if ($request->has('amenities')) {
@@ -39,12 +25,10 @@ public function index(Request $request)
             if (is_string($amenities)) {
                 $amenities = json_decode($amenities, true);
             }
-            foreach ($amenities as $amenity) {
-                $query->whereJsonContains('amenities', $amenity);
-            }
+            $filters['amenities'] = $amenities;
         }
 
-        $rooms = $query->with('reviews')->paginate(12);
+        [$rooms, $facets] = RoomSearchService::search($filters, max(1, (int) $request->query('page', 1)));
 
         return response()->json([
             'success' => true,
@@ -57,9 +41,11 @@ public function index(Request $request)
                     'price' => (float) $room->price,
                     'capacity' => $room->capacity,
                     'image' => $room->image,
+                    'image_url' => $room->imageUrl('card'),
+                    'thumbnail_url' => $room->imageUrl('thumb'),
                     'amenities' => $room->amenities ?? [],
                     'rating' => round($room->averageRating(), 1),
-                    'review_count' => $room->reviews()->count(),
+                    'review_count' => $room->review_count,
                 ];
             }),
             'pagination' => [
@@ -67,7 +53,8 @@ public function index(Request $request)
                 'per_page' => $rooms->perPage(),
                 'current_page' => $rooms->currentPage(),
                 'last_page' => $rooms->lastPage(),
-            ]
+            ],
+            'facets' => $facets,
         ]);
     }
 
@@ -88,12 +75,15 @@ public function show($id)
                 'price' => (float) $room->price,
                 'capacity' => $room->capacity,
                 'image' => $room->image,
+                'image_url' => $room->imageUrl('full'),
                 'wifi' => $room->wifi,
                 'air_conditioning' => $room->air_conditioning,
                 'tv' => $room->tv,
                 'bathroom_type' => $room->bathroom_type,
                 'amenities' => $room->amenities ?? [],
                 'rating' => round($room->averageRating(), 1),
+                'review_count' => $room->review_count,
+                'rating_histogram' => $room->ratingHistogram(),
                 'reviews' => $room->reviews->map(function ($review) {
                     return [
                         'id' => $review->id,
@@ -128,48 +118,78 @@ public function checkAvailability(Request $request)
             'room_id' => $room->id,
             'room_title' => $room->room_title,
             'price' => (float) $room->price,
+            'quote' => PricingService::quote($room, $request->check_in, $request->check_out),
             'check_in' => $request->check_in,
             'check_out' => $request->check_out,
         ]);
     }
 
+    /**
+     * Price a stay from the room's base price and rate plans
+     */
+    public function quote($id, Request $request)
+    {
+        $request->validate([
+            'check_in' => 'required|date',
+            'check_out' => 'required|date|after:check_in',
+        ]);
+
+        $room = Room::findOrFail($id);
+
+        return response()->json([
+            'success' => true,
+            'data' => PricingService::quote($room, $request->check_in, $request->check_out),
+        ]);
+    }
+
     /**
      * Get availability calendar for a room
+     *
+     * Returns one occupancy bitmap per month (bit day-1 set = night booked),
+     * starting at month/year and covering `months` months (default 1).
      */
     public function getAvailabilityCalendar($id, Request $request)
     {
         $request->validate([
             'month' => 'nullable|integer|min:1|max:12',
             'year' => 'nullable|integer|min:2024',
+            'months' => 'nullable|integer|min:1|max:12',
         ]);
 
         $room = Room::findOrFail($id);
-        $month = $request->month ?? now()->month;
-        $year = $request->year ?? now()->year;
-
-        $bookedDates = $room->bookings()
-            ->where('status', '!=', 'cancelled')
-            ->where('paid_status', 'paid')
-            ->get()
-            ->map(function ($booking) {
-                $dates = [];
-                $current = strtotime($booking->check_in);
-                $end = strtotime($booking->check_out);
-                while ($current < $end) {
-                    $dates[] = date('Y-m-d', $current);
-                    $current = strtotime('+1 day', $current);
+        $month = (int) ($request->month ?? now()->month);
+        $year = (int) ($request->year ?? now()->year);
+        $span = (int) ($request->months ?? 1);
+
+        $calendar = [];
+        $bookedDates = [];
+        $current = Carbon::create($year, $month, 1);
+
+        for ($i = 0; $i < $span; $i++) {
+            $bitmap = RoomInventoryService::monthBitmap($room->room_type, $current->year, $current->month);
+
+            for ($day = 1; $day <= $current->daysInMonth; $day++) {
+                if ($bitmap & (1 << ($day - 1))) {
+                    $bookedDates[] = $current->copy()->day($day)->toDateString();
                 }
-                return $dates;
-            })
-            ->flatten()
-            ->unique()
-            ->values();
+            }
+
+            $calendar[] = [
+                'year' => $current->year,
+                'month' => $current->month,
+                'days' => $current->daysInMonth,
+                'bitmap' => $bitmap,
+            ];
+
+            $current->addMonth();
+        }
 
         return response()->json([
             'success' => true,
             'room_id' => $room->id,
             'month' => $month,
             'year' => $year,
+            'months' => $calendar,
             'booked_dates' => $bookedDates,
         ]);
     }
@@ -3,8 +3,12 @@
 namespace App\Http\Controllers\Api;
 
 use App\Http\Controllers\Controller;
+use App\Models\Booking;
+use App\Models\Payment;
 use App\Models\User;
 use Illuminate\Http\Request;
+use Illuminate\Support\Arr;
+use Illuminate\Support\Facades\DB;
 use Illuminate\Support\Facades\Hash;
 use Illuminate\Support\Facades\Validator;
 
@@ -99,27 +103,125 @@ public function changePassword(Request $request)
         ]);
     }
 
+    /**
+     * Booking fields a client may ask for through `fields`
+     */
+    const OVERVIEW_FIELDS = ['booking_id', 'room_type', 'check_in', 'check_out', 'guests', 'nights', 'rate', 'total', 'status', 'paid_status', 'payment_status', 'refund_amount', 'special_requests', 'created_at'];
+
+    /**
+     * Fields returned when `fields` is not given
+     */
+    const OVERVIEW_DEFAULT_FIELDS = ['booking_id', 'room_type', 'check_in', 'check_out', 'total', 'status', 'paid_status', 'payment_status'];
+
     /**
      * Get user bookings summary
      */
     public function bookingsSummary(Request $request)
     {
+        return response()->json([
+            'success' => true,
+            'data' => $this->bookingCounters($request->user())
+        ]);
+    }
+
+    /**
+     * Profile, booking counters and the first page of bookings in one response
+     *
+     * The counters come from one aggregate query and the bookings from one
+     * keyset page (newest first) with the latest payment status as a
+     * subquery, so the cost does not grow with the guest's history. Pass
+     * `next_cursor` back as `cursor` for further pages, which return only
+     * bookings. `fields` is a comma-separated subset of OVERVIEW_FIELDS.
+     *
+     * The pages list live bookings only; archived stays are counted in the
+     * summary as `archived_bookings` and listed by `my_bookings` with a `from`
+     * date before the archive horizon.
+     */
+    public function overview(Request $request)
+    {
+        $request->validate([
+            'per_page' => 'nullable|integer|min:1|max:50',
+            'cursor' => 'nullable|string',
+            'fields' => 'nullable|string',
+        ]);
+
+        $fields = $request->filled('fields')
+            ? array_values(array_unique(array_map('trim', explode(',', $request->fields))))
+            : self::OVERVIEW_DEFAULT_FIELDS;
+
+        $unknown = array_diff($fields, self::OVERVIEW_FIELDS);
+        if ($unknown) {
+            return response()->json([
+                'success' => false,
+                'message' => 'Unknown fields: ' . implode(', ', $unknown),
+                'allowed_fields' => self::OVERVIEW_FIELDS,
+            ], 422);
+        }
+
         $user = $request->user();
 
-        $totalBookings = $user->bookings()->count();
-        $completedBookings = $user->bookings()->where('status', 'completed')->count();
-        $upcomingBookings = $user->bookings()
-            ->where('check_in', '>=', now()->toDateString())
-            ->where('status', '!=', 'cancelled')
-            ->count();
+        // id and created_at are always read: they are the keyset cursor
+        $query = Booking::where('user_id', $user->id)
+            ->select(array_values(array_unique(array_merge(['id', 'created_at'], array_diff($fields, ['payment_status'])))))
+            ->orderBy('created_at', 'desc')
+            ->orderBy('id', 'desc');
+
+        if (in_array('payment_status', $fields)) {
+            $query->addSelect(['payment_status' => Payment::select('status')
+                ->whereColumn('payments.booking_id', 'bookings.booking_id')
+                ->orderBy('id', 'desc')
+                ->limit(1)]);
+        }
+
+        $bookings = $query->cursorPaginate($request->per_page ?? 10);
+
+        $data = [
+            'bookings' => collect($bookings->items())->map(fn ($booking) => Arr::only($booking->toArray(), $fields))->values(),
+            'next_cursor' => $bookings->nextCursor()?->encode(),
+        ];
+
+        if (!$request->filled('cursor')) {
+            $data = [
+                'user' => [
+                    'id' => $user->id,
+                    'name' => $user->name,
+                    'email' => $user->email,
+                    'phone' => $user->phone,
+                ],
+                'summary' => $this->bookingCounters($user),
+            ] + $data;
+        }
 
         return response()->json([
             'success' => true,
-            'data' => [
-                'total_bookings' => $totalBookings,
-                'completed_bookings' => $completedBookings,
-                'upcoming_bookings' => $upcomingBookings,
-            ]
+            'data' => $data
         ]);
     }
+
+    /**
+     * Every booking counter of a user from one conditional-aggregation query
+     *
+     * Archived stays count too, so totals don't drop when the lifecycle job
+     * moves old bookings out of the live table; archived_bookings says how
+     * many of them are no longer in the live table.
+     */
+    private function bookingCounters(User $user)
+    {
+        $rows = fn ($query, $archived) => $query->where('user_id', $user->id)
+            ->select(['status', 'paid_status', 'check_in', DB::raw("{$archived} as archived")]);
+
+        $counts = DB::query()
+            ->fromSub($rows(Booking::query(), 0)->unionAll($rows(Booking::archived(), 1)), 'stays')
+            ->selectRaw("
+                COUNT(*) as total_bookings,
+                SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) as completed_bookings,
+                SUM(CASE WHEN check_in >= ? AND status != 'cancelled' THEN 1 ELSE 0 END) as upcoming_bookings,
+                SUM(CASE WHEN status = 'cancelled' THEN 1 ELSE 0 END) as cancelled_bookings,
+                SUM(CASE WHEN paid_status = 'unpaid' AND status != 'cancelled' THEN 1 ELSE 0 END) as awaiting_payment,
+                COALESCE(SUM(archived), 0) as archived_bookings
+            ", [now()->toDateString()])
+            ->first();
+
+        return array_map('intval', (array) $counts);
+    }
 }
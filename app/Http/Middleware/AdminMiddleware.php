@@ -12,7 +12,7 @@ class AdminMiddleware
      */
     public function handle(Request $request, Closure $next)
     {
-        $user = auth()->user();
+        $user = $request->user();
 
         if (!$user || $user->usertype !== 'admin') {
             return response()->json([
@@ -0,0 +1,70 @@
+<?php
+
+namespace App\Http\Middleware;
+
+use App\Services\ResponseCacheService;
+use Closure;
+use Illuminate\Http\Request;
+
+class CacheResponse
+{
+    /**
+     * Serve a public GET endpoint from the response cache, with ETag revalidation.
+     *
+     * $scope names the route in the hit/miss stats. With $roomParam the entry is
+     * tagged with that route parameter's room; without it, with the room listing.
+     */
+    public function handle(Request $request, Closure $next, $scope, $roomParam = null)
+    {
+        if (!$request->isMethod('GET') || $request->bearerToken()) {
+            return $next($request);
+        }
+
+        $tags = $roomParam
+            ? ['room:' . $request->route($roomParam)]
+            : [ResponseCacheService::LIST_TAG];
+
+        $key = ResponseCacheService::key($request, $tags);
+        $entry = ResponseCacheService::get($key);
+        $hit = $entry !== null;
+
+        if (!$hit) {
+            $response = $next($request);
+
+            if ($response->getStatusCode() !== 200) {
+                return $response;
+            }
+
+            $entry = ResponseCacheService::put(
+                $key,
+                $response->getStatusCode(),
+                $response->getContent(),
+                $response->headers->get('Content-Type')
+            );
+        }
+
+        ResponseCacheService::record($scope, $hit);
+
+        $response = in_array($entry['etag'], $request->getETags(), true)
+            ? response('', 304)
+            : response($entry['content'], $entry['status'])->header('Content-Type', $entry['content_type']);
+
+        return $response
+            ->setEtag(trim($entry['etag'], '"'))
+            ->header('Cache-Control', 'public, no-cache')
+            ->header('X-Cache', $hit ? 'HIT' : 'MISS');
+    }
+
+    /**
+     * Write the buffered hit/miss counts once the response is sent.
+     */
+    public function terminate(Request $request, $response)
+    {
+        try {
+            ResponseCacheService::flushStats();
+        } catch (\Exception $e) {
+            // Stats must never fail a request
+            \Log::warning('Response cache stats dropped: ' . $e->getMessage());
+        }
+    }
+}
@@ -0,0 +1,106 @@
+<?php
+
+namespace App\Http\Middleware;
+
+use App\Models\IdempotencyKey;
+use Closure;
+use Illuminate\Http\Request;
+
+class EnsureIdempotency
+{
+    /**
+     * Seconds after which an unfinished request is treated as abandoned
+     */
+    const IN_PROGRESS_TIMEOUT = 60;
+
+    /**
+     * Replay the stored response when a write is retried with the same Idempotency-Key.
+     *
+     * The first request with a key runs normally and its response is stored
+     * (unless it is a 5xx, which leaves the key free for a retry). Retries with
+     * the same body get the stored response back; the same key with a
+     * different body is rejected.
+     */
+    public function handle(Request $request, Closure $next)
+    {
+        $key = $request->header('Idempotency-Key');
+
+        if ($key === null || $request->isMethodSafe()) {
+            return $next($request);
+        }
+
+        if (trim($key) === '' || strlen($key) > 255) {
+            return response()->json([
+                'success' => false,
+                'message' => 'Invalid Idempotency-Key header'
+            ], 400);
+        }
+
+        $scope = $request->method() . ' ' . $request->route()->uri() . '|' . (optional($request->user('sanctum'))->id ?? 'guest');
+        $fingerprint = hash('sha256', $request->getContent());
+
+        if (!$this->begin($scope, $key, $fingerprint)) {
+            return $this->replay(IdempotencyKey::where('scope', $scope)->where('key', $key)->first(), $fingerprint);
+        }
+
+        $response = $next($request);
+
+        $record = IdempotencyKey::where('scope', $scope)->where('key', $key);
+
+        if ($response->getStatusCode() >= 500) {
+            $record->delete();
+        } else {
+            $record->update([
+                'response_status' => $response->getStatusCode(),
+                'response_body' => $response->getContent(),
+            ]);
+        }
+
+        return $response;
+    }
+
+    /**
+     * Take the key for this request; false if another request already has it
+     */
+    protected function begin($scope, $key, $fingerprint)
+    {
+        // A request that died mid-flight must not block its retries forever
+        IdempotencyKey::where('scope', $scope)
+            ->where('key', $key)
+            ->whereNull('response_status')
+            ->where('updated_at', '<', now()->subSeconds(self::IN_PROGRESS_TIMEOUT))
+            ->delete();
+
+        return IdempotencyKey::insertOrIgnore([
+            'scope' => $scope,
+            'key' => $key,
+            'fingerprint' => $fingerprint,
+            'created_at' => now(),
+            'updated_at' => now(),
+        ]) === 1;
+    }
+
+    /**
+     * Response for a request whose key was already taken
+     */
+    protected function replay($record, $fingerprint)
+    {
+        if ($record && $record->fingerprint !== $fingerprint) {
+            return response()->json([
+                'success' => false,
+                'message' => 'Idempotency-Key was already used for a different request'
+            ], 422);
+        }
+
+        if (!$record || $record->response_status === null) {
+            return response()->json([
+                'success' => false,
+                'message' => 'A request with this Idempotency-Key is still being processed'
+            ], 409)->header('Retry-After', 1);
+        }
+
+        return response($record->response_body, $record->response_status)
+            ->header('Content-Type', 'application/json')
+            ->header('Idempotent-Replayed', 'true');
+    }
+}
@@ -0,0 +1,61 @@
+<?php
+
+namespace App\Http\Middleware;
+
+use App\Services\RequestMetricsService;
+use Closure;
+use Illuminate\Http\Request;
+
+class RecordRequestMetrics
+{
+    /**
+     * Measure query count, DB time, slowest statement, wall time and peak memory.
+     *
+     * Outside production the numbers are also returned as X-* response headers.
+     */
+    public function handle(Request $request, Closure $next)
+    {
+        RequestMetricsService::start();
+
+        $response = $next($request);
+
+        $metrics = RequestMetricsService::finish();
+
+        // terminate() runs on a fresh middleware instance, so hand the numbers over on the request
+        $request->attributes->set('request_metrics', $metrics);
+
+        if ($metrics && !app()->isProduction()) {
+            $response->headers->add([
+                'X-Query-Count' => $metrics['queries'],
+                'X-Query-Time-Ms' => $metrics['db_ms'],
+                'X-Slowest-Query-Ms' => $metrics['slowest_ms'],
+                'X-Response-Time-Ms' => $metrics['wall_ms'],
+                'X-Peak-Memory-Mb' => $metrics['peak_memory_mb'],
+            ]);
+        }
+
+        return $response;
+    }
+
+    /**
+     * Fold the numbers into the rolling histograms once the response is sent.
+     */
+    public function terminate(Request $request, $response)
+    {
+        $metrics = $request->attributes->get('request_metrics');
+
+        if (!$metrics) {
+            return;
+        }
+
+        $route = $request->route();
+        $name = $request->method() . ' ' . ($route ? '/' . ltrim($route->uri(), '/') : 'unmatched');
+
+        try {
+            RequestMetricsService::aggregate($name, $metrics);
+        } catch (\Exception $e) {
+            // Metrics must never fail a request
+            \Log::warning('Request metrics dropped: ' . $e->getMessage());
+        }
+    }
+}
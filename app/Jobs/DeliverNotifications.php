@@ -0,0 +1,81 @@
+<?php
+
+namespace App\Jobs;
+
+use App\Models\Notification;
+use App\Models\NotificationDeadLetter;
+use App\Services\NotificationService;
+use Illuminate\Bus\Queueable;
+use Illuminate\Contracts\Queue\ShouldQueue;
+use Illuminate\Foundation\Bus\Dispatchable;
+use Illuminate\Queue\InteractsWithQueue;
+use Illuminate\Queue\SerializesModels;
+use Illuminate\Support\Facades\DB;
+use Throwable;
+
+class DeliverNotifications implements ShouldQueue
+{
+    use Dispatchable, InteractsWithQueue, Queueable, SerializesModels;
+
+    /**
+     * Rows per INSERT statement
+     */
+    const INSERT_CHUNK = 500;
+
+    /**
+     * Number of attempts before the batch is dead-lettered
+     */
+    public $tries = 3;
+
+    /**
+     * Seconds to wait between attempts
+     */
+    public $backoff = [10, 60];
+
+    /**
+     * Only enqueue once the surrounding transaction has committed
+     */
+    public $afterCommit = true;
+
+    /**
+     * Notification rows ready for insertion
+     */
+    public array $rows;
+
+    /**
+     * Create a new job instance.
+     */
+    public function __construct(array $rows)
+    {
+        $this->rows = $rows;
+    }
+
+    /**
+     * Insert the whole batch with multi-row statements.
+     */
+    public function handle(): void
+    {
+        DB::transaction(function () {
+            foreach (array_chunk($this->rows, self::INSERT_CHUNK) as $chunk) {
+                Notification::insert($chunk);
+            }
+        });
+
+        NotificationService::delivered($this->rows);
+    }
+
+    /**
+     * Keep the undelivered batch so it can be replayed.
+     */
+    public function failed(Throwable $exception): void
+    {
+        NotificationDeadLetter::create([
+            'payload' => $this->rows,
+            'row_count' => count($this->rows),
+            'error' => $exception->getMessage(),
+            'attempts' => $this->attempts(),
+        ]);
+
+        \Log::error('Notification batch dead-lettered: ' . $exception->getMessage());
+    }
+}
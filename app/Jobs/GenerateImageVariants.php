@@ -0,0 +1,84 @@
+<?php
+
+namespace App\Jobs;
+
+use App\Models\Payment;
+use App\Models\Room;
+use App\Services\ImageVariantService;
+use App\Services\ResponseCacheService;
+use Illuminate\Bus\Queueable;
+use Illuminate\Contracts\Queue\ShouldQueue;
+use Illuminate\Database\Eloquent\Model;
+use Illuminate\Foundation\Bus\Dispatchable;
+use Illuminate\Queue\InteractsWithQueue;
+use Illuminate\Queue\SerializesModels;
+use Illuminate\Support\Facades\Log;
+
+class GenerateImageVariants implements ShouldQueue
+{
+    use Dispatchable, InteractsWithQueue, Queueable, SerializesModels;
+
+    /**
+     * Number of attempts before giving up; the original keeps being served
+     */
+    public $tries = 3;
+
+    /**
+     * Seconds to wait between attempts
+     */
+    public $backoff = [30, 120];
+
+    /**
+     * Only enqueue once the upload's transaction has committed
+     */
+    public $afterCommit = true;
+
+    /**
+     * Drop the job quietly if the record was deleted in the meantime
+     */
+    public $deleteWhenMissingModels = true;
+
+    /**
+     * Room photo or payment proof to process
+     */
+    public Model $record;
+
+    /**
+     * Create a new job instance.
+     */
+    public function __construct(Room|Payment $record)
+    {
+        $this->record = $record;
+    }
+
+    /**
+     * Resize the record's image and store the variant paths on it.
+     */
+    public function handle(): void
+    {
+        if (!ImageVariantService::available()) {
+            Log::warning('Image variants skipped: the GD extension with WebP support is not installed');
+            return;
+        }
+
+        [$source, $column, $directory] = $this->record instanceof Payment
+            ? [$this->record->proofPath(), 'proof_variants', 'variants/payment-proofs/' . $this->record->id]
+            : [$this->record->imagePath(), 'image_variants', 'variants/rooms/' . $this->record->id];
+
+        if (!$source || !is_file($source)) {
+            return;
+        }
+
+        $previous = $this->record->getAttribute($column);
+        $variants = ImageVariantService::generate($source, $directory);
+
+        // Variants are derived data; the booking and payment hooks have nothing to track
+        $this->record->forceFill([$column => $variants])->saveQuietly();
+
+        ImageVariantService::delete($previous, ImageVariantService::paths($variants));
+
+        if ($this->record instanceof Room) {
+            ResponseCacheService::forgetRoom($this->record->id);
+        }
+    }
+}
@@ -4,10 +4,14 @@
 
 use Illuminate\Database\Eloquent\Model;
 use Illuminate\Database\Eloquent\Factories\HasFactory;
+use App\Models\Concerns\Archivable;
+use App\Services\RoomInventoryService;
+use App\Services\ReportRollupService;
+use App\Services\UserStatsService;
 
 class Booking extends Model
 {
-    use HasFactory;
+    use HasFactory, Archivable;
 
     protected $fillable = [
         'user_id',
@@ -39,6 +43,31 @@ class Booking extends Model
         'cancelled_at' => 'datetime',
     ];
 
+    /**
+     * Keep the room-night inventory, user stats and report rollups in step with booking writes
+     */
+    protected static function booted()
+    {
+        static::created(function (Booking $booking) {
+            RoomInventoryService::sync($booking);
+            UserStatsService::bookingCreated($booking);
+            ReportRollupService::bookingCreated($booking);
+        });
+
+        static::updated(function (Booking $booking) {
+            RoomInventoryService::syncChanges($booking);
+            UserStatsService::bookingChanged($booking);
+            ReportRollupService::bookingUpdated($booking);
+        });
+
+        static::deleted(function (Booking $booking) {
+            RoomInventoryService::release($booking);
+            RoomInventoryService::forgetCalendarFor($booking);
+            UserStatsService::bookingDeleted($booking);
+            ReportRollupService::bookingDeleted($booking);
+        });
+    }
+
     public function user()
     {
         return $this->belongsTo(User::class);
@@ -58,5 +87,9 @@ public function reviews()
     {
         return $this->hasMany(Review::class);
     }
-}
+
+    public function roomNights()
+    {
+        return $this->hasMany(RoomNight::class);
+    }
 }
@@ -0,0 +1,20 @@
+<?php
+
+namespace App\Models\Concerns;
+
+trait Archivable
+{
+    /**
+     * Query the model's archive table, filled by the lifecycle job
+     *
+     * Archived rows carry the live columns plus archive_month and archived_at.
+     * They are read-only copies: saving one would write to the archive table
+     * and skip the derived-data hooks that only apply to live rows.
+     */
+    public static function archived()
+    {
+        $model = new static;
+
+        return $model->setTable($model->getTable() . '_archive')->newQuery();
+    }
+}
@@ -0,0 +1,24 @@
+<?php
+
+namespace App\Models;
+
+use Illuminate\Database\Eloquent\Model;
+
+class DailyRollup extends Model
+{
+    protected $fillable = [
+        'day',
+        'metric',
+        'room_type',
+        'payment_method',
+        'status',
+        'records',
+        'amount',
+    ];
+
+    protected $casts = [
+        'day' => 'date',
+        'records' => 'integer',
+        'amount' => 'decimal:2',
+    ];
+}
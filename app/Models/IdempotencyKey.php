@@ -0,0 +1,20 @@
+<?php
+
+namespace App\Models;
+
+use Illuminate\Database\Eloquent\Model;
+
+class IdempotencyKey extends Model
+{
+    protected $fillable = [
+        'key',
+        'scope',
+        'fingerprint',
+        'response_status',
+        'response_body',
+    ];
+
+    protected $casts = [
+        'response_status' => 'integer',
+    ];
+}
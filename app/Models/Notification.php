@@ -4,10 +4,11 @@
 
 use Illuminate\Database\Eloquent\Model;
 use Illuminate\Database\Eloquent\Factories\HasFactory;
+use App\Models\Concerns\Archivable;
 
 class Notification extends Model
 {
-    use HasFactory;
+    use HasFactory, Archivable;
 
     protected $fillable = [
         'user_id',
@@ -0,0 +1,23 @@
+<?php
+
+namespace App\Models;
+
+use Illuminate\Database\Eloquent\Model;
+
+class NotificationDeadLetter extends Model
+{
+    protected $fillable = [
+        'payload',
+        'row_count',
+        'error',
+        'attempts',
+        'replayed_at',
+    ];
+
+    protected $casts = [
+        'payload' => 'array',
+        'row_count' => 'integer',
+        'attempts' => 'integer',
+        'replayed_at' => 'datetime',
+    ];
+}
@@ -4,10 +4,15 @@
 
 use Illuminate\Database\Eloquent\Model;
 use Illuminate\Database\Eloquent\Factories\HasFactory;
+use App\Models\Concerns\Archivable;
+use Illuminate\Support\Facades\Storage;
+use App\Services\ImageVariantService;
+use App\Services\ReportRollupService;
+use App\Services\UserStatsService;
 
 class Payment extends Model
 {
-    use HasFactory;
+    use HasFactory, Archivable;
 
     protected $fillable = [
         'booking_id',
@@ -30,8 +35,30 @@ class Payment extends Model
     protected $casts = [
         'amount' => 'decimal:2',
         'verified_at' => 'datetime',
+        'proof_variants' => 'array',
     ];
 
+    /**
+     * Keep the payer's lifetime spend and report rollups in step with payment writes
+     */
+    protected static function booted()
+    {
+        static::created(function (Payment $payment) {
+            UserStatsService::paymentCreated($payment);
+            ReportRollupService::paymentCreated($payment);
+        });
+
+        static::updated(function (Payment $payment) {
+            UserStatsService::paymentUpdated($payment);
+            ReportRollupService::paymentUpdated($payment);
+        });
+
+        static::deleted(function (Payment $payment) {
+            UserStatsService::paymentDeleted($payment);
+            ReportRollupService::paymentDeleted($payment);
+        });
+    }
+
     /**
      * Get the booking associated with this payment
      */
@@ -39,4 +66,25 @@ public function booking()
     {
         return $this->belongsTo(Booking::class, 'booking_id', 'booking_id');
     }
+
+    /**
+     * Absolute path of the uploaded payment proof
+     */
+    public function proofPath()
+    {
+        return $this->proof_file ? Storage::disk('public')->path($this->proof_file) : null;
+    }
+
+    /**
+     * URL of the proof at a variant size, falling back to the original until variants exist
+     */
+    public function proofUrl($size = 'full', $format = 'webp')
+    {
+        if (!$this->proof_file) {
+            return null;
+        }
+
+        return ImageVariantService::url($this->proof_variants, $size, $format)
+            ?? asset('storage/' . $this->proof_file);
+    }
 }
@@ -0,0 +1,43 @@
+<?php
+
+namespace App\Models;
+
+use App\Services\ApiTokenService;
+use Laravel\Sanctum\PersonalAccessToken as SanctumPersonalAccessToken;
+
+class PersonalAccessToken extends SanctumPersonalAccessToken
+{
+    /**
+     * Drop the cached copy whenever the token itself changes or is revoked
+     */
+    protected static function booted()
+    {
+        static::updated(fn (PersonalAccessToken $token) => ApiTokenService::forget($token));
+        static::deleted(fn (PersonalAccessToken $token) => ApiTokenService::forget($token));
+    }
+
+    /**
+     * Find the token instance matching the given token, from the cache when possible
+     */
+    public static function findToken($token)
+    {
+        return ApiTokenService::find($token, fn ($plainText) => parent::findToken($plainText));
+    }
+
+    /**
+     * Sanctum saves last_used_at on every authenticated request; skip that write
+     *
+     * ApiTokenService records the use when it resolves the token and
+     * tokens:flush-usage writes it.
+     */
+    public function save(array $options = [])
+    {
+        if ($this->exists && array_keys($this->getDirty()) === ['last_used_at']) {
+            $this->syncOriginalAttribute('last_used_at');
+
+            return true;
+        }
+
+        return parent::save($options);
+    }
+}
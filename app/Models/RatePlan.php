@@ -0,0 +1,61 @@
+<?php
+
+namespace App\Models;
+
+use Illuminate\Database\Eloquent\Model;
+use App\Services\PricingService;
+
+class RatePlan extends Model
+{
+    protected $fillable = [
+        'room_id',
+        'room_type',
+        'name',
+        'price',
+        'starts_on',
+        'ends_on',
+        'weekdays',
+        'priority',
+    ];
+
+    protected $casts = [
+        'price' => 'decimal:2',
+        'starts_on' => 'date',
+        'ends_on' => 'date',
+        'priority' => 'integer',
+    ];
+
+    /**
+     * Drop memoized quotes whenever a plan changes
+     */
+    protected static function booted()
+    {
+        static::saved(fn () => PricingService::forgetQuotes());
+        static::deleted(fn () => PricingService::forgetQuotes());
+    }
+
+    public function room()
+    {
+        return $this->belongsTo(Room::class);
+    }
+
+    /**
+     * Whether the plan applies to a night (Carbon date)
+     */
+    public function coversNight($night)
+    {
+        if ($this->starts_on && $night->lt($this->starts_on)) {
+            return false;
+        }
+
+        if ($this->ends_on && $night->gt($this->ends_on)) {
+            return false;
+        }
+
+        if ($this->weekdays !== null && $this->weekdays !== '') {
+            return in_array($night->dayOfWeekIso, array_map('intval', explode(',', $this->weekdays)), true);
+        }
+
+        return true;
+    }
+}
@@ -3,9 +3,18 @@
 namespace App\Models;
 
 use Illuminate\Database\Eloquent\Model;
+use Illuminate\Database\Eloquent\Factories\HasFactory;
+use Illuminate\Support\Facades\Storage;
+use App\Services\ImageVariantService;
+use App\Services\PricingService;
+use App\Services\ResponseCacheService;
+use App\Services\RoomInventoryService;
+use App\Services\RoomSearchService;
 
 class Room extends Model
 {
+    use HasFactory;
+
     protected $fillable = [
         'room_title',
         'room_type',
@@ -23,10 +32,41 @@ class Room extends Model
 
     protected $casts = [
         'amenities' => 'array',
+        'image_variants' => 'array',
         'price' => 'decimal:2',
         'capacity' => 'integer',
+        'rating_avg' => 'float',
+        'review_count' => 'integer',
     ];
 
+    /**
+     * Keep the amenity index in step and drop memoized quotes and cached API responses when a room changes
+     */
+    protected static function booted()
+    {
+        static::created(function (Room $room) {
+            RoomSearchService::syncAmenities($room);
+            ResponseCacheService::forgetRoom($room->id);
+        });
+
+        static::updated(function (Room $room) {
+            if ($room->wasChanged('amenities')) {
+                RoomSearchService::syncAmenities($room);
+            }
+            if ($room->wasChanged(['price', 'room_type'])) {
+                PricingService::forgetQuotes();
+            }
+            ResponseCacheService::forgetRoom($room->id);
+        });
+
+        static::deleted(fn (Room $room) => ResponseCacheService::forgetRoom($room->id));
+    }
+
+    public function ratePlans()
+    {
+        return $this->hasMany(RatePlan::class);
+    }
+
     public function bookings()
     {
         return $this->hasMany(Booking::class);
@@ -37,26 +77,56 @@ public function reviews()
         return $this->hasMany(Review::class);
     }
 
-    public function isAvailable($checkIn, $checkOut)
+    /**
+     * Absolute path of the uploaded image
+     *
+     * API uploads live on the public disk under rooms/; the older admin panel
+     * moved files into public/room and stored only the file name.
+     */
+    public function imagePath()
+    {
+        if (!$this->image) {
+            return null;
+        }
+
+        return str_contains($this->image, '/')
+            ? Storage::disk('public')->path($this->image)
+            : public_path('room/' . $this->image);
+    }
+
+    /**
+     * URL of the image at a variant size, falling back to the original until variants exist
+     */
+    public function imageUrl($size = 'full', $format = 'webp')
     {
-        $bookings = $this->bookings()
-            ->where('status', '!=', 'cancelled')
-            ->where('paid_status', 'paid')
-            ->where(function ($query) use ($checkIn, $checkOut) {
-                $query->whereBetween('check_in', [$checkIn, $checkOut])
-                    ->orWhereBetween('check_out', [$checkIn, $checkOut])
-                    ->orWhere(function ($q) use ($checkIn, $checkOut) {
-                        $q->where('check_in', '<=', $checkIn)
-                          ->where('check_out', '>=', $checkOut);
-                    });
-            })
-            ->exists();
+        if (!$this->image) {
+            return null;
+        }
 
-        return !$bookings;
+        return ImageVariantService::url($this->image_variants, $size, $format)
+            ?? (str_contains($this->image, '/') ? asset('storage/' . $this->image) : asset('room/' . $this->image));
+    }
+
+    public function isAvailable($checkIn, $checkOut)
+    {
+        return RoomInventoryService::isAvailable($this->room_type, $checkIn, $checkOut);
     }
 
     public function averageRating()
     {
-        return $this->reviews()->avg('rating') ?? 0;
+        return (float) $this->rating_avg;
+    }
+
+    /**
+     * Number of reviews per star rating, 1 to 5
+     */
+    public function ratingHistogram()
+    {
+        $histogram = [];
+        foreach (range(1, 5) as $stars) {
+            $histogram[$stars] = (int) $this->getAttribute("stars_{$stars}");
+        }
+
+        return $histogram;
     }
 }
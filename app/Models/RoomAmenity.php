@@ -0,0 +1,23 @@
+<?php
+
+namespace App\Models;
+
+use Illuminate\Database\Eloquent\Model;
+
+class RoomAmenity extends Model
+{
+    public $timestamps = false;
+
+    protected $fillable = [
+        'room_id',
+        'amenity',
+    ];
+
+    /**
+     * Get the room offering this amenity
+     */
+    public function room()
+    {
+        return $this->belongsTo(Room::class);
+    }
+}
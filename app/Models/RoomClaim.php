@@ -0,0 +1,23 @@
+<?php
+
+namespace App\Models;
+
+use Illuminate\Database\Eloquent\Model;
+
+class RoomClaim extends Model
+{
+    protected $fillable = [
+        'room_type',
+        'night',
+        'booking_id',
+    ];
+
+    protected $casts = [
+        'night' => 'date',
+    ];
+
+    public function booking()
+    {
+        return $this->belongsTo(Booking::class);
+    }
+}
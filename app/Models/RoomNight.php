@@ -0,0 +1,27 @@
+<?php
+
+namespace App\Models;
+
+use Illuminate\Database\Eloquent\Model;
+
+class RoomNight extends Model
+{
+    protected $fillable = [
+        'booking_id',
+        'room_type',
+        'night',
+        'status',
+    ];
+
+    protected $casts = [
+        'night' => 'date',
+    ];
+
+    /**
+     * Get the booking that holds this night
+     */
+    public function booking()
+    {
+        return $this->belongsTo(Booking::class);
+    }
+}
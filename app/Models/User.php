@@ -3,6 +3,7 @@
 namespace App\Models;
 
 // use Illuminate\Contracts\Auth\MustVerifyEmail;
+use App\Services\ApiTokenService;
 use Illuminate\Database\Eloquent\Factories\HasFactory;
 use Illuminate\Foundation\Auth\User as Authenticatable;
 use Illuminate\Notifications\Notifiable;
@@ -69,6 +70,15 @@ protected function casts(): array
         ];
     }
 
+    /**
+     * Cached token lookups carry the user, so drop them when the user changes
+     */
+    protected static function booted()
+    {
+        static::updated(fn (User $user) => ApiTokenService::forgetUser($user));
+        static::deleted(fn (User $user) => ApiTokenService::forgetUser($user));
+    }
+
     /**
      * Get the bookings for the user
      */
@@ -85,6 +95,14 @@ public function notifications()
         return $this->hasMany(Notification::class);
     }
 
+    /**
+     * Get the materialized booking/spend stats for the user
+     */
+    public function stats()
+    {
+        return $this->hasOne(UserStat::class);
+    }
+
     /**
      * Get the reviews by the user
      */
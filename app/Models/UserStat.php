@@ -0,0 +1,35 @@
+<?php
+
+namespace App\Models;
+
+use Illuminate\Database\Eloquent\Model;
+
+class UserStat extends Model
+{
+    protected $primaryKey = 'user_id';
+
+    public $incrementing = false;
+
+    protected $fillable = [
+        'user_id',
+        'booking_count',
+        'cancellation_count',
+        'lifetime_spend',
+        'last_stay_at',
+    ];
+
+    protected $casts = [
+        'booking_count' => 'integer',
+        'cancellation_count' => 'integer',
+        'lifetime_spend' => 'decimal:2',
+        'last_stay_at' => 'datetime',
+    ];
+
+    /**
+     * Get the user these stats belong to
+     */
+    public function user()
+    {
+        return $this->belongsTo(User::class);
+    }
+}
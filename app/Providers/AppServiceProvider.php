@@ -2,7 +2,18 @@
 
 namespace App\Providers;
 
+use App\Models\PersonalAccessToken;
+use App\Services\NotificationService;
+use App\Services\RequestMetricsService;
+use App\Services\ResponseCacheService;
+use Illuminate\Support\Facades\DB;
+use Illuminate\Support\Facades\Event;
 use Illuminate\Support\ServiceProvider;
+use Laravel\Octane\Events\RequestReceived;
+use Laravel\Octane\Events\RequestTerminated;
+use Laravel\Octane\Events\WorkerStarting;
+use Laravel\Octane\Events\WorkerStopping;
+use Laravel\Sanctum\Sanctum;
 
 class AppServiceProvider extends ServiceProvider
 {
@@ -19,6 +30,21 @@ public function register(): void
      */
     public function boot(): void
     {
-        //
+        // Feeds the per-request query numbers collected by RecordRequestMetrics
+        DB::listen(fn ($query) => RequestMetricsService::recordQuery($query));
+
+        // Cached token resolution with buffered last_used_at writes
+        Sanctum::usePersonalAccessTokenModel(PersonalAccessToken::class);
+
+        // Under Octane one booted app serves many requests: reset static per-request state
+        Event::listen(RequestReceived::class, fn () => NotificationService::servingRequest(true));
+        Event::listen(RequestTerminated::class, function () {
+            NotificationService::servingRequest(false);
+            RequestMetricsService::finish();
+        });
+
+        // Octane workers buffer response cache stats across requests and write them on the way out
+        Event::listen(WorkerStarting::class, fn () => ResponseCacheService::longLived(true));
+        Event::listen(WorkerStopping::class, fn () => ResponseCacheService::flushStats(true));
     }
 }
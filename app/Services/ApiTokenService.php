@@ -0,0 +1,210 @@
+<?php
+
+namespace App\Services;
+
+use App\Models\PersonalAccessToken;
+use App\Models\User;
+use Carbon\Carbon;
+use Illuminate\Support\Facades\Cache;
+use Illuminate\Support\Facades\DB;
+
+class ApiTokenService
+{
+    /**
+     * Seconds a resolved token (with its user) is served from the cache
+     */
+    const TTL = 60;
+
+    /**
+     * Seconds a recorded use waits in the cache for flushUsage()
+     */
+    const USAGE_TTL = 86400;
+
+    /**
+     * Seconds the per-minute lists of used token ids are kept
+     */
+    const USED_LIST_TTL = 3600;
+
+    /**
+     * Tokens written per UPDATE statement
+     */
+    const FLUSH_CHUNK = 500;
+
+    /**
+     * Cache key holding the last minute flushUsage() has written (YmdHi)
+     */
+    const FLUSHED_KEY = 'api-tokens:flushed-through';
+
+    /**
+     * Resolve a bearer token to its PersonalAccessToken, with the tokenable user loaded
+     *
+     * Misses fall through to Sanctum's own lookup; unknown tokens are not cached.
+     * A miss also records the token's use, so a token in steady use is
+     * recorded once per TTL without any extra cache call on the hits.
+     */
+    public static function find(string $plainText, callable $lookup)
+    {
+        $id = null;
+        $secret = $plainText;
+
+        if (str_contains($plainText, '|')) {
+            [$id, $secret] = explode('|', $plainText, 2);
+        }
+
+        $token = Cache::get(static::key(hash('sha256', $secret)));
+
+        if (!$token) {
+            $token = $lookup($plainText);
+
+            if (!$token) {
+                return null;
+            }
+
+            $token->loadMissing('tokenable');
+            Cache::put(static::key($token->token), $token, static::TTL);
+            static::recordUse($token->getKey());
+        }
+
+        // The id prefix must still match the token the secret belongs to
+        if ($id !== null && (string) $token->getKey() !== (string) $id) {
+            return null;
+        }
+
+        return $token;
+    }
+
+    /**
+     * Evict a token, e.g. on logout, revocation or ability changes
+     */
+    public static function forget(PersonalAccessToken $token)
+    {
+        Cache::forget(static::key($token->getOriginal('token') ?? $token->token));
+    }
+
+    /**
+     * Evict every token of a user whose record changed
+     */
+    public static function forgetUser(User $user)
+    {
+        $user->tokens()->pluck('token')->each(fn ($hash) => Cache::forget(static::key($hash)));
+    }
+
+    /**
+     * Write the recorded last_used_at values; returns how many tokens were updated
+     *
+     * Only the tokens listed as used in the minutes since the last flush are
+     * read, so the cost follows recent use rather than the size of the token
+     * table. The current minute is left for the next run.
+     */
+    public static function flushUsage()
+    {
+        $current = now()->startOfMinute();
+        $through = Cache::get(static::FLUSHED_KEY);
+
+        $minute = $current->copy()->subSeconds(static::USED_LIST_TTL);
+        if ($through) {
+            $minute = $minute->max(Carbon::createFromFormat('YmdHi', $through)->startOfMinute()->addMinute());
+        }
+
+        $minutes = [];
+        for (; $minute->lt($current); $minute->addMinute()) {
+            $minutes[] = $minute->format('YmdHi');
+        }
+
+        if (!$minutes) {
+            return 0;
+        }
+
+        $counts = Cache::many(array_map(fn ($m) => static::usedCountKey($m), $minutes));
+
+        $slots = [];
+        foreach ($minutes as $m) {
+            for ($i = 1; $i <= (int) ($counts[static::usedCountKey($m)] ?? 0); $i++) {
+                $slots[] = static::usedSlotKey($m, $i);
+            }
+        }
+
+        $ids = array_values(array_unique(array_filter($slots ? Cache::many($slots) : [])));
+        $flushed = 0;
+
+        foreach (array_chunk($ids, static::FLUSH_CHUNK) as $chunk) {
+            $recorded = Cache::many(array_map(fn ($id) => static::usageKey($id), $chunk));
+
+            $usage = [];
+            foreach (PersonalAccessToken::whereIn('id', $chunk)->get(['id', 'last_used_at']) as $token) {
+                $usedAt = $recorded[static::usageKey($token->getKey())] ?? null;
+
+                if ($usedAt && $usedAt > (string) $token->last_used_at?->toDateTimeString()) {
+                    $usage[$token->getKey()] = $usedAt;
+                }
+            }
+
+            if ($usage) {
+                static::writeUsage($usage);
+                $flushed += count($usage);
+            }
+        }
+
+        Cache::forever(static::FLUSHED_KEY, end($minutes));
+
+        return $flushed;
+    }
+
+    /**
+     * Record a token's use and list its id under the current minute
+     *
+     * Each id takes its own numbered slot, so recording never rewrites a
+     * shared list; it happens once per TTL for a token in steady use.
+     */
+    protected static function recordUse($id)
+    {
+        $minute = now()->format('YmdHi');
+        $countKey = static::usedCountKey($minute);
+
+        Cache::put(static::usageKey($id), now()->toDateTimeString(), static::USAGE_TTL);
+
+        Cache::add($countKey, 0, static::USED_LIST_TTL);
+        Cache::put(static::usedSlotKey($minute, Cache::increment($countKey)), $id, static::USED_LIST_TTL);
+    }
+
+    /**
+     * One UPDATE ... CASE statement for a batch of token id => last use
+     */
+    protected static function writeUsage(array $usage)
+    {
+        $cases = [];
+        $bindings = [];
+        foreach ($usage as $id => $usedAt) {
+            $cases[] = 'WHEN ? THEN ?';
+            array_push($bindings, (int) $id, $usedAt);
+        }
+
+        $ids = array_map('intval', array_keys($usage));
+        $placeholders = implode(', ', array_fill(0, count($ids), '?'));
+
+        DB::update(
+            'UPDATE personal_access_tokens SET last_used_at = CASE id ' . implode(' ', $cases) . " END WHERE id IN ({$placeholders})",
+            array_merge($bindings, $ids)
+        );
+    }
+
+    protected static function key(string $hash)
+    {
+        return 'api-tokens:' . $hash;
+    }
+
+    protected static function usageKey($id)
+    {
+        return 'api-tokens:used:' . $id;
+    }
+
+    protected static function usedCountKey($minute)
+    {
+        return 'api-tokens:used-in:' . $minute;
+    }
+
+    protected static function usedSlotKey($minute, $slot)
+    {
+        return 'api-tokens:used-in:' . $minute . ':' . $slot;
+    }
+}
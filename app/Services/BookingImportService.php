@@ -0,0 +1,231 @@
+<?php
+
+namespace App\Services;
+
+use App\Http\Controllers\Api\BookingController;
+use App\Models\Booking;
+use App\Models\RoomClaim;
+use App\Models\RoomNight;
+use App\Models\User;
+use Carbon\Carbon;
+use Illuminate\Support\Facades\DB;
+use Illuminate\Support\Facades\Validator;
+
+class BookingImportService
+{
+    /**
+     * Bookings written per INSERT statement and transaction
+     */
+    const INSERT_CHUNK = 500;
+
+    /**
+     * Values bound per WHERE IN lookup
+     */
+    const LOOKUP_CHUNK = 500;
+
+    /**
+     * Import bookings from NDJSON lines
+     *
+     * Returns a report with one result per non-empty line: created, invalid,
+     * duplicate, unavailable (a night is claimed, booked or taken by an
+     * earlier line) or failed (the chunk it was in could not be written).
+     */
+    public static function import(iterable $lines)
+    {
+        $results = [];
+        $rows = [];
+
+        // Parse and validate everything first
+        $lineNumber = 0;
+        foreach ($lines as $line) {
+            $lineNumber++;
+            if (trim($line) === '') {
+                continue;
+            }
+
+            $data = json_decode($line, true);
+            if (!is_array($data)) {
+                $results[$lineNumber] = static::result($lineNumber, null, 'invalid', ['Line is not a JSON object']);
+                continue;
+            }
+
+            $validator = Validator::make($data, BookingController::BOOKING_RULES);
+            if ($validator->fails()) {
+                $results[$lineNumber] = static::result($lineNumber, $data['bookingId'] ?? null, 'invalid', $validator->errors()->all());
+                continue;
+            }
+
+            $rows[$lineNumber] = $validator->validated();
+        }
+
+        // Drop booking ids repeated in the file or already stored
+        $existing = static::existingBookingIds(array_column($rows, 'bookingId'));
+        $seen = [];
+        foreach ($rows as $lineNumber => $row) {
+            $bookingId = $row['bookingId'];
+            if (isset($existing[$bookingId]) || isset($seen[$bookingId])) {
+                $results[$lineNumber] = static::result($lineNumber, $bookingId, 'duplicate', ['Booking ID already exists']);
+                unset($rows[$lineNumber]);
+                continue;
+            }
+            $seen[$bookingId] = true;
+        }
+
+        // Drop stays that overlap a claimed or booked night, or a line above them
+        $taken = static::takenNights($rows);
+        foreach ($rows as $lineNumber => $row) {
+            $nights = array_map(
+                fn ($night) => $row['roomType'] . '|' . $night,
+                RoomInventoryService::nightsBetween($row['checkin'], $row['checkout'])
+            );
+
+            if (array_intersect_key(array_flip($nights), $taken)) {
+                $results[$lineNumber] = static::result($lineNumber, $row['bookingId'], 'unavailable', ['Room is not available for the selected dates']);
+                unset($rows[$lineNumber]);
+                continue;
+            }
+            $taken += array_fill_keys($nights, true);
+        }
+
+        $users = static::usersByEmail(array_filter(array_column($rows, 'userEmail')));
+
+        foreach (array_chunk($rows, static::INSERT_CHUNK, true) as $chunk) {
+            try {
+                $ids = static::insertChunk($chunk, $users);
+
+                foreach ($chunk as $lineNumber => $row) {
+                    $results[$lineNumber] = static::result($lineNumber, $row['bookingId'], 'created') + ['id' => $ids[$row['bookingId']] ?? null];
+                }
+            } catch (\Exception $e) {
+                foreach ($chunk as $lineNumber => $row) {
+                    $results[$lineNumber] = static::result($lineNumber, $row['bookingId'], 'failed', [$e->getMessage()]);
+                }
+            }
+        }
+
+        ksort($results);
+        $created = count(array_filter($results, fn ($result) => $result['status'] === 'created'));
+
+        return [
+            'total' => count($results),
+            'created' => $created,
+            'rejected' => count($results) - $created,
+            'results' => array_values($results),
+        ];
+    }
+
+    /**
+     * Insert one chunk of validated rows and bring the derived tables up to date
+     *
+     * Returns the new primary keys keyed by booking id.
+     */
+    protected static function insertChunk(array $chunk, $users)
+    {
+        return DB::transaction(function () use ($chunk, $users) {
+            $now = now()->toDateTimeString();
+
+            Booking::insert(array_map(fn ($row) => [
+                'user_id' => optional($users->get($row['userEmail'] ?? ''))->id,
+                'booking_id' => $row['bookingId'],
+                'first_name' => $row['firstName'],
+                'last_name' => $row['lastName'],
+                'email' => $row['email'],
+                'phone' => $row['phone'],
+                'room_type' => $row['roomType'],
+                'check_in' => Carbon::parse($row['checkin'])->toDateTimeString(),
+                'check_out' => Carbon::parse($row['checkout'])->toDateTimeString(),
+                'guests' => $row['guests'],
+                'nights' => $row['nights'],
+                'rate' => $row['rate'],
+                'total' => $row['total'],
+                'status' => 'confirmed',
+                'special_requests' => $row['specialRequests'] ?? null,
+                'created_at' => $now,
+                'updated_at' => $now,
+            ], array_values($chunk)));
+
+            // Multi-row inserts skip the model events, so feed the derived tables directly
+            $bookings = Booking::whereIn('booking_id', array_column($chunk, 'bookingId'))->get();
+
+            // A reservation that took one of the nights since the check fails the chunk
+            ReservationService::claimMany($bookings);
+            RoomInventoryService::insertFor($bookings);
+            ReportRollupService::bookingsInserted($bookings);
+            UserStatsService::refreshUsers($bookings->pluck('user_id')->all());
+
+            $owners = $users->keyBy('id');
+            foreach ($bookings as $booking) {
+                if ($booking->user_id) {
+                    NotificationService::notifyBookingConfirmation($booking, $owners->get($booking->user_id));
+                }
+            }
+
+            return $bookings->pluck('id', 'booking_id')->all();
+        });
+    }
+
+    /**
+     * Booking ids that are already stored, as a lookup set
+     */
+    protected static function existingBookingIds(array $bookingIds)
+    {
+        $existing = [];
+        foreach (array_chunk(array_unique($bookingIds), static::LOOKUP_CHUNK) as $chunk) {
+            foreach (Booking::whereIn('booking_id', $chunk)->pluck('booking_id') as $bookingId) {
+                $existing[$bookingId] = true;
+            }
+        }
+
+        return $existing;
+    }
+
+    /**
+     * Claimed or booked nights within the rows' stays, as a "room_type|Y-m-d" lookup set
+     */
+    protected static function takenNights(array $rows)
+    {
+        $taken = [];
+
+        foreach (collect($rows)->groupBy('roomType') as $roomType => $stays) {
+            $range = [
+                $stays->min(fn ($row) => Carbon::parse($row['checkin'])->toDateString()),
+                $stays->max(fn ($row) => Carbon::parse($row['checkout'])->toDateString()),
+            ];
+
+            $nights = RoomClaim::where('room_type', $roomType)->whereBetween('night', $range)->toBase()->pluck('night')
+                ->concat(RoomNight::where('room_type', $roomType)->where('status', 'booked')->whereBetween('night', $range)->toBase()->pluck('night'));
+
+            foreach ($nights as $night) {
+                $taken[$roomType . '|' . substr($night, 0, 10)] = true;
+            }
+        }
+
+        return $taken;
+    }
+
+    /**
+     * Users for a set of emails, keyed by email
+     */
+    protected static function usersByEmail(array $emails)
+    {
+        $users = collect();
+        foreach (array_chunk(array_unique($emails), static::LOOKUP_CHUNK) as $chunk) {
+            $users = $users->concat(User::whereIn('email', $chunk)->get());
+        }
+
+        return $users->keyBy('email');
+    }
+
+    /**
+     * One line of the import report
+     */
+    protected static function result($line, $bookingId, $status, array $errors = [])
+    {
+        return [
+            'line' => $line,
+            'booking_id' => $bookingId,
+            'status' => $status,
+            'errors' => $errors,
+        ];
+    }
+}
@@ -0,0 +1,222 @@
+<?php
+
+namespace App\Services;
+
+use App\Models\Booking;
+use App\Models\Payment;
+use App\Models\User;
+use Carbon\Carbon;
+
+class ExportService
+{
+    /**
+     * Rows fetched per keyset query
+     */
+    const CHUNK = 1000;
+
+    /**
+     * Exportable datasets
+     */
+    const DATASETS = ['bookings', 'payments', 'users'];
+
+    /**
+     * Stream a dataset as CSV or NDJSON with constant memory.
+     *
+     * Rows are read in id order with keyset chunks and written straight to the
+     * output. Only rows changed before the export started are included; that
+     * moment is returned as X-Export-Watermark and can be passed back as
+     * `since` to pull just the rows changed after it.
+     */
+    public static function response(string $dataset, array $filters, string $format)
+    {
+        $watermark = now()->startOfSecond();
+        [$query, $column, $alias, $map] = static::$dataset($filters, $watermark);
+
+        $headers = [
+            'Content-Type' => $format === 'csv' ? 'text/csv; charset=UTF-8' : 'application/x-ndjson',
+            'Content-Disposition' => 'attachment; filename="' . $dataset . '-' . $watermark->format('Ymd-His') . '.' . $format . '"',
+            'Cache-Control' => 'no-store',
+            'X-Accel-Buffering' => 'no',
+            'X-Export-Watermark' => $watermark->toDateTimeString(),
+        ];
+
+        return response()->stream(function () use ($query, $column, $alias, $map, $format) {
+            $out = fopen('php://output', 'w');
+            $written = 0;
+
+            foreach ($query->lazyById(static::CHUNK, $column, $alias) as $model) {
+                $row = $map($model);
+
+                if ($format === 'csv') {
+                    if ($written === 0) {
+                        fputcsv($out, array_keys($row));
+                    }
+                    fputcsv($out, array_map([static::class, 'csvCell'], $row));
+                } else {
+                    fwrite($out, json_encode($row) . "\n");
+                }
+
+                if (++$written % static::CHUNK === 0) {
+                    flush();
+                }
+            }
+
+            fclose($out);
+        }, 200, $headers);
+    }
+
+    /**
+     * Bookings, filtered like the admin booking list
+     */
+    protected static function bookings(array $filters, Carbon $watermark)
+    {
+        $query = static::changedBetween(Booking::query(), 'updated_at', $filters, $watermark);
+
+        if (isset($filters['status'])) {
+            $query->where('status', $filters['status']);
+        }
+
+        if (isset($filters['paid_status'])) {
+            $query->where('paid_status', $filters['paid_status']);
+        }
+
+        return [$query, 'id', 'id', fn (Booking $booking) => [
+            'id' => $booking->id,
+            'booking_id' => $booking->booking_id,
+            'user_id' => $booking->user_id,
+            'guest_name' => $booking->first_name . ' ' . $booking->last_name,
+            'email' => $booking->email,
+            'phone' => $booking->phone,
+            'room_type' => $booking->room_type,
+            'check_in' => optional($booking->check_in)->toDateTimeString(),
+            'check_out' => optional($booking->check_out)->toDateTimeString(),
+            'guests' => $booking->guests,
+            'nights' => $booking->nights,
+            'rate' => (float) $booking->rate,
+            'total' => (float) $booking->total,
+            'status' => $booking->status,
+            'paid_status' => $booking->paid_status,
+            'refund_amount' => $booking->refund_amount === null ? null : (float) $booking->refund_amount,
+            'cancelled_at' => optional($booking->cancelled_at)->toDateTimeString(),
+            'created_at' => optional($booking->created_at)->toDateTimeString(),
+            'updated_at' => optional($booking->updated_at)->toDateTimeString(),
+        ]];
+    }
+
+    /**
+     * Payments, optionally by status and booking status
+     */
+    protected static function payments(array $filters, Carbon $watermark)
+    {
+        $query = static::changedBetween(Payment::query(), 'updated_at', $filters, $watermark);
+
+        if (isset($filters['status'])) {
+            $query->where('status', $filters['status']);
+        }
+
+        if (isset($filters['paid_status'])) {
+            $query->whereIn('booking_id', Booking::select('booking_id')->where('paid_status', $filters['paid_status']));
+        }
+
+        return [$query, 'id', 'id', fn (Payment $payment) => [
+            'id' => $payment->id,
+            'booking_id' => $payment->booking_id,
+            'transaction_id' => $payment->transaction_id,
+            'payment_method' => $payment->payment_method,
+            'card_last_four' => $payment->card_last_four,
+            'amount' => (float) $payment->amount,
+            'status' => $payment->status,
+            'user_email' => $payment->user_email,
+            'country' => $payment->country,
+            'verified_at' => optional($payment->verified_at)->toDateTimeString(),
+            'created_at' => optional($payment->created_at)->toDateTimeString(),
+            'updated_at' => optional($payment->updated_at)->toDateTimeString(),
+        ]];
+    }
+
+    /**
+     * Guests with their user_stats numbers, filtered like the admin user list
+     */
+    protected static function users(array $filters, Carbon $watermark)
+    {
+        $query = User::where('users.usertype', '!=', 'admin')
+            ->leftJoin('user_stats', 'user_stats.user_id', '=', 'users.id')
+            ->select([
+                'users.*',
+                'user_stats.booking_count',
+                'user_stats.cancellation_count',
+                'user_stats.lifetime_spend',
+                'user_stats.last_stay_at',
+            ]);
+
+        // Stats change without touching users, so a guest counts as changed when either row did
+        static::changedBetween($query, ['users.updated_at', 'user_stats.updated_at'], $filters, $watermark);
+
+        if (isset($filters['min_spent'])) {
+            $query->where('user_stats.lifetime_spend', '>=', $filters['min_spent']);
+        }
+
+        if (isset($filters['min_bookings'])) {
+            $query->where('user_stats.booking_count', '>=', $filters['min_bookings']);
+        }
+
+        if (isset($filters['stayed_since'])) {
+            $query->where('user_stats.last_stay_at', '>=', $filters['stayed_since']);
+        }
+
+        return [$query, 'users.id', 'id', fn (User $user) => [
+            'id' => $user->id,
+            'name' => $user->name,
+            'email' => $user->email,
+            'phone' => $user->phone,
+            'total_bookings' => (int) $user->booking_count,
+            'total_spent' => (float) $user->lifetime_spend,
+            'cancellations' => (int) $user->cancellation_count,
+            'last_stay' => $user->last_stay_at,
+            'created_at' => optional($user->created_at)->toDateTimeString(),
+            'updated_at' => optional($user->updated_at)->toDateTimeString(),
+        ]];
+    }
+
+    /**
+     * Limit to rows changed in [since, watermark), so consecutive pulls neither miss nor repeat a row
+     *
+     * With several columns the latest of them is compared; a NULL column (no
+     * joined row) is ignored.
+     */
+    protected static function changedBetween($query, $columns, array $filters, Carbon $watermark)
+    {
+        $columns = (array) $columns;
+        [$first, $others] = [array_shift($columns), $columns];
+
+        if (isset($filters['since'])) {
+            $since = Carbon::parse($filters['since'])->toDateTimeString();
+
+            $query->where(function ($query) use ($first, $others, $since) {
+                $query->where($first, '>=', $since);
+                foreach ($others as $column) {
+                    $query->orWhere($column, '>=', $since);
+                }
+            });
+        }
+
+        $query->where($first, '<', $watermark->toDateTimeString());
+        foreach ($others as $column) {
+            $query->where(fn ($query) => $query->whereNull($column)->orWhere($column, '<', $watermark->toDateTimeString()));
+        }
+
+        return $query;
+    }
+
+    /**
+     * Keep guest-supplied text from being evaluated as a formula by spreadsheet apps
+     */
+    protected static function csvCell($value)
+    {
+        if (is_string($value) && $value !== '' && str_contains('=+-@', $value[0])) {
+            return "'" . $value;
+        }
+
+        return $value;
+    }
+}
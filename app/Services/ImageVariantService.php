@@ -0,0 +1,200 @@
+<?php
+
+namespace App\Services;
+
+use Illuminate\Support\Facades\Storage;
+use RuntimeException;
+
+class ImageVariantService
+{
+    /**
+     * Variant names and their maximum widths in pixels, smallest first
+     */
+    const SIZES = [
+        'thumb' => 160,
+        'card' => 480,
+        'full' => 1600,
+    ];
+
+    const WEBP_QUALITY = 80;
+
+    const JPEG_QUALITY = 82;
+
+    /**
+     * Whether the GD extension can decode images and write WebP
+     */
+    public static function available()
+    {
+        return function_exists('imagecreatefromstring') && function_exists('imagewebp');
+    }
+
+    /**
+     * Write resized WebP and JPEG copies of an image to the public disk
+     *
+     * Images are decoded and re-encoded, which drops EXIF and other metadata;
+     * camera orientation is applied first so photos stay upright. Images are
+     * never scaled up. Returns, per size name, the width, height and disk
+     * paths of both files.
+     */
+    public static function generate($sourcePath, $directory)
+    {
+        $image = static::load($sourcePath);
+        $name = pathinfo($sourcePath, PATHINFO_FILENAME);
+        $disk = Storage::disk('public');
+        $variants = [];
+
+        try {
+            foreach (static::SIZES as $size => $maxWidth) {
+                $resized = static::resize($image, $maxWidth);
+                $base = trim($directory, '/') . "/{$name}-{$size}";
+
+                $disk->put("{$base}.webp", static::encode($resized, 'webp'));
+
+                $flat = static::flatten($resized);
+                $disk->put("{$base}.jpg", static::encode($flat, 'jpeg'));
+                imagedestroy($flat);
+
+                $variants[$size] = [
+                    'width' => imagesx($resized),
+                    'height' => imagesy($resized),
+                    'webp' => "{$base}.webp",
+                    'jpeg' => "{$base}.jpg",
+                ];
+
+                if ($resized !== $image) {
+                    imagedestroy($resized);
+                }
+            }
+        } finally {
+            imagedestroy($image);
+        }
+
+        return $variants;
+    }
+
+    /**
+     * Public URL of one variant, or null if it has not been generated
+     */
+    public static function url($variants, $size, $format = 'webp')
+    {
+        $path = $variants[$size][$format] ?? null;
+
+        return $path ? asset('storage/' . $path) : null;
+    }
+
+    /**
+     * Every file path a set of variants points at
+     */
+    public static function paths($variants)
+    {
+        $paths = [];
+        foreach ((array) $variants as $variant) {
+            array_push($paths, ...array_filter([$variant['webp'] ?? null, $variant['jpeg'] ?? null]));
+        }
+
+        return $paths;
+    }
+
+    /**
+     * Remove variant files from the public disk
+     */
+    public static function delete($variants, array $keep = [])
+    {
+        $paths = array_diff(static::paths($variants), $keep);
+
+        if ($paths) {
+            Storage::disk('public')->delete(array_values($paths));
+        }
+    }
+
+    /**
+     * Decode an image file into a true-colour GD image, upright
+     */
+    protected static function load($path)
+    {
+        $contents = @file_get_contents($path);
+        $image = $contents === false ? false : @imagecreatefromstring($contents);
+
+        if (!$image) {
+            throw new RuntimeException("Unreadable image: {$path}");
+        }
+
+        if (!imageistruecolor($image)) {
+            imagepalettetotruecolor($image);
+        }
+        imagealphablending($image, false);
+        imagesavealpha($image, true);
+
+        return static::orient($image, $path);
+    }
+
+    /**
+     * Apply the EXIF orientation of a JPEG, since re-encoding drops the tag
+     */
+    protected static function orient($image, $path)
+    {
+        if (!function_exists('exif_read_data')) {
+            return $image;
+        }
+
+        $exif = @exif_read_data($path);
+        $angle = match ((int) ($exif['Orientation'] ?? 1)) {
+            3 => 180,
+            6 => -90,
+            8 => 90,
+            default => 0,
+        };
+
+        if ($angle === 0) {
+            return $image;
+        }
+
+        $rotated = imagerotate($image, $angle, 0);
+        imagedestroy($image);
+
+        return $rotated;
+    }
+
+    /**
+     * Scale an image down to a maximum width, keeping its aspect ratio
+     */
+    protected static function resize($image, $maxWidth)
+    {
+        if (imagesx($image) <= $maxWidth) {
+            return $image;
+        }
+
+        $resized = imagescale($image, $maxWidth, -1, IMG_BICUBIC);
+        imagealphablending($resized, false);
+        imagesavealpha($resized, true);
+
+        return $resized;
+    }
+
+    /**
+     * Copy of an image composited onto white, for formats without alpha
+     */
+    protected static function flatten($image)
+    {
+        $flat = imagecreatetruecolor(imagesx($image), imagesy($image));
+        imagefill($flat, 0, 0, imagecolorallocate($flat, 255, 255, 255));
+        imagealphablending($flat, true);
+        imagecopy($flat, $image, 0, 0, 0, 0, imagesx($image), imagesy($image));
+
+        return $flat;
+    }
+
+    /**
+     * Encode an image to a string in the given format
+     */
+    protected static function encode($image, $format)
+    {
+        ob_start();
+
+        $format === 'webp'
+            ? imagewebp($image, null, static::WEBP_QUALITY)
+            : imagejpeg($image, null, static::JPEG_QUALITY);
+
+        return ob_get_clean();
+    }
+}
@@ -0,0 +1,288 @@
+<?php
+
+namespace App\Services;
+
+use App\Models\Booking;
+use App\Models\Notification;
+use App\Models\Payment;
+use Carbon\Carbon;
+use Illuminate\Support\Facades\DB;
+
+class LifecycleService
+{
+    /**
+     * Live columns copied to each archive table
+     */
+    const COLUMNS = [
+        'bookings' => [
+            'id', 'user_id', 'booking_id', 'first_name', 'last_name', 'email', 'phone', 'room_type',
+            'check_in', 'check_out', 'guests', 'nights', 'rate', 'total', 'refund_amount', 'cancelled_at',
+            'special_requests', 'status', 'paid_status', 'paid', 'payment_ref', 'created_at', 'updated_at',
+        ],
+        'payments' => [
+            'id', 'booking_id', 'transaction_id', 'payment_method', 'cardholder_name', 'card_last_four',
+            'amount', 'status', 'proof_file', 'proof_variants', 'verified_at', 'verified_comment',
+            'billing_address', 'city', 'zip_code', 'country', 'user_email', 'created_at', 'updated_at',
+        ],
+        'notifications' => [
+            'id', 'user_id', 'booking_id', 'type', 'title', 'message', 'status', 'read_at', 'created_at', 'updated_at',
+        ],
+    ];
+
+    /**
+     * Booking statuses that are final and may be archived
+     */
+    const SETTLED_STATUSES = ['completed', 'cancelled'];
+
+    /**
+     * Mark paid, confirmed bookings whose check-out has passed as completed
+     *
+     * Unpaid stays are left to expireUnpaidHolds(), so a no-show is never
+     * counted as completed. Set-based per chunk: only the report rollups
+     * bucket by status, so they are moved explicitly instead of loading and
+     * saving every booking.
+     */
+    public static function completePastStays()
+    {
+        $completed = 0;
+
+        Booking::where('status', 'confirmed')
+            ->where('paid_status', 'paid')
+            ->where('check_out', '<', now())
+            ->select(['id', 'room_type', 'status', 'total', 'created_at'])
+            ->chunkById(static::chunkSize(), function ($bookings) use (&$completed) {
+                DB::transaction(function () use ($bookings) {
+                    Booking::whereIn('id', $bookings->modelKeys())->toBase()->update([
+                        'status' => 'completed',
+                        'updated_at' => now(),
+                    ]);
+
+                    ReportRollupService::bookingsStatusChanged($bookings, 'completed');
+                });
+
+                $completed += $bookings->count();
+            });
+
+        return $completed;
+    }
+
+    /**
+     * Cancel unpaid bookings that passed the hold window without a payment
+     *
+     * Saved one by one so the inventory, claims, user stats and rollups
+     * release the held nights through the model hooks.
+     */
+    public static function expireUnpaidHolds()
+    {
+        $expired = 0;
+
+        Booking::where('status', 'confirmed')
+            ->where('paid_status', 'unpaid')
+            ->where('created_at', '<', now()->subHours(config('lifecycle.hold_hours')))
+            ->whereNotExists(function ($query) {
+                $query->selectRaw('1')
+                    ->from('payments')
+                    ->whereColumn('payments.booking_id', 'bookings.booking_id')
+                    ->where('payments.status', '!=', 'rejected');
+            })
+            ->with('user')
+            ->chunkById(static::chunkSize(), function ($bookings) use (&$expired) {
+                foreach ($bookings as $booking) {
+                    $booking->update(['status' => 'cancelled', 'cancelled_at' => now()]);
+                    $expired++;
+
+                    if ($booking->user) {
+                        NotificationService::notify(
+                            $booking->user,
+                            $booking,
+                            'booking_expired',
+                            'Booking Expired',
+                            "Your booking {$booking->booking_id} was cancelled because no payment was received in time."
+                        );
+                    }
+                }
+            });
+
+        return $expired;
+    }
+
+    /**
+     * Move settled bookings and read notifications past their horizons to the archive tables
+     */
+    public static function archive()
+    {
+        $moved = static::archiveBookings(static::cutoff());
+        $moved['notifications'] += static::archiveNotifications(
+            now()->subDays(config('lifecycle.notifications_after_days'))
+        );
+
+        return $moved;
+    }
+
+    /**
+     * Archive settled bookings that checked out before $before, with their payments and notifications
+     *
+     * Each chunk is copied and deleted in one transaction. The deletes are
+     * set-based on purpose: user stats and report rollups keep counting
+     * archived history, and their rebuilds read the archive tables too.
+     * Reviews stay live and lose their booking link.
+     */
+    public static function archiveBookings($before)
+    {
+        $moved = ['bookings' => 0, 'payments' => 0, 'notifications' => 0];
+
+        Booking::whereIn('status', static::SETTLED_STATUSES)
+            ->where('check_out', '<', $before)
+            ->select('id')
+            ->chunkById(static::chunkSize(), function ($chunk) use (&$moved) {
+                DB::transaction(function () use ($chunk, &$moved) {
+                    $bookings = Booking::whereIn('id', $chunk->modelKeys())->toBase()->get(static::COLUMNS['bookings']);
+                    $months = $bookings->mapWithKeys(fn ($row) => [$row->id => static::monthOf($row->check_out)]);
+                    $monthsByReference = $bookings->mapWithKeys(fn ($row) => [$row->booking_id => $months[$row->id]]);
+
+                    $payments = Payment::whereIn('booking_id', $monthsByReference->keys())->toBase()->get(static::COLUMNS['payments']);
+                    $notifications = Notification::whereIn('booking_id', $months->keys())->toBase()->get(static::COLUMNS['notifications']);
+
+                    static::copy('bookings', $bookings, fn ($row) => $months[$row->id]);
+                    static::copy('payments', $payments, fn ($row) => $monthsByReference[$row->booking_id]);
+                    static::copy('notifications', $notifications, fn ($row) => $months[$row->booking_id]);
+
+                    Notification::whereIn('id', $notifications->pluck('id'))->toBase()->delete();
+                    Payment::whereIn('id', $payments->pluck('id'))->toBase()->delete();
+                    Booking::whereIn('id', $months->keys())->toBase()->delete();
+
+                    static::forgetUnread($notifications);
+
+                    $moved['bookings'] += $bookings->count();
+                    $moved['payments'] += $payments->count();
+                    $moved['notifications'] += $notifications->count();
+                });
+            });
+
+        return $moved;
+    }
+
+    /**
+     * Archive read notifications created before $before
+     */
+    public static function archiveNotifications($before)
+    {
+        $moved = 0;
+
+        Notification::where('status', 'read')
+            ->where('created_at', '<', $before)
+            ->select('id')
+            ->chunkById(static::chunkSize(), function ($chunk) use (&$moved) {
+                DB::transaction(function () use ($chunk, &$moved) {
+                    $rows = Notification::whereIn('id', $chunk->modelKeys())->toBase()->get(static::COLUMNS['notifications']);
+
+                    static::copy('notifications', $rows, fn ($row) => static::monthOf($row->created_at));
+                    Notification::whereIn('id', $rows->pluck('id'))->toBase()->delete();
+
+                    $moved += $rows->count();
+                });
+            });
+
+        return $moved;
+    }
+
+    /**
+     * Live bookings, plus archived ones when the stay range starts before the horizon
+     *
+     * $filter receives each side's query and applies the same conditions to
+     * both; archived rows are pruned to months the range can reach. Order
+     * the result after calling this, so the order applies to the union.
+     */
+    public static function bookingsFrom($from, callable $filter)
+    {
+        $live = $filter(Booking::select(static::COLUMNS['bookings']));
+
+        if (!$from || !static::reachesArchive($from)) {
+            return $live;
+        }
+
+        $archived = $filter(Booking::archived()->select(static::COLUMNS['bookings']))
+            ->where('archive_month', '>=', static::monthOf($from));
+
+        return $live->unionAll($archived);
+    }
+
+    /**
+     * Live payments, plus archived ones when the range starts before the horizon
+     *
+     * Archived payments are filed under their stay's check-out month, which a
+     * late payment can follow, so they are not pruned by month. Order the
+     * result after calling this, as with bookingsFrom().
+     */
+    public static function paymentsFrom($from, callable $filter)
+    {
+        $live = $filter(Payment::select(static::COLUMNS['payments']));
+
+        if (!$from || !static::reachesArchive($from)) {
+            return $live;
+        }
+
+        return $live->unionAll($filter(Payment::archived()->select(static::COLUMNS['payments'])));
+    }
+
+    /**
+     * Whether a date range starting at $from can include archived rows
+     */
+    public static function reachesArchive($from)
+    {
+        return Carbon::parse($from)->lt(static::cutoff());
+    }
+
+    /**
+     * Stays that ended before this moment are due for the archive
+     */
+    public static function cutoff()
+    {
+        return now()->subMonths(config('lifecycle.archive_after_months'))->startOfMonth();
+    }
+
+    /**
+     * Partition key (YYYY-MM) for a date
+     */
+    public static function monthOf($date)
+    {
+        return Carbon::parse($date)->format('Y-m');
+    }
+
+    /**
+     * Insert rows into a table's archive, tagged with their archive month
+     */
+    protected static function copy($table, $rows, callable $month)
+    {
+        $now = now();
+
+        $archived = $rows->map(fn ($row) => array_merge((array) $row, [
+            'archive_month' => $month($row),
+            'archived_at' => $now,
+        ]))->all();
+
+        foreach (array_chunk($archived, 200) as $chunk) {
+            DB::table($table . '_archive')->insert($chunk);
+        }
+    }
+
+    /**
+     * Take archived unread notifications off their users' cached counters
+     */
+    protected static function forgetUnread($notifications)
+    {
+        $notifications
+            ->where('status', 'unread')
+            ->whereNotNull('user_id')
+            ->countBy('user_id')
+            ->each(fn ($count, $userId) => NotificationService::adjustUnread($userId, -$count));
+    }
+
+    /**
+     * Rows moved or updated per transaction
+     */
+    protected static function chunkSize()
+    {
+        return max(1, (int) config('lifecycle.chunk'));
+    }
+}
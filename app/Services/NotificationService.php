@@ -2,12 +2,202 @@
 
 namespace App\Services;
 
+use App\Jobs\DeliverNotifications;
 use App\Models\Notification;
 use App\Models\User;
 use App\Models\Booking;
+use Illuminate\Support\Facades\Cache;
 
 class NotificationService
 {
+    /**
+     * Notification rows waiting to be handed to the queue at the end of the request
+     */
+    protected static $pending = [];
+
+    /**
+     * Whether a long-lived worker is serving an HTTP request right now
+     */
+    protected static $servingRequest = false;
+
+    /**
+     * How long a cached unread counter is trusted before it is recounted (seconds)
+     */
+    const UNREAD_TTL = 600;
+
+    /**
+     * Queue a notification row for asynchronous, batched delivery
+     *
+     * During an HTTP request rows are collected and dispatched as one job once
+     * the response has been sent; elsewhere (console, queue workers) they are
+     * dispatched immediately. Octane workers run on the CLI SAPI, so they mark
+     * their requests with servingRequest().
+     */
+    public static function queue(array $attributes)
+    {
+        $row = array_merge([
+            'booking_id' => null,
+            'status' => 'unread',
+            'read_at' => null,
+            'created_at' => now()->toDateTimeString(),
+            'updated_at' => now()->toDateTimeString(),
+        ], $attributes);
+
+        if (app()->runningInConsole() && !static::$servingRequest) {
+            DeliverNotifications::dispatch([$row]);
+            return;
+        }
+
+        if (empty(static::$pending)) {
+            app()->terminating(function () {
+                static::flush();
+            });
+        }
+
+        static::$pending[] = $row;
+    }
+
+    /**
+     * Hand every pending notification row to the queue as a single job
+     */
+    public static function flush()
+    {
+        if (empty(static::$pending)) {
+            return;
+        }
+
+        $rows = static::$pending;
+        static::$pending = [];
+
+        DeliverNotifications::dispatch($rows);
+    }
+
+    /**
+     * Mark the start or end of a request in a long-lived worker
+     *
+     * Ending one hands over anything still pending, so no rows carry over
+     * into the worker's next request.
+     */
+    public static function servingRequest(bool $serving)
+    {
+        if (!$serving) {
+            static::flush();
+        }
+
+        static::$servingRequest = $serving;
+    }
+
+    /**
+     * Unread notification count for a user, served from cache
+     */
+    public static function unreadCount($userId)
+    {
+        return (int) Cache::remember(static::unreadKey($userId), static::UNREAD_TTL, function () use ($userId) {
+            return Notification::where('user_id', $userId)->where('status', 'unread')->count();
+        });
+    }
+
+    /**
+     * Adjust a user's cached unread counter and wake any long-poll waiting on it
+     *
+     * A counter that is not cached is left alone; it is recounted on next read.
+     */
+    public static function adjustUnread($userId, $delta)
+    {
+        $key = static::unreadKey($userId);
+
+        // Some stores create missing keys on increment, which would store a delta as a count
+        if ($delta > 0 && Cache::has($key)) {
+            Cache::increment($key, $delta);
+        } elseif ($delta < 0 && Cache::has($key)) {
+            Cache::decrement($key, -$delta);
+        }
+
+        static::touch($userId);
+    }
+
+    /**
+     * Set a user's cached unread counter to zero
+     */
+    public static function clearUnread($userId)
+    {
+        Cache::put(static::unreadKey($userId), 0, static::UNREAD_TTL);
+        static::touch($userId);
+    }
+
+    /**
+     * Record that a user's notifications changed
+     */
+    public static function touch($userId)
+    {
+        Cache::put(static::changeKey($userId), microtime(true), static::UNREAD_TTL);
+    }
+
+    /**
+     * Marker that changes whenever a user's notifications change
+     */
+    public static function changeMarker($userId)
+    {
+        return Cache::get(static::changeKey($userId));
+    }
+
+    /**
+     * Update counters after a batch of notification rows has been inserted
+     */
+    public static function delivered(array $rows)
+    {
+        $unread = [];
+        foreach ($rows as $row) {
+            if (($row['status'] ?? 'unread') === 'unread' && !empty($row['user_id'])) {
+                $unread[$row['user_id']] = ($unread[$row['user_id']] ?? 0) + 1;
+            }
+        }
+
+        foreach ($unread as $userId => $count) {
+            static::adjustUnread($userId, $count);
+        }
+    }
+
+    /**
+     * Send the same notification to many users through the queue
+     *
+     * $recipients is an iterable of ['user_id' => ..., 'booking_id' => ...] pairs.
+     * Returns the number of notifications queued.
+     */
+    public static function fanOut(iterable $recipients, $type, $title, $message)
+    {
+        $queued = 0;
+        $batch = [];
+        $now = now()->toDateTimeString();
+
+        foreach ($recipients as $recipient) {
+            $batch[] = [
+                'user_id' => $recipient['user_id'],
+                'booking_id' => $recipient['booking_id'] ?? null,
+                'type' => $type,
+                'title' => $title,
+                'message' => $message,
+                'status' => 'unread',
+                'read_at' => null,
+                'created_at' => $now,
+                'updated_at' => $now,
+            ];
+
+            if (count($batch) === DeliverNotifications::INSERT_CHUNK) {
+                DeliverNotifications::dispatch($batch);
+                $queued += count($batch);
+                $batch = [];
+            }
+        }
+
+        if ($batch) {
+            DeliverNotifications::dispatch($batch);
+            $queued += count($batch);
+        }
+
+        return $queued;
+    }
+
     /**
      * Create a booking confirmation notification
      */
@@ -22,7 +212,7 @@ public static function notifyBookingConfirmation(Booking $booking, ?User $user =
                 return false;
             }
 
-            Notification::create([
+            static::queue([
                 'user_id' => $user->id,
                 'booking_id' => $booking->id,
                 'type' => 'booking_confirmation',
@@ -44,7 +234,7 @@ public static function notifyBookingConfirmation(Booking $booking, ?User $user =
     public static function notifyPaymentConfirmation($payment, User $user, Booking $booking)
     {
         try {
-            Notification::create([
+            static::queue([
                 'user_id' => $user->id,
                 'booking_id' => $booking->id,
                 'type' => 'payment_received',
@@ -66,7 +256,7 @@ public static function notifyPaymentConfirmation($payment, User $user, Booking $
     public static function notify(User $user, Booking $booking = null, $type = 'info', $title = '', $message = '')
     {
         try {
-            Notification::create([
+            static::queue([
                 'user_id' => $user->id,
                 'booking_id' => $booking ? $booking->id : null,
                 'type' => $type,
@@ -93,7 +283,7 @@ public static function notifyBookingCancellation(Booking $booking, User $user, $
                 $message .= " A refund of \$" . number_format($refundAmount, 2) . " has been processed.";
             }
 
-            Notification::create([
+            static::queue([
                 'user_id' => $user->id,
                 'booking_id' => $booking->id,
                 'type' => 'booking_cancelled',
@@ -115,7 +305,7 @@ public static function notifyBookingCancellation(Booking $booking, User $user, $
     public static function notifyPaymentProofReceived($payment, User $user, Booking $booking)
     {
         try {
-            Notification::create([
+            static::queue([
                 'user_id' => $user->id,
                 'booking_id' => $booking->id,
                 'type' => 'payment_proof_received',
@@ -137,7 +327,7 @@ public static function notifyPaymentProofReceived($payment, User $user, Booking
     public static function notifyPaymentVerified($payment, User $user, Booking $booking)
     {
         try {
-            Notification::create([
+            static::queue([
                 'user_id' => $user->id,
                 'booking_id' => $booking->id,
                 'type' => 'payment_verified',
@@ -165,7 +355,7 @@ public static function notifyPaymentRejected($payment, User $user, Booking $book
             }
             $message .= " Please resubmit or contact support.";
 
-            Notification::create([
+            static::queue([
                 'user_id' => $user->id,
                 'booking_id' => $booking->id,
                 'type' => 'payment_rejected',
@@ -180,4 +370,20 @@ public static function notifyPaymentRejected($payment, User $user, Booking $book
             return false;
         }
     }
+
+    /**
+     * Cache key for a user's unread counter
+     */
+    protected static function unreadKey($userId)
+    {
+        return "notifications:unread:{$userId}";
+    }
+
+    /**
+     * Cache key for a user's change marker
+     */
+    protected static function changeKey($userId)
+    {
+        return "notifications:changed:{$userId}";
+    }
 }
@@ -0,0 +1,117 @@
+<?php
+
+namespace App\Services;
+
+use App\Models\Booking;
+use App\Models\Payment;
+use Illuminate\Support\Facades\DB;
+
+class PaymentVerificationService
+{
+    /**
+     * Most decisions accepted in one batch
+     */
+    const MAX_BATCH = 200;
+
+    /**
+     * Verify or reject many payment proofs at once
+     *
+     * $decisions is a list of ['payment_id' => ..., 'verified' => bool,
+     * 'comment' => ...] items. Payments, their bookings and the bookings'
+     * users are loaded with one query each. Statuses are then written with
+     * one update per (decision, comment) group inside a single transaction.
+     * Set-based updates skip the model events, so the rollups, user stats
+     * and inventory are moved explicitly. Only payments still awaiting
+     * verification are touched. Returns one result per decision, in order.
+     */
+    public static function review(array $decisions)
+    {
+        [$payments, $bookings, $reviewed] = DB::transaction(function () use ($decisions) {
+            $now = now();
+
+            $payments = Payment::whereIn('id', array_column($decisions, 'payment_id'))
+                ->lockForUpdate()
+                ->get()
+                ->keyBy('id');
+
+            $pending = $payments->where('status', 'pending_verification');
+
+            $bookings = Booking::whereIn('booking_id', $pending->pluck('booking_id')->unique()->values())
+                ->with('user')
+                ->get()
+                ->keyBy('booking_id');
+
+            $groups = collect($decisions)
+                ->filter(fn ($decision) => $pending->has($decision['payment_id']))
+                ->groupBy(fn ($decision) => json_encode([(bool) $decision['verified'], $decision['comment'] ?? null]));
+
+            $reviewed = [];
+            $paidReferences = [];
+
+            foreach ($groups as $group) {
+                $verified = (bool) $group->first()['verified'];
+                $changes = $verified
+                    ? ['status' => 'verified', 'verified_at' => $now, 'verified_comment' => $group->first()['comment'] ?? null]
+                    : ['status' => 'rejected', 'verified_comment' => $group->first()['comment'] ?? null];
+
+                $changed = $pending->only($group->pluck('payment_id')->all());
+
+                Payment::whereIn('id', $changed->modelKeys())->toBase()->update($changes + ['updated_at' => $now]);
+
+                ReportRollupService::paymentsStatusChanged($changed, $changes['status']);
+                UserStatsService::paymentsStatusChanged($changed, $changes['status']);
+
+                foreach ($changed as $payment) {
+                    $payment->forceFill($changes + ['updated_at' => $now])->syncOriginal();
+                    $reviewed[] = $payment->id;
+
+                    if ($verified) {
+                        $paidReferences[] = $payment->booking_id;
+                    }
+                }
+            }
+
+            $paid = $bookings->filter(
+                fn ($booking) => $booking->paid_status !== 'paid' && in_array($booking->booking_id, $paidReferences, true)
+            );
+
+            if ($paid->isNotEmpty()) {
+                Booking::whereIn('id', $paid->modelKeys())->toBase()->update(['paid_status' => 'paid', 'updated_at' => $now]);
+
+                foreach ($paid as $booking) {
+                    $booking->forceFill(['paid_status' => 'paid', 'updated_at' => $now])->syncOriginal();
+                }
+
+                RoomInventoryService::bookingsPaid($paid);
+            }
+
+            return [$payments, $bookings, $reviewed];
+        });
+
+        // Queued after commit; within a request they are inserted together by one job
+        foreach ($reviewed as $id) {
+            $payment = $payments[$id];
+            $booking = $bookings->get($payment->booking_id);
+
+            if ($booking && $booking->user) {
+                $payment->status === 'verified'
+                    ? NotificationService::notifyPaymentVerified($payment, $booking->user, $booking)
+                    : NotificationService::notifyPaymentRejected($payment, $booking->user, $booking);
+            }
+        }
+
+        return array_map(function ($decision) use ($payments, $reviewed) {
+            $payment = $payments->get($decision['payment_id']);
+
+            if (!$payment) {
+                return ['payment_id' => $decision['payment_id'], 'success' => false, 'status' => null, 'message' => 'Payment not found'];
+            }
+
+            if (!in_array($payment->id, $reviewed, true)) {
+                return ['payment_id' => $payment->id, 'success' => false, 'status' => $payment->status, 'message' => 'Payment is not awaiting verification'];
+            }
+
+            return ['payment_id' => $payment->id, 'success' => true, 'status' => $payment->status, 'message' => 'Payment ' . $payment->status];
+        }, $decisions);
+    }
+}
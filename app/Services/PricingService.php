@@ -0,0 +1,186 @@
+<?php
+
+namespace App\Services;
+
+use App\Models\RatePlan;
+use App\Models\Room;
+use Carbon\Carbon;
+use Illuminate\Support\Facades\Cache;
+use Illuminate\Support\Facades\DB;
+
+class PricingService
+{
+    /**
+     * Taxes and fees added on top of the nightly prices, as shown at checkout
+     */
+    const TAX_RATE = 0.10;
+
+    /**
+     * How long a computed quote stays cached (seconds)
+     */
+    const QUOTE_TTL = 3600;
+
+    /**
+     * Cache key holding the current pricing version; quotes are keyed by it
+     */
+    const VERSION_KEY = 'pricing:version';
+
+    /**
+     * Price a stay in a room from its base price and rate plans
+     *
+     * Each night is charged the price of the highest-priority plan covering it
+     * (a plan for the room itself wins a tie over one for its room type), or
+     * the room's base price when no plan matches. Results are memoized per
+     * room and date range until a price or plan changes.
+     */
+    public static function quote(Room $room, $checkIn, $checkOut)
+    {
+        $nights = RoomInventoryService::nightsBetween($checkIn, $checkOut);
+        $key = sprintf('room-quote:%s:%d:%s:%s', static::version(), $room->id, reset($nights), end($nights));
+
+        return Cache::remember($key, static::QUOTE_TTL, fn () => static::compute($room, $nights));
+    }
+
+    /**
+     * Quote a stay for the first room of a room type, or null if there is none
+     */
+    public static function quoteForType($roomType, $checkIn, $checkOut)
+    {
+        $room = Room::where('room_type', $roomType)->orderBy('id')->first();
+
+        return $room ? static::quote($room, $checkIn, $checkOut) : null;
+    }
+
+    /**
+     * Set base prices for many rooms in one statement
+     *
+     * $prices maps room id to price.
+     */
+    public static function setBasePrices(array $prices)
+    {
+        if (!$prices) {
+            return 0;
+        }
+
+        $cases = [];
+        $bindings = [];
+        foreach ($prices as $roomId => $price) {
+            $cases[] = 'WHEN ? THEN ?';
+            array_push($bindings, (int) $roomId, round((float) $price, 2));
+        }
+
+        $ids = array_map('intval', array_keys($prices));
+        $placeholders = implode(', ', array_fill(0, count($ids), '?'));
+
+        $updated = DB::transaction(fn () => DB::update(
+            'UPDATE rooms SET price = CASE id ' . implode(' ', $cases) . " END, updated_at = ? WHERE id IN ({$placeholders})",
+            array_merge($bindings, [now()->toDateTimeString()], $ids)
+        ));
+
+        static::forgetQuotes();
+        ResponseCacheService::forgetRooms($ids);
+
+        return $updated;
+    }
+
+    /**
+     * Create or update many rate plans in one transaction
+     *
+     * Rows with an id update that plan; rows without one create a plan.
+     */
+    public static function savePlans(array $plans)
+    {
+        $now = now()->toDateTimeString();
+        $columns = ['room_id', 'room_type', 'name', 'price', 'starts_on', 'ends_on', 'weekdays', 'priority'];
+
+        $rows = array_map(function ($plan) use ($columns, $now) {
+            $row = ['updated_at' => $now];
+            foreach ($columns as $column) {
+                $row[$column] = $plan[$column] ?? null;
+            }
+            $row['priority'] = (int) ($row['priority'] ?? 0);
+            $row['weekdays'] = is_array($row['weekdays']) ? implode(',', $row['weekdays']) : $row['weekdays'];
+
+            return isset($plan['id']) ? ['id' => (int) $plan['id']] + $row : $row + ['created_at' => $now];
+        }, $plans);
+
+        $updates = array_values(array_filter($rows, fn ($row) => isset($row['id'])));
+        $inserts = array_values(array_filter($rows, fn ($row) => !isset($row['id'])));
+
+        DB::transaction(function () use ($updates, $inserts, $columns) {
+            if ($updates) {
+                RatePlan::upsert($updates, ['id'], array_merge($columns, ['updated_at']));
+            }
+            if ($inserts) {
+                RatePlan::insert($inserts);
+            }
+        });
+
+        // Set-based writes skip the model events
+        static::forgetQuotes();
+
+        return count($rows);
+    }
+
+    /**
+     * Invalidate every memoized quote by moving to a new pricing version
+     */
+    public static function forgetQuotes()
+    {
+        Cache::forever(static::VERSION_KEY, uniqid('', true));
+    }
+
+    /**
+     * Current pricing version
+     */
+    protected static function version()
+    {
+        return Cache::rememberForever(static::VERSION_KEY, fn () => uniqid('', true));
+    }
+
+    /**
+     * Price each night of a stay
+     */
+    protected static function compute(Room $room, array $nights)
+    {
+        $plans = RatePlan::where(function ($query) use ($room) {
+                $query->where('room_id', $room->id)
+                    ->orWhere(fn ($q) => $q->whereNull('room_id')->where('room_type', $room->room_type));
+            })
+            ->where(fn ($q) => $q->whereNull('starts_on')->orWhere('starts_on', '<=', end($nights)))
+            ->where(fn ($q) => $q->whereNull('ends_on')->orWhere('ends_on', '>=', reset($nights)))
+            ->get()
+            ->sortBy([
+                ['priority', 'desc'],
+                fn ($a, $b) => ($a->room_id ? 0 : 1) <=> ($b->room_id ? 0 : 1),
+                ['id', 'desc'],
+            ])
+            ->values();
+
+        $nightly = [];
+        foreach ($nights as $night) {
+            $date = Carbon::parse($night);
+            $plan = $plans->first(fn ($plan) => $plan->coversNight($date));
+
+            $nightly[] = [
+                'date' => $night,
+                'price' => round((float) ($plan ? $plan->price : $room->price), 2),
+                'rate_plan_id' => $plan?->id,
+            ];
+        }
+
+        $subtotal = round(array_sum(array_column($nightly, 'price')), 2);
+        $taxes = round($subtotal * static::TAX_RATE, 2);
+
+        return [
+            'room_id' => $room->id,
+            'room_type' => $room->room_type,
+            'nights' => count($nightly),
+            'nightly' => $nightly,
+            'rate' => round($subtotal / count($nightly), 2),
+            'subtotal' => $subtotal,
+            'taxes' => $taxes,
+            'total' => round($subtotal + $taxes, 2),
+        ];
+    }
+}
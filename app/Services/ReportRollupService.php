@@ -0,0 +1,353 @@
+<?php
+
+namespace App\Services;
+
+use App\Models\Booking;
+use App\Models\DailyRollup;
+use App\Models\Payment;
+use Carbon\Carbon;
+use Illuminate\Support\Facades\DB;
+
+class ReportRollupService
+{
+    /**
+     * Number of buckets returned per report period
+     */
+    const REPORT_BUCKETS = 30;
+
+    /**
+     * Count a new booking in its day's rollup
+     */
+    public static function bookingCreated(Booking $booking)
+    {
+        static::add(static::bookingBucket($booking), 1, $booking->total);
+    }
+
+    /**
+     * Count bulk-inserted bookings with one write per rollup bucket
+     */
+    public static function bookingsInserted($bookings)
+    {
+        foreach (static::bookingBuckets($bookings) as [$bucket, $count, $amount]) {
+            static::add($bucket, $count, $amount);
+        }
+    }
+
+    /**
+     * Move bookings to a new status bucket after a set-based status update
+     *
+     * The bookings passed in still carry their old status.
+     */
+    public static function bookingsStatusChanged($bookings, $status)
+    {
+        foreach (static::bookingBuckets($bookings) as [$bucket, $count, $amount]) {
+            static::add($bucket, -$count, -$amount);
+            static::add(array_merge($bucket, ['status' => (string) $status]), $count, $amount);
+        }
+    }
+
+    /**
+     * Move a booking between rollup buckets after a status, room or total change
+     */
+    public static function bookingUpdated(Booking $booking)
+    {
+        if (!$booking->wasChanged(['status', 'room_type', 'total', 'created_at'])) {
+            return;
+        }
+
+        static::add(static::bookingBucket($booking, true), -1, -(float) $booking->getOriginal('total'));
+        static::add(static::bookingBucket($booking), 1, $booking->total);
+    }
+
+    /**
+     * Take a deleted booking out of its day's rollup
+     */
+    public static function bookingDeleted(Booking $booking)
+    {
+        static::add(static::bookingBucket($booking), -1, -(float) $booking->total);
+    }
+
+    /**
+     * Count a new payment in its day's rollup
+     */
+    public static function paymentCreated(Payment $payment)
+    {
+        static::add(static::paymentBucket($payment), 1, $payment->amount);
+    }
+
+    /**
+     * Move a payment between rollup buckets after a status, method or amount change
+     */
+    public static function paymentUpdated(Payment $payment)
+    {
+        if (!$payment->wasChanged(['status', 'payment_method', 'amount', 'created_at'])) {
+            return;
+        }
+
+        static::add(static::paymentBucket($payment, true), -1, -(float) $payment->getOriginal('amount'));
+        static::add(static::paymentBucket($payment), 1, $payment->amount);
+    }
+
+    /**
+     * Move payments to a new status bucket after a set-based status update
+     *
+     * The payments passed in still carry their old status.
+     */
+    public static function paymentsStatusChanged($payments, $status)
+    {
+        foreach (static::paymentBuckets($payments) as [$bucket, $count, $amount]) {
+            static::add($bucket, -$count, -$amount);
+            static::add(array_merge($bucket, ['status' => (string) $status]), $count, $amount);
+        }
+    }
+
+    /**
+     * Take a deleted payment out of its day's rollup
+     */
+    public static function paymentDeleted(Payment $payment)
+    {
+        static::add(static::paymentBucket($payment), -1, -(float) $payment->amount);
+    }
+
+    /**
+     * Rebuild the rollups for a date range (inclusive) from live and archived bookings and payments
+     *
+     * Returns the number of rollup rows written.
+     */
+    public static function rebuild($from = null, $to = null)
+    {
+        $from = $from ? Carbon::parse($from)->startOfDay() : null;
+        $to = $to ? Carbon::parse($to)->endOfDay() : null;
+
+        $inRange = function ($query, $column) use ($from, $to) {
+            return $query
+                ->when($from, fn ($q) => $q->where($column, '>=', $from))
+                ->when($to, fn ($q) => $q->where($column, '<=', $to));
+        };
+
+        return DB::transaction(function () use ($from, $to, $inRange) {
+            DailyRollup::query()
+                ->when($from, fn ($q) => $q->where('day', '>=', $from->toDateString()))
+                ->when($to, fn ($q) => $q->where('day', '<=', $to->toDateString()))
+                ->delete();
+
+            // Archived bookings and payments still count towards their days
+            $bookingRows = fn ($query) => $inRange($query, 'created_at')->select(['created_at', 'room_type', 'status', 'total']);
+            $paymentRows = fn ($query) => $inRange($query, 'created_at')->select(['created_at', 'payment_method', 'status', 'amount']);
+
+            $bookings = DB::query()
+                ->fromSub($bookingRows(Booking::query())->unionAll($bookingRows(Booking::archived())), 'bookings')
+                ->selectRaw("DATE(created_at) as day, 'booking' as metric, room_type, '' as payment_method, COALESCE(status, '') as status, COUNT(*) as records, COALESCE(SUM(total), 0) as amount")
+                ->groupByRaw('DATE(created_at), room_type, status')
+                ->get();
+
+            $payments = DB::query()
+                ->fromSub($paymentRows(Payment::query())->unionAll($paymentRows(Payment::archived())), 'payments')
+                ->selectRaw("DATE(created_at) as day, 'payment' as metric, '' as room_type, COALESCE(payment_method, '') as payment_method, COALESCE(status, '') as status, COUNT(*) as records, COALESCE(SUM(amount), 0) as amount")
+                ->groupByRaw('DATE(created_at), payment_method, status')
+                ->get();
+
+            $now = now();
+            $rows = $bookings->concat($payments)->map(fn ($row) => array_merge((array) $row, [
+                'room_type' => (string) $row->room_type,
+                'created_at' => $now,
+                'updated_at' => $now,
+            ]))->all();
+
+            foreach (array_chunk($rows, 500) as $chunk) {
+                DailyRollup::insert($chunk);
+            }
+
+            return count($rows);
+        });
+    }
+
+    /**
+     * Headline numbers for the admin dashboard
+     */
+    public static function totals()
+    {
+        $rows = DailyRollup::selectRaw('metric, status, SUM(records) as count, SUM(amount) as amount')
+            ->groupBy('metric', 'status')
+            ->toBase()
+            ->get();
+
+        $bookings = $rows->where('metric', 'booking');
+        $verified = $rows->where('metric', 'payment')->where('status', 'verified');
+
+        $bookingCount = (int) $bookings->sum('count');
+        $bookingAmount = (float) $bookings->sum('amount');
+
+        return [
+            'total_bookings' => $bookingCount,
+            'total_revenue' => (float) $verified->sum('amount'),
+            'pending_payments' => (int) $rows->where('metric', 'payment')->where('status', 'pending_verification')->sum('count'),
+            'average_booking_value' => $bookingCount ? round($bookingAmount / $bookingCount, 2) : 0,
+        ];
+    }
+
+    /**
+     * Booking count and revenue per period bucket, newest first
+     */
+    public static function bookingSeries($period = 'daily')
+    {
+        $start = static::periodStart(now(), $period)->subUnit(static::periodUnit($period), static::REPORT_BUCKETS - 1);
+
+        $days = DailyRollup::where('metric', 'booking')
+            ->where('day', '>=', $start->toDateString())
+            ->selectRaw('day, SUM(records) as count, SUM(amount) as revenue')
+            ->groupBy('day')
+            ->toBase()
+            ->get();
+
+        return $days
+            ->groupBy(fn ($row) => static::periodStart(Carbon::parse($row->day), $period)->toDateString())
+            ->map(fn ($rows, $date) => [
+                'date' => $date,
+                'count' => (int) $rows->sum('count'),
+                'revenue' => round((float) $rows->sum('revenue'), 2),
+            ])
+            ->sortKeysDesc()
+            ->values();
+    }
+
+    /**
+     * Verified revenue per payment method
+     */
+    public static function revenueByMethod()
+    {
+        return DailyRollup::where('metric', 'payment')
+            ->where('status', 'verified')
+            ->selectRaw('payment_method, SUM(amount) as total, SUM(records) as count')
+            ->groupBy('payment_method')
+            ->toBase()
+            ->get();
+    }
+
+    /**
+     * Room types with the most bookings
+     */
+    public static function topRoomTypes($limit = 5)
+    {
+        return DailyRollup::where('metric', 'booking')
+            ->selectRaw('room_type, SUM(records) as count, SUM(amount) as revenue')
+            ->groupBy('room_type')
+            ->orderByDesc('count')
+            ->limit($limit)
+            ->toBase()
+            ->get();
+    }
+
+    /**
+     * First day of the period a date falls in
+     */
+    protected static function periodStart(Carbon $date, $period)
+    {
+        return match ($period) {
+            'weekly' => $date->copy()->startOfWeek(),
+            'monthly' => $date->copy()->startOfMonth(),
+            'yearly' => $date->copy()->startOfYear(),
+            default => $date->copy()->startOfDay(),
+        };
+    }
+
+    /**
+     * Carbon unit for a report period
+     */
+    protected static function periodUnit($period)
+    {
+        return match ($period) {
+            'weekly' => 'week',
+            'monthly' => 'month',
+            'yearly' => 'year',
+            default => 'day',
+        };
+    }
+
+    /**
+     * Rollup bucket a booking falls in, before or after its last write
+     */
+    protected static function bookingBucket(Booking $booking, $original = false)
+    {
+        $value = fn ($key) => $original ? $booking->getOriginal($key) : $booking->getAttribute($key);
+
+        return [
+            'day' => Carbon::parse($value('created_at') ?? now())->toDateString(),
+            'metric' => 'booking',
+            'room_type' => (string) $value('room_type'),
+            'payment_method' => '',
+            'status' => (string) ($value('status') ?? ''),
+        ];
+    }
+
+    /**
+     * Group bookings by rollup bucket as [bucket, count, amount]
+     */
+    protected static function bookingBuckets($bookings)
+    {
+        $buckets = [];
+        foreach ($bookings as $booking) {
+            $bucket = static::bookingBucket($booking);
+            $key = implode('|', $bucket);
+
+            $buckets[$key] ??= [$bucket, 0, 0.0];
+            $buckets[$key][1]++;
+            $buckets[$key][2] += (float) $booking->total;
+        }
+
+        return $buckets;
+    }
+
+    /**
+     * Rollup bucket a payment falls in, before or after its last write
+     */
+    protected static function paymentBucket(Payment $payment, $original = false)
+    {
+        $value = fn ($key) => $original ? $payment->getOriginal($key) : $payment->getAttribute($key);
+
+        return [
+            'day' => Carbon::parse($value('created_at') ?? now())->toDateString(),
+            'metric' => 'payment',
+            'room_type' => '',
+            'payment_method' => (string) ($value('payment_method') ?? ''),
+            'status' => (string) ($value('status') ?? ''),
+        ];
+    }
+
+    /**
+     * Group payments by rollup bucket as [bucket, count, amount]
+     */
+    protected static function paymentBuckets($payments)
+    {
+        $buckets = [];
+        foreach ($payments as $payment) {
+            $bucket = static::paymentBucket($payment);
+            $key = implode('|', $bucket);
+
+            $buckets[$key] ??= [$bucket, 0, 0.0];
+            $buckets[$key][1]++;
+            $buckets[$key][2] += (float) $payment->amount;
+        }
+
+        return $buckets;
+    }
+
+    /**
+     * Add to a bucket's count and amount, creating the bucket if needed
+     */
+    protected static function add(array $bucket, $count, $amount)
+    {
+        DailyRollup::insertOrIgnore(array_merge($bucket, [
+            'records' => 0,
+            'amount' => 0,
+            'created_at' => now(),
+            'updated_at' => now(),
+        ]));
+
+        DailyRollup::where($bucket)->toBase()->update([
+            'records' => DB::raw('records + ' . (int) $count),
+            'amount' => DB::raw('amount + ' . number_format((float) $amount, 2, '.', '')),
+            'updated_at' => now(),
+        ]);
+    }
+}
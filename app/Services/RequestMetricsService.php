@@ -0,0 +1,391 @@
+<?php
+
+namespace App\Services;
+
+use Illuminate\Database\Events\QueryExecuted;
+use Illuminate\Support\Facades\Cache;
+
+class RequestMetricsService
+{
+    /**
+     * Length of one aggregation window (seconds)
+     */
+    const WINDOW = 300;
+
+    /**
+     * Number of windows kept, i.e. one hour of history
+     */
+    const WINDOWS_KEPT = 12;
+
+    /**
+     * Upper bounds of the latency histogram buckets (milliseconds)
+     */
+    const TIME_BUCKETS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000];
+
+    /**
+     * Upper bounds of the query-count histogram buckets
+     */
+    const QUERY_BUCKETS = [1, 2, 5, 10, 20, 50, 100];
+
+    /**
+     * Longest SQL text kept for the slowest statement
+     */
+    const SQL_LIMIT = 500;
+
+    /**
+     * Cache key listing every route that has recorded metrics
+     */
+    const ROUTES_KEY = 'request-metrics:routes';
+
+    /**
+     * Cache drivers whose increments are atomic without row locks
+     */
+    const ATOMIC_DRIVERS = ['redis', 'memcached', 'array'];
+
+    /**
+     * Measurements of the request in progress, null when none is being measured
+     */
+    protected static $current = null;
+
+    /**
+     * Start measuring a request
+     */
+    public static function start()
+    {
+        if (function_exists('memory_reset_peak_usage')) {
+            memory_reset_peak_usage();
+        }
+
+        static::$current = [
+            'started' => microtime(true),
+            'queries' => 0,
+            'db_ms' => 0.0,
+            'slowest_ms' => 0.0,
+            'slowest_sql' => null,
+        ];
+    }
+
+    /**
+     * Count a statement against the request being measured
+     */
+    public static function recordQuery(QueryExecuted $query)
+    {
+        if (static::$current === null) {
+            return;
+        }
+
+        static::$current['queries']++;
+        static::$current['db_ms'] += $query->time;
+
+        if ($query->time > static::$current['slowest_ms']) {
+            static::$current['slowest_ms'] = $query->time;
+            static::$current['slowest_sql'] = mb_substr($query->sql, 0, static::SQL_LIMIT);
+        }
+    }
+
+    /**
+     * Stop measuring and return the request's numbers
+     */
+    public static function finish()
+    {
+        if (static::$current === null) {
+            return null;
+        }
+
+        $metrics = [
+            'queries' => static::$current['queries'],
+            'db_ms' => round(static::$current['db_ms'], 2),
+            'slowest_ms' => round(static::$current['slowest_ms'], 2),
+            'slowest_sql' => static::$current['slowest_sql'],
+            'wall_ms' => round((microtime(true) - static::$current['started']) * 1000, 2),
+            'peak_memory_mb' => round(memory_get_peak_usage(true) / 1048576, 2),
+        ];
+
+        static::$current = null;
+
+        return $metrics;
+    }
+
+    /**
+     * Add one request's numbers to the current window of its route
+     *
+     * Every route and window has its own counters, bumped with atomic
+     * increments. Sums are stored in hundredths of a millisecond. The peaks
+     * key is only rewritten when a request beats it; two requests racing
+     * there keep one of their values. Without a store that increments
+     * atomically (see store()) nothing is recorded.
+     */
+    public static function aggregate($route, array $metrics)
+    {
+        $cache = static::store();
+        if (!$cache) {
+            return;
+        }
+
+        $prefix = static::entryPrefix(static::windowStart(time()), $route);
+        $ttl = static::WINDOW * (static::WINDOWS_KEPT + 1);
+
+        static::register($cache, $route);
+
+        // Counters are created up front with the window's expiry; some stores would
+        // otherwise create them on increment without one
+        if ($cache->add($prefix . ':open', 1, $ttl)) {
+            $zeroes = [];
+            foreach (static::counters() as $counter) {
+                $zeroes[$prefix . ':' . $counter] = 0;
+            }
+            $cache->putMany($zeroes, $ttl);
+        }
+
+        $cache->increment($prefix . ':wall_ms', (int) round($metrics['wall_ms'] * 100));
+        $cache->increment($prefix . ':db_ms', (int) round($metrics['db_ms'] * 100));
+        $cache->increment($prefix . ':queries', $metrics['queries']);
+        $cache->increment($prefix . ':wall_histogram:' . static::bucket(static::TIME_BUCKETS, $metrics['wall_ms']));
+        $cache->increment($prefix . ':db_histogram:' . static::bucket(static::TIME_BUCKETS, $metrics['db_ms']));
+        $cache->increment($prefix . ':query_histogram:' . static::bucket(static::QUERY_BUCKETS, $metrics['queries']));
+
+        $peaks = $cache->get($prefix . ':peaks', ['max_queries' => 0, 'peak_memory_mb' => 0.0, 'slowest_ms' => 0.0, 'slowest_sql' => null]);
+
+        if ($metrics['queries'] > $peaks['max_queries'] || $metrics['peak_memory_mb'] > $peaks['peak_memory_mb']
+            || $metrics['slowest_ms'] > $peaks['slowest_ms']) {
+            $peaks['max_queries'] = max($peaks['max_queries'], $metrics['queries']);
+            $peaks['peak_memory_mb'] = max($peaks['peak_memory_mb'], $metrics['peak_memory_mb']);
+
+            if ($metrics['slowest_ms'] > $peaks['slowest_ms']) {
+                $peaks['slowest_ms'] = $metrics['slowest_ms'];
+                $peaks['slowest_sql'] = $metrics['slowest_sql'];
+            }
+
+            $cache->put($prefix . ':peaks', $peaks, $ttl);
+        }
+    }
+
+    /**
+     * Per-route summary over the last $minutes, slowest routes (by total time) first
+     */
+    public static function summary($minutes = 60)
+    {
+        $cache = static::store();
+        if (!$cache) {
+            return [];
+        }
+
+        $windows = min(static::WINDOWS_KEPT, max(1, (int) ceil($minutes * 60 / static::WINDOW)));
+        $current = static::windowStart(time());
+
+        $routes = $cache->get(static::ROUTES_KEY, []);
+
+        $merged = [];
+        for ($i = 0; $i < $windows; $i++) {
+            foreach ($routes as $route) {
+                $entry = static::readEntry($cache, static::entryPrefix($current - $i * static::WINDOW, $route));
+
+                if ($entry) {
+                    $merged[$route] = isset($merged[$route]) ? static::merge($merged[$route], $entry) : $entry;
+                }
+            }
+        }
+
+        $summary = [];
+        foreach ($merged as $route => $entry) {
+            $summary[] = [
+                'route' => $route,
+                'requests' => $entry['requests'],
+                'avg_wall_ms' => round($entry['wall_ms'] / $entry['requests'], 2),
+                'p50_wall_ms' => static::percentile(static::TIME_BUCKETS, $entry['wall_histogram'], 0.50),
+                'p95_wall_ms' => static::percentile(static::TIME_BUCKETS, $entry['wall_histogram'], 0.95),
+                'avg_db_ms' => round($entry['db_ms'] / $entry['requests'], 2),
+                'avg_queries' => round($entry['queries'] / $entry['requests'], 2),
+                'max_queries' => $entry['max_queries'],
+                'peak_memory_mb' => $entry['peak_memory_mb'],
+                'slowest_query' => ['ms' => $entry['slowest_ms'], 'sql' => $entry['slowest_sql']],
+                'histograms' => [
+                    'wall_ms' => static::labelled(static::TIME_BUCKETS, $entry['wall_histogram']),
+                    'db_ms' => static::labelled(static::TIME_BUCKETS, $entry['db_histogram']),
+                    'queries' => static::labelled(static::QUERY_BUCKETS, $entry['query_histogram']),
+                ],
+                'total_wall_ms' => round($entry['wall_ms'], 2),
+            ];
+        }
+
+        usort($summary, fn ($a, $b) => $b['total_wall_ms'] <=> $a['total_wall_ms']);
+
+        return $summary;
+    }
+
+    /**
+     * Cache store the metrics are kept in, or null when it cannot take them
+     *
+     * On the database or file store every increment is a locked write, so a
+     * request would queue behind every other request to its route.
+     */
+    public static function store()
+    {
+        $name = config('cache.metrics_store') ?: config('cache.default');
+
+        if (!in_array(config("cache.stores.{$name}.driver"), static::ATOMIC_DRIVERS, true)) {
+            return null;
+        }
+
+        return Cache::store($name);
+    }
+
+    /**
+     * Remember a route name so summary() can find its counters
+     *
+     * The marker is only missing on a route's first request of the day, so
+     * the shared list is rarely written.
+     */
+    protected static function register($cache, $route)
+    {
+        if (!$cache->add('request-metrics:route:' . md5($route), 1, 86400)) {
+            return;
+        }
+
+        $cache->lock(static::ROUTES_KEY . ':lock', 5)->block(2, function () use ($cache, $route) {
+            $routes = $cache->get(static::ROUTES_KEY, []);
+
+            if (!in_array($route, $routes, true)) {
+                $routes[] = $route;
+                $cache->forever(static::ROUTES_KEY, $routes);
+            }
+        });
+    }
+
+    /**
+     * One route's window in the shape summary() merges, or null when it saw no requests
+     */
+    protected static function readEntry($cache, $prefix)
+    {
+        $keys = array_map(fn ($counter) => $prefix . ':' . $counter, static::counters());
+        $values = $cache->many(array_merge($keys, [$prefix . ':peaks']));
+
+        $entry = static::emptyEntry();
+        foreach (static::counters() as $counter) {
+            $value = (int) ($values[$prefix . ':' . $counter] ?? 0);
+
+            if (str_contains($counter, ':')) {
+                [$histogram, $i] = explode(':', $counter);
+                $entry[$histogram][(int) $i] = $value;
+            } else {
+                $entry[$counter] = in_array($counter, ['wall_ms', 'db_ms']) ? $value / 100 : $value;
+            }
+        }
+
+        $entry['requests'] = array_sum($entry['wall_histogram']);
+        if (!$entry['requests']) {
+            return null;
+        }
+
+        return array_merge($entry, $values[$prefix . ':peaks'] ?? []);
+    }
+
+    /**
+     * Names of the integer counters kept per route and window
+     */
+    protected static function counters()
+    {
+        $counters = ['wall_ms', 'db_ms', 'queries'];
+
+        foreach (['wall_histogram' => static::TIME_BUCKETS, 'db_histogram' => static::TIME_BUCKETS, 'query_histogram' => static::QUERY_BUCKETS] as $histogram => $bounds) {
+            for ($i = 0; $i <= count($bounds); $i++) {
+                $counters[] = $histogram . ':' . $i;
+            }
+        }
+
+        return $counters;
+    }
+
+    protected static function emptyEntry()
+    {
+        return [
+            'requests' => 0,
+            'wall_ms' => 0.0,
+            'db_ms' => 0.0,
+            'queries' => 0,
+            'max_queries' => 0,
+            'peak_memory_mb' => 0.0,
+            'slowest_ms' => 0.0,
+            'slowest_sql' => null,
+            'wall_histogram' => array_fill(0, count(static::TIME_BUCKETS) + 1, 0),
+            'db_histogram' => array_fill(0, count(static::TIME_BUCKETS) + 1, 0),
+            'query_histogram' => array_fill(0, count(static::QUERY_BUCKETS) + 1, 0),
+        ];
+    }
+
+    protected static function merge(array $a, array $b)
+    {
+        foreach (['requests', 'wall_ms', 'db_ms', 'queries'] as $sum) {
+            $a[$sum] += $b[$sum];
+        }
+        foreach (['max_queries', 'peak_memory_mb'] as $max) {
+            $a[$max] = max($a[$max], $b[$max]);
+        }
+        foreach (['wall_histogram', 'db_histogram', 'query_histogram'] as $histogram) {
+            foreach ($b[$histogram] as $i => $count) {
+                $a[$histogram][$i] += $count;
+            }
+        }
+        if ($b['slowest_ms'] > $a['slowest_ms']) {
+            $a['slowest_ms'] = $b['slowest_ms'];
+            $a['slowest_sql'] = $b['slowest_sql'];
+        }
+
+        return $a;
+    }
+
+    /**
+     * Index of the first bucket whose upper bound holds the value; the last bucket is open-ended
+     */
+    protected static function bucket(array $bounds, $value)
+    {
+        foreach ($bounds as $i => $bound) {
+            if ($value <= $bound) {
+                return $i;
+            }
+        }
+
+        return count($bounds);
+    }
+
+    /**
+     * Upper bound of the bucket holding a percentile, or null in the open-ended bucket
+     */
+    protected static function percentile(array $bounds, array $histogram, $fraction)
+    {
+        $target = array_sum($histogram) * $fraction;
+        $seen = 0;
+
+        foreach ($histogram as $i => $count) {
+            $seen += $count;
+            if ($count && $seen >= $target) {
+                return $bounds[$i] ?? null;
+            }
+        }
+
+        return null;
+    }
+
+    /**
+     * Histogram keyed by bucket label ("<=50", ">5000")
+     */
+    protected static function labelled(array $bounds, array $histogram)
+    {
+        $labelled = [];
+        foreach ($histogram as $i => $count) {
+            $labelled[isset($bounds[$i]) ? '<=' . $bounds[$i] : '>' . end($bounds)] = $count;
+        }
+
+        return $labelled;
+    }
+
+    protected static function windowStart($timestamp)
+    {
+        return $timestamp - $timestamp % static::WINDOW;
+    }
+
+    protected static function entryPrefix($windowStart, $route)
+    {
+        return 'request-metrics:' . $windowStart . ':' . md5($route);
+    }
+}
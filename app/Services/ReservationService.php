@@ -0,0 +1,135 @@
+<?php
+
+namespace App\Services;
+
+use App\Models\Booking;
+use App\Models\Payment;
+use App\Models\RoomClaim;
+use Illuminate\Database\UniqueConstraintViolationException;
+use Illuminate\Support\Facades\DB;
+
+class ReservationService
+{
+    /**
+     * Transaction attempts when the database reports a deadlock
+     */
+    const ATTEMPTS = 3;
+
+    /**
+     * Create a booking and claim its room-nights atomically
+     *
+     * Returns [booking, null] on success, or [null, reason] where reason is
+     * 'unavailable' (a night is taken) or 'duplicate' (the booking id exists).
+     * $within runs with the new booking inside the same transaction, for rows
+     * that must only exist together with it. Nothing is written when the
+     * reservation fails.
+     */
+    public static function reserve(array $attributes, ?callable $within = null)
+    {
+        // Fail fast, without writing, when the stay is visibly taken
+        if (!RoomInventoryService::isAvailable($attributes['room_type'], $attributes['check_in'], $attributes['check_out'])) {
+            return [null, 'unavailable'];
+        }
+
+        try {
+            $booking = DB::transaction(function () use ($attributes, $within) {
+                $booking = Booking::create($attributes);
+
+                if ($within) {
+                    $within($booking);
+                }
+
+                // Claimed last, so the unique-index entries are only held until commit
+                static::claim($booking);
+
+                return $booking;
+            }, static::ATTEMPTS);
+        } catch (UniqueConstraintViolationException $e) {
+            // Either another request claimed a night first or the booking id was reused
+            $duplicate = Booking::where('booking_id', $attributes['booking_id'])->exists();
+
+            return [null, $duplicate ? 'duplicate' : 'unavailable'];
+        }
+
+        return [$booking, null];
+    }
+
+    /**
+     * Reserve a stay and record its payment in one transaction
+     *
+     * The booking is created already paid and the payment is charged the
+     * server-side total, so neither is written again afterwards. Returns
+     * [booking, payment, null] or [null, null, reason] as reserve() does.
+     */
+    public static function checkout(array $attributes, array $payment)
+    {
+        $created = null;
+
+        [$booking, $conflict] = static::reserve(
+            array_merge($attributes, ['paid_status' => 'paid']),
+            function (Booking $booking) use ($payment, &$created) {
+                $created = Payment::create(array_merge($payment, [
+                    'booking_id' => $booking->booking_id,
+                    'amount' => $booking->total,
+                ]));
+            }
+        );
+
+        return [$booking, $conflict ? null : $created, $conflict];
+    }
+
+    /**
+     * Claim every night of a booking's stay; fails on the first night already claimed
+     */
+    public static function claim(Booking $booking)
+    {
+        RoomClaim::insert(static::claimRows($booking));
+    }
+
+    /**
+     * Claim the nights of many bookings with chunked multi-row inserts
+     *
+     * Fails like claim() when a night is taken, unless $skipTaken is set: then
+     * the night stays with the booking that claimed it first. Rebuilds use that
+     * for stays that overlapped before claims existed. Returns the number of
+     * claims written.
+     */
+    public static function claimMany($bookings, $skipTaken = false)
+    {
+        $rows = [];
+        foreach ($bookings as $booking) {
+            array_push($rows, ...static::claimRows($booking));
+        }
+
+        $written = 0;
+        foreach (array_chunk($rows, 500) as $chunk) {
+            $written += $skipTaken ? RoomClaim::insertOrIgnore($chunk) : (RoomClaim::insert($chunk) ? count($chunk) : 0);
+        }
+
+        return $written;
+    }
+
+    /**
+     * Give back the nights a booking claimed
+     */
+    public static function release(Booking $booking)
+    {
+        RoomClaim::where('booking_id', $booking->id)->delete();
+    }
+
+    /**
+     * Build the room_claims rows for a booking
+     */
+    protected static function claimRows(Booking $booking)
+    {
+        $now = now()->toDateTimeString();
+
+        return array_map(fn ($night) => [
+            'room_type' => $booking->room_type,
+            'night' => $night,
+            'booking_id' => $booking->id,
+            'created_at' => $now,
+            'updated_at' => $now,
+        ], RoomInventoryService::nightsBetween($booking->check_in, $booking->check_out));
+    }
+}
@@ -0,0 +1,225 @@
+<?php
+
+namespace App\Services;
+
+use Illuminate\Http\Request;
+use Illuminate\Support\Facades\Cache;
+use Illuminate\Support\Facades\DB;
+
+class ResponseCacheService
+{
+    /**
+     * How long a cached response is kept (seconds)
+     */
+    const TTL = 600;
+
+    /**
+     * Tag covering every room listing page
+     */
+    const LIST_TAG = 'rooms';
+
+    /**
+     * How long hit/miss counters live without traffic (seconds)
+     */
+    const STATS_TTL = 2592000;
+
+    /**
+     * How long a long-lived worker buffers hit/miss counts before writing them (seconds)
+     */
+    const STATS_FLUSH_SECONDS = 10;
+
+    /**
+     * Hit/miss counts not yet written, per scope and counter
+     */
+    protected static $pendingStats = [];
+
+    /**
+     * When the oldest buffered count was taken
+     */
+    protected static $pendingSince = null;
+
+    /**
+     * Whether this process serves many requests (an Octane worker)
+     */
+    protected static $longLived = false;
+
+    /**
+     * Cache a response body under a request's key, with its strong ETag
+     */
+    public static function put($key, $status, $content, $contentType)
+    {
+        $entry = [
+            'status' => $status,
+            'content' => $content,
+            'content_type' => $contentType,
+            'etag' => '"' . sha1($content) . '"',
+        ];
+
+        Cache::put($key, $entry, static::TTL);
+
+        return $entry;
+    }
+
+    /**
+     * Cached response entry for a key, if any
+     */
+    public static function get($key)
+    {
+        return Cache::get($key);
+    }
+
+    /**
+     * Cache key for a request: path, normalized query string and tag generations
+     *
+     * The cache store has no tags, so each tag is a generation value that is
+     * replaced on invalidation; keys built from an old generation are never
+     * read again and simply expire.
+     */
+    public static function key(Request $request, array $tags)
+    {
+        $query = $request->query();
+        static::sortRecursive($query);
+
+        $generations = [];
+        foreach ($tags as $tag) {
+            $generations[] = $tag . '@' . static::generation($tag);
+        }
+
+        return 'response-cache:' . sha1($request->path() . '?' . http_build_query($query) . '|' . implode(',', $generations));
+    }
+
+    /**
+     * Invalidate cached responses for rooms (their detail and reviews) and every listing
+     */
+    public static function forgetRooms(array $roomIds)
+    {
+        // Wait for the surrounding write to commit so a concurrent miss cannot re-cache old data
+        DB::afterCommit(function () use ($roomIds) {
+            foreach (array_unique($roomIds) as $roomId) {
+                static::bump('room:' . $roomId);
+            }
+            static::bump(static::LIST_TAG);
+        });
+    }
+
+    /**
+     * Invalidate cached responses for one room and every listing
+     */
+    public static function forgetRoom($roomId)
+    {
+        static::forgetRooms([$roomId]);
+    }
+
+    /**
+     * Count a hit or a miss for a cached route
+     *
+     * Counts are buffered in the process and written by flushStats(). A
+     * long-lived worker writes them at most every STATS_FLUSH_SECONDS; a
+     * classic boot keeps nothing between requests, so there only one request
+     * in cache.response_stats_sample is counted, weighted by that rate.
+     */
+    public static function record($scope, $hit)
+    {
+        $rate = static::$longLived ? 1 : max(1, (int) config('cache.response_stats_sample', 1));
+
+        if ($rate > 1 && random_int(1, $rate) !== 1) {
+            return;
+        }
+
+        $counter = $hit ? 'hits' : 'misses';
+        static::$pendingStats[$scope][$counter] = (static::$pendingStats[$scope][$counter] ?? 0) + $rate;
+        static::$pendingSince ??= now()->getTimestamp();
+    }
+
+    /**
+     * Write buffered hit/miss counts, one increment per counter
+     *
+     * A long-lived worker keeps buffering until the oldest count is
+     * STATS_FLUSH_SECONDS old, unless $force is set.
+     */
+    public static function flushStats($force = false)
+    {
+        if (!static::$pendingStats) {
+            return;
+        }
+
+        if (static::$longLived && !$force && now()->getTimestamp() - static::$pendingSince < static::STATS_FLUSH_SECONDS) {
+            return;
+        }
+
+        $pending = static::$pendingStats;
+        static::$pendingStats = [];
+        static::$pendingSince = null;
+
+        foreach ($pending as $scope => $counters) {
+            foreach ($counters as $counter => $count) {
+                $key = static::counterKey($scope, $counter);
+
+                // The counter is only created when it does not exist yet
+                if (Cache::increment($key, $count) === false) {
+                    Cache::add($key, 0, static::STATS_TTL);
+                    Cache::increment($key, $count);
+                }
+            }
+        }
+    }
+
+    /**
+     * Mark this process as a long-lived worker, whose buffer outlives a request
+     */
+    public static function longLived(bool $longLived)
+    {
+        static::$longLived = $longLived;
+    }
+
+    /**
+     * Hits, misses and hit rate per cached route
+     */
+    public static function stats(array $scopes = ['rooms', 'room', 'reviews'])
+    {
+        $stats = [];
+        foreach ($scopes as $scope) {
+            $hits = (int) Cache::get(static::counterKey($scope, 'hits'), 0);
+            $misses = (int) Cache::get(static::counterKey($scope, 'misses'), 0);
+
+            $stats[$scope] = [
+                'hits' => $hits,
+                'misses' => $misses,
+                'hit_rate' => $hits + $misses ? round($hits / ($hits + $misses), 4) : null,
+            ];
+        }
+
+        return $stats;
+    }
+
+    /**
+     * Current generation of a tag
+     */
+    protected static function generation($tag)
+    {
+        return Cache::rememberForever('response-cache:gen:' . $tag, fn () => uniqid());
+    }
+
+    /**
+     * Move a tag to a new generation
+     */
+    protected static function bump($tag)
+    {
+        Cache::forever('response-cache:gen:' . $tag, uniqid('', true));
+    }
+
+    protected static function counterKey($scope, $counter)
+    {
+        return "response-cache:stats:{$scope}:{$counter}";
+    }
+
+    protected static function sortRecursive(array &$values)
+    {
+        ksort($values);
+        foreach ($values as &$value) {
+            if (is_array($value)) {
+                static::sortRecursive($value);
+            }
+        }
+    }
+}
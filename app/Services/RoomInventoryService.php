@@ -0,0 +1,299 @@
+<?php
+
+namespace App\Services;
+
+use App\Models\Booking;
+use App\Models\RoomClaim;
+use App\Models\RoomNight;
+use Carbon\Carbon;
+use Carbon\CarbonPeriod;
+use Illuminate\Support\Facades\Cache;
+
+class RoomInventoryService
+{
+    /**
+     * Booking fields that decide which room-nights a booking holds
+     */
+    const TRACKED_FIELDS = ['room_type', 'check_in', 'check_out', 'status', 'paid_status', 'refund_amount'];
+
+    /**
+     * How long a month of the availability calendar stays cached (seconds)
+     */
+    const CALENDAR_TTL = 86400;
+
+    /**
+     * List the nights (Y-m-d) a stay occupies, check-out day excluded
+     */
+    public static function nightsBetween($checkIn, $checkOut)
+    {
+        $start = Carbon::parse($checkIn)->startOfDay();
+        $end = Carbon::parse($checkOut)->startOfDay();
+
+        if ($end->lte($start)) {
+            $end = $start->copy()->addDay();
+        }
+
+        $nights = [];
+        foreach (CarbonPeriod::create($start, $end->subDay()) as $night) {
+            $nights[] = $night->toDateString();
+        }
+
+        return $nights;
+    }
+
+    /**
+     * Check that no reservation claims and no paid booking holds any night of the stay
+     */
+    public static function isAvailable($roomType, $checkIn, $checkOut)
+    {
+        $nights = static::nightsBetween($checkIn, $checkOut);
+
+        $claimed = RoomClaim::where('room_type', $roomType)
+            ->whereBetween('night', [reset($nights), end($nights)])
+            ->exists();
+
+        return !$claimed && !RoomNight::where('room_type', $roomType)
+            ->where('status', 'booked')
+            ->whereBetween('night', [reset($nights), end($nights)])
+            ->exists();
+    }
+
+    /**
+     * Occupancy bitmap for one month: bit (day - 1) is set when the night is booked
+     */
+    public static function monthBitmap($roomType, $year, $month)
+    {
+        return Cache::remember(static::calendarKey($roomType, $year, $month), static::CALENDAR_TTL, function () use ($roomType, $year, $month) {
+            $start = Carbon::create($year, $month, 1);
+
+            $nights = RoomNight::where('room_type', $roomType)
+                ->where('status', 'booked')
+                ->whereBetween('night', [$start->toDateString(), $start->copy()->endOfMonth()->toDateString()])
+                ->distinct()
+                ->pluck('night');
+
+            $bitmap = 0;
+            foreach ($nights as $night) {
+                $bitmap |= 1 << (Carbon::parse($night)->day - 1);
+            }
+
+            return $bitmap;
+        });
+    }
+
+    /**
+     * Evict the cached calendar months covered by a stay
+     */
+    public static function forgetCalendar($roomType, $checkIn, $checkOut)
+    {
+        $nights = static::nightsBetween($checkIn, $checkOut);
+        $month = Carbon::parse(reset($nights))->startOfMonth();
+        $last = Carbon::parse(end($nights))->startOfMonth();
+
+        while ($month->lte($last)) {
+            Cache::forget(static::calendarKey($roomType, $month->year, $month->month));
+            $month->addMonth();
+        }
+    }
+
+    /**
+     * Write the nights held and claimed by a booking, replacing any previous rows
+     *
+     * A new booking is claimed by ReservationService::reserve() or the import,
+     * so only an updated one re-claims here. When another booking already
+     * claimed one of its new nights this throws, and an update made inside a
+     * transaction is rolled back with it.
+     */
+    public static function sync(Booking $booking)
+    {
+        static::release($booking);
+        static::forgetCalendarFor($booking);
+
+        if (static::holdsInventory($booking)) {
+            RoomNight::insert(static::rowsFor($booking));
+
+            if (!$booking->wasRecentlyCreated || $booking->wasChanged()) {
+                ReservationService::claim($booking);
+            }
+        }
+    }
+
+    /**
+     * Keep the inventory in step with a booking that was just updated
+     */
+    public static function syncChanges(Booking $booking)
+    {
+        if (!$booking->wasChanged(static::TRACKED_FIELDS)) {
+            return;
+        }
+
+        // Only the payment state moved: flip the status of the existing rows
+        if (static::holdsInventory($booking) && !$booking->wasChanged(['room_type', 'check_in', 'check_out'])
+            && RoomNight::where('booking_id', $booking->id)->exists()) {
+            RoomNight::where('booking_id', $booking->id)
+                ->update(['status' => static::statusFor($booking), 'updated_at' => now()]);
+            static::forgetCalendarFor($booking);
+            return;
+        }
+
+        static::sync($booking);
+    }
+
+    /**
+     * Turn the held nights of bookings marked paid by a set-based update into booked ones
+     */
+    public static function bookingsPaid($bookings)
+    {
+        $holding = $bookings->filter(fn ($booking) => static::holdsInventory($booking));
+
+        if ($holding->isEmpty()) {
+            return;
+        }
+
+        RoomNight::whereIn('booking_id', $holding->modelKeys())
+            ->update(['status' => 'booked', 'updated_at' => now()]);
+
+        foreach ($holding as $booking) {
+            static::forgetCalendar($booking->room_type, $booking->check_in, $booking->check_out);
+        }
+    }
+
+    /**
+     * Free every night held or claimed by a booking
+     */
+    public static function release(Booking $booking)
+    {
+        RoomNight::where('booking_id', $booking->id)->delete();
+        ReservationService::release($booking);
+    }
+
+    /**
+     * Evict the calendar months a booking covered before and after its last write
+     */
+    public static function forgetCalendarFor(Booking $booking)
+    {
+        // Only paid bookings show up on the calendar
+        if ($booking->paid_status !== 'paid' && $booking->getOriginal('paid_status') !== 'paid') {
+            return;
+        }
+
+        if ($booking->getOriginal('check_in') && $booking->getOriginal('check_out')) {
+            static::forgetCalendar(
+                $booking->getOriginal('room_type'),
+                $booking->getOriginal('check_in'),
+                $booking->getOriginal('check_out')
+            );
+        }
+
+        static::forgetCalendar($booking->room_type, $booking->check_in, $booking->check_out);
+    }
+
+    /**
+     * Rebuild the whole inventory and the reservation claims from the bookings table
+     *
+     * Where stays overlapped before claims existed, the booking with the
+     * lower id keeps the night. Returns ['nights' => ..., 'claims' => ...].
+     */
+    public static function rebuild($chunkSize = 500)
+    {
+        static::forgetAllCalendars();
+        RoomNight::query()->delete();
+        RoomClaim::query()->delete();
+
+        $nights = 0;
+        $claims = 0;
+
+        Booking::where('status', '!=', 'cancelled')
+            ->whereNull('refund_amount')
+            ->select(['id', 'room_type', 'check_in', 'check_out', 'status', 'paid_status', 'refund_amount'])
+            ->chunkById($chunkSize, function ($bookings) use (&$nights, &$claims) {
+                $nights += static::insertFor($bookings);
+                $claims += ReservationService::claimMany($bookings->filter(fn ($booking) => static::holdsInventory($booking)), true);
+            });
+
+        static::forgetAllCalendars();
+
+        return ['nights' => $nights, 'claims' => $claims];
+    }
+
+    /**
+     * Write the nights held by bookings that have no inventory rows yet
+     *
+     * Used for bulk inserts, which bypass the model events. Returns the number
+     * of room-night rows written.
+     */
+    public static function insertFor($bookings)
+    {
+        $rows = [];
+        foreach ($bookings as $booking) {
+            if (static::holdsInventory($booking)) {
+                array_push($rows, ...static::rowsFor($booking));
+            }
+        }
+
+        foreach (array_chunk($rows, 500) as $chunk) {
+            RoomNight::insert($chunk);
+        }
+
+        return count($rows);
+    }
+
+    /**
+     * Evict every cached calendar month that has inventory behind it
+     */
+    protected static function forgetAllCalendars()
+    {
+        $ranges = RoomNight::selectRaw('room_type, MIN(night) as first_night, MAX(night) as last_night')
+            ->groupBy('room_type')
+            ->toBase()
+            ->get();
+
+        foreach ($ranges as $range) {
+            static::forgetCalendar($range->room_type, $range->first_night, Carbon::parse($range->last_night)->addDay());
+        }
+    }
+
+    /**
+     * Cache key for one month of a room type's calendar
+     */
+    protected static function calendarKey($roomType, $year, $month)
+    {
+        return sprintf('room-calendar:%s:%04d-%02d', $roomType, $year, $month);
+    }
+
+    /**
+     * Whether a booking should hold room-nights at all
+     */
+    protected static function holdsInventory(Booking $booking)
+    {
+        return $booking->status !== 'cancelled'
+            && $booking->paid_status !== 'refunded'
+            && $booking->refund_amount === null;
+    }
+
+    /**
+     * Inventory status for a booking: paid bookings block the room
+     */
+    protected static function statusFor(Booking $booking)
+    {
+        return $booking->paid_status === 'paid' ? 'booked' : 'held';
+    }
+
+    /**
+     * Build the room_nights rows for a booking
+     */
+    protected static function rowsFor(Booking $booking)
+    {
+        $now = now();
+        $status = static::statusFor($booking);
+
+        return array_map(fn ($night) => [
+            'booking_id' => $booking->id,
+            'room_type' => $booking->room_type,
+            'night' => $night,
+            'status' => $status,
+            'created_at' => $now,
+            'updated_at' => $now,
+        ], static::nightsBetween($booking->check_in, $booking->check_out));
+    }
+}
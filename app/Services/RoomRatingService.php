@@ -0,0 +1,143 @@
+<?php
+
+namespace App\Services;
+
+use App\Models\Review;
+use App\Models\Room;
+use Illuminate\Support\Facades\DB;
+
+class RoomRatingService
+{
+    /**
+     * Count a new review in its room's aggregates
+     */
+    public static function reviewAdded(Review $review)
+    {
+        static::apply($review->room_id, [
+            'review_count' => DB::raw('review_count + 1'),
+            'rating_sum' => DB::raw('rating_sum + ' . static::stars($review->rating)),
+            static::bucket($review->rating) => DB::raw(static::bucket($review->rating) . ' + 1'),
+        ]);
+    }
+
+    /**
+     * Move a review from its old rating to its new one
+     */
+    public static function reviewChanged(Review $review, $oldRating)
+    {
+        $old = static::stars($oldRating);
+        $new = static::stars($review->rating);
+
+        if ($old === $new) {
+            return;
+        }
+
+        static::apply($review->room_id, [
+            'rating_sum' => DB::raw('rating_sum + ' . ($new - $old)),
+            static::bucket($old) => DB::raw(static::bucket($old) . ' - 1'),
+            static::bucket($new) => DB::raw(static::bucket($new) . ' + 1'),
+        ]);
+    }
+
+    /**
+     * Take a deleted review out of its room's aggregates
+     */
+    public static function reviewRemoved(Review $review)
+    {
+        static::apply($review->room_id, [
+            'review_count' => DB::raw('review_count - 1'),
+            'rating_sum' => DB::raw('rating_sum - ' . static::stars($review->rating)),
+            static::bucket($review->rating) => DB::raw(static::bucket($review->rating) . ' - 1'),
+        ]);
+    }
+
+    /**
+     * Recompute the aggregates from the reviews table and fix any drift
+     *
+     * Returns the number of rooms whose stored values were wrong.
+     */
+    public static function reconcile($roomId = null)
+    {
+        $counts = Review::selectRaw('room_id, rating, COUNT(*) as total')
+            ->when($roomId, fn ($query) => $query->where('room_id', $roomId))
+            ->groupBy('room_id', 'rating')
+            ->toBase()
+            ->get()
+            ->groupBy('room_id');
+
+        $fixed = 0;
+
+        Room::when($roomId, fn ($query) => $query->whereKey($roomId))
+            ->chunkById(200, function ($rooms) use ($counts, &$fixed) {
+                foreach ($rooms as $room) {
+                    $expected = static::aggregatesFor($counts->get($room->id, collect()));
+
+                    $drifted = collect($expected)->contains(
+                        fn ($value, $column) => (float) $room->getAttribute($column) !== (float) $value
+                    );
+
+                    if ($drifted) {
+                        Room::whereKey($room->id)->update($expected);
+                        ResponseCacheService::forgetRoom($room->id);
+                        $fixed++;
+                    }
+                }
+            });
+
+        return $fixed;
+    }
+
+    /**
+     * Build the stored aggregate columns from per-rating review counts
+     */
+    protected static function aggregatesFor($rows)
+    {
+        $aggregates = ['review_count' => 0, 'rating_sum' => 0];
+        foreach (range(1, 5) as $stars) {
+            $aggregates["stars_{$stars}"] = 0;
+        }
+
+        foreach ($rows as $row) {
+            $stars = static::stars($row->rating);
+            $aggregates["stars_{$stars}"] += $row->total;
+            $aggregates['review_count'] += $row->total;
+            $aggregates['rating_sum'] += $stars * $row->total;
+        }
+
+        $aggregates['rating_avg'] = $aggregates['review_count']
+            ? round($aggregates['rating_sum'] / $aggregates['review_count'], 2)
+            : 0;
+
+        return $aggregates;
+    }
+
+    /**
+     * Apply counter changes to a room, then refresh its stored average
+     */
+    protected static function apply($roomId, array $changes)
+    {
+        // Two statements: databases disagree on whether later SET clauses see earlier ones
+        Room::whereKey($roomId)->toBase()->update($changes);
+        Room::whereKey($roomId)->toBase()->update([
+            'rating_avg' => DB::raw('CASE WHEN review_count > 0 THEN ROUND(rating_sum * 1.0 / review_count, 2) ELSE 0 END'),
+        ]);
+
+        ResponseCacheService::forgetRoom($roomId);
+    }
+
+    /**
+     * Clamp a rating to a valid 1-5 star value
+     */
+    protected static function stars($rating)
+    {
+        return max(1, min(5, (int) $rating));
+    }
+
+    /**
+     * Histogram column for a rating
+     */
+    protected static function bucket($rating)
+    {
+        return 'stars_' . static::stars($rating);
+    }
+}
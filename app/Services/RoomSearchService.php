@@ -0,0 +1,209 @@
+<?php
+
+namespace App\Services;
+
+use App\Models\Room;
+use App\Models\RoomAmenity;
+use Illuminate\Pagination\LengthAwarePaginator;
+use Illuminate\Pagination\Paginator;
+
+class RoomSearchService
+{
+    /**
+     * Rooms per search page
+     */
+    const PER_PAGE = 12;
+
+    /**
+     * Lower bounds of the price facet buckets; the last bucket is open-ended
+     */
+    const PRICE_BUCKETS = [0, 100, 200, 300, 500];
+
+    /**
+     * Search available rooms and count facets for the filter sidebar
+     *
+     * Filters: room_type, min_price + max_price, capacity, amenities (all must
+     * match). The total, room type, amenity and price bucket counts come from
+     * one UNION ALL query, which also replaces the paginator's COUNT.
+     * Room type and price counts ignore their own filter so the sidebar can
+     * offer the alternatives; amenity counts are within the current results.
+     *
+     * Returns [paginator, facets].
+     */
+    public static function search(array $filters, int $page = 1)
+    {
+        $facets = static::facets($filters);
+
+        $rooms = $facets['total'] > 0
+            ? static::filtered($filters)->orderBy('id')->forPage($page, static::PER_PAGE)->get()
+            : collect();
+
+        $paginator = new LengthAwarePaginator($rooms, $facets['total'], static::PER_PAGE, $page, [
+            'path' => Paginator::resolveCurrentPath(),
+        ]);
+
+        unset($facets['total']);
+
+        return [$paginator, $facets];
+    }
+
+    /**
+     * Available rooms matching the filters, optionally leaving one filter out
+     */
+    public static function filtered(array $filters, ?string $except = null)
+    {
+        $query = Room::where('status', 'available');
+
+        if (isset($filters['room_type']) && $except !== 'room_type') {
+            $query->where('room_type', $filters['room_type']);
+        }
+
+        if (isset($filters['min_price'], $filters['max_price']) && $except !== 'price') {
+            $query->whereBetween('price', [(float) $filters['min_price'], (float) $filters['max_price']]);
+        }
+
+        if (isset($filters['capacity'])) {
+            $query->where('capacity', '>=', (int) $filters['capacity']);
+        }
+
+        $amenities = static::normalize($filters['amenities'] ?? []);
+        if ($amenities) {
+            // Rooms having every requested amenity, read from the (amenity, room_id) index
+            $query->whereIn('id', RoomAmenity::select('room_id')
+                ->whereIn('amenity', $amenities)
+                ->groupBy('room_id')
+                ->havingRaw('COUNT(*) = ?', [count($amenities)]));
+        }
+
+        return $query;
+    }
+
+    /**
+     * Total plus room type, amenity and price bucket counts in one round trip
+     */
+    public static function facets(array $filters)
+    {
+        $bucket = static::bucketExpression();
+
+        $total = static::filtered($filters)->toBase()
+            ->selectRaw("'total' as facet, '' as value, COUNT(*) as aggregate");
+
+        $roomTypes = static::filtered($filters, 'room_type')->toBase()
+            ->selectRaw("'room_type' as facet, room_type as value, COUNT(*) as aggregate")
+            ->groupBy('room_type');
+
+        $amenities = RoomAmenity::query()->toBase()
+            ->selectRaw("'amenity' as facet, amenity as value, COUNT(*) as aggregate")
+            ->whereIn('room_id', static::filtered($filters)->select('id'))
+            ->groupBy('amenity');
+
+        $prices = static::filtered($filters, 'price')->toBase()
+            ->selectRaw("'price' as facet, {$bucket} as value, COUNT(*) as aggregate")
+            ->groupByRaw($bucket);
+
+        $rows = $total->unionAll($roomTypes)->unionAll($amenities)->unionAll($prices)->get();
+
+        $facets = ['total' => 0, 'room_types' => [], 'amenities' => [], 'price' => []];
+        $priceCounts = [];
+
+        foreach ($rows as $row) {
+            switch ($row->facet) {
+                case 'total':
+                    $facets['total'] = (int) $row->aggregate;
+                    break;
+                case 'room_type':
+                    $facets['room_types'][] = ['value' => $row->value, 'count' => (int) $row->aggregate];
+                    break;
+                case 'amenity':
+                    $facets['amenities'][] = ['value' => $row->value, 'count' => (int) $row->aggregate];
+                    break;
+                case 'price':
+                    $priceCounts[(int) $row->value] = (int) $row->aggregate;
+                    break;
+            }
+        }
+
+        $byCount = fn ($a, $b) => [$b['count'], $a['value']] <=> [$a['count'], $b['value']];
+        usort($facets['room_types'], $byCount);
+        usort($facets['amenities'], $byCount);
+
+        foreach (static::PRICE_BUCKETS as $i => $min) {
+            $facets['price'][] = [
+                'min' => $min,
+                'max' => static::PRICE_BUCKETS[$i + 1] ?? null,
+                'count' => $priceCounts[$min] ?? 0,
+            ];
+        }
+
+        return $facets;
+    }
+
+    /**
+     * Rewrite a room's amenity rows from its amenities JSON
+     */
+    public static function syncAmenities(Room $room)
+    {
+        RoomAmenity::where('room_id', $room->id)->delete();
+
+        $rows = array_map(
+            fn ($amenity) => ['room_id' => $room->id, 'amenity' => $amenity],
+            static::normalize($room->amenities ?? [])
+        );
+
+        if ($rows) {
+            RoomAmenity::insert($rows);
+        }
+    }
+
+    /**
+     * Rebuild room_amenities for every room; returns the number of rows written
+     */
+    public static function rebuild()
+    {
+        RoomAmenity::query()->delete();
+
+        $written = 0;
+
+        Room::select(['id', 'amenities'])->chunkById(500, function ($rooms) use (&$written) {
+            $rows = [];
+            foreach ($rooms as $room) {
+                foreach (static::normalize($room->amenities ?? []) as $amenity) {
+                    $rows[] = ['room_id' => $room->id, 'amenity' => $amenity];
+                }
+            }
+
+            foreach (array_chunk($rows, 1000) as $chunk) {
+                RoomAmenity::insert($chunk);
+            }
+
+            $written += count($rows);
+        });
+
+        return $written;
+    }
+
+    /**
+     * Trimmed, non-empty, distinct amenity names
+     */
+    public static function normalize($amenities)
+    {
+        if (!is_array($amenities)) {
+            return [];
+        }
+
+        $names = array_map(fn ($amenity) => is_string($amenity) ? trim($amenity) : '', $amenities);
+
+        return array_values(array_unique(array_filter($names, fn ($amenity) => $amenity !== '')));
+    }
+
+    /**
+     * SQL CASE mapping a room price to the lower bound of its bucket (as text)
+     */
+    protected static function bucketExpression()
+    {
+        $bounds = array_reverse(static::PRICE_BUCKETS);
+        $cases = array_map(fn ($min) => "WHEN price >= {$min} THEN '{$min}'", $bounds);
+
+        return 'CASE ' . implode(' ', $cases) . " ELSE '0' END";
+    }
+}
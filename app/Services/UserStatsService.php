@@ -0,0 +1,267 @@
+<?php
+
+namespace App\Services;
+
+use App\Models\Booking;
+use App\Models\Payment;
+use App\Models\User;
+use App\Models\UserStat;
+use Illuminate\Support\Facades\DB;
+
+class UserStatsService
+{
+    /**
+     * Count a new booking against its user
+     */
+    public static function bookingCreated(Booking $booking)
+    {
+        if (!$booking->user_id) {
+            return;
+        }
+
+        static::ensure($booking->user_id);
+
+        UserStat::where('user_id', $booking->user_id)->increment('booking_count', 1, [
+            'cancellation_count' => DB::raw('cancellation_count + ' . ($booking->status === 'cancelled' ? 1 : 0)),
+        ]);
+
+        if ($booking->status !== 'cancelled') {
+            static::bumpLastStay($booking->user_id, $booking->check_out);
+        }
+    }
+
+    /**
+     * Follow cancellations, date changes and ownership changes of a booking
+     */
+    public static function bookingChanged(Booking $booking)
+    {
+        if (!$booking->wasChanged(['user_id', 'status', 'check_out'])) {
+            return;
+        }
+
+        if ($booking->wasChanged('user_id')) {
+            static::refreshUser($booking->getOriginal('user_id'));
+            static::refreshUser($booking->user_id);
+            return;
+        }
+
+        if (!$booking->user_id) {
+            return;
+        }
+
+        $wasCancelled = $booking->getOriginal('status') === 'cancelled';
+        $isCancelled = $booking->status === 'cancelled';
+
+        if ($wasCancelled !== $isCancelled) {
+            static::ensure($booking->user_id);
+            UserStat::where('user_id', $booking->user_id)
+                ->increment('cancellation_count', $isCancelled ? 1 : -1);
+        }
+
+        if ($isCancelled || $wasCancelled || $booking->wasChanged('check_out')) {
+            static::refreshLastStay($booking->user_id);
+        }
+    }
+
+    /**
+     * Take a deleted booking out of its user's stats
+     */
+    public static function bookingDeleted(Booking $booking)
+    {
+        static::refreshUser($booking->user_id);
+    }
+
+    /**
+     * Add a new payment to its payer's lifetime spend
+     */
+    public static function paymentCreated(Payment $payment)
+    {
+        static::addSpend($payment->user_email, static::spendOf($payment->status, $payment->amount));
+    }
+
+    /**
+     * Follow amount, status or payer changes of a payment
+     */
+    public static function paymentUpdated(Payment $payment)
+    {
+        if (!$payment->wasChanged(['user_email', 'amount', 'status'])) {
+            return;
+        }
+
+        static::addSpend(
+            $payment->getOriginal('user_email'),
+            -static::spendOf($payment->getOriginal('status'), $payment->getOriginal('amount'))
+        );
+        static::addSpend($payment->user_email, static::spendOf($payment->status, $payment->amount));
+    }
+
+    /**
+     * Follow a set-based status update of many payments, one write per payer
+     *
+     * The payments passed in still carry their old status.
+     */
+    public static function paymentsStatusChanged($payments, $status)
+    {
+        foreach ($payments->groupBy('user_email') as $email => $group) {
+            static::addSpend($email, $group->sum(
+                fn ($payment) => static::spendOf($status, $payment->amount) - static::spendOf($payment->status, $payment->amount)
+            ));
+        }
+    }
+
+    /**
+     * Take a deleted payment out of its payer's lifetime spend
+     */
+    public static function paymentDeleted(Payment $payment)
+    {
+        static::addSpend($payment->user_email, -static::spendOf($payment->status, $payment->amount));
+    }
+
+    /**
+     * Recompute stats for every user from bookings and payments
+     *
+     * Returns the number of users processed.
+     */
+    public static function rebuild($chunkSize = 1000)
+    {
+        $processed = 0;
+
+        User::select(['id', 'email'])->chunkById($chunkSize, function ($users) use (&$processed) {
+            $rows = static::computeFor($users);
+            UserStat::whereIn('user_id', $users->pluck('id'))->delete();
+            UserStat::insert($rows);
+            $processed += count($rows);
+        });
+
+        return $processed;
+    }
+
+    /**
+     * Recompute one user's stats from scratch
+     */
+    public static function refreshUser($userId)
+    {
+        static::refreshUsers([$userId]);
+    }
+
+    /**
+     * Recompute stats for a set of users from scratch
+     */
+    public static function refreshUsers(array $userIds)
+    {
+        $userIds = array_values(array_unique(array_filter($userIds)));
+        if (!$userIds) {
+            return;
+        }
+
+        $users = User::select(['id', 'email'])->whereIn('id', $userIds)->get();
+        if ($users->isEmpty()) {
+            return;
+        }
+
+        $rows = static::computeFor($users);
+        UserStat::upsert($rows, ['user_id'], ['booking_count', 'cancellation_count', 'lifetime_spend', 'last_stay_at', 'updated_at']);
+    }
+
+    /**
+     * Build user_stats rows for a set of users with one query per source table and its archive
+     */
+    protected static function computeFor($users)
+    {
+        // Archived history counts too, so a rebuild after archiving changes nothing
+        $bookingRows = fn ($query) => $query->whereIn('user_id', $users->pluck('id'))->select(['user_id', 'status', 'check_out']);
+        $paymentRows = fn ($query) => $query->whereIn('user_email', $users->pluck('email'))
+            ->where('status', '!=', 'rejected')
+            ->select(['user_email', 'amount']);
+
+        $bookings = DB::query()
+            ->fromSub($bookingRows(Booking::query())->unionAll($bookingRows(Booking::archived())), 'bookings')
+            ->selectRaw("user_id, COUNT(*) as booking_count, SUM(CASE WHEN status = 'cancelled' THEN 1 ELSE 0 END) as cancellation_count, MAX(CASE WHEN status != 'cancelled' THEN check_out END) as last_stay_at")
+            ->groupBy('user_id')
+            ->get()
+            ->keyBy('user_id');
+
+        $spend = DB::query()
+            ->fromSub($paymentRows(Payment::query())->unionAll($paymentRows(Payment::archived())), 'payments')
+            ->selectRaw('user_email, SUM(amount) as lifetime_spend')
+            ->groupBy('user_email')
+            ->get()
+            ->keyBy('user_email');
+
+        $now = now();
+
+        return $users->map(fn ($user) => [
+            'user_id' => $user->id,
+            'booking_count' => (int) ($bookings[$user->id]->booking_count ?? 0),
+            'cancellation_count' => (int) ($bookings[$user->id]->cancellation_count ?? 0),
+            'lifetime_spend' => (float) ($spend[$user->email]->lifetime_spend ?? 0),
+            'last_stay_at' => $bookings[$user->id]->last_stay_at ?? null,
+            'created_at' => $now,
+            'updated_at' => $now,
+        ])->values()->all();
+    }
+
+    /**
+     * Amount a payment contributes to lifetime spend
+     */
+    protected static function spendOf($status, $amount)
+    {
+        return $status === 'rejected' ? 0 : (float) $amount;
+    }
+
+    /**
+     * Add to the lifetime spend of the user with this email
+     */
+    protected static function addSpend($email, $amount)
+    {
+        if (!$email || !$amount) {
+            return;
+        }
+
+        $userId = User::where('email', $email)->value('id');
+        if (!$userId) {
+            return;
+        }
+
+        static::ensure($userId);
+        UserStat::where('user_id', $userId)->increment('lifetime_spend', $amount);
+    }
+
+    /**
+     * Move last_stay_at forward if this stay ends later
+     */
+    protected static function bumpLastStay($userId, $checkOut)
+    {
+        UserStat::where('user_id', $userId)
+            ->where(function ($query) use ($checkOut) {
+                $query->whereNull('last_stay_at')->orWhere('last_stay_at', '<', $checkOut);
+            })
+            ->update(['last_stay_at' => $checkOut]);
+    }
+
+    /**
+     * Recompute last_stay_at after a stay was cancelled or moved
+     */
+    protected static function refreshLastStay($userId)
+    {
+        $lastStay = fn ($query) => $query->where('user_id', $userId)
+            ->where('status', '!=', 'cancelled')
+            ->max('check_out');
+
+        UserStat::where('user_id', $userId)->update([
+            'last_stay_at' => max($lastStay(Booking::query()), $lastStay(Booking::archived())),
+        ]);
+    }
+
+    /**
+     * Make sure a stats row exists for the user
+     */
+    protected static function ensure($userId)
+    {
+        UserStat::insertOrIgnore([
+            'user_id' => $userId,
+            'created_at' => now(),
+            'updated_at' => now(),
+        ]);
+    }
+}
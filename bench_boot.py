@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Benchmark the classic per-request boot against a long-lived Octane worker.
+
+Both targets run the same code against the same database; only the way PHP
+serves requests differs:
+
+    classic  php artisan serve         public/index.php boots the app for every request
+    worker   php artisan octane:start  each worker boots the app once and keeps it
+
+Start both yourself and point the script at them:
+
+    PHP_CLI_SERVER_WORKERS=4 php artisan serve --port 8000
+    php artisan octane:start --workers 4 --port 8001
+    python bench_boot.py --classic-url http://127.0.0.1:8000 --worker-url http://127.0.0.1:8001
+
+or let the script start and stop them with --start. Every endpoint gets
+--warmup unmeasured requests, then --requests measured ones with
+--concurrency in flight. The JSON report lists requests/sec and p50/p95/p99
+latency per target and endpoint, plus worker/classic ratios.
+
+Requires aiohttp (pip install aiohttp).
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+import uuid
+from collections import defaultdict
+
+import aiohttp
+
+from load_test import percentile
+
+CLASSIC_URL = 'http://127.0.0.1:8000'
+WORKER_URL = 'http://127.0.0.1:8001'
+
+# Small JSON endpoints where framework boot dominates. Values: (path, needs a token)
+ENDPOINTS = {
+    'rooms': ('/api/rooms', False),
+    'unread_count': ('/api/notifications/unread-count', True),
+}
+
+
+async def sign_in(session, base_url):
+    """Register a throwaway guest and return a Sanctum token for it."""
+    email = f'bench-{uuid.uuid4().hex[:12]}@example.com'
+    body = {'firstName': 'Bench', 'lastName': 'Guest', 'email': email, 'phone': '081234567890', 'password': 'password'}
+
+    async with session.post(base_url + '/api/register', json=body) as response:
+        if response.status not in (200, 201):
+            raise RuntimeError(f'register failed: HTTP {response.status}')
+
+    async with session.post(base_url + '/api/login', json={'email': email, 'password': 'password'}) as response:
+        payload = await response.json()
+        if response.status != 200 or not payload.get('token'):
+            raise RuntimeError(f'login failed: HTTP {response.status}')
+        return payload['token']
+
+
+async def measure(session, url, headers, total, concurrency):
+    """Send `total` GET requests with `concurrency` in flight; returns latency and throughput numbers."""
+    remaining = iter(range(total))
+    latencies = []
+    status_codes = defaultdict(int)
+
+    async def worker():
+        while next(remaining, None) is not None:
+            started = time.perf_counter()
+            try:
+                async with session.get(url, headers=headers) as response:
+                    await response.read()
+                    status = response.status
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                status = 'error'
+            latencies.append((time.perf_counter() - started) * 1000)
+            status_codes[str(status)] += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = max(time.perf_counter() - started, 1e-9)
+
+    samples = sorted(latencies)
+    return {
+        'requests': len(samples),
+        'errors': sum(count for status, count in status_codes.items() if not status.startswith('2')),
+        'rps': round(len(samples) / elapsed, 1),
+        'p50_ms': round(percentile(samples, 50), 2),
+        'p95_ms': round(percentile(samples, 95), 2),
+        'p99_ms': round(percentile(samples, 99), 2),
+        'max_ms': round(samples[-1], 2) if samples else 0.0,
+        'status_codes': dict(status_codes),
+    }
+
+
+async def run(args):
+    targets = {'classic': args.classic_url, 'worker': args.worker_url}
+    timeout = aiohttp.ClientTimeout(total=args.timeout)
+    connector = aiohttp.TCPConnector(limit=args.concurrency * 2)
+    results = {name: {} for name in targets}
+
+    async with aiohttp.ClientSession(timeout=timeout, connector=connector,
+                                     headers={'Accept': 'application/json'}) as session:
+        token = args.token or await sign_in(session, args.classic_url)
+        auth = {'Authorization': f'Bearer {token}'}
+
+        for endpoint, (path, needs_token) in ENDPOINTS.items():
+            headers = auth if needs_token else {}
+            # Alternate targets per endpoint so neither always runs on a cooler machine
+            for name, base_url in targets.items():
+                await measure(session, base_url + path, headers, args.warmup, args.concurrency)
+                results[name][endpoint] = await measure(session, base_url + path, headers, args.requests, args.concurrency)
+                print(f'{name:8} {endpoint:14} {results[name][endpoint]["rps"]:>9} req/s  '
+                      f'p99 {results[name][endpoint]["p99_ms"]:>8} ms', file=sys.stderr)
+
+    comparison = {}
+    for endpoint in ENDPOINTS:
+        classic, worker = results['classic'][endpoint], results['worker'][endpoint]
+        comparison[endpoint] = {
+            'rps_ratio': round(worker['rps'] / classic['rps'], 2) if classic['rps'] else None,
+            'p99_ratio': round(worker['p99_ms'] / classic['p99_ms'], 2) if classic['p99_ms'] else None,
+        }
+
+    return {
+        'config': {
+            'classic_url': args.classic_url,
+            'worker_url': args.worker_url,
+            'requests': args.requests,
+            'warmup': args.warmup,
+            'concurrency': args.concurrency,
+        },
+        'results': results,
+        'worker_vs_classic': comparison,
+    }
+
+
+def start_servers(args):
+    """Start `artisan serve` and `octane:start` on the ports of the two URLs; returns the processes."""
+    port = lambda url: url.rstrip('/').rsplit(':', 1)[-1]
+    classic_env = dict(os.environ, PHP_CLI_SERVER_WORKERS=str(args.workers))
+
+    processes = [
+        subprocess.Popen(['php', 'artisan', 'serve', '--host', '127.0.0.1', '--port', port(args.classic_url)],
+                         env=classic_env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True),
+        subprocess.Popen(['php', 'artisan', 'octane:start', '--host', '127.0.0.1', '--port', port(args.worker_url),
+                          '--workers', str(args.workers), '--server', args.server],
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True),
+    ]
+
+    asyncio.run(wait_until_up([args.classic_url, args.worker_url], args.startup_timeout))
+    return processes
+
+
+async def wait_until_up(urls, limit):
+    deadline = time.monotonic() + limit
+    async with aiohttp.ClientSession() as session:
+        for url in urls:
+            while True:
+                try:
+                    async with session.get(url + '/up') as response:
+                        if response.status == 200:
+                            break
+                except aiohttp.ClientError:
+                    pass
+                if time.monotonic() > deadline:
+                    raise RuntimeError(f'{url} did not come up within {limit}s')
+                await asyncio.sleep(0.25)
+
+
+def stop_servers(processes):
+    for process in processes:
+        try:
+            os.killpg(process.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+    for process in processes:
+        process.wait(timeout=10)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description='Classic boot vs Octane worker benchmark.')
+    parser.add_argument('--classic-url', default=CLASSIC_URL, help=f'php artisan serve / php-fpm host (default {CLASSIC_URL})')
+    parser.add_argument('--worker-url', default=WORKER_URL, help=f'octane:start host (default {WORKER_URL})')
+    parser.add_argument('--token', help='Sanctum token for authenticated endpoints (default: register a guest)')
+    parser.add_argument('--requests', type=int, default=2000, help='measured requests per target and endpoint')
+    parser.add_argument('--warmup', type=int, default=200, help='unmeasured requests sent first')
+    parser.add_argument('--concurrency', type=int, default=16, help='requests in flight')
+    parser.add_argument('--timeout', type=float, default=30.0, help='per-request timeout in seconds')
+    parser.add_argument('--start', action='store_true', help='start and stop both servers on the URL ports')
+    parser.add_argument('--workers', type=int, default=4, help='PHP workers per server when using --start')
+    parser.add_argument('--server', default=os.environ.get('OCTANE_SERVER', 'frankenphp'),
+                        help='Octane server for --start (frankenphp, roadrunner, swoole)')
+    parser.add_argument('--startup-timeout', type=float, default=60.0, help='seconds to wait for --start servers')
+    parser.add_argument('--output', help='write the JSON report to this file as well as stdout')
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.requests < 1 or args.concurrency < 1:
+        print('--requests and --concurrency must be at least 1', file=sys.stderr)
+        return 2
+
+    processes = start_servers(args) if args.start else []
+    try:
+        report = asyncio.run(run(args))
+    finally:
+        stop_servers(processes)
+
+    output = json.dumps(report, indent=2)
+    print(output)
+
+    if args.output:
+        with open(args.output, 'w') as handle:
+            handle.write(output + '\n')
+
+    failed = any(result['errors'] for target in report['results'].values() for result in target.values())
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -14,6 +14,12 @@
     ->withMiddleware(function (Middleware $middleware) {
         $middleware->alias([
             'admin' => \App\Http\Middleware\AdminMiddleware::class,
+            'cache.response' => \App\Http\Middleware\CacheResponse::class,
+            'idempotent' => \App\Http\Middleware\EnsureIdempotency::class,
+        ]);
+
+        $middleware->api(append: [
+            \App\Http\Middleware\RecordRequestMetrics::class,
         ]);
     })
     ->withExceptions(function (Exceptions $exceptions) {
@@ -105,4 +105,30 @@
 
     'prefix' => env('CACHE_PREFIX', Str::slug(env('APP_NAME', 'laravel'), '_').'_cache_'),
 
+    /*
+    |--------------------------------------------------------------------------
+    | Request Metrics Store
+    |--------------------------------------------------------------------------
+    |
+    | Per-route request metrics bump several counters on every request, so
+    | they are only aggregated on a store with atomic increments (redis or
+    | memcached). Leave this empty to use the default store when it is one.
+    |
+    */
+
+    'metrics_store' => env('REQUEST_METRICS_STORE'),
+
+    /*
+    |--------------------------------------------------------------------------
+    | Response Cache Stats Sampling
+    |--------------------------------------------------------------------------
+    |
+    | Octane workers buffer the response cache hit/miss counters and write
+    | them every few seconds. A classic boot cannot buffer across requests,
+    | so it only counts one request in this many, weighted by the rate.
+    |
+    */
+
+    'response_stats_sample' => (int) env('RESPONSE_CACHE_STATS_SAMPLE', 20),
+
 ];
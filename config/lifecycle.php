@@ -0,0 +1,47 @@
+<?php
+
+return [
+
+    /*
+    |--------------------------------------------------------------------------
+    | Unpaid Holds
+    |--------------------------------------------------------------------------
+    |
+    | A confirmed booking that is still unpaid, with no payment submitted,
+    | this many hours after it was made is cancelled and its nights are
+    | released back to inventory.
+    |
+    */
+
+    'hold_hours' => (int) env('LIFECYCLE_HOLD_HOURS', 24),
+
+    /*
+    |--------------------------------------------------------------------------
+    | Archive Horizons
+    |--------------------------------------------------------------------------
+    |
+    | Completed and cancelled bookings whose stay ended before the start of
+    | the month this many months ago move to bookings_archive together with
+    | their payments and notifications. Read notifications move on their own
+    | once they are older than the notification horizon.
+    |
+    */
+
+    'archive_after_months' => (int) env('LIFECYCLE_ARCHIVE_AFTER_MONTHS', 18),
+
+    'notifications_after_days' => (int) env('LIFECYCLE_NOTIFICATIONS_AFTER_DAYS', 90),
+
+    /*
+    |--------------------------------------------------------------------------
+    | Chunk Size
+    |--------------------------------------------------------------------------
+    |
+    | Rows moved per transaction. Each chunk is copied and deleted in one
+    | short transaction so the job never holds locks on the hot tables for
+    | long.
+    |
+    */
+
+    'chunk' => (int) env('LIFECYCLE_CHUNK', 500),
+
+];
@@ -0,0 +1,187 @@
+<?php
+
+namespace Database\Factories;
+
+use Carbon\Carbon;
+use Illuminate\Database\Eloquent\Factories\Factory;
+
+/**
+ * @extends \Illuminate\Database\Eloquent\Factories\Factory<\App\Models\Booking>
+ */
+class BookingFactory extends Factory
+{
+    /**
+     * Relative demand per check-in month: summer and year-end peaks
+     */
+    const MONTH_WEIGHTS = [1 => 0.7, 2 => 0.7, 3 => 0.85, 4 => 0.95, 5 => 1.0, 6 => 1.35, 7 => 1.6, 8 => 1.6, 9 => 1.0, 10 => 0.9, 11 => 0.75, 12 => 1.25];
+
+    /**
+     * Extra demand for Friday and Saturday check-ins
+     */
+    const WEEKEND_WEIGHT = 1.3;
+
+    /**
+     * Length of stay => relative frequency
+     */
+    const NIGHTS = [1 => 30, 2 => 27, 3 => 18, 4 => 9, 5 => 6, 7 => 7, 10 => 2, 14 => 1];
+
+    /**
+     * Days booked ahead as [min, max, relative frequency]
+     */
+    const LEAD_DAYS = [[0, 2, 10], [3, 6, 15], [7, 13, 20], [14, 29, 20], [30, 59, 20], [60, 119, 10], [120, 240, 5]];
+
+    const CANCELLATION_RATE = 0.12;
+
+    /**
+     * Share of bookings paid once the stay has started, and of upcoming ones
+     */
+    const PAID_RATE = 0.85;
+    const UPCOMING_PAID_RATE = 0.4;
+
+    /**
+     * Define the model's default state.
+     *
+     * @return array<string, mixed>
+     */
+    public function definition(): array
+    {
+        $type = fake()->randomElement(array_keys(RoomFactory::TYPES));
+        [$min, $max, $capacity] = RoomFactory::TYPES[$type];
+        $roll = fn () => fake()->randomFloat(6, 0, 1);
+
+        $checkIn = static::seasonalDay(
+            fn () => fake()->numberBetween(now()->subYear()->timestamp, now()->addMonths(6)->timestamp),
+            $roll
+        )->setTime(15, 0);
+        $nights = static::weighted(static::NIGHTS, $roll());
+        $checkOut = $checkIn->copy()->addDays($nights)->setTime(11, 0);
+        $createdAt = $checkIn->copy()->subDays(static::leadDays($roll(), $roll()))
+            ->setTime(fake()->numberBetween(7, 22), fake()->numberBetween(0, 59))
+            ->min(now());
+        $rate = fake()->numberBetween($min, $max);
+        $paidRate = $checkIn->isPast() ? static::PAID_RATE : static::UPCOMING_PAID_RATE;
+
+        return [
+            'user_id' => null,
+            'booking_id' => 'BK' . fake()->unique()->numerify('##########'),
+            'first_name' => fake()->firstName(),
+            'last_name' => fake()->lastName(),
+            'email' => fake()->safeEmail(),
+            'phone' => fake()->numerify('08##########'),
+            'room_type' => $type,
+            'check_in' => $checkIn,
+            'check_out' => $checkOut,
+            'guests' => fake()->numberBetween(1, $capacity),
+            'nights' => $nights,
+            'rate' => $rate,
+            'total' => $rate * $nights,
+            'status' => $checkOut->isPast() ? 'completed' : 'confirmed',
+            'paid_status' => $roll() < $paidRate ? 'paid' : 'unpaid',
+            'created_at' => $createdAt,
+            'updated_at' => $createdAt,
+        ];
+    }
+
+    /**
+     * A stay that has not started yet
+     */
+    public function upcoming(): static
+    {
+        return $this->state(function (array $attributes) {
+            $checkIn = now()->addDays(fake()->numberBetween(3, 120))->setTime(15, 0);
+
+            return [
+                'check_in' => $checkIn,
+                'check_out' => $checkIn->copy()->addDays($attributes['nights'])->setTime(11, 0),
+                'status' => 'confirmed',
+            ];
+        });
+    }
+
+    public function paid(): static
+    {
+        return $this->state(fn (array $attributes) => ['paid_status' => 'paid']);
+    }
+
+    public function unpaid(): static
+    {
+        return $this->state(fn (array $attributes) => ['paid_status' => 'unpaid']);
+    }
+
+    /**
+     * Cancelled before check-in, refunded by the cancellation policy when paid
+     */
+    public function cancelled(): static
+    {
+        return $this->state(function (array $attributes) {
+            $checkIn = Carbon::parse($attributes['check_in']);
+            $createdAt = Carbon::parse($attributes['created_at']);
+            $cancelledAt = $createdAt->copy()->addSeconds(fake()->numberBetween(0, max(0, $checkIn->timestamp - $createdAt->timestamp)));
+
+            return [
+                'status' => 'cancelled',
+                'cancelled_at' => $cancelledAt,
+                'refund_amount' => static::refundFor($attributes['paid_status'] ?? 'unpaid', $attributes['total'], $cancelledAt, $checkIn),
+                'updated_at' => $cancelledAt,
+            ];
+        });
+    }
+
+    /**
+     * Refund under BookingController::cancel's policy: half within 7 days of check-in
+     */
+    public static function refundFor(string $paidStatus, $total, Carbon $cancelledAt, Carbon $checkIn)
+    {
+        if ($paidStatus !== 'paid') {
+            return 0;
+        }
+
+        return $cancelledAt->diffInDays($checkIn) <= 7 ? round($total * 0.5, 2) : $total;
+    }
+
+    /**
+     * Draw a check-in day following MONTH_WEIGHTS and WEEKEND_WEIGHT
+     *
+     * $timestamp draws a uniform moment in the range, $roll a number in [0, 1].
+     */
+    public static function seasonalDay(callable $timestamp, callable $roll)
+    {
+        $max = max(static::MONTH_WEIGHTS) * static::WEEKEND_WEIGHT;
+
+        do {
+            $day = Carbon::createFromTimestamp($timestamp())->startOfDay();
+        } while ($roll() * $max > static::dayWeight($day->month, $day->dayOfWeekIso));
+
+        return $day;
+    }
+
+    public static function dayWeight(int $month, int $isoWeekday)
+    {
+        return static::MONTH_WEIGHTS[$month] * ($isoWeekday >= 5 && $isoWeekday <= 6 ? static::WEEKEND_WEIGHT : 1);
+    }
+
+    public static function leadDays(float $bucketRoll, float $dayRoll)
+    {
+        $weights = array_column(static::LEAD_DAYS, 2);
+        [$min, $max] = static::LEAD_DAYS[static::weighted($weights, $bucketRoll)];
+
+        return $min + (int) floor($dayRoll * ($max - $min + 1));
+    }
+
+    /**
+     * Key of a value => weight map picked by a roll in [0, 1]
+     */
+    public static function weighted(array $weights, float $roll)
+    {
+        $target = $roll * array_sum($weights);
+
+        foreach ($weights as $key => $weight) {
+            $target -= $weight;
+            if ($target < 0) {
+                return $key;
+            }
+        }
+
+        return array_key_last($weights);
+    }
+}
@@ -0,0 +1,64 @@
+<?php
+
+namespace Database\Factories;
+
+use App\Models\User;
+use Illuminate\Database\Eloquent\Factories\Factory;
+
+/**
+ * @extends \Illuminate\Database\Eloquent\Factories\Factory<\App\Models\Notification>
+ */
+class NotificationFactory extends Factory
+{
+    /**
+     * Notification type => [title, relative frequency]
+     */
+    const TYPES = [
+        'booking_confirmation' => ['Booking Confirmed', 50],
+        'payment_received' => ['Payment Received', 35],
+        'booking_cancelled' => ['Booking Cancelled', 8],
+        'payment_proof_received' => ['Payment Proof Received', 7],
+    ];
+
+    /**
+     * Chance a notification is still unread: recent ones often are, old ones rarely
+     */
+    const RECENT_UNREAD_RATE = 0.6;
+    const OLD_UNREAD_RATE = 0.05;
+    const RECENT_DAYS = 14;
+
+    /**
+     * Define the model's default state.
+     *
+     * @return array<string, mixed>
+     */
+    public function definition(): array
+    {
+        $type = BookingFactory::weighted(array_map(fn ($type) => $type[1], static::TYPES), fake()->randomFloat(6, 0, 1));
+        $createdAt = fake()->dateTimeBetween('-1 year');
+        $recent = $createdAt > now()->subDays(static::RECENT_DAYS);
+        $unread = fake()->boolean(($recent ? static::RECENT_UNREAD_RATE : static::OLD_UNREAD_RATE) * 100);
+
+        return [
+            'user_id' => User::factory(),
+            'booking_id' => null,
+            'type' => $type,
+            'title' => static::TYPES[$type][0],
+            'message' => fake()->sentence(),
+            'status' => $unread ? 'unread' : 'read',
+            'read_at' => $unread ? null : fake()->dateTimeBetween($createdAt),
+            'created_at' => $createdAt,
+            'updated_at' => $createdAt,
+        ];
+    }
+
+    public function unread(): static
+    {
+        return $this->state(fn (array $attributes) => ['status' => 'unread', 'read_at' => null]);
+    }
+
+    public function read(): static
+    {
+        return $this->state(fn (array $attributes) => ['status' => 'read', 'read_at' => now()]);
+    }
+}
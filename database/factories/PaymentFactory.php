@@ -0,0 +1,71 @@
+<?php
+
+namespace Database\Factories;
+
+use App\Models\Booking;
+use Illuminate\Database\Eloquent\Factories\Factory;
+
+/**
+ * @extends \Illuminate\Database\Eloquent\Factories\Factory<\App\Models\Payment>
+ */
+class PaymentFactory extends Factory
+{
+    /**
+     * Payment method => relative frequency
+     */
+    const METHODS = ['credit_card' => 55, 'debit_card' => 20, 'bank_transfer' => 25];
+
+    /**
+     * Share of unpaid upcoming bookings with a transfer proof awaiting verification
+     */
+    const PENDING_PROOF_RATE = 0.15;
+
+    /**
+     * Define the model's default state.
+     *
+     * @return array<string, mixed>
+     */
+    public function definition(): array
+    {
+        return [
+            'booking_id' => fn () => Booking::factory()->paid()->create()->booking_id,
+            'payment_method' => BookingFactory::weighted(static::METHODS, fake()->randomFloat(6, 0, 1)),
+            'cardholder_name' => fake()->name(),
+            'card_last_four' => fake()->numerify('####'),
+            'amount' => fn (array $attributes) => Booking::where('booking_id', $attributes['booking_id'])->value('total') ?? fake()->numberBetween(80, 2000),
+            'status' => 'completed',
+            'billing_address' => fake()->streetAddress(),
+            'city' => fake()->city(),
+            'zip_code' => fake()->postcode(),
+            'country' => fake()->country(),
+            'user_email' => fake()->safeEmail(),
+            'transaction_id' => 'TXN' . fake()->unique()->numerify('##############'),
+        ];
+    }
+
+    /**
+     * A bank transfer proof uploaded and waiting for an admin
+     */
+    public function pendingProof(): static
+    {
+        return $this->state(fn (array $attributes) => [
+            'booking_id' => fn () => Booking::factory()->upcoming()->unpaid()->create()->booking_id,
+            'payment_method' => 'bank_transfer',
+            'status' => 'pending_verification',
+            'proof_file' => 'payment_proofs/' . fake()->uuid() . '.jpg',
+        ]);
+    }
+
+    /**
+     * A transfer proof an admin has approved
+     */
+    public function verified(): static
+    {
+        return $this->state(fn (array $attributes) => [
+            'payment_method' => 'bank_transfer',
+            'status' => 'verified',
+            'proof_file' => 'payment_proofs/' . fake()->uuid() . '.jpg',
+            'verified_at' => now(),
+        ]);
+    }
+}
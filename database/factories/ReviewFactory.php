@@ -0,0 +1,45 @@
+<?php
+
+namespace Database\Factories;
+
+use App\Models\Room;
+use App\Models\User;
+use Illuminate\Database\Eloquent\Factories\Factory;
+
+/**
+ * @extends \Illuminate\Database\Eloquent\Factories\Factory<\App\Models\Review>
+ */
+class ReviewFactory extends Factory
+{
+    /**
+     * Stars => relative frequency; guests who review skew positive
+     */
+    const RATINGS = [5 => 45, 4 => 30, 3 => 13, 2 => 7, 1 => 5];
+
+    /**
+     * Share of completed stays by registered guests that get reviewed
+     */
+    const REVIEW_RATE = 0.2;
+
+    /**
+     * Define the model's default state.
+     *
+     * @return array<string, mixed>
+     */
+    public function definition(): array
+    {
+        return [
+            'user_id' => User::factory(),
+            'room_id' => Room::factory(),
+            'booking_id' => null,
+            'rating' => BookingFactory::weighted(static::RATINGS, fake()->randomFloat(6, 0, 1)),
+            'comment' => fake()->optional(0.7)->sentences(2, true),
+            'verified_booking' => false,
+        ];
+    }
+
+    public function rating(int $stars): static
+    {
+        return $this->state(fn (array $attributes) => ['rating' => $stars]);
+    }
+}
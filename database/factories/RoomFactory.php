@@ -0,0 +1,73 @@
+<?php
+
+namespace Database\Factories;
+
+use Illuminate\Database\Eloquent\Factories\Factory;
+
+/**
+ * @extends \Illuminate\Database\Eloquent\Factories\Factory<\App\Models\Room>
+ */
+class RoomFactory extends Factory
+{
+    /**
+     * Room types with [min price, max price, capacity, share of the hotel's rooms]
+     */
+    const TYPES = [
+        'standard' => [79, 129, 2, 40],
+        'deluxe' => [139, 199, 2, 30],
+        'family' => [169, 249, 5, 20],
+        'suite' => [249, 449, 4, 10],
+    ];
+
+    const AMENITIES = ['WiFi', 'Air Conditioning', 'TV', 'Mini Bar', 'Balcony', 'Sea View', 'Bathtub', 'Coffee Maker', 'Safe', 'Room Service'];
+
+    /**
+     * Define the model's default state.
+     *
+     * @return array<string, mixed>
+     */
+    public function definition(): array
+    {
+        $type = fake()->randomElement(array_keys(static::TYPES));
+        [$min, $max, $capacity] = static::TYPES[$type];
+
+        return [
+            'room_title' => ucfirst($type) . ' Room ' . fake()->unique()->numberBetween(100, 999),
+            'room_type' => $type,
+            'description' => fake()->paragraph(),
+            'price' => fake()->numberBetween($min, $max),
+            'capacity' => $capacity,
+            'wifi' => 'yes',
+            'air_conditioning' => true,
+            'tv' => true,
+            'bathroom_type' => 'private',
+            'amenities' => fake()->randomElements(static::AMENITIES, fake()->numberBetween(2, 6)),
+            'status' => 'available',
+        ];
+    }
+
+    /**
+     * A room of the given type, priced within that type's range
+     */
+    public function ofType(string $type): static
+    {
+        [$min, $max, $capacity] = static::TYPES[$type];
+
+        return $this->state(fn (array $attributes) => [
+            'room_title' => ucfirst($type) . ' Room ' . fake()->unique()->numberBetween(100, 999),
+            'room_type' => $type,
+            'price' => fake()->numberBetween($min, $max),
+            'capacity' => $capacity,
+        ]);
+    }
+
+    /**
+     * A room taken out of service
+     */
+    public function maintenance(): static
+    {
+        return $this->state(fn (array $attributes) => [
+            'status' => 'maintenance',
+        ]);
+    }
+}
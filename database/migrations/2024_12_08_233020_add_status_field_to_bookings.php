@@ -12,7 +12,9 @@
     public function up(): void
     {
         Schema::table('bookings', function (Blueprint $table) {
-            $table->string('status') ->default('waiting')->after ('phone');
+            if (!Schema::hasColumn('bookings', 'status')) {
+                $table->string('status') ->default('waiting')->after ('phone');
+            }
         });
     }
 
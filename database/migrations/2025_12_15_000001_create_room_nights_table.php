@@ -0,0 +1,35 @@
+<?php
+
+use Illuminate\Database\Migrations\Migration;
+use Illuminate\Database\Schema\Blueprint;
+use Illuminate\Support\Facades\Schema;
+
+return new class extends Migration
+{
+    /**
+     * Run the migrations.
+     */
+    public function up(): void
+    {
+        Schema::create('room_nights', function (Blueprint $table) {
+            $table->id();
+            $table->unsignedBigInteger('booking_id');
+            $table->string('room_type');
+            $table->date('night');
+            $table->string('status')->default('held'); // 'held' (unpaid) or 'booked' (paid)
+            $table->timestamps();
+
+            $table->unique(['booking_id', 'night']);
+            $table->index(['room_type', 'night', 'status']);
+            $table->foreign('booking_id')->references('id')->on('bookings')->onDelete('cascade');
+        });
+    }
+
+    /**
+     * Reverse the migrations.
+     */
+    public function down(): void
+    {
+        Schema::dropIfExists('room_nights');
+    }
+};
@@ -0,0 +1,48 @@
+<?php
+
+use Illuminate\Database\Migrations\Migration;
+use Illuminate\Database\Schema\Blueprint;
+use Illuminate\Support\Facades\Schema;
+
+return new class extends Migration
+{
+    /**
+     * Run the migrations.
+     *
+     * Populate existing rooms afterwards with `php artisan ratings:reconcile`.
+     */
+    public function up(): void
+    {
+        Schema::table('rooms', function (Blueprint $table) {
+            if (!Schema::hasColumn('rooms', 'rating_avg')) {
+                $table->decimal('rating_avg', 3, 2)->default(0);
+            }
+            if (!Schema::hasColumn('rooms', 'review_count')) {
+                $table->unsignedInteger('review_count')->default(0);
+            }
+            if (!Schema::hasColumn('rooms', 'rating_sum')) {
+                $table->unsignedInteger('rating_sum')->default(0);
+            }
+            foreach (range(1, 5) as $stars) {
+                if (!Schema::hasColumn('rooms', "stars_{$stars}")) {
+                    $table->unsignedInteger("stars_{$stars}")->default(0);
+                }
+            }
+        });
+    }
+
+    /**
+     * Reverse the migrations.
+     */
+    public function down(): void
+    {
+        Schema::table('rooms', function (Blueprint $table) {
+            $columns = ['rating_avg', 'review_count', 'rating_sum', 'stars_1', 'stars_2', 'stars_3', 'stars_4', 'stars_5'];
+            foreach ($columns as $column) {
+                if (Schema::hasColumn('rooms', $column)) {
+                    $table->dropColumn($column);
+                }
+            }
+        });
+    }
+};
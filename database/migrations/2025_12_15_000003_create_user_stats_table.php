@@ -0,0 +1,38 @@
+<?php
+
+use Illuminate\Database\Migrations\Migration;
+use Illuminate\Database\Schema\Blueprint;
+use Illuminate\Support\Facades\Schema;
+
+return new class extends Migration
+{
+    /**
+     * Run the migrations.
+     *
+     * Populate existing users afterwards with `php artisan user-stats:rebuild`.
+     */
+    public function up(): void
+    {
+        Schema::create('user_stats', function (Blueprint $table) {
+            $table->unsignedBigInteger('user_id')->primary();
+            $table->unsignedInteger('booking_count')->default(0);
+            $table->unsignedInteger('cancellation_count')->default(0);
+            $table->decimal('lifetime_spend', 12, 2)->default(0);
+            $table->dateTime('last_stay_at')->nullable();
+            $table->timestamps();
+
+            $table->index('lifetime_spend');
+            $table->index('booking_count');
+            $table->index('last_stay_at');
+            $table->foreign('user_id')->references('id')->on('users')->onDelete('cascade');
+        });
+    }
+
+    /**
+     * Reverse the migrations.
+     */
+    public function down(): void
+    {
+        Schema::dropIfExists('user_stats');
+    }
+};
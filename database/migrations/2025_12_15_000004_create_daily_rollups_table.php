@@ -0,0 +1,39 @@
+<?php
+
+use Illuminate\Database\Migrations\Migration;
+use Illuminate\Database\Schema\Blueprint;
+use Illuminate\Support\Facades\Schema;
+
+return new class extends Migration
+{
+    /**
+     * Run the migrations.
+     *
+     * Populate history afterwards with `php artisan rollups:rebuild`.
+     */
+    public function up(): void
+    {
+        Schema::create('daily_rollups', function (Blueprint $table) {
+            $table->id();
+            $table->date('day');
+            $table->string('metric'); // 'booking' or 'payment'
+            $table->string('room_type')->default('');
+            $table->string('payment_method')->default('');
+            $table->string('status')->default('');
+            $table->integer('records')->default(0);
+            $table->decimal('amount', 14, 2)->default(0);
+            $table->timestamps();
+
+            $table->unique(['day', 'metric', 'room_type', 'payment_method', 'status'], 'daily_rollups_bucket_unique');
+            $table->index(['metric', 'day']);
+        });
+    }
+
+    /**
+     * Reverse the migrations.
+     */
+    public function down(): void
+    {
+        Schema::dropIfExists('daily_rollups');
+    }
+};
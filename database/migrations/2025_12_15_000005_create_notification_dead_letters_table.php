@@ -0,0 +1,34 @@
+<?php
+
+use Illuminate\Database\Migrations\Migration;
+use Illuminate\Database\Schema\Blueprint;
+use Illuminate\Support\Facades\Schema;
+
+return new class extends Migration
+{
+    /**
+     * Run the migrations.
+     */
+    public function up(): void
+    {
+        Schema::create('notification_dead_letters', function (Blueprint $table) {
+            $table->id();
+            $table->longText('payload'); // JSON array of notification rows
+            $table->unsignedInteger('row_count');
+            $table->text('error');
+            $table->unsignedTinyInteger('attempts')->default(0);
+            $table->timestamp('replayed_at')->nullable();
+            $table->timestamps();
+
+            $table->index('replayed_at');
+        });
+    }
+
+    /**
+     * Reverse the migrations.
+     */
+    public function down(): void
+    {
+        Schema::dropIfExists('notification_dead_letters');
+    }
+};
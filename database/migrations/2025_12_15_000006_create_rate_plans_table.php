@@ -0,0 +1,42 @@
+<?php
+
+use Illuminate\Database\Migrations\Migration;
+use Illuminate\Database\Schema\Blueprint;
+use Illuminate\Support\Facades\Schema;
+
+return new class extends Migration
+{
+    /**
+     * Run the migrations.
+     *
+     * A plan targets one room (room_id) or every room of a type (room_type) and
+     * overrides the nightly price on the nights it matches. Nights no plan
+     * matches are charged rooms.price.
+     */
+    public function up(): void
+    {
+        Schema::create('rate_plans', function (Blueprint $table) {
+            $table->id();
+            $table->foreignId('room_id')->nullable()->constrained()->cascadeOnDelete();
+            $table->string('room_type')->nullable();
+            $table->string('name');
+            $table->decimal('price', 10, 2);
+            $table->date('starts_on')->nullable();
+            $table->date('ends_on')->nullable();
+            $table->string('weekdays')->nullable(); // ISO days, e.g. "5,6" for Friday and Saturday
+            $table->integer('priority')->default(0);
+            $table->timestamps();
+
+            $table->index(['room_id', 'starts_on', 'ends_on']);
+            $table->index(['room_type', 'starts_on', 'ends_on']);
+        });
+    }
+
+    /**
+     * Reverse the migrations.
+     */
+    public function down(): void
+    {
+        Schema::dropIfExists('rate_plans');
+    }
+};
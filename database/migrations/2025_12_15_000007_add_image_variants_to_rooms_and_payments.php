@@ -0,0 +1,46 @@
+<?php
+
+use Illuminate\Database\Migrations\Migration;
+use Illuminate\Database\Schema\Blueprint;
+use Illuminate\Support\Facades\Schema;
+
+return new class extends Migration
+{
+    /**
+     * Run the migrations.
+     *
+     * Generate variants for existing images with `php artisan images:backfill`.
+     */
+    public function up(): void
+    {
+        Schema::table('rooms', function (Blueprint $table) {
+            if (!Schema::hasColumn('rooms', 'image_variants')) {
+                $table->json('image_variants')->nullable()->after('image');
+            }
+        });
+
+        Schema::table('payments', function (Blueprint $table) {
+            if (!Schema::hasColumn('payments', 'proof_variants')) {
+                $table->json('proof_variants')->nullable()->after('proof_file');
+            }
+        });
+    }
+
+    /**
+     * Reverse the migrations.
+     */
+    public function down(): void
+    {
+        Schema::table('rooms', function (Blueprint $table) {
+            if (Schema::hasColumn('rooms', 'image_variants')) {
+                $table->dropColumn('image_variants');
+            }
+        });
+
+        Schema::table('payments', function (Blueprint $table) {
+            if (Schema::hasColumn('payments', 'proof_variants')) {
+                $table->dropColumn('proof_variants');
+            }
+        });
+    }
+};
@@ -0,0 +1,38 @@
+<?php
+
+use Illuminate\Database\Migrations\Migration;
+use Illuminate\Database\Schema\Blueprint;
+use Illuminate\Support\Facades\Schema;
+
+return new class extends Migration
+{
+    /**
+     * Run the migrations.
+     *
+     * One row per room type and night taken by a reservation. The unique index
+     * is the lock: of two requests claiming the same night, the second insert
+     * fails, while claims on other rooms or nights never wait on each other.
+     */
+    public function up(): void
+    {
+        Schema::create('room_claims', function (Blueprint $table) {
+            $table->id();
+            $table->string('room_type');
+            $table->date('night');
+            $table->unsignedBigInteger('booking_id');
+            $table->timestamps();
+
+            $table->unique(['room_type', 'night']);
+            $table->index('booking_id');
+            $table->foreign('booking_id')->references('id')->on('bookings')->onDelete('cascade');
+        });
+    }
+
+    /**
+     * Reverse the migrations.
+     */
+    public function down(): void
+    {
+        Schema::dropIfExists('room_claims');
+    }
+};
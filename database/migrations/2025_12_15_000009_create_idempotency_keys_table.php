@@ -0,0 +1,35 @@
+<?php
+
+use Illuminate\Database\Migrations\Migration;
+use Illuminate\Database\Schema\Blueprint;
+use Illuminate\Support\Facades\Schema;
+
+return new class extends Migration
+{
+    /**
+     * Run the migrations.
+     */
+    public function up(): void
+    {
+        Schema::create('idempotency_keys', function (Blueprint $table) {
+            $table->id();
+            $table->string('key');
+            $table->string('scope'); // route and caller the key belongs to
+            $table->string('fingerprint', 64); // hash of the request body
+            $table->unsignedSmallInteger('response_status')->nullable(); // null while in progress
+            $table->longText('response_body')->nullable();
+            $table->timestamps();
+
+            $table->unique(['scope', 'key']);
+            $table->index('created_at');
+        });
+    }
+
+    /**
+     * Reverse the migrations.
+     */
+    public function down(): void
+    {
+        Schema::dropIfExists('idempotency_keys');
+    }
+};
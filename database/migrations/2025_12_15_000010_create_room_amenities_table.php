@@ -0,0 +1,34 @@
+<?php
+
+use Illuminate\Database\Migrations\Migration;
+use Illuminate\Database\Schema\Blueprint;
+use Illuminate\Support\Facades\Schema;
+
+return new class extends Migration
+{
+    /**
+     * Run the migrations.
+     *
+     * Populate existing rooms afterwards with `php artisan amenities:rebuild`.
+     */
+    public function up(): void
+    {
+        Schema::create('room_amenities', function (Blueprint $table) {
+            $table->id();
+            $table->unsignedBigInteger('room_id');
+            $table->string('amenity');
+
+            $table->unique(['room_id', 'amenity']);
+            $table->index(['amenity', 'room_id']);
+            $table->foreign('room_id')->references('id')->on('rooms')->onDelete('cascade');
+        });
+    }
+
+    /**
+     * Reverse the migrations.
+     */
+    public function down(): void
+    {
+        Schema::dropIfExists('room_amenities');
+    }
+};
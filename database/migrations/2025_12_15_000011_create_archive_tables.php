@@ -0,0 +1,104 @@
+<?php
+
+use Illuminate\Database\Migrations\Migration;
+use Illuminate\Database\Schema\Blueprint;
+use Illuminate\Support\Facades\Schema;
+
+return new class extends Migration
+{
+    /**
+     * Run the migrations.
+     *
+     * Cold copies of bookings, payments and notifications moved out by
+     * `php artisan lifecycle:run`. Rows keep their original ids; archive_month
+     * (YYYY-MM) is the partition key every archive read and purge filters on.
+     * No foreign keys: archived rows outlive the users and rooms they mention.
+     */
+    public function up(): void
+    {
+        Schema::create('bookings_archive', function (Blueprint $table) {
+            $table->unsignedBigInteger('id')->primary();
+            $table->unsignedBigInteger('user_id')->nullable();
+            $table->string('booking_id');
+            $table->string('first_name');
+            $table->string('last_name');
+            $table->string('email');
+            $table->string('phone');
+            $table->string('room_type');
+            $table->dateTime('check_in');
+            $table->dateTime('check_out');
+            $table->integer('guests');
+            $table->integer('nights');
+            $table->decimal('rate', 10, 2);
+            $table->decimal('total', 10, 2);
+            $table->decimal('refund_amount', 10, 2)->nullable();
+            $table->timestamp('cancelled_at')->nullable();
+            $table->text('special_requests')->nullable();
+            $table->string('status');
+            $table->string('paid_status')->default('unpaid');
+            $table->boolean('paid')->default(false);
+            $table->string('payment_ref')->nullable();
+            $table->timestamps();
+            $table->char('archive_month', 7);
+            $table->timestamp('archived_at');
+
+            $table->index(['archive_month', 'check_in']);
+            $table->index(['user_id', 'archive_month']);
+            $table->index('booking_id');
+        });
+
+        Schema::create('payments_archive', function (Blueprint $table) {
+            $table->unsignedBigInteger('id')->primary();
+            $table->string('booking_id');
+            $table->string('transaction_id');
+            $table->string('payment_method');
+            $table->string('cardholder_name');
+            $table->string('card_last_four');
+            $table->decimal('amount', 10, 2);
+            $table->string('status');
+            $table->string('proof_file')->nullable();
+            $table->json('proof_variants')->nullable();
+            $table->timestamp('verified_at')->nullable();
+            $table->text('verified_comment')->nullable();
+            $table->string('billing_address');
+            $table->string('city');
+            $table->string('zip_code');
+            $table->string('country');
+            $table->string('user_email')->nullable();
+            $table->timestamps();
+            $table->char('archive_month', 7);
+            $table->timestamp('archived_at');
+
+            $table->index(['archive_month', 'created_at']);
+            $table->index('booking_id');
+            $table->index('user_email');
+        });
+
+        Schema::create('notifications_archive', function (Blueprint $table) {
+            $table->unsignedBigInteger('id')->primary();
+            $table->unsignedBigInteger('user_id')->nullable();
+            $table->unsignedBigInteger('booking_id')->nullable();
+            $table->string('type');
+            $table->string('title');
+            $table->text('message');
+            $table->string('status');
+            $table->timestamp('read_at')->nullable();
+            $table->timestamps();
+            $table->char('archive_month', 7);
+            $table->timestamp('archived_at');
+
+            $table->index(['archive_month', 'user_id']);
+            $table->index(['user_id', 'created_at']);
+        });
+    }
+
+    /**
+     * Reverse the migrations.
+     */
+    public function down(): void
+    {
+        Schema::dropIfExists('notifications_archive');
+        Schema::dropIfExists('payments_archive');
+        Schema::dropIfExists('bookings_archive');
+    }
+};
@@ -0,0 +1,86 @@
+<?php
+
+use Illuminate\Database\Migrations\Migration;
+use Illuminate\Database\Schema\Blueprint;
+use Illuminate\Support\Facades\DB;
+use Illuminate\Support\Facades\Schema;
+
+return new class extends Migration
+{
+    /**
+     * Composite indexes for the API's filters and sort orders
+     *
+     * Each index leads with the equality filter and ends with the sort
+     * column, so pages are read in order without a sort step.
+     * tests/Feature/QueryPlanTest.php fails when an API query stops using them.
+     */
+    const INDEXES = [
+        'bookings' => [
+            ['user_id', 'created_at'],       // my_bookings, user overview and counters
+            ['created_at'],                  // admin booking list, dashboard
+            ['status', 'created_at'],        // admin booking list by status
+            ['paid_status', 'created_at'],   // admin booking list by payment status
+            ['room_type', 'check_in'],       // admin room list booking counts
+            ['check_in'],                    // stay-range filters, arrival notices
+        ],
+        'payments' => [
+            ['booking_id'],                  // payments of a booking, latest payment status
+            ['user_email', 'created_at'],    // my_payments
+            ['status', 'created_at'],        // pending verification queue
+        ],
+        'notifications' => [
+            ['user_id', 'created_at'],       // notification feed
+            ['user_id', 'status'],           // unread count, mark all read
+            ['user_id', 'id'],               // long-poll for newer notifications
+        ],
+        'reviews' => [
+            ['room_id', 'created_at'],       // room reviews
+            ['booking_id'],                  // one review per booking
+        ],
+    ];
+
+    /**
+     * Foreign key columns whose implicit MySQL index is replaced by one above
+     */
+    const FOREIGN_KEYS = [
+        'bookings' => ['user_id'],
+        'payments' => ['booking_id'],
+        'notifications' => ['user_id'],
+        'reviews' => ['room_id', 'booking_id'],
+    ];
+
+    /**
+     * Run the migrations.
+     */
+    public function up(): void
+    {
+        foreach (self::INDEXES as $tableName => $indexes) {
+            Schema::table($tableName, function (Blueprint $table) use ($indexes) {
+                foreach ($indexes as $columns) {
+                    $table->index($columns);
+                }
+            });
+        }
+    }
+
+    /**
+     * Reverse the migrations.
+     */
+    public function down(): void
+    {
+        foreach (self::INDEXES as $tableName => $indexes) {
+            Schema::table($tableName, function (Blueprint $table) use ($tableName, $indexes) {
+                // MySQL dropped each foreign key's own index when ours took over; they need one back
+                if (DB::getDriverName() === 'mysql') {
+                    foreach (self::FOREIGN_KEYS[$tableName] as $column) {
+                        $table->index($column, "{$tableName}_{$column}_foreign");
+                    }
+                }
+
+                foreach ($indexes as $columns) {
+                    $table->dropIndex($columns);
+                }
+            });
+        }
+    }
+};
@@ -0,0 +1,483 @@
+<?php
+
+namespace Database\Seeders;
+
+use Carbon\Carbon;
+use Database\Factories\BookingFactory;
+use Database\Factories\NotificationFactory;
+use Database\Factories\PaymentFactory;
+use Database\Factories\ReviewFactory;
+use Database\Factories\RoomFactory;
+use Illuminate\Database\Seeder;
+use Illuminate\Support\Facades\DB;
+use Illuminate\Support\Facades\Hash;
+
+/**
+ * Production-size dataset for performance work.
+ *
+ * Uses the distributions defined on the model factories, but draws from a
+ * seeded mt_rand() and writes plain multi-row INSERTs instead of building
+ * models, so millions of bookings take minutes. The same seed and `until`
+ * date always produce the same rows. Model events are bypassed; rebuild the
+ * derived tables afterwards (db:seed-scale does this unless told not to).
+ */
+class ScaleSeeder extends Seeder
+{
+    /**
+     * Rows per INSERT statement
+     */
+    const CHUNK = 1000;
+
+    /**
+     * INSERT statements per transaction
+     */
+    const COMMIT_EVERY = 50;
+
+    /**
+     * Share of bookings made by registered guests
+     */
+    const REGISTERED_RATE = 0.8;
+
+    /**
+     * Days of bookings generated after `until`
+     */
+    const FUTURE_DAYS = 180;
+
+    public int $bookings = 100000;
+    public int $years = 3;
+    public ?int $users = null;
+    public int $rooms = 40;
+    public int $seed = 20251215;
+    public ?string $until = null;
+
+    /**
+     * Directory to write <table>.ndjson files to instead of the database
+     */
+    public ?string $export = null;
+
+    /**
+     * Rows written per table
+     */
+    public array $counts = [];
+
+    protected array $buffers = [];
+    protected array $files = [];
+    protected int $statements = 0;
+    protected array $ids = [];
+    protected array $pools = [];
+    protected array $days = [];
+    protected float $dayTotal = 0;
+    protected int $now;
+
+    /**
+     * Seed the application's database.
+     */
+    public function run(): void
+    {
+        mt_srand($this->seed);
+        fake()->seed($this->seed);
+
+        $this->now = Carbon::parse($this->until ?? 'today')->endOfDay()->timestamp;
+        $this->counts = [];
+        $this->buildPools();
+        $this->buildSeasonalDays();
+        $this->open();
+
+        $rooms = $this->seedRooms();
+        [$firstUser, $lastUser] = $this->seedUsers();
+
+        for ($i = 0; $i < $this->bookings; $i++) {
+            $this->seedBooking($rooms, $firstUser, $lastUser);
+
+            if (count($this->buffers['bookings']) >= static::CHUNK) {
+                $this->flushAll();
+            }
+        }
+
+        $this->flushAll();
+        $this->close();
+    }
+
+    /**
+     * Name, address and comment pools drawn once from Faker
+     */
+    protected function buildPools()
+    {
+        $faker = fake();
+        $this->pools = [
+            'first' => array_map(fn () => $faker->firstName(), range(1, 300)),
+            'last' => array_map(fn () => $faker->lastName(), range(1, 300)),
+            'street' => array_map(fn () => $faker->streetAddress(), range(1, 200)),
+            'city' => array_map(fn () => $faker->city(), range(1, 80)),
+            'zip' => array_map(fn () => $faker->postcode(), range(1, 80)),
+            'country' => array_map(fn () => $faker->country(), range(1, 30)),
+            'comment' => array_map(fn () => $faker->sentences(2, true), range(1, 60)),
+        ];
+    }
+
+    /**
+     * Cumulative check-in weight per day, for a binary-search draw
+     */
+    protected function buildSeasonalDays()
+    {
+        $day = Carbon::createFromTimestamp($this->now)->subYears($this->years)->startOfDay();
+        $end = Carbon::createFromTimestamp($this->now)->addDays(static::FUTURE_DAYS);
+
+        $this->days = [];
+        $this->dayTotal = 0;
+
+        for (; $day->lte($end); $day->addDay()) {
+            $this->dayTotal += BookingFactory::dayWeight($day->month, $day->dayOfWeekIso);
+            $this->days[] = [$this->dayTotal, $day->timestamp];
+        }
+    }
+
+    protected function seedRooms()
+    {
+        $types = array_keys(RoomFactory::TYPES);
+        $shares = array_map(fn ($type) => $type[3], RoomFactory::TYPES);
+        $rooms = [];
+
+        for ($i = 0; $i < $this->rooms; $i++) {
+            // Every type gets a room before the shares apply
+            $type = $i < count($types) ? $types[$i] : BookingFactory::weighted($shares, $this->roll());
+            [$min, $max, $capacity] = RoomFactory::TYPES[$type];
+            $id = $this->nextId('rooms');
+            $price = mt_rand($min, $max);
+            $amenities = array_values(array_intersect_key(
+                RoomFactory::AMENITIES,
+                array_flip(array_rand(RoomFactory::AMENITIES, mt_rand(2, 6)))
+            ));
+            $createdAt = $this->date($this->now - $this->years * 31536000);
+
+            $this->add('rooms', [
+                'id' => $id,
+                'room_title' => ucfirst($type) . ' Room ' . (100 + $id),
+                'room_type' => $type,
+                'description' => $this->pick('comment'),
+                'price' => $price,
+                'capacity' => $capacity,
+                'wifi' => 'yes',
+                'air_conditioning' => 1,
+                'tv' => 1,
+                'bathroom_type' => 'private',
+                'amenities' => json_encode($amenities),
+                'status' => 'available',
+                'created_at' => $createdAt,
+                'updated_at' => $createdAt,
+            ]);
+
+            $rooms[] = [$id, $type, $price, $capacity];
+        }
+
+        $this->flushAll();
+
+        return $rooms;
+    }
+
+    protected function seedUsers()
+    {
+        $count = $this->users ?? max(1, intdiv($this->bookings, 5));
+        $password = Hash::make('password');
+        $start = $this->now - $this->years * 31536000;
+        $first = null;
+
+        for ($i = 0; $i < $count; $i++) {
+            $id = $this->nextId('users');
+            $first ??= $id;
+            $createdAt = $this->date(mt_rand($start, $this->now));
+
+            $this->add('users', [
+                'id' => $id,
+                'name' => $this->guestName($id),
+                'email' => "guest{$id}@example.test",
+                'phone' => $this->phone(),
+                'usertype' => 'user',
+                'email_verified_at' => $createdAt,
+                'password' => $password,
+                'provider' => 'local',
+                'created_at' => $createdAt,
+                'updated_at' => $createdAt,
+            ]);
+
+            if (count($this->buffers['users']) >= static::CHUNK) {
+                $this->flushAll();
+            }
+        }
+
+        $this->flushAll();
+
+        return [$first, $first + $count - 1];
+    }
+
+    /**
+     * One booking with the payment, review and notifications it would have produced
+     */
+    protected function seedBooking(array $rooms, int $firstUser, int $lastUser)
+    {
+        $id = $this->nextId('bookings');
+        [$roomId, $type, $rate, $capacity] = $rooms[mt_rand(0, count($rooms) - 1)];
+
+        $userId = $this->roll() < static::REGISTERED_RATE ? mt_rand($firstUser, $lastUser) : null;
+        [$firstName, $lastName] = $userId
+            ? explode(' ', $this->guestName($userId), 2)
+            : [$this->pick('first'), $this->pick('last')];
+        $email = $userId ? "guest{$userId}@example.test" : "walkin{$id}@example.test";
+
+        $checkIn = $this->seasonalDay() + 15 * 3600;
+        $nights = BookingFactory::weighted(BookingFactory::NIGHTS, $this->roll());
+        $checkOut = $checkIn + $nights * 86400 - 4 * 3600;
+        $createdAt = min($this->now, $checkIn - BookingFactory::leadDays($this->roll(), $this->roll()) * 86400 - mt_rand(0, 8 * 3600));
+        $total = $rate * $nights;
+
+        $paid = $this->roll() < ($checkIn <= $this->now ? BookingFactory::PAID_RATE : BookingFactory::UPCOMING_PAID_RATE);
+        $status = $checkOut <= $this->now ? 'completed' : 'confirmed';
+        $cancelledAt = null;
+        $refund = null;
+
+        if ($this->roll() < BookingFactory::CANCELLATION_RATE) {
+            $cancelledAt = mt_rand($createdAt, max($createdAt, min($checkIn, $this->now)));
+            $status = 'cancelled';
+            $refund = $paid ? ($checkIn - $cancelledAt <= 7 * 86400 ? round($total * 0.5, 2) : $total) : 0;
+        }
+
+        $bookingId = 'BK' . str_pad((string) $id, 10, '0', STR_PAD_LEFT);
+
+        $this->add('bookings', [
+            'id' => $id,
+            'user_id' => $userId,
+            'booking_id' => $bookingId,
+            'first_name' => $firstName,
+            'last_name' => $lastName,
+            'email' => $email,
+            'phone' => $this->phone(),
+            'room_type' => $type,
+            'check_in' => $this->date($checkIn),
+            'check_out' => $this->date($checkOut),
+            'guests' => mt_rand(1, $capacity),
+            'nights' => $nights,
+            'rate' => $rate,
+            'total' => $total,
+            'special_requests' => $this->roll() < 0.1 ? 'Late check-in' : null,
+            'status' => $status,
+            'paid_status' => $paid ? 'paid' : 'unpaid',
+            'refund_amount' => $refund,
+            'cancelled_at' => $cancelledAt ? $this->date($cancelledAt) : null,
+            'created_at' => $this->date($createdAt),
+            'updated_at' => $this->date($cancelledAt ?? $createdAt),
+        ]);
+
+        $payment = null;
+        if ($paid) {
+            $payment = $this->seedPayment($bookingId, $total, $email, min($this->now, $createdAt + mt_rand(60, 86400)), false);
+        } elseif ($status === 'confirmed' && $checkIn > $this->now && $this->roll() < PaymentFactory::PENDING_PROOF_RATE) {
+            $payment = $this->seedPayment($bookingId, $total, $email, min($this->now, $createdAt + mt_rand(3600, 3 * 86400)), true);
+        }
+
+        if (!$userId) {
+            return;
+        }
+
+        $this->notify($userId, $id, 'booking_confirmation', $createdAt);
+        if ($payment) {
+            $this->notify($userId, $id, $payment[1] ? 'payment_proof_received' : 'payment_received', $payment[0]);
+        }
+        if ($cancelledAt) {
+            $this->notify($userId, $id, 'booking_cancelled', $cancelledAt);
+        }
+
+        if ($status === 'completed' && $this->roll() < ReviewFactory::REVIEW_RATE) {
+            $reviewedAt = $this->date(min($this->now, $checkOut + mt_rand(3600, 10 * 86400)));
+
+            $this->add('reviews', [
+                'id' => $this->nextId('reviews'),
+                'user_id' => $userId,
+                'room_id' => $roomId,
+                'booking_id' => $id,
+                'rating' => BookingFactory::weighted(ReviewFactory::RATINGS, $this->roll()),
+                'comment' => $this->roll() < 0.7 ? $this->pick('comment') : null,
+                'verified_booking' => 1,
+                'created_at' => $reviewedAt,
+                'updated_at' => $reviewedAt,
+            ]);
+        }
+    }
+
+    /**
+     * Returns [paid at, pending proof]
+     */
+    protected function seedPayment(string $bookingId, $amount, string $email, int $paidAt, bool $pendingProof)
+    {
+        $id = $this->nextId('payments');
+        $method = $pendingProof ? 'bank_transfer' : BookingFactory::weighted(PaymentFactory::METHODS, $this->roll());
+        $proof = $method === 'bank_transfer' ? "payment_proofs/seed-{$id}.jpg" : null;
+
+        $this->add('payments', [
+            'id' => $id,
+            'booking_id' => $bookingId,
+            'transaction_id' => 'TXN' . str_pad((string) $id, 12, '0', STR_PAD_LEFT),
+            'payment_method' => $method,
+            'cardholder_name' => $this->pick('first') . ' ' . $this->pick('last'),
+            'card_last_four' => str_pad((string) mt_rand(0, 9999), 4, '0', STR_PAD_LEFT),
+            'amount' => $amount,
+            'status' => $pendingProof ? 'pending_verification' : ($proof ? 'verified' : 'completed'),
+            'billing_address' => $this->pick('street'),
+            'city' => $this->pick('city'),
+            'zip_code' => $this->pick('zip'),
+            'country' => $this->pick('country'),
+            'user_email' => $email,
+            'proof_file' => $proof,
+            'verified_at' => $proof && !$pendingProof ? $this->date(min($this->now, $paidAt + mt_rand(600, 86400))) : null,
+            'created_at' => $this->date($paidAt),
+            'updated_at' => $this->date($paidAt),
+        ]);
+
+        return [$paidAt, $pendingProof];
+    }
+
+    protected function notify(int $userId, int $bookingId, string $type, int $at)
+    {
+        $recent = $at > $this->now - NotificationFactory::RECENT_DAYS * 86400;
+        $unread = $this->roll() < ($recent ? NotificationFactory::RECENT_UNREAD_RATE : NotificationFactory::OLD_UNREAD_RATE);
+        $createdAt = $this->date($at);
+
+        $this->add('notifications', [
+            'id' => $this->nextId('notifications'),
+            'user_id' => $userId,
+            'booking_id' => $bookingId,
+            'type' => $type,
+            'title' => NotificationFactory::TYPES[$type][0],
+            'message' => NotificationFactory::TYPES[$type][0] . ' for booking #' . $bookingId,
+            'status' => $unread ? 'unread' : 'read',
+            'read_at' => $unread ? null : $this->date(min($this->now, $at + mt_rand(60, 3 * 86400))),
+            'created_at' => $createdAt,
+            'updated_at' => $createdAt,
+        ]);
+    }
+
+    /**
+     * Start ids after existing rows, disable durability we do not need, open the first transaction
+     */
+    protected function open()
+    {
+        foreach (['rooms', 'users', 'bookings', 'payments', 'reviews', 'notifications'] as $table) {
+            $this->buffers[$table] = [];
+            $this->counts[$table] = 0;
+            $this->ids[$table] = $this->export ? 1 : (int) DB::table($table)->max('id') + 1;
+        }
+
+        if ($this->export) {
+            if (!is_dir($this->export)) {
+                mkdir($this->export, 0755, true);
+            }
+            foreach (array_keys($this->buffers) as $table) {
+                $this->files[$table] = fopen($this->export . '/' . $table . '.ndjson', 'w');
+            }
+            return;
+        }
+
+        if (DB::getDriverName() === 'sqlite' && DB::transactionLevel() === 0) {
+            DB::statement('PRAGMA synchronous = OFF');
+            DB::statement('PRAGMA journal_mode = MEMORY');
+        }
+
+        DB::beginTransaction();
+    }
+
+    protected function close()
+    {
+        if ($this->export) {
+            array_map('fclose', $this->files);
+            return;
+        }
+
+        DB::commit();
+
+        // Explicit ids leave PostgreSQL sequences behind
+        if (DB::getDriverName() === 'pgsql') {
+            foreach (array_keys($this->buffers) as $table) {
+                DB::statement("SELECT setval(pg_get_serial_sequence('{$table}', 'id'), (SELECT COALESCE(MAX(id), 1) FROM {$table}))");
+            }
+        }
+    }
+
+    protected function add(string $table, array $row)
+    {
+        $this->buffers[$table][] = $row;
+    }
+
+    /**
+     * Write every buffer, parents first so foreign keys always resolve
+     */
+    protected function flushAll()
+    {
+        foreach ($this->buffers as $table => $rows) {
+            foreach (array_chunk($rows, static::CHUNK) as $chunk) {
+                if ($this->export) {
+                    fwrite($this->files[$table], implode("\n", array_map('json_encode', $chunk)) . "\n");
+                } else {
+                    DB::table($table)->insert($chunk);
+
+                    if (++$this->statements % static::COMMIT_EVERY === 0) {
+                        DB::commit();
+                        DB::beginTransaction();
+                    }
+                }
+            }
+
+            $this->counts[$table] += count($rows);
+            $this->buffers[$table] = [];
+        }
+    }
+
+    protected function nextId(string $table)
+    {
+        return $this->ids[$table]++;
+    }
+
+    /**
+     * Check-in day drawn from the cumulative seasonal weights
+     */
+    protected function seasonalDay()
+    {
+        $target = $this->roll() * $this->dayTotal;
+        $low = 0;
+        $high = count($this->days) - 1;
+
+        while ($low < $high) {
+            $mid = intdiv($low + $high, 2);
+            if ($this->days[$mid][0] < $target) {
+                $low = $mid + 1;
+            } else {
+                $high = $mid;
+            }
+        }
+
+        return $this->days[$low][1];
+    }
+
+    protected function guestName(int $userId)
+    {
+        return $this->pools['first'][$userId * 7 % 300] . ' ' . $this->pools['last'][$userId * 13 % 300];
+    }
+
+    protected function phone()
+    {
+        return '08' . mt_rand(1000000000, 9999999999);
+    }
+
+    protected function pick(string $pool)
+    {
+        return $this->pools[$pool][mt_rand(0, count($this->pools[$pool]) - 1)];
+    }
+
+    protected function roll()
+    {
+        return mt_rand() / mt_getrandmax();
+    }
+
+    protected function date(int $timestamp)
+    {
+        return date('Y-m-d H:i:s', $timestamp);
+    }
+}
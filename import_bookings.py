@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Stream a JSONL file of bookings into POST /api/admin/bookings/import.
+
+Each line is one booking in the same shape BookingController::store accepts
+(bookingId, firstName, lastName, email, phone, roomType, checkin, checkout,
+guests, nights, rate, total, specialRequests, userEmail). The file is read
+lazily and sent in batches, with several batches in flight at once so the
+server is never waiting on the client.
+
+Re-running a file is safe: rows whose bookingId already exists come back as
+"duplicate" instead of being inserted twice.
+
+Usage:
+    python import_bookings.py allocations.jsonl --token <admin token>
+    python import_bookings.py big.jsonl --token T --batch-size 2000 --in-flight 4 --errors rejected.jsonl
+"""
+
+import argparse
+import json
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+
+import requests
+
+BASE_URL = 'http://localhost:8000'
+IMPORT_PATH = '/api/admin/bookings/import'
+
+# Must not exceed BookingController::IMPORT_MAX_ROWS
+MAX_BATCH_SIZE = 5000
+
+
+def read_batches(path, batch_size):
+    """Yield (first line number, [lines]) without loading the whole file."""
+    with open(path, 'r', encoding='utf-8') as handle:
+        line_number = 1
+        while True:
+            lines = list(islice(handle, batch_size))
+            if not lines:
+                return
+            yield line_number, lines
+            line_number += len(lines)
+
+
+def send_batch(session, url, lines, timeout, retries):
+    """POST one batch as NDJSON, retrying connection errors and 5xx responses."""
+    body = ''.join(line if line.endswith('\n') else line + '\n' for line in lines).encode('utf-8')
+
+    for attempt in range(retries + 1):
+        try:
+            response = session.post(url, data=body, timeout=timeout,
+                                    headers={'Content-Type': 'application/x-ndjson'})
+            if response.status_code < 500:
+                return response.status_code, response.json()
+            error = f'HTTP {response.status_code}'
+        except (requests.RequestException, ValueError) as exc:
+            error = str(exc)
+
+        if attempt < retries:
+            time.sleep(2 ** attempt)
+
+    return None, {'success': False, 'message': error}
+
+
+def run(args):
+    url = args.base_url.rstrip('/') + IMPORT_PATH
+    session = requests.Session()
+    session.headers.update({'Accept': 'application/json', 'Authorization': f'Bearer {args.token}'})
+    adapter = requests.adapters.HTTPAdapter(pool_connections=args.in_flight, pool_maxsize=args.in_flight)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+
+    totals = {'batches': 0, 'rows': 0, 'created': 0, 'rejected': 0, 'failed_batches': 0}
+    errors = open(args.errors, 'w', encoding='utf-8') if args.errors else None
+    started = time.monotonic()
+
+    def collect(future):
+        first_line, status, report = future.result()
+        totals['batches'] += 1
+
+        if status != 200 or 'results' not in report:
+            totals['failed_batches'] += 1
+            print(f'batch at line {first_line} failed: {report.get("message", status)}', file=sys.stderr)
+            return
+
+        totals['rows'] += report['total']
+        totals['created'] += report['created']
+        totals['rejected'] += report['rejected']
+
+        for result in report['results']:
+            if result['status'] != 'created' and errors:
+                result = dict(result, line=first_line + result['line'] - 1)
+                errors.write(json.dumps(result) + '\n')
+
+        if not args.quiet:
+            print(f'batch at line {first_line}: {report["created"]} created, {report["rejected"]} rejected',
+                  file=sys.stderr)
+
+    try:
+        with ThreadPoolExecutor(max_workers=args.in_flight) as pool:
+            pending = set()
+            for first_line, lines in read_batches(args.file, args.batch_size):
+                # Keep at most --in-flight batches outstanding
+                if len(pending) >= args.in_flight:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        collect(future)
+
+                pending.add(pool.submit(
+                    lambda first, batch: (first, *send_batch(session, url, batch, args.timeout, args.retries)),
+                    first_line, lines,
+                ))
+
+            for future in pending:
+                collect(future)
+    finally:
+        if errors:
+            errors.close()
+
+    elapsed = time.monotonic() - started
+    totals['seconds'] = round(elapsed, 2)
+    totals['rows_per_second'] = round(totals['rows'] / elapsed, 1) if elapsed else 0.0
+
+    print(json.dumps(totals, indent=2))
+    return 0 if totals['failed_batches'] == 0 else 1
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description='Stream a JSONL file of bookings into the bulk import endpoint.')
+    parser.add_argument('file', help='JSONL file, one booking per line')
+    parser.add_argument('--token', required=True, help='Sanctum token of an admin user')
+    parser.add_argument('--base-url', default=BASE_URL, help=f'API host (default {BASE_URL})')
+    parser.add_argument('--batch-size', type=int, default=1000, help=f'lines per request (max {MAX_BATCH_SIZE})')
+    parser.add_argument('--in-flight', type=int, default=3, help='batches sent concurrently')
+    parser.add_argument('--timeout', type=float, default=120.0, help='per-request timeout in seconds')
+    parser.add_argument('--retries', type=int, default=2, help='retries for a batch on connection errors or 5xx')
+    parser.add_argument('--errors', help='write rejected rows (with file line numbers) to this JSONL file')
+    parser.add_argument('--quiet', action='store_true', help='only print the final summary')
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if not 1 <= args.batch_size <= MAX_BATCH_SIZE:
+        build_parser().error(f'--batch-size must be between 1 and {MAX_BATCH_SIZE}')
+    if args.in_flight < 1:
+        build_parser().error('--in-flight must be at least 1')
+    return run(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
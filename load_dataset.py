@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Load a generated dataset into a running server through the public API.
+
+Generate the files first with the same seed used for database runs:
+
+    php artisan db:seed-scale --bookings 200000 --seed 42 --until 2025-12-15 --export storage/dataset
+
+then replay them end to end:
+
+    python load_dataset.py storage/dataset --token <admin token> --workers 8
+
+Stages, in order (pick a subset with --only):
+    rooms     POST /api/admin/rooms
+    users     POST /api/register (password "password")
+    bookings  POST /api/admin/bookings/import, in NDJSON batches
+    payments  POST /api/payments/create for settled payments, which marks the booking paid
+
+Cancellations, reviews, notifications and pending transfer proofs need a
+signed-in guest per row and are only produced by the database seeder.
+Re-running is safe: existing users and booking ids are reported as skipped.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+import requests
+
+from import_bookings import IMPORT_PATH, send_batch
+
+BASE_URL = 'http://localhost:8000'
+STAGES = ('rooms', 'users', 'bookings', 'payments')
+
+
+def read_rows(directory, table):
+    path = os.path.join(directory, f'{table}.ndjson')
+    if not os.path.exists(path):
+        return
+    with open(path, 'r', encoding='utf-8') as handle:
+        for line in handle:
+            if line.strip():
+                yield json.loads(line)
+
+
+def chunks(rows, size):
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, size))
+        if not batch:
+            return
+        yield batch
+
+
+def parallel(workers, rows, send):
+    """Run send(row) over rows with a bounded number of requests in flight; returns status counts."""
+    counts = {}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for batch in chunks(rows, workers * 20):
+            for outcome in pool.map(send, batch):
+                counts[outcome] = counts.get(outcome, 0) + 1
+    return counts
+
+
+def load_rooms(session, args):
+    def send(row):
+        body = {
+            'room_title': row['room_title'],
+            'room_type': row['room_type'],
+            'description': row['description'],
+            'price': row['price'],
+            'capacity': row['capacity'],
+            'amenities': json.loads(row['amenities'] or '[]'),
+        }
+        response = session.post(args.base_url + '/api/admin/rooms', json=body, timeout=args.timeout)
+        return 'created' if response.status_code == 201 else f'http {response.status_code}'
+
+    return parallel(1, read_rows(args.directory, 'rooms'), send)
+
+
+def load_users(session, args):
+    def send(row):
+        first, _, last = row['name'].partition(' ')
+        body = {
+            'firstName': first,
+            'lastName': last or first,
+            'email': row['email'],
+            'phone': row['phone'],
+            'password': 'password',
+        }
+        response = session.post(args.base_url + '/api/register', json=body, timeout=args.timeout)
+        if response.status_code in (200, 201):
+            return 'created'
+        return 'skipped' if response.status_code == 422 else f'http {response.status_code}'
+
+    return parallel(args.workers, read_rows(args.directory, 'users'), send)
+
+
+def load_bookings(session, args):
+    url = args.base_url + IMPORT_PATH
+    counts = {'created': 0, 'skipped': 0, 'rejected': 0, 'failed_batches': 0}
+
+    def to_import_line(row):
+        return json.dumps({
+            'bookingId': row['booking_id'],
+            'firstName': row['first_name'],
+            'lastName': row['last_name'],
+            'email': row['email'],
+            'phone': row['phone'],
+            'roomType': row['room_type'],
+            'checkin': row['check_in'],
+            'checkout': row['check_out'],
+            'guests': row['guests'],
+            'nights': row['nights'],
+            'rate': row['rate'],
+            'total': row['total'],
+            'specialRequests': row['special_requests'],
+            'userEmail': row['email'] if row['user_id'] else None,
+        })
+
+    def send(batch):
+        return send_batch(session, url, [to_import_line(row) for row in batch], args.timeout, args.retries)
+
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        batches = chunks(read_rows(args.directory, 'bookings'), args.batch_size)
+        for window in chunks(batches, args.workers):
+            for status, report in pool.map(send, window):
+                if status != 200 or 'results' not in report:
+                    counts['failed_batches'] += 1
+                    continue
+                counts['created'] += report['created']
+                for result in report['results']:
+                    if result['status'] == 'duplicate':
+                        counts['skipped'] += 1
+                    elif result['status'] != 'created':
+                        counts['rejected'] += 1
+
+    return counts
+
+
+def load_payments(session, args):
+    def send(row):
+        if row['status'] == 'pending_verification':
+            return 'needs guest login'
+        body = {key: row[key] for key in (
+            'booking_id', 'payment_method', 'cardholder_name', 'card_last_four', 'amount', 'status',
+            'billing_address', 'city', 'zip_code', 'country', 'user_email',
+        )}
+        response = session.post(args.base_url + '/api/payments/create', json=body, timeout=args.timeout)
+        return 'created' if response.status_code in (200, 201) else f'http {response.status_code}'
+
+    return parallel(args.workers, read_rows(args.directory, 'payments'), send)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Load a db:seed-scale --export dataset through the API.')
+    parser.add_argument('directory', help='directory with rooms/users/bookings/payments .ndjson files')
+    parser.add_argument('--token', required=True, help='Sanctum token of an admin user')
+    parser.add_argument('--base-url', default=BASE_URL, help=f'API host (default {BASE_URL})')
+    parser.add_argument('--only', default=','.join(STAGES), help='comma-separated stages to run')
+    parser.add_argument('--workers', type=int, default=4, help='requests in flight')
+    parser.add_argument('--batch-size', type=int, default=1000, help='bookings per import request')
+    parser.add_argument('--timeout', type=float, default=120.0, help='per-request timeout in seconds')
+    parser.add_argument('--retries', type=int, default=2, help='retries for an import batch')
+    args = parser.parse_args(argv)
+    args.base_url = args.base_url.rstrip('/')
+
+    stages = [stage.strip() for stage in args.only.split(',') if stage.strip()]
+    unknown = set(stages) - set(STAGES)
+    if unknown:
+        parser.error(f'unknown stage(s): {", ".join(sorted(unknown))}')
+
+    session = requests.Session()
+    session.headers.update({'Accept': 'application/json', 'Authorization': f'Bearer {args.token}'})
+    adapter = requests.adapters.HTTPAdapter(pool_connections=args.workers, pool_maxsize=args.workers)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+
+    loaders = {'rooms': load_rooms, 'users': load_users, 'bookings': load_bookings, 'payments': load_payments}
+    summary = {}
+
+    for stage in STAGES:
+        if stage not in stages:
+            continue
+        started = time.monotonic()
+        summary[stage] = loaders[stage](session, args)
+        summary[stage]['seconds'] = round(time.monotonic() - started, 2)
+        print(f'{stage}: {summary[stage]}', file=sys.stderr)
+
+    print(json.dumps(summary, indent=2))
+    failed = any(key.startswith('http') or key == 'failed_batches' and value
+                 for counts in summary.values() for key, value in counts.items())
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,476 @@
+#!/usr/bin/env python3
+"""
+Concurrent load test for the booking API.
+
+Runs many virtual guests at once through the same flows as
+test_booking_flow.py (register -> login -> book -> pay -> history) and
+reports per-endpoint latency percentiles, throughput and error rate as JSON.
+
+Usage:
+    python load_test.py --users 2000 --ramp-up 30 --mix booking=6,browse=3,poll=1
+    python load_test.py --stand-in --users 500          # no Laravel needed
+    python load_test.py --users 1000 --output run.json  # compare runs later
+
+Requires aiohttp (pip install aiohttp).
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+import aiohttp
+from aiohttp import web
+
+BASE_URL = 'http://127.0.0.1:8000'
+
+# Endpoint paths from routes/api.php, relative to BASE_URL. Keys are the names
+# used in the report. The --stand-in server registers the same paths.
+ENDPOINTS = {
+    'register': '/api/register',
+    'login': '/api/login',
+    'create_booking': '/api/booking',
+    'create_payment': '/api/payments/create',
+    'my_bookings': '/api/my_bookings',
+    'notifications': '/api/notifications',
+}
+
+ROOM_TYPES = {
+    'luxury': 199,
+    'deluxe': 149,
+    'standard': 99,
+}
+
+DEFAULT_MIX = 'booking=6,browse=3,poll=1'
+
+
+class Stats:
+    """Collects latency samples and errors per endpoint."""
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.status_codes = defaultdict(lambda: defaultdict(int))
+        self.scenarios = defaultdict(int)
+        self.started = None
+        self.finished = None
+
+    def record(self, endpoint, elapsed_ms, status, ok):
+        self.latencies[endpoint].append(elapsed_ms)
+        self.status_codes[endpoint][str(status)] += 1
+        if not ok:
+            self.errors[endpoint] += 1
+
+    def report(self, config):
+        duration = max((self.finished or time.perf_counter()) - self.started, 1e-9)
+        endpoints = {}
+        total_requests = 0
+        total_errors = 0
+
+        for name in sorted(self.latencies):
+            samples = sorted(self.latencies[name])
+            count = len(samples)
+            errors = self.errors[name]
+            total_requests += count
+            total_errors += errors
+            endpoints[name] = {
+                'requests': count,
+                'errors': errors,
+                'error_rate': round(errors / count, 4) if count else 0.0,
+                'throughput_rps': round(count / duration, 2),
+                'status_codes': dict(self.status_codes[name]),
+                'latency_ms': {
+                    'min': round(samples[0], 2),
+                    'mean': round(sum(samples) / count, 2),
+                    'p50': round(percentile(samples, 50), 2),
+                    'p95': round(percentile(samples, 95), 2),
+                    'p99': round(percentile(samples, 99), 2),
+                    'max': round(samples[-1], 2),
+                },
+            }
+
+        return {
+            'generated_at': datetime.now().isoformat(timespec='seconds'),
+            'config': config,
+            'duration_s': round(duration, 3),
+            'scenarios': dict(self.scenarios),
+            'totals': {
+                'requests': total_requests,
+                'errors': total_errors,
+                'error_rate': round(total_errors / total_requests, 4) if total_requests else 0.0,
+                'throughput_rps': round(total_requests / duration, 2),
+            },
+            'endpoints': endpoints,
+        }
+
+
+def percentile(sorted_samples, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+def parse_mix(value):
+    """Parse 'booking=6,browse=3' into a {scenario: weight} dict."""
+    mix = {}
+    for part in value.split(','):
+        if not part.strip():
+            continue
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        if name not in SCENARIOS:
+            raise argparse.ArgumentTypeError(
+                f"unknown scenario '{name}' (choose from {', '.join(SCENARIOS)})"
+            )
+        mix[name] = float(weight or 1)
+    if not mix or sum(mix.values()) <= 0:
+        raise argparse.ArgumentTypeError('workload mix needs at least one positive weight')
+    return mix
+
+
+class Guest:
+    """One virtual guest with its own identity and auth token."""
+
+    def __init__(self, index, session, base_url, stats, rng, think_time):
+        self.index = index
+        self.session = session
+        self.base_url = base_url
+        self.stats = stats
+        self.rng = rng
+        self.think_time = think_time
+        self.email = f'loadtest{int(time.time())}_{index}_{rng.randrange(10**6)}@example.com'
+        self.password = 'password123'
+        self.token = None
+
+    async def call(self, endpoint, method='GET', payload=None):
+        headers = {'Accept': 'application/json'}
+        if self.token:
+            headers['Authorization'] = f'Bearer {self.token}'
+
+        started = time.perf_counter()
+        status = 0
+        body = None
+        try:
+            async with self.session.request(
+                method, self.base_url + ENDPOINTS[endpoint], json=payload, headers=headers
+            ) as response:
+                status = response.status
+                try:
+                    body = await response.json(content_type=None)
+                except (ValueError, aiohttp.ContentTypeError):
+                    body = None
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            status = 'error'
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        ok = isinstance(status, int) and status < 400 and isinstance(body, dict) \
+            and body.get('success', True) is not False
+        self.stats.record(endpoint, elapsed_ms, status, ok)
+        return body if ok else None
+
+    async def think(self):
+        if self.think_time > 0:
+            await asyncio.sleep(self.rng.uniform(0, self.think_time))
+
+    async def sign_up(self):
+        registered = await self.call('register', 'POST', {
+            'firstName': 'Load',
+            'lastName': f'Guest{self.index}',
+            'email': self.email,
+            'phone': '0812345678',
+            'password': self.password,
+            'provider': 'local',
+        })
+        if not registered:
+            return False
+
+        await self.think()
+        login = await self.call('login', 'POST', {
+            'email': self.email,
+            'password': self.password,
+        })
+        if not login or not login.get('token'):
+            return False
+
+        self.token = login['token']
+        return True
+
+    async def book(self):
+        room_type = self.rng.choice(list(ROOM_TYPES))
+        rate = ROOM_TYPES[room_type]
+        nights = self.rng.randint(1, 5)
+        checkin = datetime.now() + timedelta(days=self.rng.randint(1, 90))
+        checkout = checkin + timedelta(days=nights)
+        total = round(rate * nights * 1.1, 2)
+        booking_id = f'BK{int(time.time() * 1000)}{self.index}{self.rng.randrange(1000)}'
+
+        booking = await self.call('create_booking', 'POST', {
+            'bookingId': booking_id,
+            'firstName': 'Load',
+            'lastName': f'Guest{self.index}',
+            'email': self.email,
+            'phone': '0812345678',
+            'roomType': room_type,
+            'checkin': checkin.strftime('%Y-%m-%dT15:00:00'),
+            'checkout': checkout.strftime('%Y-%m-%dT11:00:00'),
+            'guests': self.rng.randint(1, 4),
+            'nights': nights,
+            'rate': rate,
+            'total': total,
+            'userEmail': self.email,
+        })
+        if not booking:
+            return None
+
+        await self.think()
+        saved_id = (booking.get('booking') or {}).get('booking_id', booking_id)
+        await self.call('create_payment', 'POST', {
+            'booking_id': saved_id,
+            'payment_method': 'credit_card',
+            'cardholder_name': f'Load Guest{self.index}',
+            'card_last_four': '4242',
+            'amount': total,
+            'status': 'completed',
+            'billing_address': '123 Test Street',
+            'city': 'Test City',
+            'zip_code': '12345',
+            'country': 'Indonesia',
+            'user_email': self.email,
+        })
+        return saved_id
+
+
+# Workloads. Each one is a coroutine taking a signed-in Guest.
+
+async def booking_scenario(guest):
+    """New guest books and pays, then checks history and notifications."""
+    await guest.book()
+    await guest.think()
+    await guest.call('my_bookings')
+    await guest.call('notifications')
+
+
+async def browse_scenario(guest):
+    """Returning guest looks at history and notifications a few times."""
+    for _ in range(guest.rng.randint(2, 4)):
+        await guest.call('my_bookings')
+        await guest.think()
+        await guest.call('notifications')
+        await guest.think()
+
+
+async def poll_scenario(guest):
+    """Idle tab polling notifications."""
+    for _ in range(guest.rng.randint(5, 10)):
+        await guest.call('notifications')
+        await guest.think()
+
+
+SCENARIOS = {
+    'booking': booking_scenario,
+    'browse': browse_scenario,
+    'poll': poll_scenario,
+}
+
+
+async def run_guest(index, delay, scenario, session, args, stats, rng):
+    await asyncio.sleep(delay)
+    guest = Guest(index, session, args.base_url, stats, rng, args.think_time)
+    stats.scenarios[scenario] += 1
+    if await guest.sign_up():
+        await SCENARIOS[scenario](guest)
+
+
+async def run_load(args):
+    stats = Stats()
+    rng = random.Random(args.seed)
+    names = list(args.mix)
+    weights = [args.mix[name] for name in names]
+
+    connector = aiohttp.TCPConnector(limit=args.connections, limit_per_host=args.connections)
+    timeout = aiohttp.ClientTimeout(total=args.timeout)
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        stats.started = time.perf_counter()
+        tasks = []
+        for index in range(args.users):
+            delay = args.ramp_up * index / args.users if args.users else 0
+            scenario = rng.choices(names, weights)[0]
+            guest_rng = random.Random(rng.random())
+            tasks.append(asyncio.create_task(
+                run_guest(index, delay, scenario, session, args, stats, guest_rng)
+            ))
+        await asyncio.gather(*tasks)
+        stats.finished = time.perf_counter()
+
+    return stats
+
+
+# Stand-in server --------------------------------------------------------------
+#
+# A tiny in-memory imitation of the Laravel API so the harness itself can be
+# exercised without `php artisan serve`. Latency is simulated, not measured.
+
+def build_stand_in(latency_ms):
+    users = {}
+    tokens = {}
+    bookings = defaultdict(list)
+    notifications = defaultdict(list)
+
+    async def pause():
+        if latency_ms:
+            await asyncio.sleep(random.uniform(0.5, 1.5) * latency_ms / 1000)
+
+    def authed(request):
+        header = request.headers.get('Authorization', '')
+        return tokens.get(header.removeprefix('Bearer ').strip())
+
+    async def register(request):
+        await pause()
+        data = await request.json()
+        if data.get('email') in users:
+            return web.json_response({'success': False, 'message': 'Email taken'}, status=422)
+        user_id = len(users) + 1
+        users[data['email']] = {'id': user_id, 'email': data['email'], 'password': data['password']}
+        return web.json_response({'success': True, 'user': {'id': user_id, 'email': data['email']}}, status=201)
+
+    async def login(request):
+        await pause()
+        data = await request.json()
+        user = users.get(data.get('email'))
+        if not user or user['password'] != data.get('password'):
+            return web.json_response({'success': False, 'message': 'Invalid email or password'}, status=401)
+        token = f"{user['id']}|{random.getrandbits(64):x}"
+        tokens[token] = user
+        return web.json_response({'success': True, 'user': user, 'token': token})
+
+    async def create_booking(request):
+        await pause()
+        data = await request.json()
+        booking = {'booking_id': data['bookingId'], 'room_type': data['roomType'], 'total': data['total']}
+        user = users.get(data.get('userEmail'))
+        if user:
+            bookings[user['id']].append(booking)
+            notifications[user['id']].append({'type': 'booking_confirmation', 'status': 'unread'})
+        return web.json_response({'success': True, 'booking': booking}, status=201)
+
+    async def create_payment(request):
+        await pause()
+        data = await request.json()
+        return web.json_response({
+            'success': True,
+            'payment': {'booking_id': data['booking_id'], 'amount': data['amount']},
+            'transaction_id': f'TXN{random.getrandbits(32)}',
+        }, status=201)
+
+    async def my_bookings(request):
+        await pause()
+        user = authed(request)
+        if not user:
+            return web.json_response({'success': False, 'message': 'Unauthorized'}, status=401)
+        return web.json_response({'success': True, 'bookings': bookings[user['id']]})
+
+    async def list_notifications(request):
+        await pause()
+        user = authed(request)
+        if not user:
+            return web.json_response({'success': False, 'message': 'Unauthorized'}, status=401)
+        items = notifications[user['id']]
+        return web.json_response({
+            'success': True,
+            'notifications': items,
+            'unread_count': sum(1 for item in items if item['status'] == 'unread'),
+        })
+
+    app = web.Application()
+    app.router.add_post(ENDPOINTS['register'], register)
+    app.router.add_post(ENDPOINTS['login'], login)
+    app.router.add_post(ENDPOINTS['create_booking'], create_booking)
+    app.router.add_post(ENDPOINTS['create_payment'], create_payment)
+    app.router.add_get(ENDPOINTS['my_bookings'], my_bookings)
+    app.router.add_get(ENDPOINTS['notifications'], list_notifications)
+    return app
+
+
+async def start_stand_in(port, latency_ms):
+    runner = web.AppRunner(build_stand_in(latency_ms), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', port, backlog=4096)
+    await site.start()
+    return runner
+
+
+async def main_async(args):
+    runner = None
+    if args.stand_in:
+        runner = await start_stand_in(args.stand_in_port, args.stand_in_latency)
+        args.base_url = f'http://127.0.0.1:{args.stand_in_port}'
+
+    try:
+        stats = await run_load(args)
+    finally:
+        if runner:
+            await runner.cleanup()
+
+    config = {
+        'base_url': args.base_url,
+        'users': args.users,
+        'ramp_up_s': args.ramp_up,
+        'mix': args.mix,
+        'connections': args.connections,
+        'think_time_s': args.think_time,
+        'seed': args.seed,
+        'stand_in': args.stand_in,
+    }
+    return stats.report(config)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description='Concurrent load test for the booking API.')
+    parser.add_argument('--base-url', default=BASE_URL, help=f'API host (default {BASE_URL})')
+    parser.add_argument('--users', type=int, default=100, help='number of virtual guests')
+    parser.add_argument('--ramp-up', type=float, default=10.0,
+                        help='seconds over which guests are started')
+    parser.add_argument('--mix', type=parse_mix, default=parse_mix(DEFAULT_MIX),
+                        help=f'weighted workload mix (default {DEFAULT_MIX})')
+    parser.add_argument('--connections', type=int, default=200,
+                        help='maximum open connections to the server')
+    parser.add_argument('--think-time', type=float, default=0.5,
+                        help='max random pause between a guest\'s requests, in seconds')
+    parser.add_argument('--timeout', type=float, default=30.0, help='per-request timeout in seconds')
+    parser.add_argument('--seed', type=int, default=42, help='random seed for reproducible runs')
+    parser.add_argument('--output', help='write the JSON report to this file as well as stdout')
+    parser.add_argument('--stand-in', action='store_true',
+                        help='run against a built-in in-memory imitation of the API')
+    parser.add_argument('--stand-in-port', type=int, default=8765)
+    parser.add_argument('--stand-in-latency', type=float, default=5.0,
+                        help='simulated server latency for --stand-in, in ms')
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.users < 1:
+        print('--users must be at least 1', file=sys.stderr)
+        return 2
+
+    report = asyncio.run(main_async(args))
+    output = json.dumps(report, indent=2)
+    print(output)
+
+    if args.output:
+        with open(args.output, 'w') as handle:
+            handle.write(output + '\n')
+
+    return 0 if report['totals']['requests'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
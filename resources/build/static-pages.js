@@ -0,0 +1,334 @@
+import { existsSync, readFileSync, writeFileSync } from 'node:fs';
+import { join, posix } from 'node:path';
+import { brotliCompressSync, constants, gzipSync } from 'node:zlib';
+import { transformWithEsbuild } from 'vite';
+
+const ENTRY = 'static-pages';
+const RESOLVED_ENTRY = '\0static-pages';
+const COMPRESSIBLE = /\.(html|js|css|svg|json)$/;
+const TAGS = /<!--[\s\S]*?-->|<script\b([^>]*)>([\s\S]*?)<\/script\s*>|<style\b([^>]*)>([\s\S]*?)<\/style\s*>|<link\b([^>]*)>/gi;
+const CLASSIC_TYPES = ['', 'text/javascript', 'application/javascript'];
+
+/**
+ * Bundle the hand-written HTML pages under `root` into fingerprinted assets.
+ *
+ * Each page's consecutive local and inline <script> tags become one minified
+ * classic script, and its consecutive local stylesheets and <style> blocks
+ * one minified stylesheet, so execution and cascade order never change.
+ * Only files a page actually references are bundled, and runs shared by
+ * several pages are emitted once. Rewritten pages go to `<outDir>/pages`,
+ * and every text file gets .br and .gz siblings.
+ *
+ * Transfer size (brotli) of each page plus its bundles is checked against
+ * `budget`. A page over budget fails the build. Set UPDATE_SIZE_BUDGET=1
+ * to rewrite the budget from this build with 5% headroom.
+ */
+export default function staticPages({ root = 'public', outDir = 'dist', pages, budget = null }) {
+    const base = `/${outDir}/`;
+
+    return {
+        name: 'static-pages',
+
+        config() {
+            return {
+                base,
+                publicDir: false,
+                build: {
+                    outDir: join(root, outDir),
+                    emptyOutDir: true,
+                    rollupOptions: {
+                        input: ENTRY,
+                        output: { assetFileNames: 'assets/[name]-[hash][extname]' },
+                    },
+                },
+            };
+        },
+
+        resolveId(id) {
+            return id === ENTRY ? RESOLVED_ENTRY : null;
+        },
+
+        load(id) {
+            return id === RESOLVED_ENTRY ? 'export default null;' : null;
+        },
+
+        async generateBundle(options, bundle) {
+            for (const [fileName, file] of Object.entries(bundle)) {
+                if (file.type === 'chunk' && file.facadeModuleId === RESOLVED_ENTRY) {
+                    delete bundle[fileName];
+                }
+            }
+
+            const emitted = new Map();
+            const emit = (name, source) => {
+                if (!emitted.has(source)) {
+                    emitted.set(source, this.emitFile({ type: 'asset', name, source }));
+                }
+                return emitted.get(source);
+            };
+
+            const built = [];
+            let unminified = 0;
+            for (const page of pages) {
+                const html = readFileSync(join(root, page), 'utf8');
+                const slug = page.replace(/\.html$/, '').replace(/\//g, '-');
+                const edits = [];
+                const fallback = (message) => {
+                    unminified++;
+                    this.warn(`${page}: ${message}`);
+                };
+
+                for (const run of findRuns(html, page, root, (message) => this.warn(message))) {
+                    const source = run.kind === 'js'
+                        ? await bundleScripts(run.parts, fallback)
+                        : await bundleStyles(run.parts, fallback);
+
+                    edits.push({ ...run, ref: emit(`${slug}.${run.kind}`, source) });
+                }
+
+                built.push({ page, html, edits });
+            }
+
+            const report = {};
+            for (const { page, html, edits } of built) {
+                // The bundle tag takes the place of a run's first tag; the rest are cut
+                const spans = edits.flatMap((edit) => edit.spans.map((span, i) => ({
+                    ...span,
+                    text: i > 0 ? '' : edit.kind === 'js'
+                        ? `<script src="${base}${this.getFileName(edit.ref)}"></script>`
+                        : `<link rel="stylesheet" href="${base}${this.getFileName(edit.ref)}">`,
+                })));
+
+                let output = html;
+                for (const span of spans.sort((a, b) => b.start - a.start)) {
+                    output = output.slice(0, span.start) + span.text + output.slice(span.end);
+                }
+
+                this.emitFile({ type: 'asset', fileName: `pages/${page}`, source: output });
+
+                const assets = [...new Set(edits.map((edit) => this.getFileName(edit.ref)))];
+                report[page] = {
+                    html: brotliSize(output),
+                    assets: assets.reduce((sum, fileName) => sum + brotliSize(bundle[fileName].source), 0),
+                };
+                report[page].total = report[page].html + report[page].assets;
+            }
+
+            for (const [fileName, file] of Object.entries(bundle)) {
+                if (file.type !== 'asset' || !COMPRESSIBLE.test(fileName)) {
+                    continue;
+                }
+
+                const source = Buffer.from(file.source);
+                this.emitFile({ type: 'asset', fileName: `${fileName}.br`, source: brotli(source) });
+                this.emitFile({ type: 'asset', fileName: `${fileName}.gz`, source: gzipSync(source, { level: 9 }) });
+            }
+
+            this.emitFile({ type: 'asset', fileName: 'size-report.json', source: JSON.stringify(report, null, 4) + '\n' });
+            checkBudget(report, budget, unminified, (message) => this.warn(message), (message) => this.error(message));
+        },
+    };
+}
+
+/**
+ * Runs of bundlable tags in document order, with the span of every tag in each run
+ */
+function findRuns(html, page, root, warn) {
+    const pageDir = posix.dirname(page);
+    const runs = [];
+    const open = { js: null, css: null };
+
+    for (const match of html.matchAll(TAGS)) {
+        const [tag, scriptAttrs, scriptBody, styleAttrs, styleBody, linkAttrs] = match;
+        let kind = null;
+        let part = null;
+
+        if (scriptAttrs !== undefined) {
+            kind = 'js';
+            part = scriptPart(scriptAttrs, scriptBody, pageDir, root);
+        } else if (styleAttrs !== undefined) {
+            kind = 'css';
+            part = attribute(styleAttrs, 'media') === null ? { code: styleBody, dir: pageDir } : null;
+        } else if (linkAttrs !== undefined && (attribute(linkAttrs, 'rel') ?? '').toLowerCase().trim() === 'stylesheet') {
+            kind = 'css';
+            part = ['', 'all', 'screen'].includes(attribute(linkAttrs, 'media') ?? '')
+                ? localFile(attribute(linkAttrs, 'href'), pageDir, root)
+                : null;
+        }
+
+        if (!kind) {
+            continue;
+        }
+
+        if (part && part.missing) {
+            warn(`${page}: ${part.missing} not found, left as is`);
+            part = null;
+        }
+
+        // Anything that cannot be bundled ends the run, so order is kept
+        if (!part) {
+            open[kind] = null;
+            continue;
+        }
+
+        if (!open[kind]) {
+            open[kind] = { kind, spans: [], parts: [], files: new Set() };
+            runs.push(open[kind]);
+        }
+
+        const run = open[kind];
+        run.spans.push({ start: match.index, end: match.index + tag.length });
+
+        // A file already in this run is not loaded twice
+        if (part.file && run.files.has(part.file)) {
+            continue;
+        }
+        if (part.file) {
+            run.files.add(part.file);
+        }
+        run.parts.push(part);
+    }
+
+    return runs;
+}
+
+/**
+ * A classic script as a bundle part, or null when it must stay a separate tag
+ */
+function scriptPart(attrs, body, pageDir, root) {
+    const type = (attribute(attrs, 'type') ?? '').toLowerCase();
+    if (!CLASSIC_TYPES.includes(type) || ['async', 'defer', 'nomodule', 'integrity'].some((name) => attribute(attrs, name) !== null)) {
+        return null;
+    }
+
+    const src = attribute(attrs, 'src');
+    if (src === null) {
+        return body.trim() ? { code: body, dir: pageDir } : null;
+    }
+
+    return localFile(src, pageDir, root);
+}
+
+/**
+ * A local file referenced from a page, or null for remote URLs
+ */
+function localFile(url, pageDir, root) {
+    if (!url || /^([a-z]+:|\/\/)/i.test(url)) {
+        return null;
+    }
+
+    const path = url.replace(/[?#].*$/, '');
+    const file = path.startsWith('/') ? posix.normalize(path.slice(1)) : posix.join(pageDir, path);
+
+    if (!existsSync(join(root, file))) {
+        return { missing: file };
+    }
+
+    return { file, code: readFileSync(join(root, file), 'utf8'), dir: posix.dirname(file) };
+}
+
+async function bundleScripts(parts, warn) {
+    const code = parts.map((part) => stripSourceMap(part.code)).join('\n;\n');
+
+    try {
+        return (await transformWithEsbuild(code, 'bundle.js', { minify: true })).code;
+    } catch (error) {
+        warn(`script bundle left unminified: ${error.message}`);
+        return code;
+    }
+}
+
+async function bundleStyles(parts, warn) {
+    const imports = [];
+    const bodies = parts.map((part) => stripSourceMap(rebaseUrls(part.code, part.dir))
+        .replace(/@charset\s+[^;]+;/gi, '')
+        .replace(/@import\s+[^;]+;/gi, (rule) => {
+            imports.push(rule);
+            return '';
+        }));
+
+    // @import is only honoured before every other rule
+    const code = [...imports, ...bodies].join('\n');
+
+    try {
+        return (await transformWithEsbuild(code, 'bundle.css', { minify: true })).code;
+    } catch (error) {
+        warn(`style bundle left unminified: ${error.message}`);
+        return code;
+    }
+}
+
+/**
+ * Make relative url() and @import references absolute, as they were relative to the source file
+ */
+function rebaseUrls(css, dir) {
+    const rebase = (url) => (/^([a-z]+:|\/|#)/i.test(url) ? url : posix.join('/', dir, url));
+
+    return css
+        .replace(/url\(\s*(['"]?)([^'")]+)\1\s*\)/gi, (match, quote, url) => `url(${quote}${rebase(url.trim())}${quote})`)
+        .replace(/@import\s+(['"])([^'"]+)\1/gi, (match, quote, url) => `@import ${quote}${rebase(url)}${quote}`);
+}
+
+function stripSourceMap(code) {
+    return code.replace(/^\s*(\/\/|\/\*)[#@] sourceMappingURL=.*$/gm, '');
+}
+
+function attribute(attrs, name) {
+    const match = attrs.match(new RegExp(`(?:^|\\s)${name}(?![\\w-])(?:\\s*=\\s*(?:"([^"]*)"|'([^']*)'|([^\\s>]+)))?`, 'i'));
+    return match ? (match[1] ?? match[2] ?? match[3] ?? '') : null;
+}
+
+function brotli(source) {
+    return brotliCompressSync(source, {
+        params: {
+            [constants.BROTLI_PARAM_QUALITY]: constants.BROTLI_MAX_QUALITY,
+            [constants.BROTLI_PARAM_SIZE_HINT]: source.length,
+        },
+    });
+}
+
+function brotliSize(source) {
+    return brotli(Buffer.from(source)).length;
+}
+
+/**
+ * Print the transfer sizes and fail on any page over its budget
+ *
+ * A budget is never recorded from a build with unminified bundles, which
+ * would make it far too loose.
+ */
+function checkBudget(report, budgetFile, unminified, warn, fail) {
+    const budget = budgetFile && existsSync(budgetFile) ? JSON.parse(readFileSync(budgetFile, 'utf8')) : {};
+    const kb = (bytes) => `${(bytes / 1024).toFixed(1)} kB`;
+    const over = [];
+
+    console.log('\nTransfer size per page (brotli, HTML + bundles):');
+    for (const [page, size] of Object.entries(report)) {
+        const limit = budget[page];
+        const status = limit === undefined ? 'no budget' : size.total > limit ? `OVER by ${kb(size.total - limit)}` : 'ok';
+        console.log(`  ${page.padEnd(24)} ${kb(size.total).padStart(10)}  of ${limit === undefined ? '-' : kb(limit)}  ${status}`);
+
+        if (limit !== undefined && size.total > limit) {
+            over.push(page);
+        }
+    }
+
+    if (budgetFile && process.env.UPDATE_SIZE_BUDGET) {
+        if (unminified) {
+            fail(`${unminified} bundle(s) were left unminified; fix the warnings above before recording ${budgetFile}.`);
+        }
+
+        const updated = Object.fromEntries(Object.entries(report).map(([page, size]) => [page, Math.ceil(size.total * 1.05)]));
+        writeFileSync(budgetFile, JSON.stringify(updated, null, 4) + '\n');
+        console.log(`Size budget rewritten: ${budgetFile}`);
+        return;
+    }
+
+    for (const page of Object.keys(report).filter((page) => budget[page] === undefined)) {
+        warn(`${page} has no size budget; run with UPDATE_SIZE_BUDGET=1 to record one`);
+    }
+
+    if (over.length) {
+        fail(`Size budget exceeded by ${over.join(', ')}. Trim the page or raise its budget in ${budgetFile}.`);
+    }
+}
@@ -87,7 +87,7 @@
                 <td>{{ $data->room->room_title }}</td>
                 <td>{{ $data->room->price }}</td>
                 <td>
-                    <img style="width: 100!important" src="/room/{{ $data->room->image }}">
+                    <img style="width: 100!important" src="{{ $data->room->imageUrl('thumb') }}">
                 </td>
                 <td> 
                     <a onclick="return confirm ('Kamu yakin mau hapus?')" class="btn btn-danger" href="{{ url('delete_booking', $data->id) }}">Delete</a>
@@ -61,7 +61,7 @@
                         <td>{{ $data->wifi }}</td>
                         <td>{{ $data->room_type }}</td>
                         <td>
-                            <img width="100" src="room/{{ $data->image }}">
+                            <img width="100" src="{{ $data->imageUrl('thumb') }}">
                         </td>
                         
                         <td>
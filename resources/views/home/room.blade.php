@@ -14,7 +14,7 @@
              <div id="serv_hover"  class="room">
                 <div class="room_img">
                    <figure>
-                     <img style= "height 200px; width: 350px;" src="room/{{ $rooms->image }}" alt="#"/></figure>
+                     <img style= "height 200px; width: 350px;" src="{{ $rooms->imageUrl('card') }}" alt="#"/></figure>
                 </div>
                 <div class="bed_room">
                    <h3>{{ $rooms->room_title}}</h3>
@@ -53,7 +53,7 @@
                  <div id="serv_hover"  class="room">
                     <div style="padding: 20px" class="room_img">
                        <figure>
-                         <img style= "height 300px; width: 800px;" src="/room/{{ $room->image  }}" alt="#"/></figure>
+                         <img style= "height 300px; width: 800px;" src="{{ $room->imageUrl('full') }}" alt="#"/></figure>
                     </div>
                     <div class="bed_room">
                        <h2>{{ $room->room_title }}</h2>
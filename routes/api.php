@@ -2,6 +2,7 @@
 
 use Illuminate\Http\Request;
 use Illuminate\Support\Facades\Route;
+use App\Http\Controllers\Api\AdminController;
 use App\Http\Controllers\Api\AuthController;
 use App\Http\Controllers\Api\BookingController;
 use App\Http\Controllers\Api\PaymentController;
@@ -9,38 +10,43 @@
 use App\Http\Controllers\Api\RoomController;
 use App\Http\Controllers\Api\ReviewController;
 use App\Http\Controllers\Api\UserProfileController;
+use App\Services\ExportService;
 
 // Public Auth Routes
 Route::post('/register', [AuthController::class, 'register']);
 Route::post('/login', [AuthController::class, 'login']);
 
 // Public Room Routes
-Route::get('/rooms', [RoomController::class, 'index']);
-Route::get('/rooms/{id}', [RoomController::class, 'show']);
+Route::get('/rooms', [RoomController::class, 'index'])->middleware('cache.response:rooms');
+Route::get('/rooms/{id}', [RoomController::class, 'show'])->middleware('cache.response:room,id');
 Route::post('/rooms/check-availability', [RoomController::class, 'checkAvailability']);
 Route::get('/rooms/{id}/availability-calendar', [RoomController::class, 'getAvailabilityCalendar']);
+Route::get('/rooms/{id}/quote', [RoomController::class, 'quote']);
 
 // Public Booking Routes
-Route::post('/booking', [BookingController::class, 'store']);
+Route::post('/booking', [BookingController::class, 'store'])->middleware('idempotent');
 Route::post('/booking/check-availability', [BookingController::class, 'getRoomAvailability']);
+Route::post('/checkout', [BookingController::class, 'checkout'])->middleware('idempotent');
 
 // Public Payment Routes
 Route::post('/payments/create', [PaymentController::class, 'store']);
 
 // Public Reviews (read-only)
-Route::get('/rooms/{roomId}/reviews', [ReviewController::class, 'roomReviews']);
+Route::get('/rooms/{roomId}/reviews', [ReviewController::class, 'roomReviews'])->middleware('cache.response:reviews,roomId');
 
 // Protected Routes (Authenticated Users)
 Route::middleware('auth:sanctum')->group(function () {
     Route::get('/user', function (Request $request) {
         return $request->user();
     });
+    Route::post('/logout', [AuthController::class, 'logout']);
     
     // User Profile
     Route::get('/user/profile', [UserProfileController::class, 'show']);
     Route::put('/user/profile', [UserProfileController::class, 'update']);
     Route::post('/user/change-password', [UserProfileController::class, 'changePassword']);
     Route::get('/user/bookings-summary', [UserProfileController::class, 'bookingsSummary']);
+    Route::get('/user/overview', [UserProfileController::class, 'overview']);
     
     // User Bookings
     Route::get('/my_bookings', [BookingController::class, 'userBookings']);
@@ -60,6 +66,7 @@
     // Notifications
     Route::get('/notifications', [NotificationController::class, 'index']);
     Route::get('/notifications/unread-count', [NotificationController::class, 'unreadCount']);
+    Route::get('/notifications/poll', [NotificationController::class, 'poll']);
     Route::post('/notifications/{id}/read', [NotificationController::class, 'markAsRead']);
     Route::post('/notifications/mark-all-read', [NotificationController::class, 'markAllAsRead']);
     Route::delete('/notifications/{id}', [NotificationController::class, 'destroy']);
@@ -77,6 +84,11 @@
 
         // Booking Management
         Route::get('/admin/bookings', [AdminController::class, 'listBookings']);
+        Route::post('/admin/bookings/import', [BookingController::class, 'import']);
+
+        // Streaming exports
+        Route::get('/admin/export/{dataset}', [AdminController::class, 'export'])
+            ->whereIn('dataset', ExportService::DATASETS);
 
         // User Management
         Route::get('/admin/users', [AdminController::class, 'listUsers']);
@@ -84,12 +96,21 @@
         // Payment Verification
         Route::get('/admin/payments/pending', [AdminController::class, 'pendingPayments']);
         Route::post('/payments/{payment_id}/verify', [PaymentController::class, 'verifyProof']);
+        Route::post('/admin/payments/verify-batch', [PaymentController::class, 'verifyBatch']);
 
         // Reports
         Route::get('/admin/reports', [AdminController::class, 'reports']);
+        Route::get('/admin/cache-stats', [AdminController::class, 'cacheStats']);
+        Route::get('/admin/metrics', [AdminController::class, 'metrics']);
+
+        // Notification fan-out
+        Route::post('/admin/notifications/arrivals', [AdminController::class, 'notifyArrivals']);
 
         // Price Management
         Route::post('/admin/prices', [AdminController::class, 'updatePrices']);
+        Route::get('/admin/rate-plans', [AdminController::class, 'listRatePlans']);
+        Route::post('/admin/rate-plans', [AdminController::class, 'saveRatePlans']);
+        Route::delete('/admin/rate-plans/{id}', [AdminController::class, 'deleteRatePlan']);
     });
 });
 
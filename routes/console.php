@@ -1,8 +1,142 @@
 <?php
 
+use App\Jobs\DeliverNotifications;
+use App\Jobs\GenerateImageVariants;
+use App\Models\IdempotencyKey;
+use App\Models\NotificationDeadLetter;
+use App\Models\Payment;
+use App\Models\Room;
+use App\Services\ApiTokenService;
+use App\Services\LifecycleService;
+use App\Services\ReportRollupService;
+use App\Services\RoomInventoryService;
+use App\Services\RoomRatingService;
+use App\Services\RoomSearchService;
+use App\Services\UserStatsService;
+use Database\Seeders\ScaleSeeder;
 use Illuminate\Foundation\Inspiring;
 use Illuminate\Support\Facades\Artisan;
 
 Artisan::command('inspire', function () {
     $this->comment(Inspiring::quote());
 })->purpose('Display an inspiring quote')->hourly();
+
+Artisan::command('inventory:rebuild', function () {
+    $rebuilt = RoomInventoryService::rebuild();
+    $this->info("Room inventory rebuilt: {$rebuilt['nights']} room-nights and {$rebuilt['claims']} claims from existing bookings.");
+})->purpose('Backfill the room-night inventory and reservation claims from the bookings table');
+
+Artisan::command('amenities:rebuild', function () {
+    $written = RoomSearchService::rebuild();
+    $this->info("Amenity index rebuilt: {$written} room amenities.");
+})->purpose('Rebuild the room_amenities search index from rooms.amenities');
+
+Artisan::command('ratings:reconcile {--room= : Only reconcile this room id}', function () {
+    $fixed = RoomRatingService::reconcile($this->option('room'));
+    $this->info("Room ratings reconciled: {$fixed} room(s) had drifted.");
+})->purpose('Recompute stored room rating aggregates from the reviews table');
+
+Artisan::command('user-stats:rebuild', function () {
+    $users = UserStatsService::rebuild();
+    $this->info("User stats rebuilt for {$users} user(s).");
+})->purpose('Recompute per-user booking and spend stats from bookings and payments');
+
+Artisan::command('rollups:rebuild {--from= : First day to rebuild (Y-m-d)} {--to= : Last day to rebuild (Y-m-d)}', function () {
+    $rows = ReportRollupService::rebuild($this->option('from'), $this->option('to'));
+    $this->info("Report rollups rebuilt: {$rows} row(s) written.");
+})->purpose('Rebuild the daily booking/payment rollups behind the admin dashboard and reports');
+
+Artisan::command('notifications:replay-dead', function () {
+    $letters = NotificationDeadLetter::whereNull('replayed_at')->get();
+
+    foreach ($letters as $letter) {
+        DeliverNotifications::dispatch($letter->payload);
+        $letter->update(['replayed_at' => now()]);
+    }
+
+    $this->info("Re-queued {$letters->count()} dead-lettered notification batch(es).");
+})->purpose('Re-queue notification batches that exhausted their retries');
+
+Artisan::command('images:backfill {--force : Regenerate variants that already exist} {--queue : Dispatch jobs instead of processing inline}', function () {
+    $queued = 0;
+
+    $process = function ($record) use (&$queued) {
+        try {
+            $this->option('queue') ? GenerateImageVariants::dispatch($record) : GenerateImageVariants::dispatchSync($record);
+            $queued++;
+        } catch (\Exception $e) {
+            $this->warn(class_basename($record) . " #{$record->id}: " . $e->getMessage());
+        }
+    };
+
+    Room::whereNotNull('image')
+        ->when(!$this->option('force'), fn ($q) => $q->whereNull('image_variants'))
+        ->lazyById()
+        ->each($process);
+
+    Payment::whereNotNull('proof_file')
+        ->when(!$this->option('force'), fn ($q) => $q->whereNull('proof_variants'))
+        ->lazyById()
+        ->each($process);
+
+    $this->info("Image variants " . ($this->option('queue') ? 'queued' : 'generated') . " for {$queued} image(s).");
+})->purpose('Generate resized WebP/JPEG variants for existing room photos (public/room) and payment proofs');
+
+Artisan::command('idempotency:prune {--hours=24 : Keep keys newer than this}', function () {
+    $deleted = IdempotencyKey::where('created_at', '<', now()->subHours((int) $this->option('hours')))->delete();
+    $this->info("Idempotency keys pruned: {$deleted} removed.");
+})->purpose('Delete stored Idempotency-Key responses older than the replay window')->daily();
+
+Artisan::command('tokens:flush-usage', function () {
+    $flushed = ApiTokenService::flushUsage();
+    $this->info("API token usage flushed: {$flushed} token(s) updated.");
+})->purpose('Write buffered personal_access_tokens.last_used_at values')->everyMinute();
+
+Artisan::command('lifecycle:run {--skip-archive : Only complete past stays and expire unpaid holds}', function () {
+    // Expire first, so an unpaid stay that already ended is cancelled rather than completed
+    $expired = LifecycleService::expireUnpaidHolds();
+    $completed = LifecycleService::completePastStays();
+    $this->info("Bookings completed: {$completed}; unpaid holds expired: {$expired}.");
+
+    if ($this->option('skip-archive')) {
+        return;
+    }
+
+    $moved = LifecycleService::archive();
+    $this->info("Archived {$moved['bookings']} booking(s), {$moved['payments']} payment(s) and {$moved['notifications']} notification(s).");
+})->purpose('Complete past stays, expire unpaid holds and move old rows to the archive tables')->dailyAt('03:00')->withoutOverlapping();
+
+Artisan::command('db:seed-scale
+    {--bookings=100000 : Bookings to generate}
+    {--years=3 : Years of history before --until}
+    {--users= : Registered guests (default: bookings / 5)}
+    {--rooms=40 : Rooms to create}
+    {--seed=20251215 : Random seed; the same seed and --until give the same dataset}
+    {--until= : Day the history ends (default: today)}
+    {--export= : Write <table>.ndjson files to this directory instead of the database}
+    {--skip-derived : Do not rebuild inventory, stats, rollups, ratings and amenities afterwards}', function () {
+    $seeder = new ScaleSeeder();
+    $seeder->bookings = (int) $this->option('bookings');
+    $seeder->years = (int) $this->option('years');
+    $seeder->users = $this->option('users') !== null ? (int) $this->option('users') : null;
+    $seeder->rooms = max(1, (int) $this->option('rooms'));
+    $seeder->seed = (int) $this->option('seed');
+    $seeder->until = $this->option('until');
+    $seeder->export = $this->option('export');
+
+    $started = microtime(true);
+    $seeder->run();
+
+    foreach ($seeder->counts as $table => $rows) {
+        $this->line(sprintf('  %-14s %12s rows', $table, number_format($rows)));
+    }
+    $this->info(sprintf('Generated in %.1fs.', microtime(true) - $started));
+
+    if ($seeder->export || $this->option('skip-derived')) {
+        return;
+    }
+
+    foreach (['inventory:rebuild', 'user-stats:rebuild', 'rollups:rebuild', 'ratings:reconcile', 'amenities:rebuild'] as $command) {
+        $this->call($command);
+    }
+})->purpose('Generate a production-size, reproducible dataset with chunked multi-row inserts');
@@ -4,26 +4,22 @@
 use App\Http\Controllers\AdminController;
 use App\Http\Controllers\HomeController;
 
-// Public Routes - Serve hotel booking frontend
-Route::get("/", function () {
-    return file_get_contents(public_path('index.html'));
-});
-
-Route::get("/index.html", function () {
-    return file_get_contents(public_path('index.html'));
-});
-
-Route::get("/signin.html", function () {
-    return file_get_contents(public_path('signin.html'));
-});
-
-Route::get("/signup.html", function () {
-    return file_get_contents(public_path('signup.html'));
-});
-
-Route::get("/booking.html", function () {
-    return file_get_contents(public_path('booking.html'));
-});
+// Public Routes - Serve hotel booking frontend, preferring the fingerprinted build (npm run build)
+$page = function ($name) {
+    $built = public_path("dist/pages/{$name}");
+
+    return file_get_contents(is_file($built) ? $built : public_path($name));
+};
+
+Route::get("/", fn () => $page('index.html'));
+
+Route::get("/index.html", fn () => $page('index.html'));
+
+Route::get("/signin.html", fn () => $page('signin.html'));
+
+Route::get("/signup.html", fn () => $page('signup.html'));
+
+Route::get("/booking.html", fn () => $page('booking.html'));
 
 // Admin Routes
 Route::get('/admin', [AdminController::class,'home']);
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Concurrency test for POST /api/booking against a running server.
+
+Fires many booking requests for the same room type and overlapping nights at
+the same instant, then checks that exactly one of them won and that the rest
+were refused with 409 (never a 500). A second round retries one request with
+the same Idempotency-Key from many threads and checks that only one booking
+exists afterwards.
+
+Usage:
+    php artisan serve &           # or any multi-worker server (php-fpm, Octane)
+    python test_concurrent_booking.py --requests 50
+"""
+
+import argparse
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+import requests
+
+BASE_URL = 'http://127.0.0.1:8000'
+
+GREEN = '\033[92m'
+RED = '\033[91m'
+END = '\033[0m'
+
+
+def payload(booking_id, room_type, check_in, nights):
+    check_out = check_in + timedelta(days=nights)
+    return {
+        'bookingId': booking_id,
+        'firstName': 'Load',
+        'lastName': 'Test',
+        'email': 'loadtest@example.com',
+        'phone': '0812345678',
+        'roomType': room_type,
+        'checkin': f'{check_in.isoformat()}T15:00:00',
+        'checkout': f'{check_out.isoformat()}T11:00:00',
+        'guests': 2,
+        'nights': nights,
+        'rate': 100,
+        'total': 100 * nights,
+    }
+
+
+def fire(url, bodies, headers_for):
+    """Send every body at once, released together by a barrier."""
+    barrier = threading.Barrier(len(bodies))
+
+    def send(index):
+        barrier.wait()
+        response = requests.post(url, json=bodies[index], headers=headers_for(index), timeout=60)
+        return response.status_code, response.headers.get('Idempotent-Replayed')
+
+    with ThreadPoolExecutor(max_workers=len(bodies)) as pool:
+        return list(pool.map(send, range(len(bodies))))
+
+
+def round_contention(url, count):
+    """Many guests, same room type, overlapping stays: exactly one may win."""
+    room_type = f'load-{uuid.uuid4().hex[:8]}'
+    check_in = date.today() + timedelta(days=365)
+    bodies = [payload(f'BK-{uuid.uuid4().hex[:12]}', room_type, check_in + timedelta(days=i % 2), 2)
+              for i in range(count)]
+
+    results = fire(url, bodies, lambda i: {'Accept': 'application/json'})
+    codes = Counter(code for code, _ in results)
+    print(f'contention round ({room_type}): {dict(codes)}')
+
+    return codes[201] == 1 and codes[409] == count - 1
+
+
+def round_idempotency(url, count):
+    """One guest retrying the same request many times: one booking, the rest replays or 409."""
+    body = payload(f'BK-{uuid.uuid4().hex[:12]}', f'load-{uuid.uuid4().hex[:8]}', date.today() + timedelta(days=400), 1)
+    key = str(uuid.uuid4())
+
+    results = fire(url, [body] * count, lambda i: {'Accept': 'application/json', 'Idempotency-Key': key})
+    codes = Counter(code for code, _ in results)
+    replayed = sum(1 for _, header in results if header == 'true')
+    print(f'idempotency round: {dict(codes)}, {replayed} replayed')
+
+    # Late arrivals replay the stored 201; ones that overlap the first request get 409 "in progress"
+    time.sleep(0.5)
+    final = requests.post(url, json=body, headers={'Accept': 'application/json', 'Idempotency-Key': key}, timeout=60)
+
+    return (codes[201] - replayed == 1 and set(codes) <= {201, 409}
+            and final.status_code == 201 and final.headers.get('Idempotent-Replayed') == 'true')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Concurrency test for the booking endpoint.')
+    parser.add_argument('--base-url', default=BASE_URL)
+    parser.add_argument('--requests', type=int, default=30, help='parallel requests per round')
+    parser.add_argument('--rounds', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    url = args.base_url.rstrip('/') + '/api/booking'
+    ok = True
+
+    for _ in range(args.rounds):
+        ok &= round_contention(url, args.requests)
+        ok &= round_idempotency(url, args.requests)
+
+    if ok:
+        print(f'{GREEN}✓ no double bookings, retries replayed{END}')
+        return 0
+
+    print(f'{RED}✗ double booking or unexpected status detected{END}')
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
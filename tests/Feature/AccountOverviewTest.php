@@ -0,0 +1,80 @@
+<?php
+
+namespace Tests\Feature;
+
+use App\Models\Booking;
+use App\Models\Payment;
+use App\Models\User;
+use Illuminate\Foundation\Testing\RefreshDatabase;
+use Laravel\Sanctum\Sanctum;
+use Tests\TestCase;
+
+class AccountOverviewTest extends TestCase
+{
+    use RefreshDatabase;
+
+    public function test_overview_returns_counters_and_first_page_in_two_queries(): void
+    {
+        $user = User::factory()->create();
+
+        foreach (range(1, 12) as $i) {
+            Booking::factory()->create([
+                'user_id' => $user->id,
+                'booking_id' => sprintf('BK-%02d', $i),
+                'check_in' => now()->addDays($i <= 8 ? 10 + $i : -30 - $i)->setTime(15, 0),
+                'check_out' => now()->addDays($i <= 8 ? 12 + $i : -28 - $i)->setTime(11, 0),
+                'status' => $i <= 2 ? 'cancelled' : ($i <= 8 ? 'confirmed' : 'completed'),
+                'paid_status' => $i % 2 ? 'paid' : 'unpaid',
+                'created_at' => now()->subDays(20 - $i),
+            ]);
+        }
+        Payment::factory()->create(['booking_id' => 'BK-12', 'status' => 'verified']);
+        Booking::factory()->create(['user_id' => User::factory()->create()->id]);
+
+        Sanctum::actingAs($user);
+
+        $response = $this->assertQueryBudget(2, fn () => $this->getJson('/api/user/overview?per_page=5'));
+
+        $response->assertOk()
+            ->assertJsonPath('data.user.email', $user->email)
+            ->assertJsonPath('data.summary', [
+                'total_bookings' => 12,
+                'completed_bookings' => 4,
+                'upcoming_bookings' => 6,
+                'cancelled_bookings' => 2,
+                'awaiting_payment' => 5,
+                'archived_bookings' => 0,
+            ])
+            ->assertJsonCount(5, 'data.bookings')
+            ->assertJsonPath('data.bookings.0.booking_id', 'BK-12')
+            ->assertJsonPath('data.bookings.0.payment_status', 'verified')
+            ->assertJsonPath('data.bookings.1.payment_status', null);
+
+        $this->getJson('/api/user/bookings-summary')->assertJsonPath('data.upcoming_bookings', 6);
+
+        // Later pages: bookings only, in order, with just the requested fields
+        $seen = array_column($response->json('data.bookings'), 'booking_id');
+        $cursor = $response->json('data.next_cursor');
+
+        while ($cursor) {
+            $page = $this->getJson('/api/user/overview?per_page=5&fields=booking_id,status&cursor=' . urlencode($cursor))
+                ->assertOk()
+                ->assertJsonMissingPath('data.summary');
+
+            $this->assertSame(['booking_id', 'status'], array_keys($page->json('data.bookings.0')));
+            $seen = array_merge($seen, array_column($page->json('data.bookings'), 'booking_id'));
+            $cursor = $page->json('data.next_cursor');
+        }
+
+        $this->assertSame(array_map(fn ($i) => sprintf('BK-%02d', $i), range(12, 1)), $seen);
+    }
+
+    public function test_unknown_fields_are_rejected(): void
+    {
+        Sanctum::actingAs(User::factory()->create());
+
+        $this->getJson('/api/user/overview?fields=booking_id,email')
+            ->assertStatus(422)
+            ->assertJsonPath('message', 'Unknown fields: email');
+    }
+}
@@ -0,0 +1,72 @@
+<?php
+
+namespace Tests\Feature;
+
+use App\Models\PersonalAccessToken;
+use App\Models\User;
+use Illuminate\Foundation\Testing\RefreshDatabase;
+use Illuminate\Support\Facades\DB;
+use Tests\TestCase;
+
+class ApiTokenCacheTest extends TestCase
+{
+    use RefreshDatabase;
+
+    public function test_repeated_requests_do_not_touch_the_token_table(): void
+    {
+        $user = User::factory()->create();
+        $plainText = $user->createToken('auth_token')->plainTextToken;
+
+        $tokenQueries = [];
+        DB::listen(function ($query) use (&$tokenQueries) {
+            if (str_contains($query->sql, 'personal_access_tokens')) {
+                $tokenQueries[] = $query->sql;
+            }
+        });
+
+        foreach (range(1, 3) as $i) {
+            $this->withToken($plainText)->getJson('/api/notifications/unread-count')->assertOk();
+            $this->app['auth']->forgetGuards();
+        }
+
+        // One lookup for the first request, no last_used_at writes at all
+        $this->assertCount(1, $tokenQueries);
+        $this->assertStringStartsWith('select', $tokenQueries[0]);
+        $this->assertNull(PersonalAccessToken::first()->last_used_at);
+
+        // Uses are flushed once their minute is over, reading only the tokens used in it
+        $idle = $user->createToken('idle')->accessToken;
+        $this->artisan('tokens:flush-usage')->expectsOutputToContain('0 token(s) updated')->assertSuccessful();
+
+        $this->travel(1)->minutes();
+        $tokenQueries = [];
+        $this->artisan('tokens:flush-usage')->expectsOutputToContain('1 token(s) updated')->assertSuccessful();
+
+        $this->assertCount(2, $tokenQueries);
+        $this->assertMatchesRegularExpression('/where "id" in \(\?\)/', $tokenQueries[0]);
+        $this->assertNotNull(PersonalAccessToken::first()->last_used_at);
+        $this->assertNull($idle->fresh()->last_used_at);
+
+        // Already written uses are not written again
+        $this->artisan('tokens:flush-usage')->expectsOutputToContain('0 token(s) updated')->assertSuccessful();
+    }
+
+    public function test_logout_and_user_changes_evict_the_cached_token(): void
+    {
+        $user = User::factory()->create();
+        $plainText = $user->createToken('auth_token')->plainTextToken;
+
+        $this->withToken($plainText)->getJson('/api/user')->assertJsonPath('usertype', 'user');
+        $this->app['auth']->forgetGuards();
+
+        $user->forceFill(['usertype' => 'admin'])->save();
+
+        $this->withToken($plainText)->getJson('/api/user')->assertJsonPath('usertype', 'admin');
+        $this->app['auth']->forgetGuards();
+
+        $this->withToken($plainText)->postJson('/api/logout')->assertOk();
+        $this->app['auth']->forgetGuards();
+
+        $this->withToken($plainText)->getJson('/api/user')->assertUnauthorized();
+    }
+}
@@ -0,0 +1,122 @@
+<?php
+
+namespace Tests\Feature;
+
+use App\Models\Booking;
+use App\Models\RoomClaim;
+use App\Models\RoomNight;
+use App\Models\User;
+use App\Models\UserStat;
+use Illuminate\Foundation\Testing\RefreshDatabase;
+use Laravel\Sanctum\Sanctum;
+use Tests\TestCase;
+
+class BookingImportTest extends TestCase
+{
+    use RefreshDatabase;
+
+    public function test_ndjson_import_reports_each_line(): void
+    {
+        $admin = User::factory()->create();
+        $admin->forceFill(['usertype' => 'admin'])->save();
+        $guest = User::factory()->create();
+
+        Booking::factory()->create(['booking_id' => 'BK-EXISTING']);
+
+        $lines = [
+            json_encode($this->row('BK-1', ['userEmail' => $guest->email])),
+            json_encode($this->row('BK-2', ['roomType' => 'luxury'])),
+            '',
+            json_encode($this->row('BK-1')),
+            json_encode($this->row('BK-EXISTING')),
+            json_encode($this->row('BK-3', ['checkout' => '2030-01-01 11:00:00'])),
+            '{not json',
+        ];
+
+        Sanctum::actingAs($admin);
+
+        $response = $this->call('POST', '/api/admin/bookings/import', [], [], [], [
+            'CONTENT_TYPE' => 'application/x-ndjson',
+            'HTTP_ACCEPT' => 'application/json',
+        ], implode("\n", $lines)."\n");
+
+        $response->assertOk()
+            ->assertJsonPath('total', 6)
+            ->assertJsonPath('created', 2)
+            ->assertJsonPath('rejected', 4)
+            ->assertJsonPath('results.0.status', 'created')
+            ->assertJsonPath('results.1.status', 'created')
+            ->assertJsonPath('results.2.line', 4)
+            ->assertJsonPath('results.2.status', 'duplicate')
+            ->assertJsonPath('results.3.status', 'duplicate')
+            ->assertJsonPath('results.4.status', 'invalid')
+            ->assertJsonPath('results.5.status', 'invalid');
+
+        $imported = Booking::where('booking_id', 'BK-1')->first();
+        $this->assertSame($guest->id, $imported->user_id);
+        $this->assertSame(2, RoomNight::where('booking_id', $imported->id)->count());
+        $this->assertSame(1, UserStat::find($guest->id)->booking_count);
+        $this->assertSame(2, RoomClaim::where('booking_id', $imported->id)->count());
+    }
+
+    public function test_import_rejects_stays_that_overlap_claimed_nights(): void
+    {
+        $admin = User::factory()->create();
+        $admin->forceFill(['usertype' => 'admin'])->save();
+
+        $this->postJson('/api/booking', $this->row('BK-WEB'))->assertCreated();
+
+        $lines = [
+            json_encode($this->row('BK-1', ['checkin' => '2030-01-11 15:00:00', 'checkout' => '2030-01-13 11:00:00'])),
+            json_encode($this->row('BK-2', ['checkin' => '2030-01-12 15:00:00', 'checkout' => '2030-01-14 11:00:00'])),
+            json_encode($this->row('BK-3', ['checkin' => '2030-01-13 15:00:00', 'checkout' => '2030-01-15 11:00:00'])),
+        ];
+
+        Sanctum::actingAs($admin);
+
+        $this->call('POST', '/api/admin/bookings/import', [], [], [], [
+            'CONTENT_TYPE' => 'application/x-ndjson',
+            'HTTP_ACCEPT' => 'application/json',
+        ], implode("\n", $lines)."\n")
+            ->assertOk()
+            ->assertJsonPath('created', 1)
+            ->assertJsonPath('results.0.status', 'unavailable')
+            ->assertJsonPath('results.1.status', 'created')
+            ->assertJsonPath('results.2.status', 'unavailable');
+
+        // The imported stay is claimed, so the booking API sees it as taken
+        $this->postJson('/api/booking', $this->row('BK-LATE', ['checkin' => '2030-01-13 15:00:00', 'checkout' => '2030-01-14 11:00:00']))
+            ->assertStatus(409);
+        $this->assertSame(['BK-2', 'BK-WEB'], Booking::orderBy('booking_id')->pluck('booking_id')->all());
+    }
+
+    public function test_import_requires_admin(): void
+    {
+        Sanctum::actingAs(User::factory()->create());
+
+        $this->call('POST', '/api/admin/bookings/import', [], [], [], [
+            'CONTENT_TYPE' => 'application/x-ndjson',
+            'HTTP_ACCEPT' => 'application/json',
+        ], json_encode($this->row('BK-1'))."\n")->assertForbidden();
+
+        $this->assertSame(0, Booking::count());
+    }
+
+    private function row(string $bookingId, array $overrides = []): array
+    {
+        return array_merge([
+            'bookingId' => $bookingId,
+            'firstName' => 'Tour',
+            'lastName' => 'Group',
+            'email' => 'ops@example.com',
+            'phone' => '0812345678',
+            'roomType' => 'deluxe',
+            'checkin' => '2030-01-10 15:00:00',
+            'checkout' => '2030-01-12 11:00:00',
+            'guests' => 2,
+            'nights' => 2,
+            'rate' => 149,
+            'total' => 298,
+        ], $overrides);
+    }
+}
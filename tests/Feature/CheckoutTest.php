@@ -0,0 +1,84 @@
+<?php
+
+namespace Tests\Feature;
+
+use App\Jobs\DeliverNotifications;
+use App\Models\Booking;
+use App\Models\Payment;
+use App\Models\RoomClaim;
+use App\Models\User;
+use Illuminate\Foundation\Testing\RefreshDatabase;
+use Illuminate\Support\Facades\Queue;
+use Tests\TestCase;
+
+class CheckoutTest extends TestCase
+{
+    use RefreshDatabase;
+
+    public function test_checkout_books_pays_and_notifies_in_one_request(): void
+    {
+        Queue::fake();
+        $user = User::factory()->create();
+
+        $response = $this->postJson('/api/checkout', $this->payload('BK-PAY', '2030-05-01', '2030-05-03', $user->email))
+            ->assertCreated()
+            ->assertJsonPath('booking.booking_id', 'BK-PAY')
+            ->assertJsonPath('booking.paid_status', 'paid')
+            ->assertJsonPath('payment.booking_id', 'BK-PAY');
+
+        $booking = Booking::where('booking_id', 'BK-PAY')->first();
+        $payment = Payment::where('booking_id', 'BK-PAY')->first();
+
+        $this->assertSame($user->id, $booking->user_id);
+        $this->assertSame($payment->transaction_id, $response->json('transaction_id'));
+        $this->assertSame('completed', $payment->status);
+        $this->assertEquals($booking->total, $payment->amount);
+        $this->assertSame(2, RoomClaim::where('booking_id', $booking->id)->count());
+
+        Queue::assertPushed(DeliverNotifications::class, 2);
+    }
+
+    public function test_failed_checkout_leaves_no_booking_or_payment_behind(): void
+    {
+        Queue::fake();
+
+        $this->postJson('/api/checkout', $this->payload('BK-FIRST', '2030-05-01', '2030-05-04'))->assertCreated();
+
+        $this->postJson('/api/checkout', $this->payload('BK-SECOND', '2030-05-03', '2030-05-05'))
+            ->assertStatus(409)
+            ->assertJsonPath('message', 'Room is not available for the selected dates');
+
+        $this->postJson('/api/checkout', $this->payload('BK-FIRST', '2030-06-01', '2030-06-03'))
+            ->assertStatus(409)
+            ->assertJsonPath('message', 'Booking ID already exists');
+
+        $this->assertSame(['BK-FIRST'], Booking::pluck('booking_id')->all());
+        $this->assertSame(['BK-FIRST'], Payment::pluck('booking_id')->all());
+    }
+
+    private function payload(string $bookingId, string $checkIn, string $checkOut, ?string $userEmail = null): array
+    {
+        return [
+            'bookingId' => $bookingId,
+            'firstName' => 'Test',
+            'lastName' => 'Guest',
+            'email' => 'guest@example.com',
+            'phone' => '0812345678',
+            'roomType' => 'deluxe',
+            'checkin' => $checkIn.' 15:00:00',
+            'checkout' => $checkOut.' 11:00:00',
+            'guests' => 2,
+            'nights' => 1,
+            'rate' => 149,
+            'total' => 149,
+            'userEmail' => $userEmail,
+            'paymentMethod' => 'credit_card',
+            'cardholderName' => 'Test Guest',
+            'cardLastFour' => '4242',
+            'billingAddress' => '1 Test Street',
+            'city' => 'Jakarta',
+            'zipCode' => '10110',
+            'country' => 'Indonesia',
+        ];
+    }
+}
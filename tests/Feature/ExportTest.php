@@ -0,0 +1,127 @@
+<?php
+
+namespace Tests\Feature;
+
+use App\Models\Booking;
+use App\Models\Payment;
+use App\Models\User;
+use Illuminate\Foundation\Testing\RefreshDatabase;
+use Laravel\Sanctum\Sanctum;
+use Tests\TestCase;
+
+class ExportTest extends TestCase
+{
+    use RefreshDatabase;
+
+    public function test_bookings_stream_as_csv_with_list_filters(): void
+    {
+        $this->travelTo('2030-01-01 10:00:00');
+
+        $this->booked('BK-1', ['first_name' => '=HYPERLINK("x")']);
+        $this->booked('BK-2', ['paid_status' => 'paid']);
+        $this->booked('BK-3', ['status' => 'cancelled']);
+
+        $this->travel(5)->seconds();
+        $this->actingAsAdmin();
+
+        $this->getJson('/api/admin/export/rooms')->assertNotFound();
+
+        $response = $this->get('/api/admin/export/bookings?status=confirmed');
+        $response->assertOk()
+            ->assertHeader('Content-Type', 'text/csv; charset=UTF-8')
+            ->assertHeader('X-Export-Watermark', '2030-01-01 10:00:05');
+
+        $rows = array_map('str_getcsv', explode("\n", trim($response->streamedContent())));
+
+        $this->assertSame('booking_id', $rows[0][1]);
+        $this->assertSame(['BK-1', 'BK-2'], array_column(array_slice($rows, 1), 1));
+        $this->assertStringStartsWith("'=HYPERLINK", $rows[1][3]);
+
+        $paid = $this->get('/api/admin/export/bookings?format=ndjson&paid_status=paid')->streamedContent();
+        $this->assertSame(['BK-2'], $this->bookingIds($paid));
+    }
+
+    public function test_since_watermark_returns_only_later_changes(): void
+    {
+        $this->travelTo('2030-01-01 10:00:00');
+        $this->booked('BK-1');
+        $second = $this->booked('BK-2');
+
+        $this->travel(5)->seconds();
+        $this->actingAsAdmin();
+
+        $first = $this->get('/api/admin/export/bookings?format=ndjson');
+        $this->assertSame(['BK-1', 'BK-2'], $this->bookingIds($first->streamedContent()));
+
+        $this->travel(5)->seconds();
+        $second->update(['special_requests' => 'Late check-in']);
+        $this->booked('BK-3');
+
+        $this->travel(5)->seconds();
+        $next = $this->get('/api/admin/export/bookings?format=ndjson&since=' . urlencode($first->headers->get('X-Export-Watermark')));
+
+        $this->assertSame(['BK-2', 'BK-3'], $this->bookingIds($next->streamedContent()));
+    }
+
+    public function test_since_watermark_returns_guests_whose_stats_changed(): void
+    {
+        $this->travelTo('2030-01-01 10:00:00');
+        $guest = User::factory()->create(['email' => 'guest@example.com']);
+        $other = User::factory()->create();
+        $booking = $this->booked('BK-1', ['user_id' => $guest->id]);
+
+        $this->travel(5)->seconds();
+        $this->actingAsAdmin();
+
+        $first = $this->get('/api/admin/export/users?format=ndjson');
+        $this->assertSame([$guest->id, $other->id], $this->ids($first->streamedContent()));
+
+        // Paying only moves user_stats; the users row is untouched
+        $this->travel(5)->seconds();
+        Payment::factory()->create(['booking_id' => $booking->booking_id, 'user_email' => $guest->email, 'amount' => 149]);
+
+        $this->travel(5)->seconds();
+        $next = $this->get('/api/admin/export/users?format=ndjson&since=' . urlencode($first->headers->get('X-Export-Watermark')));
+
+        $rows = array_map(fn ($line) => json_decode($line, true), explode("\n", trim($next->streamedContent())));
+        $this->assertSame([$guest->id], array_column($rows, 'id'));
+        $this->assertEquals(149, $rows[0]['total_spent']);
+    }
+
+    public function test_export_requires_admin(): void
+    {
+        Sanctum::actingAs(User::factory()->create());
+
+        $this->getJson('/api/admin/export/users')->assertForbidden();
+    }
+
+    private function actingAsAdmin(): void
+    {
+        $admin = User::factory()->create();
+        $admin->forceFill(['usertype' => 'admin'])->save();
+        Sanctum::actingAs($admin);
+    }
+
+    private function ids(string $ndjson): array
+    {
+        return array_map(fn ($line) => json_decode($line, true)['id'], explode("\n", trim($ndjson)));
+    }
+
+    private function bookingIds(string $ndjson): array
+    {
+        return array_map(fn ($line) => json_decode($line, true)['booking_id'], explode("\n", trim($ndjson)));
+    }
+
+    /**
+     * A confirmed, unpaid booking written now, so it falls in the current export window
+     */
+    private function booked(string $bookingId, array $attributes = []): Booking
+    {
+        return Booking::factory()->unpaid()->create(array_merge([
+            'booking_id' => $bookingId,
+            'status' => 'confirmed',
+            'created_at' => now(),
+            'updated_at' => now(),
+        ], $attributes));
+    }
+}
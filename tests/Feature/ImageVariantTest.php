@@ -0,0 +1,85 @@
+<?php
+
+namespace Tests\Feature;
+
+use App\Models\Booking;
+use App\Models\Payment;
+use App\Models\User;
+use App\Services\ImageVariantService;
+use Illuminate\Foundation\Testing\RefreshDatabase;
+use Illuminate\Http\UploadedFile;
+use Illuminate\Support\Facades\Storage;
+use Laravel\Sanctum\Sanctum;
+use Tests\TestCase;
+
+class ImageVariantTest extends TestCase
+{
+    use RefreshDatabase;
+
+    protected function setUp(): void
+    {
+        parent::setUp();
+
+        if (!ImageVariantService::available()) {
+            $this->markTestSkipped('The GD extension with WebP support is not available.');
+        }
+    }
+
+    public function test_payment_proof_upload_generates_variants(): void
+    {
+        Storage::fake('public');
+
+        $user = User::factory()->create();
+        Booking::create([
+            'user_id' => $user->id,
+            'booking_id' => 'BK-PROOF',
+            'first_name' => 'Test',
+            'last_name' => 'Guest',
+            'email' => $user->email,
+            'phone' => '0812345678',
+            'room_type' => 'deluxe',
+            'check_in' => '2030-01-10 15:00:00',
+            'check_out' => '2030-01-12 11:00:00',
+            'guests' => 2,
+            'nights' => 2,
+            'rate' => 149,
+            'total' => 298,
+        ]);
+
+        Sanctum::actingAs($user);
+
+        $this->postJson('/api/payments/upload-proof', [
+            'booking_id' => 'BK-PROOF',
+            'proof' => UploadedFile::fake()->image('transfer.png', 2400, 1800),
+        ])->assertCreated();
+
+        $variants = Payment::first()->proof_variants;
+
+        $this->assertSame(['thumb', 'card', 'full'], array_keys($variants));
+        $this->assertSame(160, $variants['thumb']['width']);
+        $this->assertSame(120, $variants['thumb']['height']);
+        $this->assertSame(1600, $variants['full']['width']);
+        Storage::disk('public')->assertExists($variants['thumb']['webp']);
+        Storage::disk('public')->assertExists($variants['full']['jpeg']);
+
+        $admin = User::factory()->create();
+        $admin->forceFill(['usertype' => 'admin'])->save();
+        Sanctum::actingAs($admin);
+
+        $payment = $this->getJson('/api/admin/payments/pending')->assertOk()->json('data.0');
+        $this->assertStringEndsWith('-thumb.webp', $payment['proof_thumb_url']);
+        $this->assertStringEndsWith('-full.webp', $payment['proof_url']);
+    }
+
+    public function test_small_images_are_not_scaled_up(): void
+    {
+        Storage::fake('public');
+
+        $source = UploadedFile::fake()->image('small.jpg', 300, 200)->getPathname();
+        $variants = ImageVariantService::generate($source, 'variants/test');
+
+        $this->assertSame(160, $variants['thumb']['width']);
+        $this->assertSame(300, $variants['card']['width']);
+        $this->assertSame(300, $variants['full']['width']);
+    }
+}
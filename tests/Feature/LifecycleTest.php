@@ -0,0 +1,154 @@
+<?php
+
+namespace Tests\Feature;
+
+use App\Models\Booking;
+use App\Models\Notification;
+use App\Models\Payment;
+use App\Models\User;
+use App\Models\UserStat;
+use App\Services\ReportRollupService;
+use Illuminate\Foundation\Testing\RefreshDatabase;
+use Illuminate\Support\Facades\DB;
+use Laravel\Sanctum\Sanctum;
+use Tests\TestCase;
+
+class LifecycleTest extends TestCase
+{
+    use RefreshDatabase;
+
+    public function test_lifecycle_completes_stays_expires_holds_and_archives_old_rows(): void
+    {
+        $this->travelTo('2026-06-15 02:00:00');
+        $user = User::factory()->create();
+
+        $old = $this->booking($user, 'BK-OLD', '2024-03-05', ['status' => 'confirmed', 'paid_status' => 'paid']);
+        Payment::factory()->create(['booking_id' => 'BK-OLD', 'user_email' => $user->email, 'status' => 'verified']);
+        Notification::factory()->create(['user_id' => $user->id, 'booking_id' => $old->id, 'status' => 'unread', 'read_at' => null]);
+
+        $this->booking($user, 'BK-LAST-WEEK', '2026-06-05', ['status' => 'confirmed', 'paid_status' => 'paid']);
+        $this->booking($user, 'BK-HOLD', '2026-07-01', ['created_at' => now()->subDays(2)]);
+        $this->booking($user, 'BK-FRESH', '2026-07-10', ['created_at' => now()->subHour()]);
+        $this->booking($user, 'BK-PROOF', '2026-07-20', ['created_at' => now()->subDays(3)]);
+        Payment::factory()->create(['booking_id' => 'BK-PROOF', 'status' => 'pending_verification']);
+
+        Notification::factory()->read()->create(['user_id' => $user->id, 'created_at' => now()->subDays(200)]);
+        Notification::factory()->unread()->create(['user_id' => $user->id, 'created_at' => now()->subDays(200)]);
+
+        $totals = ReportRollupService::totals();
+        $bookingCount = UserStat::find($user->id)->booking_count;
+
+        $this->artisan('lifecycle:run')->assertSuccessful();
+
+        $this->assertSame('completed', DB::table('bookings_archive')->where('booking_id', 'BK-OLD')->value('status'));
+        $this->assertSame('2024-03', DB::table('bookings_archive')->where('booking_id', 'BK-OLD')->value('archive_month'));
+        $this->assertSame(1, DB::table('payments_archive')->where('booking_id', 'BK-OLD')->count());
+        $this->assertSame(2, DB::table('notifications_archive')->count());
+        $this->assertDatabaseMissing('bookings', ['booking_id' => 'BK-OLD']);
+        $this->assertDatabaseMissing('payments', ['booking_id' => 'BK-OLD']);
+
+        $this->assertSame('completed', Booking::where('booking_id', 'BK-LAST-WEEK')->value('status'));
+        $this->assertSame('cancelled', Booking::where('booking_id', 'BK-HOLD')->value('status'));
+        $this->assertSame('confirmed', Booking::where('booking_id', 'BK-FRESH')->value('status'));
+        $this->assertSame('confirmed', Booking::where('booking_id', 'BK-PROOF')->value('status'));
+        $this->assertSame(0, DB::table('room_nights')->where('booking_id', Booking::where('booking_id', 'BK-HOLD')->value('id'))->count());
+        $this->assertSame(1, Notification::where('status', 'unread')->whereNull('booking_id')->count());
+
+        // Archived history still counts, and rebuilds read it back from the archive
+        $this->assertSame($bookingCount, UserStat::find($user->id)->booking_count);
+        $this->artisan('user-stats:rebuild')->assertSuccessful();
+        $this->assertSame($bookingCount, UserStat::find($user->id)->booking_count);
+
+        $this->artisan('rollups:rebuild')->assertSuccessful();
+        $this->assertEquals($totals['total_bookings'], ReportRollupService::totals()['total_bookings']);
+        $this->assertEquals($totals['total_revenue'], ReportRollupService::totals()['total_revenue']);
+    }
+
+    public function test_history_reads_the_archive_only_for_old_stay_ranges(): void
+    {
+        $this->travelTo('2026-06-15 02:00:00');
+        $user = User::factory()->create();
+
+        $this->booking($user, 'BK-OLD', '2024-03-05', ['status' => 'completed', 'paid_status' => 'paid']);
+        $this->booking($user, 'BK-NEW', '2026-07-01', ['paid_status' => 'paid']);
+        Payment::factory()->verified()->create(['booking_id' => 'BK-OLD', 'user_email' => $user->email, 'created_at' => '2024-02-20 10:00:00']);
+        Payment::factory()->verified()->create(['booking_id' => 'BK-NEW', 'user_email' => $user->email, 'created_at' => '2026-06-01 10:00:00']);
+        $this->artisan('lifecycle:run')->assertSuccessful();
+
+        Sanctum::actingAs($user);
+
+        // Counters include archived stays and say how many of them the live pages leave out
+        $this->getJson('/api/user/overview')
+            ->assertOk()
+            ->assertJsonPath('data.summary.total_bookings', 2)
+            ->assertJsonPath('data.summary.completed_bookings', 1)
+            ->assertJsonPath('data.summary.upcoming_bookings', 1)
+            ->assertJsonPath('data.summary.archived_bookings', 1)
+            ->assertJsonCount(1, 'data.bookings')
+            ->assertJsonPath('data.next_cursor', null);
+
+        $payments = '/api/my_payments?email=' . urlencode($user->email);
+        $this->getJson($payments)->assertOk()->assertJsonCount(1, 'payments');
+        $this->getJson($payments . '&from=2024-01-01')
+            ->assertJsonCount(2, 'payments')
+            ->assertJsonPath('payments.1.booking_id', 'BK-OLD');
+        $this->getJson($payments . '&from=2024-01-01&to=2024-12-31')
+            ->assertJsonCount(1, 'payments')
+            ->assertJsonPath('payments.0.booking_id', 'BK-OLD');
+
+        $this->getJson('/api/my_bookings')
+            ->assertOk()
+            ->assertJsonCount(1, 'bookings')
+            ->assertJsonPath('bookings.0.booking_id', 'BK-NEW');
+
+        $this->getJson('/api/my_bookings?from=2024-01-01')
+            ->assertJsonCount(2, 'bookings')
+            ->assertJsonPath('bookings.1.booking_id', 'BK-OLD');
+
+        $this->getJson('/api/my_bookings?from=2024-01-01&to=2024-12-31')
+            ->assertJsonCount(1, 'bookings')
+            ->assertJsonPath('bookings.0.booking_id', 'BK-OLD');
+
+        $user->forceFill(['usertype' => 'admin'])->save();
+
+        $this->getJson('/api/admin/bookings?from=2024-01-01&status=completed')
+            ->assertOk()
+            ->assertJsonPath('pagination.total', 1)
+            ->assertJsonPath('data.0.id', 'BK-OLD');
+
+        $this->getJson('/api/admin/bookings')->assertJsonPath('pagination.total', 1);
+    }
+
+    public function test_unpaid_stays_that_ended_are_expired_not_completed(): void
+    {
+        $this->travelTo('2026-06-15 02:00:00');
+        $user = User::factory()->create();
+
+        $this->booking($user, 'BK-NO-SHOW', '2026-06-05');
+        $this->booking($user, 'BK-PROOF', '2026-06-06');
+        Payment::factory()->create(['booking_id' => 'BK-PROOF', 'status' => 'pending_verification']);
+
+        $this->artisan('lifecycle:run', ['--skip-archive' => true])->assertSuccessful();
+
+        $this->assertSame('cancelled', Booking::where('booking_id', 'BK-NO-SHOW')->value('status'));
+
+        // A proof still awaiting review keeps the booking open, neither expired nor completed
+        $this->assertSame('confirmed', Booking::where('booking_id', 'BK-PROOF')->value('status'));
+        $this->assertSame(0, Booking::where('status', 'completed')->count());
+    }
+
+    private function booking(User $user, string $reference, string $checkIn, array $overrides = []): Booking
+    {
+        return Booking::factory()->create(array_merge([
+            'user_id' => $user->id,
+            'booking_id' => $reference,
+            'room_type' => 'deluxe',
+            'check_in' => "{$checkIn} 15:00:00",
+            'check_out' => date('Y-m-d', strtotime("{$checkIn} +2 days")) . ' 11:00:00',
+            'nights' => 2,
+            'status' => 'confirmed',
+            'paid_status' => 'unpaid',
+            'created_at' => date('Y-m-d H:i:s', strtotime("{$checkIn} -10 days")),
+        ], $overrides));
+    }
+}
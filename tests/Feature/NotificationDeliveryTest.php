@@ -0,0 +1,121 @@
+<?php
+
+namespace Tests\Feature;
+
+use App\Jobs\DeliverNotifications;
+use App\Models\Booking;
+use App\Models\Notification;
+use App\Models\NotificationDeadLetter;
+use App\Models\User;
+use Illuminate\Foundation\Testing\RefreshDatabase;
+use Illuminate\Support\Facades\DB;
+use Illuminate\Support\Facades\Queue;
+use Illuminate\Support\Facades\Schema;
+use Laravel\Sanctum\Sanctum;
+use Tests\TestCase;
+
+class NotificationDeliveryTest extends TestCase
+{
+    use RefreshDatabase;
+
+    public function test_failing_batch_is_retried_dead_lettered_and_replayed(): void
+    {
+        config(['queue.default' => 'database']);
+        $user = User::factory()->create();
+
+        DeliverNotifications::dispatch($this->rows($user, 2));
+
+        // The notifications table is unavailable for every attempt
+        Schema::rename('notifications', 'notifications_offline');
+
+        $this->work();
+        $this->assertSame(1, DB::table('jobs')->count(), 'The batch is released for a retry');
+        $this->assertSame(0, NotificationDeadLetter::count());
+
+        $this->travel(11)->seconds();
+        $this->work();
+        $this->assertSame(0, NotificationDeadLetter::count());
+
+        $this->travel(61)->seconds();
+        $this->work();
+
+        $letter = NotificationDeadLetter::sole();
+        $this->assertSame(0, DB::table('jobs')->count());
+        $this->assertSame(2, $letter->row_count);
+        $this->assertSame(3, $letter->attempts);
+        $this->assertSame('Notice 1', $letter->payload[1]['title']);
+        $this->assertNull($letter->replayed_at);
+
+        Schema::rename('notifications_offline', 'notifications');
+
+        $this->artisan('notifications:replay-dead')
+            ->expectsOutputToContain('Re-queued 1 dead-lettered notification batch(es)')
+            ->assertSuccessful();
+        $this->work();
+
+        $this->assertSame(['Notice 0', 'Notice 1'], Notification::where('user_id', $user->id)->orderBy('id')->pluck('title')->all());
+        $this->assertNotNull($letter->fresh()->replayed_at);
+
+        // Replayed letters are not queued again
+        $this->artisan('notifications:replay-dead')
+            ->expectsOutputToContain('Re-queued 0 dead-lettered notification batch(es)')
+            ->assertSuccessful();
+        $this->assertSame(0, DB::table('jobs')->count());
+    }
+
+    public function test_arrivals_fan_out_to_guests_checking_in_that_day(): void
+    {
+        $guests = User::factory()->count(3)->create();
+        $arriving = $guests->map(fn ($guest) => Booking::factory()->create([
+            'user_id' => $guest->id,
+            'check_in' => '2030-06-02 15:00:00',
+            'check_out' => '2030-06-04 11:00:00',
+        ]));
+
+        // Cancelled, walk-in (no account) and next-day stays are skipped
+        Booking::factory()->create(['user_id' => $guests[0]->id, 'status' => 'cancelled', 'check_in' => '2030-06-02 15:00:00', 'check_out' => '2030-06-03 11:00:00']);
+        Booking::factory()->create(['user_id' => null, 'check_in' => '2030-06-02 15:00:00', 'check_out' => '2030-06-03 11:00:00']);
+        Booking::factory()->create(['user_id' => $guests[1]->id, 'check_in' => '2030-06-03 15:00:00', 'check_out' => '2030-06-05 11:00:00']);
+
+        $admin = User::factory()->create();
+        $admin->forceFill(['usertype' => 'admin'])->save();
+        Sanctum::actingAs($admin);
+
+        Queue::fake();
+
+        $this->postJson('/api/admin/notifications/arrivals', ['date' => '2030-06-02', 'title' => 'Welcome', 'message' => 'See you tomorrow'])
+            ->assertStatus(202)
+            ->assertJsonPath('queued', 3)
+            ->assertJsonPath('date', '2030-06-02');
+
+        // One multi-row batch, not one job per guest
+        Queue::assertPushed(DeliverNotifications::class, 1);
+        Queue::assertPushed(DeliverNotifications::class, function ($job) use ($arriving) {
+            return collect($job->rows)->pluck('booking_id')->sort()->values()->all() === $arriving->pluck('id')->sort()->values()->all()
+                && collect($job->rows)->every(fn ($row) => $row['type'] === 'check_in_reminder' && $row['title'] === 'Welcome');
+        });
+    }
+
+    /**
+     * Run the next job on the queue, if one is due
+     */
+    private function work(): void
+    {
+        $this->artisan('queue:work', ['--once' => true, '--sleep' => 0, '--tries' => 0])->assertSuccessful();
+    }
+
+    private function rows(User $user, int $count): array
+    {
+        return array_map(fn ($i) => [
+            'user_id' => $user->id,
+            'booking_id' => null,
+            'type' => 'general',
+            'title' => 'Notice '.$i,
+            'message' => 'Something happened',
+            'status' => 'unread',
+            'read_at' => null,
+            'created_at' => now()->toDateTimeString(),
+            'updated_at' => now()->toDateTimeString(),
+        ], range(0, $count - 1));
+    }
+}
@@ -0,0 +1,114 @@
+<?php
+
+namespace Tests\Feature;
+
+use App\Jobs\DeliverNotifications;
+use App\Models\Notification;
+use App\Models\User;
+use App\Services\NotificationService;
+use Illuminate\Foundation\Testing\RefreshDatabase;
+use Illuminate\Support\Facades\Event;
+use Illuminate\Support\Facades\Queue;
+use Laravel\Octane\Events\RequestReceived;
+use Laravel\Octane\Events\RequestTerminated;
+use Laravel\Sanctum\Sanctum;
+use Tests\TestCase;
+
+class NotificationFeedTest extends TestCase
+{
+    use RefreshDatabase;
+
+    public function test_notifications_are_cursor_paginated_with_a_cached_unread_count(): void
+    {
+        $user = User::factory()->create();
+        $this->deliver($user, 3);
+
+        Sanctum::actingAs($user);
+
+        $first = $this->getJson('/api/notifications?per_page=2')
+            ->assertOk()
+            ->assertJsonCount(2, 'notifications')
+            ->assertJsonPath('unread_count', 3);
+
+        $this->getJson('/api/notifications?per_page=2&cursor='.$first->json('next_cursor'))
+            ->assertOk()
+            ->assertJsonCount(1, 'notifications')
+            ->assertJsonPath('next_cursor', null);
+
+        // New deliveries adjust the cached counter instead of clearing it
+        $this->deliver($user, 1);
+        $this->getJson('/api/notifications/unread-count')->assertJsonPath('unread_count', 4);
+
+        $id = Notification::where('user_id', $user->id)->value('id');
+        $this->postJson("/api/notifications/{$id}/read")->assertOk();
+        $this->postJson("/api/notifications/{$id}/read")->assertOk();
+        $this->getJson('/api/notifications/unread-count')->assertJsonPath('unread_count', 3);
+
+        $this->deleteJson("/api/notifications/{$id}")->assertOk();
+        $this->getJson('/api/notifications/unread-count')->assertJsonPath('unread_count', 3);
+
+        $this->postJson('/api/notifications/mark-all-read')->assertOk();
+        $this->getJson('/api/notifications/unread-count')->assertJsonPath('unread_count', 0);
+    }
+
+    public function test_poll_returns_only_notifications_after_the_cursor(): void
+    {
+        $user = User::factory()->create();
+        $this->deliver($user, 2);
+        $lastId = Notification::where('user_id', $user->id)->max('id');
+
+        Sanctum::actingAs($user);
+
+        $this->getJson("/api/notifications/poll?after={$lastId}&timeout=0")
+            ->assertOk()
+            ->assertJsonCount(0, 'notifications')
+            ->assertJsonPath('timed_out', true)
+            ->assertJsonPath('last_id', $lastId);
+
+        $this->deliver($user, 1);
+
+        $this->getJson("/api/notifications/poll?after={$lastId}&timeout=5")
+            ->assertOk()
+            ->assertJsonCount(1, 'notifications')
+            ->assertJsonPath('timed_out', false)
+            ->assertJsonPath('last_id', $lastId + 1);
+    }
+
+    public function test_worker_requests_batch_notifications_and_leave_nothing_behind(): void
+    {
+        Queue::fake();
+        $user = User::factory()->create();
+
+        // Octane workers run on the CLI SAPI; its request events switch batching on and off
+        Event::dispatch(RequestReceived::class);
+        NotificationService::queue(['user_id' => $user->id, 'type' => 'general', 'title' => 'A', 'message' => 'a']);
+        NotificationService::queue(['user_id' => $user->id, 'type' => 'general', 'title' => 'B', 'message' => 'b']);
+        Queue::assertNothingPushed();
+
+        Event::dispatch(RequestTerminated::class);
+        Queue::assertPushed(DeliverNotifications::class, 1);
+
+        NotificationService::queue(['user_id' => $user->id, 'type' => 'general', 'title' => 'C', 'message' => 'c']);
+        Queue::assertPushed(DeliverNotifications::class, 2);
+    }
+
+    private function deliver(User $user, int $count): void
+    {
+        $rows = [];
+        for ($i = 0; $i < $count; $i++) {
+            $rows[] = [
+                'user_id' => $user->id,
+                'booking_id' => null,
+                'type' => 'general',
+                'title' => 'Notice '.$i,
+                'message' => 'Something happened',
+                'status' => 'unread',
+                'read_at' => null,
+                'created_at' => now()->toDateTimeString(),
+                'updated_at' => now()->toDateTimeString(),
+            ];
+        }
+
+        (new DeliverNotifications($rows))->handle();
+    }
+}
@@ -0,0 +1,71 @@
+<?php
+
+namespace Tests\Feature;
+
+use App\Jobs\DeliverNotifications;
+use App\Models\Booking;
+use App\Models\Payment;
+use App\Models\RoomNight;
+use App\Models\User;
+use App\Models\UserStat;
+use App\Services\ReportRollupService;
+use Illuminate\Foundation\Testing\RefreshDatabase;
+use Illuminate\Support\Facades\Queue;
+use Laravel\Sanctum\Sanctum;
+use Tests\TestCase;
+
+class PaymentVerificationTest extends TestCase
+{
+    use RefreshDatabase;
+
+    public function test_admin_reviews_a_page_of_proofs_in_one_request(): void
+    {
+        Queue::fake();
+        $guest = User::factory()->create();
+
+        [$first, $second, $rejected] = collect(range(1, 3))->map(function () use ($guest) {
+            $booking = Booking::factory()->upcoming()->unpaid()->create(['user_id' => $guest->id]);
+
+            return Payment::factory()->pendingProof()->create(['booking_id' => $booking->booking_id, 'user_email' => $guest->email]);
+        })->all();
+        $done = Payment::factory()->verified()->create();
+
+        $this->assertSame(3, ReportRollupService::totals()['pending_payments']);
+
+        $admin = User::factory()->create();
+        $admin->forceFill(['usertype' => 'admin'])->save();
+        Sanctum::actingAs($admin);
+
+        $this->postJson('/api/admin/payments/verify-batch', ['items' => [
+            ['payment_id' => $first->id, 'verified' => true],
+            ['payment_id' => $rejected->id, 'verified' => false, 'comment' => 'Proof is unreadable'],
+            ['payment_id' => 999999, 'verified' => true],
+            ['payment_id' => $second->id, 'verified' => true],
+            ['payment_id' => $done->id, 'verified' => false],
+        ]])
+            ->assertOk()
+            ->assertJsonPath('reviewed', 3)
+            ->assertJsonPath('results.0.status', 'verified')
+            ->assertJsonPath('results.1.status', 'rejected')
+            ->assertJsonPath('results.2.message', 'Payment not found')
+            ->assertJsonPath('results.3.success', true)
+            ->assertJsonPath('results.4.success', false)
+            ->assertJsonPath('results.4.status', 'verified');
+
+        $this->assertSame('Proof is unreadable', $rejected->fresh()->verified_comment);
+        $this->assertNotNull($first->fresh()->verified_at);
+        $this->assertSame('verified', $done->fresh()->status);
+
+        $this->assertSame('paid', $first->booking->paid_status);
+        $this->assertSame('paid', $second->booking->paid_status);
+        $this->assertSame('unpaid', $rejected->booking->paid_status);
+        $this->assertSame(0, RoomNight::where('booking_id', $first->booking->id)->where('status', 'held')->count());
+        $this->assertGreaterThan(0, RoomNight::where('booking_id', $rejected->booking->id)->where('status', 'held')->count());
+
+        // Set-based updates moved the derived tables as the model hooks would have
+        $this->assertSame(0, ReportRollupService::totals()['pending_payments']);
+        $this->assertEquals($first->amount + $second->amount, UserStat::find($guest->id)->lifetime_spend);
+
+        Queue::assertPushed(DeliverNotifications::class, 3);
+    }
+}
@@ -0,0 +1,238 @@
+<?php
+
+namespace Tests\Feature;
+
+use App\Models\Booking;
+use App\Models\Notification;
+use App\Models\Payment;
+use App\Models\Review;
+use App\Models\User;
+use App\Services\RoomRatingService;
+use Illuminate\Foundation\Testing\RefreshDatabase;
+use Illuminate\Http\UploadedFile;
+use Illuminate\Support\Facades\DB;
+use Illuminate\Support\Facades\Queue;
+use Illuminate\Support\Facades\Storage;
+use Laravel\Sanctum\Sanctum;
+use Tests\TestCase;
+
+class QueryPlanTest extends TestCase
+{
+    use RefreshDatabase;
+
+    /**
+     * Tables that grow with traffic; a full scan or sort of one of them is a regression
+     */
+    const HOT_TABLES = ['bookings', 'payments', 'notifications', 'reviews', 'room_nights', 'room_claims'];
+
+    /**
+     * API endpoints deliberately left out of the probes => why
+     */
+    const NOT_PROBED = [
+        'GET /api/admin/export/bookings' => 'streams every matching booking in id order; reading the whole table is the point',
+        'GET /api/admin/export/payments' => 'streams every matching payment in id order; reading the whole table is the point',
+        'GET /api/admin/export/users' => 'streams every matching user in id order; its since filter spans users and user_stats, so no single index can serve it',
+    ];
+
+    public function test_api_queries_are_served_by_indexes(): void
+    {
+        if (!in_array(DB::getDriverName(), ['sqlite', 'mysql'])) {
+            $this->markTestSkipped('Query plans are only checked on sqlite and MySQL.');
+        }
+
+        Queue::fake();
+        Storage::fake('public');
+        $this->travelTo('2030-06-01 12:00:00');
+
+        $this->artisan('db:seed-scale', ['--bookings' => 2000, '--years' => 1, '--rooms' => 8, '--seed' => 7, '--until' => '2030-06-30'])
+            ->assertSuccessful();
+
+        $guest = User::find(Booking::whereNotNull('user_id')->groupBy('user_id')->orderByRaw('COUNT(*) DESC')->value('user_id'));
+        $booking = Booking::where('user_id', $guest->id)->first();
+        $payment = Payment::first();
+        $room = DB::table('rooms')->first();
+
+        $admin = User::factory()->create();
+        $admin->forceFill(['usertype' => 'admin'])->save();
+
+        $reviewed = Booking::factory()->create(['user_id' => $guest->id]);
+        $unreviewed = Booking::factory()->create(['user_id' => $guest->id]);
+        $review = Review::factory()->create(['user_id' => $guest->id, 'room_id' => $room->id, 'booking_id' => $reviewed->id, 'verified_booking' => true]);
+        RoomRatingService::reviewAdded($review);
+        [$read, $deleted] = Notification::factory()->unread()->count(2)->create(['user_id' => $guest->id]);
+        [$proof, $batched] = Payment::factory()->pendingProof()->count(2)->create();
+
+        // Request => whether it may sort the rows of a stay-date range, which no index can return in page order,
+        // or [that flag, request body]; a string body is sent as NDJSON
+        $problems = array_merge($this->planProblems($guest, [
+            'POST /api/booking' => [false, $this->stay($guest, 'BK-PLAN-1', '2031-03-01', '2031-03-04', $room->room_type)],
+            'POST /api/checkout' => [false, $this->stay($guest, 'BK-PLAN-2', '2031-04-01', '2031-04-03', $room->room_type) + [
+                'paymentMethod' => 'credit_card',
+                'cardholderName' => 'Plan Guest',
+                'cardLastFour' => '4242',
+                'billingAddress' => '1 Main St',
+                'city' => 'Bandung',
+                'zipCode' => '40111',
+                'country' => 'Indonesia',
+            ]],
+            'POST /api/booking/BK-PLAN-1/cancel' => [false, ['booking_id' => 'BK-PLAN-1']],
+            'POST /api/payments/create' => [false, [
+                'booking_id' => 'BK-PLAN-2',
+                'payment_method' => 'credit_card',
+                'cardholder_name' => 'Plan Guest',
+                'card_last_four' => '4242',
+                'amount' => 100,
+                'status' => 'completed',
+                'billing_address' => '1 Main St',
+                'city' => 'Bandung',
+                'zip_code' => '40111',
+                'country' => 'Indonesia',
+                'user_email' => $guest->email,
+            ]],
+            'POST /api/payments/upload-proof' => [false, [
+                'booking_id' => $booking->booking_id,
+                'proof' => UploadedFile::fake()->image('transfer.png', 400, 300),
+            ]],
+            'POST /api/reviews' => [false, ['booking_id' => $unreviewed->id, 'room_id' => $room->id, 'rating' => 4, 'comment' => 'Quiet room']],
+            "PUT /api/reviews/{$review->id}" => [false, ['rating' => 5, 'comment' => 'Even better the second time']],
+            "DELETE /api/reviews/{$review->id}" => false,
+            'POST /api/booking/check-availability' => [false, ['room_type' => $room->room_type, 'check_in' => '2030-06-10', 'check_out' => '2030-06-14']],
+            "GET /api/rooms/{$room->id}/availability-calendar?year=2030&month=6&months=2" => false,
+            'GET /api/my_bookings' => false,
+            'GET /api/my_bookings?from=2030-01-01&to=2030-03-31' => false,
+            'GET /api/user/overview?fields=booking_id,status,payment_status' => false,
+            'GET /api/user/bookings-summary' => false,
+            "GET /api/booking/{$booking->booking_id}" => false,
+            "GET /api/my_payments?email=" . urlencode($guest->email) => false,
+            "GET /api/payments/{$payment->transaction_id}" => false,
+            'GET /api/notifications' => false,
+            'GET /api/notifications/unread-count' => false,
+            'GET /api/notifications/poll?after=0&timeout=0' => false,
+            "POST /api/notifications/{$read->id}/read" => false,
+            "DELETE /api/notifications/{$deleted->id}" => false,
+            'POST /api/notifications/mark-all-read' => false,
+            "GET /api/rooms/{$room->id}/reviews" => false,
+        ]), $this->planProblems($admin, [
+            'GET /api/admin/dashboard' => false,
+            'GET /api/admin/rooms' => false,
+            'GET /api/admin/bookings' => false,
+            'GET /api/admin/bookings?status=confirmed' => false,
+            'GET /api/admin/bookings?paid_status=unpaid' => false,
+            'GET /api/admin/bookings?status=confirmed&paid_status=paid' => false,
+            'GET /api/admin/bookings?from=2030-05-01&to=2030-05-31' => true,
+            'GET /api/admin/payments/pending' => false,
+            "POST /api/payments/{$proof->id}/verify" => [false, ['payment_id' => $proof->id, 'verified' => true]],
+            'POST /api/admin/payments/verify-batch' => [false, ['items' => [['payment_id' => $batched->id, 'verified' => false, 'comment' => 'Amount does not match']]]],
+            'POST /api/admin/bookings/import' => [false, json_encode($this->stay($guest, 'BK-PLAN-3', '2031-05-01', '2031-05-03', $room->room_type)) . "\n"],
+            'GET /api/admin/reports?period=weekly' => false,
+            'GET /api/admin/users' => true,
+            'GET /api/admin/users?sort=total_spent&min_bookings=1' => true,
+            'POST /api/admin/notifications/arrivals?date=2030-06-02&title=Welcome&message=See+you+soon' => true,
+        ]));
+
+        $this->assertSame([], $problems, "Queries that scan or sort a large table:\n" . implode("\n", $problems));
+    }
+
+    /**
+     * Send each request as $user and explain every query it runs against a hot table
+     */
+    private function planProblems(User $user, array $requests): array
+    {
+        Sanctum::actingAs($user);
+        $problems = [];
+
+        foreach ($requests as $request => $spec) {
+            [$method, $uri] = explode(' ', $request, 2);
+            [$sortsRange, $data] = is_array($spec) ? $spec : [$spec, []];
+
+            [, $queries] = $this->captureQueries(fn () => $this->probe($method, $uri, $data)->assertSuccessful());
+
+            // Reads and updates that touch a hot table
+            foreach ($queries as $query) {
+                if (!preg_match('/^\s*(select|update|delete)\b/i', $query->sql) || !$this->touchesHotTable($query->sql)) {
+                    continue;
+                }
+
+                foreach ($this->explain($query->sql, $query->connection->prepareBindings($query->bindings), $sortsRange) as $problem) {
+                    $problems[] = "{$request}\n    {$query->sql}\n    {$problem}";
+                }
+            }
+        }
+
+        return $problems;
+    }
+
+    /**
+     * JSON request, or an NDJSON upload when the body is a string
+     */
+    private function probe(string $method, string $uri, array|string $data)
+    {
+        if (is_array($data)) {
+            return $this->json($method, $uri, $data);
+        }
+
+        return $this->call($method, $uri, [], [], [], [
+            'CONTENT_TYPE' => 'application/x-ndjson',
+            'HTTP_ACCEPT' => 'application/json',
+        ], $data);
+    }
+
+    /**
+     * Booking request body for a stay of $user
+     */
+    private function stay(User $user, string $bookingId, string $checkIn, string $checkOut, string $roomType): array
+    {
+        return [
+            'bookingId' => $bookingId,
+            'firstName' => 'Plan',
+            'lastName' => 'Guest',
+            'email' => $user->email,
+            'phone' => '0812345678',
+            'roomType' => $roomType,
+            'checkin' => "{$checkIn} 15:00:00",
+            'checkout' => "{$checkOut} 11:00:00",
+            'guests' => 2,
+            'nights' => 1,
+            'rate' => 100,
+            'total' => 100,
+            'userEmail' => $user->email,
+        ];
+    }
+
+    private function touchesHotTable(string $sql): bool
+    {
+        preg_match_all('/\b(?:from|join|update)\s+[`"]?(\w+)[`"]?/i', $sql, $matches);
+
+        return (bool) array_intersect($matches[1], self::HOT_TABLES);
+    }
+
+    /**
+     * Full scans and sorts in a statement's plan
+     */
+    private function explain(string $sql, array $bindings, bool $sortsRange): array
+    {
+        $problems = [];
+
+        if (DB::getDriverName() === 'sqlite') {
+            foreach (DB::select('EXPLAIN QUERY PLAN ' . $sql, $bindings) as $step) {
+                if (preg_match('/^SCAN (?:TABLE )?(\w+)$/', $step->detail, $match) && in_array($match[1], self::HOT_TABLES)) {
+                    $problems[] = $step->detail;
+                } elseif (str_contains($step->detail, 'USE TEMP B-TREE') && !$sortsRange) {
+                    $problems[] = $step->detail;
+                }
+            }
+
+            return $problems;
+        }
+
+        foreach (DB::select('EXPLAIN ' . $sql, $bindings) as $step) {
+            if ($step->type === 'ALL' && in_array($step->table, self::HOT_TABLES)) {
+                $problems[] = "full scan of {$step->table}";
+            } elseif (str_contains((string) $step->Extra, 'filesort') && !$sortsRange) {
+                $problems[] = "filesort on {$step->table}: {$step->Extra}";
+            }
+        }
+
+        return $problems;
+    }
+}
@@ -0,0 +1,92 @@
+<?php
+
+namespace Tests\Feature;
+
+use App\Models\Booking;
+use App\Models\RatePlan;
+use App\Models\Room;
+use App\Models\User;
+use Illuminate\Foundation\Testing\RefreshDatabase;
+use Laravel\Sanctum\Sanctum;
+use Tests\TestCase;
+
+class RatePlanTest extends TestCase
+{
+    use RefreshDatabase;
+
+    public function test_quote_applies_weekday_and_seasonal_plans(): void
+    {
+        $room = $this->createPricedRoom();
+        $stay = ['check_in' => '2030-01-10', 'check_out' => '2030-01-14'];
+
+        // Thu 100 (base), Fri 150 (weekend), Sat and Sun 200 (season beats weekend)
+        $this->getJson("/api/rooms/{$room->id}/quote?".http_build_query($stay))
+            ->assertOk()
+            ->assertJsonPath('data.nights', 4)
+            ->assertJsonPath('data.subtotal', 650.0)
+            ->assertJsonPath('data.taxes', 65.0)
+            ->assertJsonPath('data.total', 715.0)
+            ->assertJsonPath('data.rate', 162.5);
+
+        $admin = User::factory()->create();
+        $admin->forceFill(['usertype' => 'admin'])->save();
+        Sanctum::actingAs($admin);
+
+        $this->postJson('/api/admin/prices', ['updates' => [['room_id' => $room->id, 'price' => 120]]])
+            ->assertOk()
+            ->assertJsonPath('updated', 1);
+
+        // The memoized quote is dropped when the base price changes
+        $this->getJson("/api/rooms/{$room->id}/quote?".http_build_query($stay))
+            ->assertJsonPath('data.total', 737.0);
+
+        $plan = RatePlan::where('name', 'Weekend')->first();
+        $this->postJson('/api/admin/rate-plans', ['plans' => [
+            ['id' => $plan->id, 'room_type' => 'deluxe', 'name' => 'Weekend', 'price' => 130, 'weekdays' => [5, 6]],
+        ]])->assertOk();
+
+        $this->getJson("/api/rooms/{$room->id}/quote?".http_build_query($stay))
+            ->assertJsonPath('data.subtotal', 650.0);
+    }
+
+    public function test_bookings_are_priced_on_the_server(): void
+    {
+        $this->createPricedRoom();
+
+        $this->postJson('/api/booking', [
+            'bookingId' => 'BK-PRICED',
+            'firstName' => 'Test',
+            'lastName' => 'Guest',
+            'email' => 'guest@example.com',
+            'phone' => '0812345678',
+            'roomType' => 'deluxe',
+            'checkin' => '2030-01-10 15:00:00',
+            'checkout' => '2030-01-14 11:00:00',
+            'guests' => 2,
+            'nights' => 1,
+            'rate' => 1,
+            'total' => 1,
+        ])->assertCreated();
+
+        $booking = Booking::where('booking_id', 'BK-PRICED')->first();
+        $this->assertSame(4, $booking->nights);
+        $this->assertSame('715.00', $booking->total);
+    }
+
+    private function createPricedRoom(): Room
+    {
+        $room = Room::create(['room_title' => 'Deluxe Room', 'room_type' => 'deluxe', 'price' => 100]);
+
+        RatePlan::create(['room_type' => 'deluxe', 'name' => 'Weekend', 'price' => 150, 'weekdays' => '5,6']);
+        RatePlan::create([
+            'room_id' => $room->id,
+            'name' => 'Holiday season',
+            'price' => 200,
+            'starts_on' => '2030-01-12',
+            'ends_on' => '2030-01-13',
+            'priority' => 1,
+        ]);
+
+        return $room;
+    }
+}
@@ -0,0 +1,103 @@
+<?php
+
+namespace Tests\Feature;
+
+use App\Models\Booking;
+use App\Models\DailyRollup;
+use App\Models\User;
+use Illuminate\Foundation\Testing\RefreshDatabase;
+use Laravel\Sanctum\Sanctum;
+use Tests\TestCase;
+
+class ReportRollupTest extends TestCase
+{
+    use RefreshDatabase;
+
+    public function test_report_periods_bucket_the_daily_rollups(): void
+    {
+        $this->travelTo('2030-06-12 10:00:00');
+
+        $this->bookedOn('2030-06-12', 100);
+        $this->bookedOn('2030-06-10', 200);
+        $this->bookedOn('2030-06-09', 50);
+        $this->bookedOn('2030-05-20', 300);
+        $this->bookedOn('2029-12-31', 400);
+
+        $admin = User::factory()->create();
+        $admin->forceFill(['usertype' => 'admin'])->save();
+        Sanctum::actingAs($admin);
+
+        $expected = [
+            // The last 30 days only
+            'daily' => [
+                ['date' => '2030-06-12', 'count' => 1, 'revenue' => 100.0],
+                ['date' => '2030-06-10', 'count' => 1, 'revenue' => 200.0],
+                ['date' => '2030-06-09', 'count' => 1, 'revenue' => 50.0],
+                ['date' => '2030-05-20', 'count' => 1, 'revenue' => 300.0],
+            ],
+            // Weeks start on Monday; Sunday the 9th falls in the week before
+            'weekly' => [
+                ['date' => '2030-06-10', 'count' => 2, 'revenue' => 300.0],
+                ['date' => '2030-06-03', 'count' => 1, 'revenue' => 50.0],
+                ['date' => '2030-05-20', 'count' => 1, 'revenue' => 300.0],
+                ['date' => '2029-12-31', 'count' => 1, 'revenue' => 400.0],
+            ],
+            'monthly' => [
+                ['date' => '2030-06-01', 'count' => 3, 'revenue' => 350.0],
+                ['date' => '2030-05-01', 'count' => 1, 'revenue' => 300.0],
+                ['date' => '2029-12-01', 'count' => 1, 'revenue' => 400.0],
+            ],
+            'yearly' => [
+                ['date' => '2030-01-01', 'count' => 4, 'revenue' => 650.0],
+                ['date' => '2029-01-01', 'count' => 1, 'revenue' => 400.0],
+            ],
+        ];
+
+        foreach ($expected as $period => $series) {
+            $this->getJson("/api/admin/reports?period={$period}")
+                ->assertOk()
+                ->assertJsonPath('data.period', $period)
+                ->assertJsonPath('data.booking_stats', $series)
+                ->assertJsonPath('data.total_bookings', 5);
+        }
+    }
+
+    public function test_rebuild_only_rewrites_the_requested_days(): void
+    {
+        $this->travelTo('2030-06-12 10:00:00');
+
+        $this->bookedOn('2030-06-04', 100);
+        $this->bookedOn('2030-06-05', 120);
+        $this->bookedOn('2030-06-05', 80);
+        $this->bookedOn('2030-06-06', 150);
+        $this->bookedOn('2030-06-07', 90);
+
+        // Drift every day, then repair the middle two
+        DailyRollup::query()->update(['records' => 0, 'amount' => 0]);
+
+        $this->artisan('rollups:rebuild', ['--from' => '2030-06-05', '--to' => '2030-06-06'])
+            ->expectsOutputToContain('Report rollups rebuilt: 2 row(s) written.')
+            ->assertSuccessful();
+
+        $rollups = DailyRollup::where('metric', 'booking')->get()->keyBy(fn ($row) => substr($row->day, 0, 10));
+
+        $this->assertEquals(2, $rollups['2030-06-05']->records);
+        $this->assertEquals(200, $rollups['2030-06-05']->amount);
+        $this->assertEquals(1, $rollups['2030-06-06']->records);
+        $this->assertEquals(150, $rollups['2030-06-06']->amount);
+
+        // Days outside the range keep whatever they held
+        $this->assertEquals(0, $rollups['2030-06-04']->records);
+        $this->assertEquals(0, $rollups['2030-06-07']->records);
+    }
+
+    private function bookedOn(string $day, float $total): Booking
+    {
+        return Booking::factory()->create([
+            'room_type' => 'deluxe',
+            'status' => 'confirmed',
+            'total' => $total,
+            'created_at' => $day . ' 09:00:00',
+        ]);
+    }
+}
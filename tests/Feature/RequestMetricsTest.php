@@ -0,0 +1,112 @@
+<?php
+
+namespace Tests\Feature;
+
+use App\Models\Room;
+use App\Models\User;
+use App\Services\RequestMetricsService;
+use Illuminate\Support\Facades\Cache;
+use Illuminate\Foundation\Testing\RefreshDatabase;
+use Laravel\Sanctum\Sanctum;
+use PHPUnit\Framework\ExpectationFailedException;
+use Tests\TestCase;
+
+class RequestMetricsTest extends TestCase
+{
+    use RefreshDatabase;
+
+    public function test_list_endpoints_stay_within_their_query_budgets(): void
+    {
+        foreach (range(1, 12) as $i) {
+            Room::create(['room_title' => "Room {$i}", 'room_type' => $i % 2 ? 'deluxe' : 'standard', 'price' => 100 + $i]);
+        }
+        User::factory()->count(10)->create();
+
+        $admin = User::factory()->create();
+        $admin->forceFill(['usertype' => 'admin'])->save();
+        Sanctum::actingAs($admin);
+
+        $this->assertQueryBudget(2, fn () => $this->getJson('/api/rooms'))
+            ->assertOk()
+            ->assertHeader('X-Query-Count', '2');
+
+        $this->assertQueryBudget(3, fn () => $this->getJson('/api/admin/rooms'))
+            ->assertOk()
+            ->assertJsonCount(12, 'data');
+
+        $this->assertQueryBudget(2, fn () => $this->getJson('/api/admin/users'))
+            ->assertOk();
+    }
+
+    public function test_query_budget_fails_when_exceeded(): void
+    {
+        Room::create(['room_title' => 'Deluxe Room', 'room_type' => 'deluxe', 'price' => 149]);
+
+        try {
+            $this->assertQueryBudget(1, fn () => $this->getJson('/api/rooms'));
+        } catch (ExpectationFailedException $e) {
+            $this->assertStringContainsString('Query budget of 1 exceeded with 2 queries', $e->getMessage());
+            return;
+        }
+
+        $this->fail('The query budget was not enforced.');
+    }
+
+    public function test_metrics_endpoint_aggregates_per_route(): void
+    {
+        Room::create(['room_title' => 'Deluxe Room', 'room_type' => 'deluxe', 'price' => 149]);
+
+        $this->getJson('/api/rooms')->assertHeader('X-Response-Time-Ms');
+        $this->getJson('/api/rooms');
+
+        $admin = User::factory()->create();
+        $admin->forceFill(['usertype' => 'admin'])->save();
+        Sanctum::actingAs($admin);
+
+        $routes = collect($this->getJson('/api/admin/metrics')->assertOk()->json('data.routes'))->keyBy('route');
+
+        $rooms = $routes['GET /api/rooms'];
+        $this->assertSame(2, $rooms['requests']);
+        $this->assertSame(2, $rooms['max_queries']);
+        $this->assertSame(2, array_sum($rooms['histograms']['queries']));
+        $this->assertStringContainsString('rooms', $rooms['slowest_query']['sql']);
+    }
+
+    public function test_recording_does_not_wait_on_other_requests(): void
+    {
+        $metrics = ['queries' => 3, 'db_ms' => 1.5, 'slowest_ms' => 1.0, 'slowest_sql' => 'select 1', 'wall_ms' => 12.25, 'peak_memory_mb' => 8.0];
+        RequestMetricsService::aggregate('GET /api/rooms', $metrics);
+
+        // A held lock (another request registering a new route) does not block or drop known routes
+        $lock = Cache::lock(RequestMetricsService::ROUTES_KEY . ':lock', 5);
+        $lock->get();
+        RequestMetricsService::aggregate('GET /api/rooms', ['queries' => 7, 'slowest_sql' => 'select 2', 'slowest_ms' => 4.0] + $metrics);
+        $lock->release();
+
+        $rooms = collect(RequestMetricsService::summary(5))->keyBy('route')['GET /api/rooms'];
+        $this->assertSame(2, $rooms['requests']);
+        $this->assertSame(24.5, $rooms['total_wall_ms']);
+        $this->assertSame(5.0, $rooms['avg_queries']);
+        $this->assertSame(7, $rooms['max_queries']);
+        $this->assertSame('select 2', $rooms['slowest_query']['sql']);
+    }
+
+    public function test_metrics_are_not_recorded_on_a_store_without_atomic_increments(): void
+    {
+        config(['cache.metrics_store' => 'file']);
+        Room::create(['room_title' => 'Deluxe Room', 'room_type' => 'deluxe', 'price' => 149]);
+
+        // Headers are still sent; only the shared aggregation is skipped
+        $this->getJson('/api/rooms')->assertHeader('X-Query-Count', '2');
+
+        $admin = User::factory()->create();
+        $admin->forceFill(['usertype' => 'admin'])->save();
+        Sanctum::actingAs($admin);
+
+        $this->getJson('/api/admin/metrics')
+            ->assertOk()
+            ->assertJsonPath('data.recording', false)
+            ->assertJsonPath('data.routes', []);
+        $this->assertNull(Cache::store('file')->get(RequestMetricsService::ROUTES_KEY));
+    }
+}
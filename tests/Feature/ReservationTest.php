@@ -0,0 +1,114 @@
+<?php
+
+namespace Tests\Feature;
+
+use App\Models\Booking;
+use App\Models\RoomClaim;
+use App\Services\ReservationService;
+use Illuminate\Database\UniqueConstraintViolationException;
+use Illuminate\Foundation\Testing\RefreshDatabase;
+use Illuminate\Support\Facades\DB;
+use Tests\TestCase;
+
+class ReservationTest extends TestCase
+{
+    use RefreshDatabase;
+
+    public function test_overlapping_stays_cannot_both_be_reserved(): void
+    {
+        $this->postJson('/api/booking', $this->payload('BK-A', '2030-05-01', '2030-05-04'))->assertCreated();
+
+        $this->postJson('/api/booking', $this->payload('BK-B', '2030-05-03', '2030-05-05'))
+            ->assertStatus(409)
+            ->assertJsonPath('message', 'Room is not available for the selected dates');
+
+        // Other room types and adjacent stays are unaffected
+        $this->postJson('/api/booking', $this->payload('BK-C', '2030-05-03', '2030-05-05', 'luxury'))->assertCreated();
+        $this->postJson('/api/booking', $this->payload('BK-D', '2030-05-04', '2030-05-06'))->assertCreated();
+
+        $this->assertSame(0, Booking::where('booking_id', 'BK-B')->count());
+
+        // Cancelling gives the nights back
+        Booking::where('booking_id', 'BK-A')->first()->update(['status' => 'cancelled', 'cancelled_at' => now()]);
+        $this->postJson('/api/booking', $this->payload('BK-B', '2030-05-02', '2030-05-04'))->assertCreated();
+    }
+
+    public function test_claims_are_enforced_by_the_database(): void
+    {
+        // Two bookings that both passed the availability check before either committed
+        [$first, $second] = Booking::factory()
+            ->count(2)
+            ->sequence(['booking_id' => 'BK-1'], ['booking_id' => 'BK-2'])
+            ->create(['room_type' => 'deluxe', 'check_in' => '2030-05-01 15:00:00', 'check_out' => '2030-05-03 11:00:00', 'nights' => 2, 'status' => 'confirmed']);
+
+        ReservationService::claim($first);
+
+        $this->expectException(UniqueConstraintViolationException::class);
+
+        try {
+            ReservationService::claim($second);
+        } finally {
+            $this->assertSame([$first->id], RoomClaim::distinct()->pluck('booking_id')->all());
+        }
+    }
+
+    public function test_edited_stays_re_claim_their_nights(): void
+    {
+        $this->postJson('/api/booking', $this->payload('BK-A', '2030-05-01', '2030-05-03'))->assertCreated();
+        $this->postJson('/api/booking', $this->payload('BK-B', '2030-05-05', '2030-05-07'))->assertCreated();
+
+        $booking = Booking::where('booking_id', 'BK-A')->first();
+        $booking->update(['check_in' => '2030-05-02 15:00:00', 'check_out' => '2030-05-04 11:00:00']);
+
+        $this->assertSame(['2030-05-02', '2030-05-03'], RoomClaim::where('booking_id', $booking->id)->orderBy('night')->get()->map(fn ($claim) => $claim->night->toDateString())->all());
+        $this->postJson('/api/booking', $this->payload('BK-C', '2030-05-01', '2030-05-02'))->assertCreated();
+
+        // Moving onto nights another booking claimed fails and leaves the booking as it was
+        $this->expectException(UniqueConstraintViolationException::class);
+
+        try {
+            DB::transaction(fn () => $booking->update(['check_in' => '2030-05-04 15:00:00', 'check_out' => '2030-05-06 11:00:00']));
+        } finally {
+            $this->assertSame('2030-05-02', $booking->fresh()->check_in->toDateString());
+            $this->assertSame(2, RoomClaim::where('booking_id', $booking->id)->count());
+        }
+    }
+
+    public function test_idempotency_key_replays_the_first_response(): void
+    {
+        $payload = $this->payload('BK-RETRY', '2030-06-01', '2030-06-03');
+
+        $first = $this->postJson('/api/booking', $payload, ['Idempotency-Key' => 'retry-1'])->assertCreated();
+
+        $this->postJson('/api/booking', $payload, ['Idempotency-Key' => 'retry-1'])
+            ->assertCreated()
+            ->assertHeader('Idempotent-Replayed', 'true')
+            ->assertJsonPath('booking.id', $first->json('booking.id'));
+
+        $this->postJson('/api/booking', $this->payload('BK-OTHER', '2030-07-01', '2030-07-03'), ['Idempotency-Key' => 'retry-1'])
+            ->assertStatus(422);
+
+        // Without a key, a reused booking id is a conflict rather than a server error
+        $this->postJson('/api/booking', $this->payload('BK-RETRY', '2030-08-01', '2030-08-03'))->assertStatus(409);
+
+        $this->assertSame(1, Booking::count());
+    }
+
+    private function payload(string $bookingId, string $checkIn, string $checkOut, string $roomType = 'deluxe'): array
+    {
+        return [
+            'bookingId' => $bookingId,
+            'firstName' => 'Test',
+            'lastName' => 'Guest',
+            'email' => 'guest@example.com',
+            'phone' => '0812345678',
+            'roomType' => $roomType,
+            'checkin' => $checkIn.' 15:00:00',
+            'checkout' => $checkOut.' 11:00:00',
+            'guests' => 2,
+            'nights' => 1,
+            'rate' => 149,
+            'total' => 149,
+        ];
+    }
+}
@@ -0,0 +1,108 @@
+<?php
+
+namespace Tests\Feature;
+
+use App\Models\Booking;
+use App\Models\Room;
+use App\Models\User;
+use App\Services\ResponseCacheService;
+use Illuminate\Foundation\Testing\RefreshDatabase;
+use Laravel\Sanctum\Sanctum;
+use Tests\TestCase;
+
+class ResponseCacheTest extends TestCase
+{
+    use RefreshDatabase;
+
+    public function test_room_listing_is_cached_with_etag_revalidation(): void
+    {
+        Room::create(['room_title' => 'Deluxe Room', 'room_type' => 'deluxe', 'price' => 149]);
+
+        $first = $this->getJson('/api/rooms?min_price=1&max_price=500')
+            ->assertOk()
+            ->assertHeader('X-Cache', 'MISS');
+        $etag = $first->headers->get('ETag');
+        $this->assertNotNull($etag);
+
+        // Same parameters in a different order hit the same entry
+        $this->getJson('/api/rooms?max_price=500&min_price=1')
+            ->assertOk()
+            ->assertHeader('X-Cache', 'HIT')
+            ->assertHeader('ETag', $etag);
+
+        $this->getJson('/api/rooms?min_price=1&max_price=500', ['If-None-Match' => $etag])
+            ->assertStatus(304);
+
+        Room::create(['room_title' => 'Standard Room', 'room_type' => 'standard', 'price' => 99]);
+
+        $this->getJson('/api/rooms?min_price=1&max_price=500')
+            ->assertHeader('X-Cache', 'MISS')
+            ->assertJsonCount(2, 'data');
+    }
+
+    public function test_review_writes_invalidate_the_room(): void
+    {
+        $user = User::factory()->create();
+        $room = Room::create(['room_title' => 'Deluxe Room', 'room_type' => 'deluxe', 'price' => 149]);
+        $booking = Booking::create([
+            'user_id' => $user->id,
+            'booking_id' => 'BK-REVIEW',
+            'first_name' => 'Test',
+            'last_name' => 'Guest',
+            'email' => $user->email,
+            'phone' => '0812345678',
+            'room_type' => 'deluxe',
+            'check_in' => '2030-01-10 15:00:00',
+            'check_out' => '2030-01-12 11:00:00',
+            'guests' => 2,
+            'nights' => 2,
+            'rate' => 149,
+            'total' => 298,
+        ]);
+
+        $this->getJson("/api/rooms/{$room->id}")->assertJsonPath('data.review_count', 0);
+        $this->getJson("/api/rooms/{$room->id}")->assertHeader('X-Cache', 'HIT');
+        $this->getJson("/api/rooms/{$room->id}/reviews")->assertJsonCount(0, 'data');
+
+        Sanctum::actingAs($user);
+        $this->postJson('/api/reviews', ['booking_id' => $booking->id, 'room_id' => $room->id, 'rating' => 4])
+            ->assertCreated();
+
+        $this->getJson("/api/rooms/{$room->id}")
+            ->assertHeader('X-Cache', 'MISS')
+            ->assertJsonPath('data.review_count', 1);
+        $this->getJson("/api/rooms/{$room->id}/reviews")->assertJsonCount(1, 'data');
+
+        $admin = User::factory()->create();
+        $admin->forceFill(['usertype' => 'admin'])->save();
+        Sanctum::actingAs($admin);
+
+        $this->getJson('/api/admin/cache-stats')
+            ->assertOk()
+            ->assertJsonPath('data.room.hits', 1)
+            ->assertJsonPath('data.room.misses', 2);
+    }
+
+    public function test_long_lived_workers_write_stats_in_batches(): void
+    {
+        Room::create(['room_title' => 'Deluxe Room', 'room_type' => 'deluxe', 'price' => 149]);
+        ResponseCacheService::longLived(true);
+
+        try {
+            $this->getJson('/api/rooms')->assertHeader('X-Cache', 'MISS');
+            $this->getJson('/api/rooms')->assertHeader('X-Cache', 'HIT');
+            $this->getJson('/api/rooms')->assertHeader('X-Cache', 'HIT');
+
+            // Nothing is written until the oldest buffered count is old enough
+            $this->assertSame(['hits' => 0, 'misses' => 0, 'hit_rate' => null], ResponseCacheService::stats(['rooms'])['rooms']);
+
+            $this->travel(ResponseCacheService::STATS_FLUSH_SECONDS)->seconds();
+            $this->getJson('/api/rooms')->assertHeader('X-Cache', 'HIT');
+
+            $this->assertSame(['hits' => 3, 'misses' => 1, 'hit_rate' => 0.75], ResponseCacheService::stats(['rooms'])['rooms']);
+        } finally {
+            ResponseCacheService::flushStats(true);
+            ResponseCacheService::longLived(false);
+        }
+    }
+}
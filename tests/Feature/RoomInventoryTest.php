@@ -0,0 +1,89 @@
+<?php
+
+namespace Tests\Feature;
+
+use App\Models\Booking;
+use App\Models\Room;
+use App\Models\RoomClaim;
+use App\Models\RoomNight;
+use App\Services\RoomInventoryService;
+use Illuminate\Foundation\Testing\RefreshDatabase;
+use Illuminate\Support\Str;
+use Tests\TestCase;
+
+class RoomInventoryTest extends TestCase
+{
+    use RefreshDatabase;
+
+    public function test_booking_writes_keep_room_nights_in_step(): void
+    {
+        $booking = $this->createBooking('2030-01-10 15:00:00', '2030-01-13 11:00:00');
+
+        $this->assertSame(3, RoomNight::where('booking_id', $booking->id)->where('status', 'held')->count());
+        $this->assertTrue(RoomInventoryService::isAvailable('deluxe', '2030-01-11', '2030-01-12'));
+
+        $booking->update(['paid_status' => 'paid']);
+
+        $this->assertSame(3, RoomNight::where('booking_id', $booking->id)->where('status', 'booked')->count());
+        $this->assertFalse(RoomInventoryService::isAvailable('deluxe', '2030-01-11', '2030-01-12'));
+        $this->assertTrue(RoomInventoryService::isAvailable('deluxe', '2030-01-13', '2030-01-15'));
+        $this->assertTrue(RoomInventoryService::isAvailable('luxury', '2030-01-11', '2030-01-12'));
+
+        $booking->update(['status' => 'cancelled', 'refund_amount' => 50, 'cancelled_at' => now()]);
+
+        $this->assertSame(0, RoomNight::count());
+        $this->assertTrue(RoomInventoryService::isAvailable('deluxe', '2030-01-11', '2030-01-12'));
+    }
+
+    public function test_rebuild_backfills_from_existing_bookings(): void
+    {
+        $this->createBooking('2030-02-01 15:00:00', '2030-02-03 11:00:00', ['paid_status' => 'paid']);
+        $this->createBooking('2030-02-05 15:00:00', '2030-02-06 11:00:00', ['status' => 'cancelled']);
+
+        RoomNight::query()->delete();
+
+        $this->assertSame(['nights' => 2, 'claims' => 2], RoomInventoryService::rebuild());
+        $this->assertSame(2, RoomClaim::count());
+        $this->assertFalse(RoomInventoryService::isAvailable('deluxe', '2030-02-02', '2030-02-04'));
+        $this->assertTrue(RoomInventoryService::isAvailable('deluxe', '2030-02-05', '2030-02-06'));
+    }
+
+    public function test_calendar_returns_month_bitmaps_and_evicts_on_change(): void
+    {
+        $room = Room::create(['room_title' => 'Deluxe Room', 'room_type' => 'deluxe', 'price' => 149]);
+        $booking = $this->createBooking('2030-03-30 15:00:00', '2030-04-02 11:00:00', ['paid_status' => 'paid']);
+
+        $response = $this->getJson("/api/rooms/{$room->id}/availability-calendar?year=2030&month=3&months=2");
+
+        $response->assertOk()
+            ->assertJsonPath('months.0.bitmap', (1 << 29) | (1 << 30))
+            ->assertJsonPath('months.1.bitmap', 1)
+            ->assertJsonPath('booked_dates', ['2030-03-30', '2030-03-31', '2030-04-01']);
+
+        $booking->update(['status' => 'cancelled', 'refund_amount' => 100, 'cancelled_at' => now()]);
+
+        $this->getJson("/api/rooms/{$room->id}/availability-calendar?year=2030&month=4")
+            ->assertOk()
+            ->assertJsonPath('months.0.bitmap', 0)
+            ->assertJsonPath('booked_dates', []);
+    }
+
+    private function createBooking(string $checkIn, string $checkOut, array $overrides = []): Booking
+    {
+        return Booking::create(array_merge([
+            'booking_id' => 'BK'.Str::random(10),
+            'first_name' => 'Test',
+            'last_name' => 'Guest',
+            'email' => 'guest@example.com',
+            'phone' => '0812345678',
+            'room_type' => 'deluxe',
+            'check_in' => $checkIn,
+            'check_out' => $checkOut,
+            'guests' => 2,
+            'nights' => 1,
+            'rate' => 149,
+            'total' => 149,
+            'status' => 'confirmed',
+        ], $overrides));
+    }
+}
@@ -0,0 +1,85 @@
+<?php
+
+namespace Tests\Feature;
+
+use App\Models\Booking;
+use App\Models\Review;
+use App\Models\Room;
+use App\Models\User;
+use App\Services\RoomRatingService;
+use Illuminate\Foundation\Testing\RefreshDatabase;
+use Illuminate\Support\Str;
+use Laravel\Sanctum\Sanctum;
+use Tests\TestCase;
+
+class RoomRatingTest extends TestCase
+{
+    use RefreshDatabase;
+
+    public function test_review_writes_update_stored_room_aggregates(): void
+    {
+        $user = User::factory()->create();
+        $room = Room::create(['room_title' => 'Deluxe Room', 'room_type' => 'deluxe', 'price' => 149]);
+        $first = $this->createBooking($user);
+        $second = $this->createBooking($user);
+
+        Sanctum::actingAs($user);
+
+        $this->postJson('/api/reviews', ['booking_id' => $first->id, 'room_id' => $room->id, 'rating' => 5])
+            ->assertCreated();
+        $review = Review::find($this->postJson('/api/reviews', ['booking_id' => $second->id, 'room_id' => $room->id, 'rating' => 2])
+            ->assertCreated()
+            ->json('data.id'));
+
+        $this->getJson("/api/rooms/{$room->id}")
+            ->assertOk()
+            ->assertJsonPath('data.rating', 3.5)
+            ->assertJsonPath('data.review_count', 2)
+            ->assertJsonPath('data.rating_histogram', ['1' => 0, '2' => 1, '3' => 0, '4' => 0, '5' => 1]);
+
+        $this->putJson("/api/reviews/{$review->id}", ['rating' => 4])->assertOk();
+        $this->assertSame([1 => 0, 2 => 0, 3 => 0, 4 => 1, 5 => 1], $room->fresh()->ratingHistogram());
+        $this->assertSame(4.5, $room->fresh()->averageRating());
+
+        $this->deleteJson("/api/reviews/{$review->id}")->assertOk();
+        $this->assertSame(1, $room->fresh()->review_count);
+        $this->assertSame(5.0, $room->fresh()->averageRating());
+    }
+
+    public function test_reconcile_fixes_drifted_aggregates(): void
+    {
+        $user = User::factory()->create();
+        $room = Room::create(['room_title' => 'Deluxe Room', 'room_type' => 'deluxe', 'price' => 149]);
+
+        Review::create(['user_id' => $user->id, 'room_id' => $room->id, 'rating' => 3]);
+        Review::create(['user_id' => $user->id, 'room_id' => $room->id, 'rating' => 4]);
+
+        $this->assertSame(1, RoomRatingService::reconcile());
+        $this->assertSame(0, RoomRatingService::reconcile());
+
+        $room->refresh();
+        $this->assertSame(2, $room->review_count);
+        $this->assertSame(3.5, $room->averageRating());
+        $this->assertSame([1 => 0, 2 => 0, 3 => 1, 4 => 1, 5 => 0], $room->ratingHistogram());
+    }
+
+    private function createBooking(User $user): Booking
+    {
+        return Booking::create([
+            'user_id' => $user->id,
+            'booking_id' => 'BK'.Str::random(10),
+            'first_name' => 'Test',
+            'last_name' => 'Guest',
+            'email' => $user->email,
+            'phone' => '0812345678',
+            'room_type' => 'deluxe',
+            'check_in' => '2030-01-10 15:00:00',
+            'check_out' => '2030-01-12 11:00:00',
+            'guests' => 2,
+            'nights' => 2,
+            'rate' => 149,
+            'total' => 298,
+            'status' => 'completed',
+        ]);
+    }
+}
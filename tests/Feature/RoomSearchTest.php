@@ -0,0 +1,60 @@
+<?php
+
+namespace Tests\Feature;
+
+use App\Models\Room;
+use App\Models\RoomAmenity;
+use Illuminate\Foundation\Testing\RefreshDatabase;
+use Tests\TestCase;
+
+class RoomSearchTest extends TestCase
+{
+    use RefreshDatabase;
+
+    public function test_amenity_index_follows_room_writes(): void
+    {
+        $room = Room::create(['room_title' => 'Deluxe', 'room_type' => 'deluxe', 'price' => 150, 'amenities' => ['WiFi', ' Pool ', 'WiFi']]);
+
+        $this->assertEqualsCanonicalizing(['WiFi', 'Pool'], RoomAmenity::where('room_id', $room->id)->pluck('amenity')->all());
+
+        $room->update(['amenities' => ['Spa']]);
+        $this->assertSame(['Spa'], RoomAmenity::where('room_id', $room->id)->pluck('amenity')->all());
+
+        RoomAmenity::query()->delete();
+        $this->artisan('amenities:rebuild')->assertSuccessful();
+        $this->assertSame(['Spa'], RoomAmenity::where('room_id', $room->id)->pluck('amenity')->all());
+    }
+
+    public function test_search_filters_by_all_amenities_and_returns_facets(): void
+    {
+        Room::create(['room_title' => 'A', 'room_type' => 'deluxe', 'price' => 150, 'amenities' => ['WiFi', 'Pool']]);
+        Room::create(['room_title' => 'B', 'room_type' => 'deluxe', 'price' => 90, 'amenities' => ['WiFi']]);
+        Room::create(['room_title' => 'C', 'room_type' => 'suite', 'price' => 550, 'amenities' => ['WiFi', 'Pool', 'Spa']]);
+        Room::create(['room_title' => 'D', 'room_type' => 'suite', 'price' => 600, 'amenities' => ['Pool'], 'status' => 'maintenance']);
+
+        $response = $this->assertQueryBudget(2, fn () => $this->getJson('/api/rooms?' . http_build_query([
+            'amenities' => ['WiFi', 'Pool'],
+            'room_type' => 'deluxe',
+        ])));
+
+        $response->assertOk()
+            ->assertJsonPath('pagination.total', 1)
+            ->assertJsonPath('data.0.room_title', 'A')
+            // Room type counts ignore the room type filter
+            ->assertJsonPath('facets.room_types', [
+                ['value' => 'deluxe', 'count' => 1],
+                ['value' => 'suite', 'count' => 1],
+            ])
+            ->assertJsonPath('facets.amenities', [
+                ['value' => 'Pool', 'count' => 1],
+                ['value' => 'WiFi', 'count' => 1],
+            ])
+            ->assertJsonPath('facets.price.1', ['min' => 100, 'max' => 200, 'count' => 1]);
+
+        $this->getJson('/api/rooms')
+            ->assertJsonPath('pagination.total', 3)
+            ->assertJsonPath('facets.amenities.0', ['value' => 'WiFi', 'count' => 3])
+            ->assertJsonPath('facets.price.0.count', 1)
+            ->assertJsonPath('facets.price.4', ['min' => 500, 'max' => null, 'count' => 1]);
+    }
+}
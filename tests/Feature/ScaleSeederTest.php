@@ -0,0 +1,69 @@
+<?php
+
+namespace Tests\Feature;
+
+use App\Models\Booking;
+use App\Models\Notification;
+use App\Models\Payment;
+use App\Models\Review;
+use App\Models\Room;
+use App\Models\RoomNight;
+use App\Models\UserStat;
+use Illuminate\Foundation\Testing\RefreshDatabase;
+use Illuminate\Support\Facades\File;
+use Tests\TestCase;
+
+class ScaleSeederTest extends TestCase
+{
+    use RefreshDatabase;
+
+    public function test_factories_produce_consistent_rows(): void
+    {
+        $booking = Booking::factory()->upcoming()->paid()->cancelled()->create();
+
+        $this->assertSame('cancelled', $booking->status);
+        $this->assertGreaterThan(0, (float) $booking->refund_amount);
+        $this->assertSame(0, RoomNight::where('booking_id', $booking->id)->count());
+
+        $payment = Payment::factory()->pendingProof()->create();
+        $this->assertSame('unpaid', Booking::where('booking_id', $payment->booking_id)->value('paid_status'));
+        $this->assertNotNull($payment->proof_file);
+
+        // Factories skip the controllers' aggregate bookkeeping; reconcile like after a bulk seed
+        Review::factory()->rating(4)->create();
+        $this->artisan('ratings:reconcile')->assertSuccessful();
+        $this->assertSame(4.0, Room::first()->rating_avg);
+
+        $this->assertSame('unread', Notification::factory()->unread()->create()->status);
+    }
+
+    public function test_bulk_seed_is_reproducible_and_rebuilds_derived_tables(): void
+    {
+        $this->artisan('db:seed-scale', ['--bookings' => 400, '--years' => 1, '--rooms' => 8, '--seed' => 7, '--until' => '2030-06-30'])
+            ->assertSuccessful();
+
+        $this->assertSame(400, Booking::count());
+        $this->assertSame(8, Room::count());
+        $this->assertGreaterThan(0, Payment::where('status', 'pending_verification')->count());
+        $this->assertGreaterThan(0, Booking::where('status', 'cancelled')->count());
+        $this->assertGreaterThan(0, Notification::where('status', 'unread')->count());
+        $this->assertGreaterThan(0, RoomNight::count());
+        $this->assertGreaterThan(0, UserStat::count());
+
+        $first = storage_path('framework/testing/dataset-a');
+        $second = storage_path('framework/testing/dataset-b');
+
+        try {
+            foreach ([$first, $second] as $directory) {
+                $this->artisan('db:seed-scale', ['--bookings' => 200, '--seed' => 7, '--until' => '2030-06-30', '--export' => $directory])
+                    ->assertSuccessful();
+            }
+
+            $this->assertFileEquals("{$first}/bookings.ndjson", "{$second}/bookings.ndjson");
+            $this->assertFileEquals("{$first}/payments.ndjson", "{$second}/payments.ndjson");
+        } finally {
+            File::deleteDirectory($first);
+            File::deleteDirectory($second);
+        }
+    }
+}
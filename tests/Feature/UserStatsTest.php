@@ -0,0 +1,122 @@
+<?php
+
+namespace Tests\Feature;
+
+use App\Models\Booking;
+use App\Models\Payment;
+use App\Models\User;
+use Illuminate\Foundation\Testing\RefreshDatabase;
+use Laravel\Sanctum\Sanctum;
+use Tests\TestCase;
+
+class UserStatsTest extends TestCase
+{
+    use RefreshDatabase;
+
+    public function test_admin_lists_top_spenders_from_user_stats(): void
+    {
+        $alice = $this->guest('alice@example.com', [200, 300]);
+        $bob = $this->guest('bob@example.com', [900]);
+        $carol = $this->guest('carol@example.com', [0]);
+        $dave = User::factory()->create(['email' => 'dave@example.com']);
+
+        $this->actingAsAdmin();
+
+        // Dave has no stats row and sorts as zero, after Carol on ties
+        $this->getJson('/api/admin/users?sort=total_spent&direction=desc')
+            ->assertOk()
+            ->assertJsonPath('data.*.email', ['bob@example.com', 'alice@example.com', 'carol@example.com', 'dave@example.com'])
+            ->assertJsonPath('data.0.total_spent', 900.0)
+            ->assertJsonPath('data.1.total_bookings', 2)
+            ->assertJsonPath('data.3.total_bookings', 0);
+
+        $this->getJson('/api/admin/users?sort=total_spent&direction=asc')
+            ->assertOk()
+            ->assertJsonPath('data.*.email', ['dave@example.com', 'carol@example.com', 'alice@example.com', 'bob@example.com']);
+
+        $this->getJson('/api/admin/users?sort=total_spent&min_spent=400')
+            ->assertOk()
+            ->assertJsonPath('data.*.email', ['bob@example.com', 'alice@example.com'])
+            ->assertJsonPath('pagination.total', 2);
+
+        $this->getJson('/api/admin/users?sort=total_bookings&min_bookings=2')
+            ->assertOk()
+            ->assertJsonPath('data.*.id', [$alice->id]);
+
+        $this->getJson('/api/admin/users?sort=balance')->assertStatus(422);
+    }
+
+    public function test_listed_stats_follow_booking_and_payment_writes(): void
+    {
+        $guest = User::factory()->create(['email' => 'guest@example.com']);
+        $first = $this->stay($guest, '2030-03-01', '2030-03-04');
+        $payment = Payment::factory()->create(['booking_id' => $first->booking_id, 'user_email' => $guest->email, 'amount' => 300]);
+
+        $this->actingAsAdmin();
+
+        $this->assertListed($guest, bookings: 1, spent: 300.0, cancellations: 0, lastStay: '2030-03-04');
+
+        $second = $this->stay($guest, '2030-05-10', '2030-05-12');
+        Payment::factory()->create(['booking_id' => $second->booking_id, 'user_email' => $guest->email, 'amount' => 150]);
+        $this->assertListed($guest, bookings: 2, spent: 450.0, cancellations: 0, lastStay: '2030-05-12');
+
+        // Cancelling the later stay moves the last stay back
+        $second->update(['status' => 'cancelled']);
+        $this->assertListed($guest, bookings: 2, spent: 450.0, cancellations: 1, lastStay: '2030-03-04');
+
+        // Rejected payments do not count as spend
+        $payment->update(['status' => 'rejected']);
+        $this->assertListed($guest, bookings: 2, spent: 150.0, cancellations: 1, lastStay: '2030-03-04');
+
+        $third = $this->stay($guest, '2030-07-01', '2030-07-03');
+        $this->assertListed($guest, bookings: 3, spent: 150.0, cancellations: 1, lastStay: '2030-07-03');
+
+        $third->delete();
+        $this->assertListed($guest, bookings: 2, spent: 150.0, cancellations: 1, lastStay: '2030-03-04');
+    }
+
+    private function assertListed(User $user, int $bookings, float $spent, int $cancellations, string $lastStay): void
+    {
+        $row = collect($this->getJson('/api/admin/users')->assertOk()->json('data'))->firstWhere('id', $user->id);
+
+        $this->assertSame($bookings, $row['total_bookings']);
+        $this->assertEquals($spent, $row['total_spent']);
+        $this->assertSame($cancellations, $row['cancellations']);
+        $this->assertStringStartsWith($lastStay, $row['last_stay']);
+    }
+
+    /**
+     * A guest with one paid booking per payment amount
+     */
+    private function guest(string $email, array $payments): User
+    {
+        $user = User::factory()->create(['email' => $email]);
+
+        foreach ($payments as $amount) {
+            $booking = Booking::factory()->paid()->create(['user_id' => $user->id]);
+
+            if ($amount) {
+                Payment::factory()->create(['booking_id' => $booking->booking_id, 'user_email' => $email, 'amount' => $amount]);
+            }
+        }
+
+        return $user;
+    }
+
+    private function stay(User $user, string $checkIn, string $checkOut): Booking
+    {
+        return Booking::factory()->paid()->create([
+            'user_id' => $user->id,
+            'status' => 'confirmed',
+            'check_in' => $checkIn . ' 15:00:00',
+            'check_out' => $checkOut . ' 11:00:00',
+        ]);
+    }
+
+    private function actingAsAdmin(): void
+    {
+        $admin = User::factory()->create();
+        $admin->forceFill(['usertype' => 'admin'])->save();
+        Sanctum::actingAs($admin);
+    }
+}
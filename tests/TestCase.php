@@ -2,9 +2,53 @@
 
 namespace Tests;
 
+use Closure;
 use Illuminate\Foundation\Testing\TestCase as BaseTestCase;
+use Illuminate\Support\Facades\DB;
 
 abstract class TestCase extends BaseTestCase
 {
-    //
+    /**
+     * Run a callback (usually one request) and fail if it issues more than $budget queries
+     *
+     * Returns whatever the callback returns, so assertions can be chained on a response.
+     */
+    protected function assertQueryBudget(int $budget, Closure $callback)
+    {
+        [$result, $executed] = $this->captureQueries($callback);
+        $queries = array_map(fn ($query) => $query->sql, $executed);
+
+        $this->assertLessThanOrEqual(
+            $budget,
+            count($queries),
+            sprintf("Query budget of %d exceeded with %d queries:\n%s", $budget, count($queries), implode("\n", $queries))
+        );
+
+        return $result;
+    }
+
+    /**
+     * Run a callback and collect the statements it executes
+     *
+     * Returns [callback result, QueryExecuted events in order].
+     */
+    protected function captureQueries(Closure $callback): array
+    {
+        $queries = [];
+        $listening = true;
+
+        DB::listen(function ($query) use (&$queries, &$listening) {
+            if ($listening) {
+                $queries[] = $query;
+            }
+        });
+
+        try {
+            $result = $callback();
+        } finally {
+            $listening = false;
+        }
+
+        return [$result, $queries];
+    }
 }
@@ -1,11 +1,36 @@
 import { defineConfig } from 'vite';
 import laravel from 'laravel-vite-plugin';
+import staticPages from './resources/build/static-pages.js';
 
-export default defineConfig({
-    plugins: [
-        laravel({
-            input: ['resources/css/app.css', 'resources/js/app.js'],
-            refresh: true,
-        }),
-    ],
+// Hand-written pages served from public/, bundled by `vite build --mode static`
+const STATIC_PAGES = [
+    'index.html', 'booking.html', 'payment.html', 'history.html', 'room-detail.html',
+    'profile.html', 'signin.html', 'signup.html', 'admin.html',
+    'about.html', 'blog.html', 'contact.html', 'gallery.html', 'room.html',
+    'admin/index.html', 'admin/charts.html', 'admin/forms.html', 'admin/tables.html',
+    'admin/login.html', 'admin/register.html',
+];
+
+export default defineConfig(({ mode }) => {
+    if (mode === 'static') {
+        return {
+            plugins: [
+                staticPages({
+                    root: 'public',
+                    outDir: 'dist',
+                    pages: STATIC_PAGES,
+                    budget: 'resources/build/size-budget.json',
+                }),
+            ],
+        };
+    }
+
+    return {
+        plugins: [
+            laravel({
+                input: ['resources/css/app.css', 'resources/js/app.js'],
+                refresh: true,
+            }),
+        ],
+    };
 });